@@ -196,6 +196,16 @@ async def list_tasks():
     )
 
 
+@router.get("/actor_pool")
+async def get_actor_pool_stats():
+    """Get the utilization of the data processing actor pool, per processing lane"""
+    try:
+        return await service.get_actor_pool_stats()
+    except Exception as e:
+        raise HTTPException(
+            status_code=HTTPStatus.INTERNAL_SERVER_ERROR, detail=str(e))
+
+
 @router.get("/indices/{index_name}")
 async def get_index_tasks(index_name: str):
     """
@@ -210,6 +220,20 @@ async def get_index_tasks(index_name: str):
             status_code=HTTPStatus.INTERNAL_SERVER_ERROR, detail=str(e))
 
 
+@router.get("/indices/{index_name}/files")
+async def get_index_files_status(index_name: str):
+    """
+    Get the state of every file of an index in one response
+
+    Returns a mapping of path_or_url to its state, latest task ID, original filename and source type
+    """
+    try:
+        return await service.get_index_files_status(index_name)
+    except Exception as e:
+        raise HTTPException(
+            status_code=HTTPStatus.INTERNAL_SERVER_ERROR, detail=str(e))
+
+
 @router.get("/{task_id}/details")
 async def get_task_details(task_id: str):
     """Get detailed information about a task, including results"""
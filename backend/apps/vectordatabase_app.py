@@ -2,13 +2,19 @@ import logging
 from http import HTTPStatus
 from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Body, Depends, Header, HTTPException, Path, Query
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, Path, Query, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse
 
+from consts.const import DP_INGEST_RETRY_AFTER_S
+from consts.exceptions import IngestOffsetConflictError, LimitExceededError
 from consts.model import ChunkCreateRequest, ChunkUpdateRequest, HybridSearchRequest, IndexingResponse
+from nexent.vector_database.async_base import AsyncVectorDatabaseCore
 from nexent.vector_database.base import VectorDatabaseCore
+from nexent.vector_database.elasticsearch_core import IndexWriteBlockedError
 from services.vectordatabase_service import (
     ElasticSearchService,
+    get_async_vector_db_core,
     get_embedding_model,
     get_vector_db_core,
     check_knowledge_base_exist_impl,
@@ -43,13 +49,16 @@ def create_new_index(
         index_name: str = Path(..., description="Name of the index to create"),
         embedding_dim: Optional[int] = Query(
             None, description="Dimension of the embedding vectors"),
+        index_profile: Optional[str] = Query(
+            None, description="Vector index profile: float, int8 or bbq"),
         vdb_core: VectorDatabaseCore = Depends(get_vector_db_core),
         authorization: Optional[str] = Header(None)
 ):
     """Create a new vector index and store it in the knowledge table"""
     try:
         user_id, tenant_id = get_current_user_id(authorization)
-        return ElasticSearchService.create_index(index_name, embedding_dim, vdb_core, user_id, tenant_id)
+        return ElasticSearchService.create_index(
+            index_name, embedding_dim, vdb_core, user_id, tenant_id, index_profile)
     except Exception as e:
         raise HTTPException(
             status_code=HTTPStatus.INTERNAL_SERVER_ERROR, detail=f"Error creating index: {str(e)}")
@@ -98,6 +107,8 @@ def create_index_documents(
         index_name: str = Path(..., description="Name of the index"),
         data: List[Dict[str, Any]
                    ] = Body(..., description="Document List to process"),
+        incremental: bool = Query(
+            False, description="Replace each document's previous version, embedding only changed chunks"),
         vdb_core: VectorDatabaseCore = Depends(get_vector_db_core),
         authorization: Optional[str] = Header(None)
 ):
@@ -108,7 +119,12 @@ def create_index_documents(
     try:
         user_id, tenant_id = get_current_user_id(authorization)
         embedding_model = get_embedding_model(tenant_id)
-        return ElasticSearchService.index_documents(embedding_model, index_name, data, vdb_core)
+        return ElasticSearchService.index_documents(
+            embedding_model, index_name, data, vdb_core, incremental=incremental)
+    except IndexWriteBlockedError as e:
+        # The index is about to be swapped by a rebuild, the same request succeeds against the new one
+        raise HTTPException(status_code=HTTPStatus.SERVICE_UNAVAILABLE, detail=str(e),
+                            headers={"Retry-After": str(DP_INGEST_RETRY_AFTER_S)})
     except Exception as e:
         error_msg = str(e)
         logger.error(f"Error indexing documents: {error_msg}")
@@ -116,18 +132,74 @@ def create_index_documents(
             status_code=HTTPStatus.INTERNAL_SERVER_ERROR, detail=f"Error indexing documents: {error_msg}")
 
 
+@router.post("/{index_name}/documents/stream")
+async def stream_index_documents(
+        request: Request,
+        index_name: str = Path(..., description="Name of the index"),
+        session_id: str = Query(..., description="Ingestion session ID, the same for every segment of one upload"),
+        offset: int = Query(0, ge=0, description="Chunk offset of the first line of the body"),
+        final: bool = Query(False, description="Whether this segment completes the upload"),
+        incremental: bool = Query(
+            False, description="Replace each document's previous version, embedding only changed chunks"),
+        vdb_core: VectorDatabaseCore = Depends(get_vector_db_core),
+        authorization: Optional[str] = Header(None)
+):
+    """
+    Index documents streamed as NDJSON segments (application/x-ndjson), one document per line.
+    Every segment is acknowledged with the offset of the next expected chunk and the final one commits the upload.
+    """
+    try:
+        user_id, tenant_id = get_current_user_id(authorization)
+        embedding_model = await run_in_threadpool(get_embedding_model, tenant_id) if final else None
+        body = await request.body()
+        return await run_in_threadpool(
+            ElasticSearchService.ingest_document_segment, embedding_model, index_name, session_id, offset, body,
+            final, vdb_core, incremental)
+    except IngestOffsetConflictError as e:
+        raise HTTPException(status_code=HTTPStatus.CONFLICT,
+                            detail={"message": str(e), "next_offset": e.next_offset})
+    except LimitExceededError as e:
+        raise HTTPException(status_code=HTTPStatus.TOO_MANY_REQUESTS, detail=str(e),
+                            headers={"Retry-After": str(DP_INGEST_RETRY_AFTER_S)})
+    except IndexWriteBlockedError as e:
+        raise HTTPException(status_code=HTTPStatus.SERVICE_UNAVAILABLE, detail=str(e),
+                            headers={"Retry-After": str(DP_INGEST_RETRY_AFTER_S)})
+    except Exception as e:
+        error_msg = str(e)
+        logger.error(f"Error indexing streamed documents: {error_msg}")
+        raise HTTPException(
+            status_code=HTTPStatus.INTERNAL_SERVER_ERROR, detail=f"Error indexing documents: {error_msg}")
+
+
 @router.get("/{index_name}/files")
 async def get_index_files(
         index_name: str = Path(..., description="Name of the index"),
+        page_size: Optional[int] = Query(
+            None, description="Number of stored files per page, all files are returned when omitted"),
+        cursor: Optional[str] = Query(
+            None, description="next_cursor returned by the previous page"),
+        sort_by: str = Query(
+            "create_time", description="Sort field: create_time, file_size, chunk_count, filename or path_or_url"),
+        sort_order: str = Query("desc", description="Sort order: asc or desc"),
         vdb_core: VectorDatabaseCore = Depends(get_vector_db_core)
 ):
     """Get all files from an index, including those that are not yet stored in ES"""
     try:
-        result = await ElasticSearchService.list_files(index_name, include_chunks=False, vdb_core=vdb_core)
-        # Transform result to match frontend expectations
+        if page_size is None:
+            result = await ElasticSearchService.list_files(index_name, include_chunks=False, vdb_core=vdb_core)
+            # Transform result to match frontend expectations
+            return {
+                "status": "success",
+                "files": result.get("files", [])
+            }
+        result = await ElasticSearchService.list_files(
+            index_name, include_chunks=False, vdb_core=vdb_core,
+            page_size=page_size, cursor=cursor, sort_by=sort_by, sort_order=sort_order)
         return {
             "status": "success",
-            "files": result.get("files", [])
+            "files": result.get("files", []),
+            "total": result.get("total"),
+            "next_cursor": result.get("next_cursor"),
         }
     except Exception as e:
         error_msg = str(e)
@@ -188,6 +260,36 @@ def delete_documents(
 
 
 # Health check
+@router.post("/{index_name}/rebuild")
+def rebuild_index(
+        index_name: str = Path(..., description="Name of the index"),
+        vdb_core: VectorDatabaseCore = Depends(get_vector_db_core),
+        authorization: Optional[str] = Header(None)
+):
+    """Re-embed the knowledge base with the tenant's current embedding model in the background"""
+    try:
+        user_id, tenant_id = get_current_user_id(authorization)
+        return ElasticSearchService.rebuild_index(index_name, tenant_id, user_id, vdb_core)
+    except Exception as e:
+        logger.error(f"Error starting rebuild of index {index_name}: {str(e)}")
+        raise HTTPException(
+            status_code=HTTPStatus.INTERNAL_SERVER_ERROR, detail=f"Error rebuilding index: {str(e)}")
+
+
+@router.get("/{index_name}/rebuild")
+def get_rebuild_status(
+        index_name: str = Path(..., description="Name of the index"),
+        vdb_core: VectorDatabaseCore = Depends(get_vector_db_core)
+):
+    """Get the progress of the knowledge base's embedding model rebuild"""
+    try:
+        return ElasticSearchService.get_rebuild_status(index_name, vdb_core)
+    except Exception as e:
+        logger.error(f"Error getting rebuild status of index {index_name}: {str(e)}")
+        raise HTTPException(
+            status_code=HTTPStatus.INTERNAL_SERVER_ERROR, detail=f"Error getting rebuild status: {str(e)}")
+
+
 @router.get("/health")
 def health_check(vdb_core: VectorDatabaseCore = Depends(get_vector_db_core)):
     """Check API and Elasticsearch health"""
@@ -199,7 +301,7 @@ def health_check(vdb_core: VectorDatabaseCore = Depends(get_vector_db_core)):
 
 
 @router.post("/{index_name}/chunks")
-def get_index_chunks(
+async def get_index_chunks(
         index_name: str = Path(...,
                                description="Name of the index to get chunks from"),
         page: int = Query(
@@ -208,16 +310,19 @@ def get_index_chunks(
             None, description="Number of records per page for pagination"),
         path_or_url: Optional[str] = Query(
             None, description="Filter chunks by document path_or_url"),
-        vdb_core: VectorDatabaseCore = Depends(get_vector_db_core)
+        cursor: Optional[str] = Query(
+            None, description="next_cursor returned by the previous page, used instead of page for deep pages"),
+        vdb_core: AsyncVectorDatabaseCore = Depends(get_async_vector_db_core)
 ):
     """Get chunks from the specified index, with optional pagination support"""
     try:
-        result = ElasticSearchService.get_index_chunks(
+        result = await ElasticSearchService.get_index_chunks_async(
             index_name=index_name,
             page=page,
             page_size=page_size,
             path_or_url=path_or_url,
             vdb_core=vdb_core,
+            cursor=cursor,
         )
         return JSONResponse(status_code=HTTPStatus.OK, content=result)
     except Exception as e:
@@ -324,13 +429,13 @@ def delete_chunk(
 @router.post("/search/hybrid")
 async def hybrid_search(
         payload: HybridSearchRequest,
-        vdb_core: VectorDatabaseCore = Depends(get_vector_db_core),
+        vdb_core: AsyncVectorDatabaseCore = Depends(get_async_vector_db_core),
         authorization: Optional[str] = Header(None),
 ):
     """Run a hybrid (accurate + semantic) search across indices."""
     try:
         _, tenant_id = get_current_user_id(authorization)
-        result = ElasticSearchService.search_hybrid(
+        result = await ElasticSearchService.search_hybrid_async(
             index_names=payload.index_names,
             query=payload.query,
             tenant_id=tenant_id,
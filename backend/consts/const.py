@@ -14,6 +14,7 @@ TEST_VOICE_PATH = os.path.join(os.path.dirname(
 # Vector database providers
 class VectorDatabaseType(str, Enum):
     ELASTICSEARCH = "elasticsearch"
+    LOCAL = "local"
 
 
 # ModelEngine Configuration
@@ -27,6 +28,56 @@ ES_API_KEY = os.getenv("ELASTICSEARCH_API_KEY")
 ES_PASSWORD = os.getenv("ELASTIC_PASSWORD")
 ES_USERNAME = "elastic"
 ELASTICSEARCH_SERVICE = os.getenv("ELASTICSEARCH_SERVICE")
+# Pipelined ingestion: max in-flight embedding requests and max embedded batches queued for bulk
+ES_EMBEDDING_CONCURRENCY = int(os.getenv("ES_EMBEDDING_CONCURRENCY", "4"))
+ES_BULK_QUEUE_SIZE = int(os.getenv("ES_BULK_QUEUE_SIZE", "4"))
+# Hybrid search: rank fusion ("weighted" or "rrf") and kNN candidate depth, independent of top_k
+ES_HYBRID_FUSION = os.getenv("ES_HYBRID_FUSION", "weighted")
+ES_KNN_NUM_CANDIDATES = int(os.getenv("ES_KNN_NUM_CANDIDATES", "100"))
+# Vector index: default profile for new knowledge bases ("float", "int8" or "bbq") and HNSW build parameters
+ES_VECTOR_INDEX_PROFILE = os.getenv("ES_VECTOR_INDEX_PROFILE", "float")
+ES_HNSW_M = int(os.getenv("ES_HNSW_M", "16"))
+ES_HNSW_EF_CONSTRUCTION = int(os.getenv("ES_HNSW_EF_CONSTRUCTION", "100"))
+ES_EXCLUDE_VECTOR_SOURCE = os.getenv(
+    "ES_EXCLUDE_VECTOR_SOURCE", "false").lower() == "true"
+# Seconds that knowledge-base statistics are cached between writes to an index
+ES_INDEX_STATS_CACHE_TTL_S = int(os.getenv("ES_INDEX_STATS_CACHE_TTL_S", "30"))
+# Connection pool size per node of the asyncio client shared by request-serving endpoints
+ES_ASYNC_CONNECTIONS_PER_NODE = int(os.getenv("ES_ASYNC_CONNECTIONS_PER_NODE", "64"))
+# Expiry of the lock held by a knowledge base rebuild, refreshed while it runs and freed if its process dies
+ES_REBUILD_LOCK_TTL_S = int(os.getenv("ES_REBUILD_LOCK_TTL_S", "60"))
+
+# Vector database backend: "elasticsearch", or "local" for the embedded store kept under LOCAL_VECTOR_STORE_PATH
+VECTOR_DATABASE_TYPE = VectorDatabaseType(os.getenv("VECTOR_DATABASE_TYPE", VectorDatabaseType.ELASTICSEARCH.value))
+LOCAL_VECTOR_STORE_PATH = os.getenv("LOCAL_VECTOR_STORE_PATH", "/mnt/nexent/vector_store")
+
+
+# Embedding Cache Configuration (content-hash cache shared by document indexing and memory)
+EMBEDDING_CACHE_ENABLED = os.getenv(
+    "EMBEDDING_CACHE_ENABLED", "true").lower() == "true"
+EMBEDDING_CACHE_MAX_ENTRIES = int(
+    os.getenv("EMBEDDING_CACHE_MAX_ENTRIES", "10000"))
+EMBEDDING_CACHE_REDIS_ENABLED = os.getenv(
+    "EMBEDDING_CACHE_REDIS_ENABLED", "false").lower() == "true"
+EMBEDDING_CACHE_REDIS_TTL_S = int(
+    os.getenv("EMBEDDING_CACHE_REDIS_TTL_S", str(7 * 24 * 3600)))
+EMBEDDING_CACHE_DISK_PATH = os.getenv("EMBEDDING_CACHE_DISK_PATH", "")
+# Keep-alive connections pooled per embedding API host
+EMBEDDING_HTTP_POOL_MAXSIZE = int(os.getenv("EMBEDDING_HTTP_POOL_MAXSIZE", "16"))
+# Query-embedding cache used by semantic and hybrid search
+QUERY_EMBEDDING_CACHE_ENABLED = os.getenv(
+    "QUERY_EMBEDDING_CACHE_ENABLED", "true").lower() == "true"
+QUERY_EMBEDDING_CACHE_MAX_ENTRIES = int(
+    os.getenv("QUERY_EMBEDDING_CACHE_MAX_ENTRIES", "10000"))
+QUERY_EMBEDDING_CACHE_TTL_S = int(
+    os.getenv("QUERY_EMBEDDING_CACHE_TTL_S", "3600"))
+# Query embedding coalescing: single-text requests arriving within the wait window share one API call
+EMBEDDING_COALESCE_ENABLED = os.getenv(
+    "EMBEDDING_COALESCE_ENABLED", "true").lower() == "true"
+EMBEDDING_COALESCE_MAX_BATCH = int(
+    os.getenv("EMBEDDING_COALESCE_MAX_BATCH", "32"))
+EMBEDDING_COALESCE_MAX_WAIT_MS = float(
+    os.getenv("EMBEDDING_COALESCE_MAX_WAIT_MS", "5"))
 
 
 # Data Processing Service Configuration
@@ -105,10 +156,78 @@ DP_REDIS_CHUNKS_POLL_INTERVAL_MS = int(
 FORWARD_REDIS_RETRY_DELAY_S = int(
     os.getenv("FORWARD_REDIS_RETRY_DELAY_S", "5"))
 FORWARD_REDIS_RETRY_MAX = int(os.getenv("FORWARD_REDIS_RETRY_MAX", "12"))
+# Chunk hand-off between the process and forward tasks: "redis" (compressed segments) or
+# "object_ref" (Ray object references, requires both task queues to run in the same Ray cluster;
+# the chunks are lost if the Celery worker of the process task exits before the forward task runs)
+DATA_PROCESS_CHUNK_TRANSPORT = os.getenv(
+    "DATA_PROCESS_CHUNK_TRANSPORT", "redis").lower()
+DP_CHUNK_SEGMENT_BYTES = int(
+    os.getenv("DP_CHUNK_SEGMENT_BYTES", str(1024 * 1024)))
+DP_CHUNK_ZSTD_LEVEL = int(os.getenv("DP_CHUNK_ZSTD_LEVEL", "3"))
+DP_CHUNKS_TTL_S = int(os.getenv("DP_CHUNKS_TTL_S", str(2 * 60 * 60)))
+# Content-addressed dedup (opt-in): files already processed with the same parameters reuse their stored
+# chunks. Every processed file keeps a copy of its chunks in Redis for DP_CONTENT_CACHE_TTL_S
+DP_CONTENT_DEDUP = os.getenv("DP_CONTENT_DEDUP", "false").lower() == "true"
+DP_CONTENT_CACHE_TTL_S = int(
+    os.getenv("DP_CONTENT_CACHE_TTL_S", str(60 * 60)))
+# Streaming ingestion: the forward task sends NDJSON segments of DP_FORWARD_SEGMENT_CHUNKS chunks, each
+# acknowledged by the main service and spooled in Redis until the final segment commits the file
+DP_FORWARD_SEGMENT_CHUNKS = int(os.getenv("DP_FORWARD_SEGMENT_CHUNKS", "256"))
+DP_FORWARD_SEGMENT_TIMEOUT_S = int(
+    os.getenv("DP_FORWARD_SEGMENT_TIMEOUT_S", "60"))
+DP_FORWARD_COMMIT_TIMEOUT_S = int(
+    os.getenv("DP_FORWARD_COMMIT_TIMEOUT_S", "600"))
+DP_INGEST_SESSION_TTL_S = int(os.getenv("DP_INGEST_SESSION_TTL_S", "3600"))
+# Files committed at once by the main service; further final segments are answered with 429 and Retry-After
+DP_INGEST_MAX_CONCURRENT_COMMITS = int(
+    os.getenv("DP_INGEST_MAX_CONCURRENT_COMMITS", "4"))
+DP_INGEST_RETRY_AFTER_S = int(os.getenv("DP_INGEST_RETRY_AFTER_S", "5"))
+# Expiry of the lock serializing the requests of one session, freeing it if a process dies while holding it
+DP_INGEST_LOCK_TTL_S = int(os.getenv("DP_INGEST_LOCK_TTL_S", "30"))
+# A commit whose heartbeat is older than this was abandoned by a dead process, its session and slot are reclaimed;
+# running commits refresh their heartbeat every third of it
+DP_INGEST_COMMIT_STALE_S = int(os.getenv("DP_INGEST_COMMIT_STALE_S", "60"))
 
 
 # Ray Configuration
 RAY_ACTOR_NUM_CPUS = int(os.getenv("RAY_ACTOR_NUM_CPUS", "2"))
+# Processing actor pool: actors per lane (text, spreadsheet, document, large_document)
+DP_ACTOR_POOL_MIN_ACTORS = int(os.getenv("DP_ACTOR_POOL_MIN_ACTORS", "0"))
+DP_ACTOR_POOL_MAX_ACTORS = int(os.getenv("DP_ACTOR_POOL_MAX_ACTORS", "4"))
+DP_ACTOR_POOL_IDLE_TIMEOUT_S = int(
+    os.getenv("DP_ACTOR_POOL_IDLE_TIMEOUT_S", "60"))
+# Leases not renewed for DP_ACTOR_LEASE_TTL_S, e.g. because their Celery worker was killed, are reclaimed;
+# workers renew the leases they hold every third of it
+DP_ACTOR_LEASE_TTL_S = int(os.getenv("DP_ACTOR_LEASE_TTL_S", "120"))
+# Longest wait for a free actor of a lane before the task fails
+DP_ACTOR_ACQUIRE_TIMEOUT_S = int(
+    os.getenv("DP_ACTOR_ACQUIRE_TIMEOUT_S", "3600"))
+# Files at least this large are routed to the large_document lane
+DP_LARGE_FILE_MB = int(os.getenv("DP_LARGE_FILE_MB", "20"))
+# Page-range parallel partitioning: PDFs of at least DP_MIN_PAGES_TO_SPLIT pages are cut into ranges of
+# DP_PAGES_PER_RANGE pages, each partitioned by a Ray task of DP_PAGE_RANGE_NUM_CPUS CPUs
+DP_PAGE_RANGE_PARALLEL = os.getenv(
+    "DP_PAGE_RANGE_PARALLEL", "true").lower() == "true"
+DP_PAGES_PER_RANGE = int(os.getenv("DP_PAGES_PER_RANGE", "32"))
+DP_MIN_PAGES_TO_SPLIT = int(os.getenv("DP_MIN_PAGES_TO_SPLIT", "64"))
+DP_PAGE_RANGE_NUM_CPUS = int(os.getenv("DP_PAGE_RANGE_NUM_CPUS", "1"))
+# Read Excel workbooks row by row in read-only mode instead of loading and copying them whole
+DP_EXCEL_STREAMING = os.getenv("DP_EXCEL_STREAMING", "true").lower() == "true"
+# Opt-in cache of unchunked partition results, so re-processing a file only re-chunks it: "minio" (objects under
+# DP_PARTITION_CACHE_PREFIX in the default bucket), "local" (files under DP_PARTITION_CACHE_DIR) or "none"
+DP_PARTITION_CACHE = os.getenv("DP_PARTITION_CACHE", "none").lower()
+DP_PARTITION_CACHE_PREFIX = os.getenv(
+    "DP_PARTITION_CACHE_PREFIX", "partition_cache")
+DP_PARTITION_CACHE_DIR = os.getenv(
+    "DP_PARTITION_CACHE_DIR", "/tmp/nexent/partition_cache")
+# Lifetime of partition results; MinIO rounds it up to whole days in a lifecycle rule of the prefix
+DP_PARTITION_CACHE_TTL_S = int(
+    os.getenv("DP_PARTITION_CACHE_TTL_S", str(7 * 24 * 60 * 60)))
+# Keep per-index task statuses in Redis so task listings do not scan every Celery result
+DP_TASK_REGISTRY = os.getenv("DP_TASK_REGISTRY", "true").lower() == "true"
+# Opt-in lifetime of Celery task results and of the task registry records, 0 keeps both forever. Failed and
+# in-flight files are listed from these records, so once set, files older than this drop out of file lists.
+DP_TASK_RESULT_TTL_S = int(os.getenv("DP_TASK_RESULT_TTL_S", "0"))
 RAY_DASHBOARD_PORT = int(os.getenv("RAY_DASHBOARD_PORT", "8265"))
 RAY_DASHBOARD_HOST = os.getenv("RAY_DASHBOARD_HOST", "0.0.0.0")
 RAY_NUM_CPUS = os.getenv("RAY_NUM_CPUS")
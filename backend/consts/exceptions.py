@@ -13,6 +13,14 @@ class LimitExceededError(Exception):
     pass
 
 
+class IngestOffsetConflictError(Exception):
+    """Raised when a streamed document segment does not start where its ingestion session expects."""
+
+    def __init__(self, next_offset: int):
+        super().__init__(f"Ingestion session expects the segment starting at chunk {next_offset}")
+        self.next_offset = next_offset
+
+
 class UnauthorizedError(Exception):
     """Raised when a user from outer platform is unauthorized."""
     pass
@@ -173,6 +173,8 @@ class IndexingResponse(BaseModel):
     message: str
     total_indexed: int
     total_submitted: int
+    total_embedded: Optional[int] = None
+    total_deleted: Optional[int] = None
 
 
 class ChunkCreateRequest(BaseModel):
@@ -6,7 +6,7 @@ import logging
 from celery import Celery
 from celery.backends.base import DisabledBackend
 
-from consts.const import ELASTICSEARCH_SERVICE, REDIS_BACKEND_URL, REDIS_URL
+from consts.const import DP_TASK_RESULT_TTL_S, ELASTICSEARCH_SERVICE, REDIS_BACKEND_URL, REDIS_URL
 
 # Configure logging
 logger = logging.getLogger("data_process.app")
@@ -67,7 +67,7 @@ app.conf.update(
     task_acks_late=True,       # Tasks are acknowledged after completion
     task_reject_on_worker_lost=True,  # Tasks are rejected if worker is lost
     # Result storage settings
-    result_expires=None,       # Results never expire
+    result_expires=DP_TASK_RESULT_TTL_S or None,  # Results never expire unless a TTL is configured
     result_persistent=True,    # Persist results to backend
     # Monitoring and task events for Flower
     task_send_sent_event=True,  # Send task-sent events
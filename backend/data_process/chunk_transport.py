@@ -0,0 +1,158 @@
+"""
+Binary hand-off of processed chunks between the process and forward tasks.
+
+Chunks are packed one by one with msgpack, grouped into segments of about DP_CHUNK_SEGMENT_BYTES packed bytes and
+each segment is compressed with zstd and stored under its own Redis key. A small manifest holding the segment and
+chunk counts is written last, so a reader never sees a partially written hand-off. The forward task decodes one
+segment at a time instead of loading the whole document as a single JSON string.
+
+Key layout for a base key such as dp:{task_id}:chunks:
+    {base_key}:manifest   msgpack map {"version", "codec", "segments", "chunks"}
+    {base_key}:{n}        zstd compressed, concatenated msgpack chunks of segment n
+    {base_key}            legacy JSON list written by older workers, read as a fallback
+"""
+import json
+import logging
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+import msgpack
+import zstandard
+
+from consts.const import DP_CHUNK_SEGMENT_BYTES, DP_CHUNK_ZSTD_LEVEL, DP_CHUNKS_TTL_S
+
+logger = logging.getLogger("data_process.chunk_transport")
+
+CHUNK_TRANSPORT_VERSION = 1
+CHUNK_TRANSPORT_CODEC = "msgpack+zstd"
+
+
+def manifest_key(base_key: str) -> str:
+    return f"{base_key}:manifest"
+
+
+def segment_key(base_key: str, index: int) -> str:
+    return f"{base_key}:{index}"
+
+
+def write_chunks(
+    client: Any,
+    base_key: str,
+    chunks: Iterable[Dict[str, Any]],
+    segment_bytes: int = DP_CHUNK_SEGMENT_BYTES,
+    level: int = DP_CHUNK_ZSTD_LEVEL,
+    ttl_s: int = DP_CHUNKS_TTL_S,
+) -> Dict[str, int]:
+    """
+    Store chunks in Redis as compressed segments followed by their manifest.
+
+    Args:
+        client: Redis client (binary, i.e. decode_responses=False)
+        base_key: Base key of the hand-off, e.g. dp:{task_id}:chunks
+        chunks: Chunks to store; only one segment is held in memory at a time
+        segment_bytes: Packed bytes per segment before compression
+        level: zstd compression level
+        ttl_s: Expiration of every key written
+
+    Returns:
+        Dict with the number of chunks, segments and compressed bytes written
+
+    Raises:
+        TypeError: If a chunk cannot be packed with msgpack
+    """
+    packer = msgpack.Packer(use_bin_type=True)
+    compressor = zstandard.ZstdCompressor(level=level)
+    buffer = bytearray()
+    stats = {"chunks": 0, "segments": 0, "bytes": 0}
+
+    def flush():
+        blob = compressor.compress(bytes(buffer))
+        client.set(segment_key(base_key, stats["segments"]), blob, ex=ttl_s)
+        stats["segments"] += 1
+        stats["bytes"] += len(blob)
+        buffer.clear()
+
+    for chunk in chunks:
+        buffer += packer.pack(chunk)
+        stats["chunks"] += 1
+        if len(buffer) >= segment_bytes:
+            flush()
+    if buffer:
+        flush()
+
+    manifest = {
+        "version": CHUNK_TRANSPORT_VERSION,
+        "codec": CHUNK_TRANSPORT_CODEC,
+        "segments": stats["segments"],
+        "chunks": stats["chunks"],
+    }
+    client.set(manifest_key(base_key), msgpack.packb(manifest, use_bin_type=True), ex=ttl_s)
+    return stats
+
+
+class ChunkStream:
+    """
+    Lazily decoded chunks of one hand-off.
+
+    len() comes from the manifest; iterating fetches and decodes the segments one by one, so only a single
+    decompressed segment is alive at a time.
+    """
+
+    def __init__(self, client: Any, base_key: str, manifest: Dict[str, Any]):
+        self._client = client
+        self._base_key = base_key
+        self._segments = int(manifest["segments"])
+        self._chunks = int(manifest["chunks"])
+
+    def __len__(self) -> int:
+        return self._chunks
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        decompressor = zstandard.ZstdDecompressor()
+        for index in range(self._segments):
+            blob = self._client.get(segment_key(self._base_key, index))
+            if blob is None:
+                raise ValueError(f"Chunk segment {index}/{self._segments} of '{self._base_key}' is missing")
+            unpacker = msgpack.Unpacker(raw=False)
+            unpacker.feed(decompressor.decompress(blob))
+            yield from unpacker
+
+
+def open_chunks(client: Any, base_key: str) -> Optional[Iterable[Dict[str, Any]]]:
+    """
+    Open the chunks stored under base_key.
+
+    Returns:
+        A ChunkStream, a list for hand-offs written in the legacy JSON format, or None if nothing is stored yet
+
+    Raises:
+        ValueError: If the manifest is unreadable or written by an unknown codec
+        json.JSONDecodeError: If a legacy value is not valid JSON
+    """
+    raw_manifest = client.get(manifest_key(base_key))
+    if raw_manifest is not None:
+        try:
+            manifest = msgpack.unpackb(raw_manifest, raw=False)
+        except Exception as e:
+            raise ValueError(f"Unreadable chunk manifest for '{base_key}': {e}")
+        if not isinstance(manifest, dict) or manifest.get("codec") != CHUNK_TRANSPORT_CODEC:
+            raise ValueError(f"Unsupported chunk manifest for '{base_key}': {manifest!r}")
+        return ChunkStream(client, base_key, manifest)
+
+    legacy = client.get(base_key)
+    if legacy is None:
+        return None
+    logger.info(f"Reading legacy JSON chunks at key '{base_key}'")
+    return json.loads(legacy)
+
+
+def delete_chunks(client: Any, base_key: str) -> None:
+    """Remove the manifest, segments and any legacy value of a hand-off"""
+    raw_manifest = client.get(manifest_key(base_key))
+    keys: List[str] = [manifest_key(base_key), base_key]
+    if raw_manifest is not None:
+        try:
+            segments = int(msgpack.unpackb(raw_manifest, raw=False).get("segments", 0))
+        except Exception:
+            segments = 0
+        keys.extend(segment_key(base_key, index) for index in range(segments))
+    client.delete(*keys)
@@ -0,0 +1,79 @@
+"""
+Content-addressed store of processed chunks.
+
+The partition output of a file is keyed by the sha256 of its bytes together with the parameters that shape the
+chunks (chunking strategy, max_characters, new_after_n_chars). A file uploaded again, or into another knowledge
+base, finds its chunks here and skips the Ray partition step; the forward task then only indexes them, and their
+embeddings come out of the per-model embedding cache.
+
+Entries use the chunk_transport layout under dp:content:{content_key}:chunks, so the forward task reads them like
+any other hand-off. They are shared by every task of the same content and expire after DP_CONTENT_CACHE_TTL_S
+instead of being deleted once indexed.
+"""
+import hashlib
+import logging
+from typing import Any, Optional
+
+from database.attachment_db import open_file_stream
+from .chunk_transport import manifest_key, open_chunks
+
+logger = logging.getLogger("data_process.content_store")
+
+CONTENT_KEY_PREFIX = "dp:content"
+HASH_BLOCK_BYTES = 1024 * 1024
+# Remaining lifetime an entry needs to be reused, enough for the forward task to pick it up
+CONTENT_MIN_REMAINING_TTL_S = 600
+
+
+def hash_file(source: str, source_type: str) -> str:
+    """
+    sha256 of the file bytes, read block by block; MinIO objects are streamed rather than loaded into memory.
+
+    Raises:
+        FileNotFoundError: If the file cannot be read
+    """
+    digest = hashlib.sha256()
+    if source_type == "local":
+        with open(source, "rb") as file:
+            for block in iter(lambda: file.read(HASH_BLOCK_BYTES), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    stream = open_file_stream(source)
+    if stream is None:
+        raise FileNotFoundError(f"Unable to fetch file from URL: {source}")
+    try:
+        for block in iter(lambda: stream.read(HASH_BLOCK_BYTES), b""):
+            digest.update(block)
+    finally:
+        stream.close()
+    return digest.hexdigest()
+
+
+def content_key(file_sha256: str, chunking_strategy: str, max_characters: Optional[int] = None,
+                new_after_n_chars: Optional[int] = None) -> str:
+    """Key of the partition output of a file processed with the given parameters"""
+    params = f"{chunking_strategy}|{max_characters}|{new_after_n_chars}"
+    return f"{file_sha256}:{hashlib.sha256(params.encode()).hexdigest()[:16]}"
+
+
+def content_chunks_key(key: str) -> str:
+    """Base chunk_transport key of a content entry"""
+    return f"{CONTENT_KEY_PREFIX}:{key}:chunks"
+
+
+def lookup_content(client: Any, key: str) -> Optional[int]:
+    """
+    Number of chunks stored for a content entry.
+
+    Entries close to expiry count as missing: their segments were written before the manifest and expire first.
+
+    Returns:
+        The chunk count, or None if the entry is missing or about to expire
+    """
+    base_key = content_chunks_key(key)
+    ttl = client.ttl(manifest_key(base_key))
+    if ttl != -1 and ttl < CONTENT_MIN_REMAINING_TTL_S:
+        return None
+    chunks = open_chunks(client, base_key)
+    return len(chunks) if chunks is not None else None
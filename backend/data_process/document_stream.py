@@ -0,0 +1,46 @@
+"""
+Client side of the streaming ingestion protocol of /indices/{index_name}/documents/stream.
+
+The formatted chunks of a file are sent as NDJSON segments of DP_FORWARD_SEGMENT_CHUNKS chunks, one request per
+segment, and a segment is only sent once the previous one was acknowledged, so neither side holds more than one
+segment in flight. The acknowledgement carries the offset of the next chunk the main service expects: segments
+ending before it were stored by an earlier attempt and are skipped, and a 409 answer carrying a smaller offset
+(an expired session) makes the upload start again from there. The last segment is sent with final=true and its
+answer is the indexing result of the whole file.
+"""
+from typing import Any, Dict, Iterable, Iterator, NamedTuple
+
+from utils.ingest_session_utils import encode_ndjson
+
+
+class Segment(NamedTuple):
+    offset: int
+    count: int
+    body: bytes
+    final: bool
+
+
+def iter_segments(documents: Iterable[Dict[str, Any]], segment_chunks: int) -> Iterator[Segment]:
+    """
+    Pack documents into NDJSON segments of segment_chunks documents, the last one marked final.
+
+    Segment boundaries only depend on the documents and segment_chunks, so a new attempt produces the same
+    offsets as the one it resumes. Nothing is yielded for no documents.
+    """
+    pending = None
+    batch = []
+    offset = 0
+    for document in documents:
+        batch.append(document)
+        if len(batch) == segment_chunks:
+            if pending is not None:
+                yield pending
+            pending = Segment(offset, len(batch), encode_ndjson(batch), False)
+            offset += len(batch)
+            batch = []
+    if batch:
+        if pending is not None:
+            yield pending
+        pending = Segment(offset, len(batch), encode_ndjson(batch), False)
+    if pending is not None:
+        yield pending._replace(final=True)
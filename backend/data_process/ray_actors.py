@@ -1,20 +1,98 @@
+import asyncio
 import logging
-import json
-from typing import Any, Dict, List, Optional
+import os
+import time
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
 
 import ray
 
-from consts.const import RAY_ACTOR_NUM_CPUS, REDIS_BACKEND_URL, DEFAULT_EXPECTED_CHUNK_SIZE, DEFAULT_MAXIMUM_CHUNK_SIZE
+from consts.const import (
+    RAY_ACTOR_NUM_CPUS,
+    DP_ACTOR_POOL_MIN_ACTORS,
+    DP_ACTOR_POOL_MAX_ACTORS,
+    DP_ACTOR_POOL_IDLE_TIMEOUT_S,
+    DP_ACTOR_LEASE_TTL_S,
+    DP_LARGE_FILE_MB,
+    DP_PAGE_RANGE_PARALLEL,
+    DP_PAGES_PER_RANGE,
+    DP_MIN_PAGES_TO_SPLIT,
+    DP_PAGE_RANGE_NUM_CPUS,
+    DP_EXCEL_STREAMING,
+    REDIS_BACKEND_URL,
+    DEFAULT_EXPECTED_CHUNK_SIZE,
+    DEFAULT_MAXIMUM_CHUNK_SIZE,
+    DP_CHUNKS_TTL_S,
+)
 from database.attachment_db import get_file_stream
 from database.model_management_db import get_model_by_model_id
 from nexent.data_process import DataProcessCore
+from utils.partition_cache_utils import create_partition_cache
+from .chunk_transport import write_chunks
 
 logger = logging.getLogger("data_process.ray_actors")
+
+
+def resolve_chunk_size_params(model_id: Optional[int], tenant_id: Optional[str]) -> Dict[str, int]:
+    """
+    Chunk sizes configured on an embedding model, as processing parameters.
+
+    Returns:
+        Dict with max_characters and new_after_n_chars, empty to keep the default chunk sizes
+    """
+    if not (model_id and tenant_id):
+        return {}
+    try:
+        # Get embedding model details directly by model_id
+        model_record = get_model_by_model_id(
+            model_id=model_id, tenant_id=tenant_id)
+        if not model_record:
+            logger.warning(
+                f"Embedding model with ID {model_id} not found for tenant '{tenant_id}', using default chunk sizes")
+            return {}
+        expected_chunk_size = model_record.get(
+            'expected_chunk_size', DEFAULT_EXPECTED_CHUNK_SIZE)
+        maximum_chunk_size = model_record.get(
+            'maximum_chunk_size', DEFAULT_MAXIMUM_CHUNK_SIZE)
+        logger.info(
+            f"Using chunk sizes from embedding model '{model_record.get('display_name')}' (ID: {model_id}): "
+            f"max_characters={maximum_chunk_size}, new_after_n_chars={expected_chunk_size}")
+        return {'max_characters': maximum_chunk_size, 'new_after_n_chars': expected_chunk_size}
+    except Exception as e:
+        logger.warning(
+            f"Failed to retrieve chunk sizes from embedding model ID {model_id}: {e}. Using default chunk sizes")
+        return {}
+
+
+# Ray task wrappers of the functions passed to ray_map
+_remote_functions: Dict[Any, Any] = {}
+
+
+def ray_map(func: Any, *iterables: Any) -> List[Any]:
+    """
+    map() over Ray tasks: every call of func runs as a task of DP_PAGE_RANGE_NUM_CPUS CPUs.
+
+    The calling actor keeps its own CPUs while it waits, so when the cluster has no CPU left for the
+    tasks the calls run in-process instead of queueing behind the caller.
+
+    Returns:
+        List of results in input order
+    """
+    args = list(zip(*iterables))
+    if ray.available_resources().get("CPU", 0) < DP_PAGE_RANGE_NUM_CPUS:
+        logger.info(f"No free CPUs for {len(args)} Ray tasks, running them in-process")
+        return [func(*call_args) for call_args in args]
+
+    remote_func = _remote_functions.get(func)
+    if remote_func is None:
+        remote_func = ray.remote(num_cpus=DP_PAGE_RANGE_NUM_CPUS)(func)
+        _remote_functions[func] = remote_func
+    return ray.get([remote_func.remote(*call_args) for call_args in args])
+
+
 # This now controls the number of CPUs requested by each DataProcessorRayActor instance.
 # It allows a single file processing task to potentially use more than one core if the
 # underlying processing library (e.g., unstructured) can leverage it.
-
-
 @ray.remote(num_cpus=RAY_ACTOR_NUM_CPUS)
 class DataProcessorRayActor:
     """
@@ -25,7 +103,14 @@ class DataProcessorRayActor:
     def __init__(self):
         logger.info(
             f"Ray actor initialized using {RAY_ACTOR_NUM_CPUS} CPU cores...")
-        self._processor = DataProcessCore()
+        # Large PDFs are partitioned page range by page range in parallel Ray tasks
+        self._processor = DataProcessCore(
+            page_range_map=ray_map if DP_PAGE_RANGE_PARALLEL else None,
+            pages_per_range=DP_PAGES_PER_RANGE,
+            min_pages_to_split=DP_MIN_PAGES_TO_SPLIT,
+            excel_streaming=DP_EXCEL_STREAMING,
+            partition_cache=create_partition_cache(),
+        )
 
     def process_file(
         self,
@@ -59,31 +144,7 @@ class DataProcessorRayActor:
             params['task_id'] = task_id
 
         # Get chunk size parameters from embedding model if model_id is provided
-        if model_id and tenant_id:
-            try:
-                # Get embedding model details directly by model_id
-                model_record = get_model_by_model_id(
-                    model_id=model_id, tenant_id=tenant_id)
-                if model_record:
-                    expected_chunk_size = model_record.get(
-                        'expected_chunk_size', DEFAULT_EXPECTED_CHUNK_SIZE)
-                    maximum_chunk_size = model_record.get(
-                        'maximum_chunk_size', DEFAULT_MAXIMUM_CHUNK_SIZE)
-                    model_name = model_record.get('display_name')
-
-                    # Pass chunk sizes to processing parameters
-                    params['max_characters'] = maximum_chunk_size
-                    params['new_after_n_chars'] = expected_chunk_size
-
-                    logger.info(
-                        f"[RayActor] Using chunk sizes from embedding model '{model_name}' (ID: {model_id}): "
-                        f"max_characters={maximum_chunk_size}, new_after_n_chars={expected_chunk_size}")
-                else:
-                    logger.warning(
-                        f"[RayActor] Embedding model with ID {model_id} not found for tenant '{tenant_id}', using default chunk sizes")
-            except Exception as e:
-                logger.warning(
-                    f"[RayActor] Failed to retrieve chunk sizes from embedding model ID {model_id}: {e}. Using default chunk sizes")
+        params.update(resolve_chunk_size_params(model_id, tenant_id))
 
         try:
             file_stream = get_file_stream(source)
@@ -119,46 +180,309 @@ class DataProcessorRayActor:
             f"[RayActor] Processing done: produced {len(chunks)} chunks for source='{source}'")
         return chunks
 
-    def store_chunks_in_redis(self, redis_key: str, chunks: List[Dict[str, Any]]) -> bool:
+    def count_chunks(self, chunks: List[Dict[str, Any]]) -> int:
+        """Number of chunks behind an ObjectRef returned by process_file, so the caller never fetches them"""
+        return len(chunks) if chunks else 0
+
+    def store_chunks_in_redis(self, redis_key: str, chunks: List[Dict[str, Any]],
+                              ttl_s: int = DP_CHUNKS_TTL_S) -> Optional[int]:
         """
         Store processed chunks into Redis under a given key.
 
         This is used to decouple Celery task execution from Ray processing, allowing
         Celery to submit work and return immediately while Ray persists results for
-        a subsequent step to retrieve.
+        a subsequent step to retrieve. Chunks are written as zstd compressed msgpack
+        segments (see chunk_transport) with the manifest last, so the forward task
+        only picks them up once they are complete.
+
+        Returns:
+            The number of chunks stored, or None if they could not be stored
         """
         if not REDIS_BACKEND_URL:
             logger.error(
                 "REDIS_BACKEND_URL is not configured; cannot store chunks.")
-            return False
+            return None
         try:
             import redis
             client = redis.Redis.from_url(
-                REDIS_BACKEND_URL, decode_responses=True)
-            # Use a compact JSON for storage
+                REDIS_BACKEND_URL, decode_responses=False)
             if chunks is None:
                 logger.error(
                     f"[RayActor] store_chunks_in_redis received None chunks for key '{redis_key}'")
-                serialized = json.dumps([])
-            else:
-                try:
-                    serialized = json.dumps(chunks, ensure_ascii=False)
-                except Exception as ser_exc:
-                    logger.error(
-                        f"[RayActor] JSON serialization failed for key '{redis_key}': {ser_exc}")
-                    # Fallback to empty list to avoid poisoning Redis with invalid data
-                    serialized = json.dumps([])
-            client.set(redis_key, serialized)
-            # Optionally set an expiration to avoid leaks (e.g., 2 hours)
-            client.expire(redis_key, 2 * 60 * 60)
+                chunks = []
             try:
-                count_logged = len(chunks) if isinstance(chunks, list) else 0
-            except Exception:
-                count_logged = 0
+                stats = write_chunks(client, redis_key, chunks, ttl_s=ttl_s)
+            except (TypeError, ValueError) as ser_exc:
+                logger.error(
+                    f"[RayActor] Chunk serialization failed for key '{redis_key}': {ser_exc}")
+                # Fallback to empty list to avoid poisoning Redis with invalid data
+                stats = write_chunks(client, redis_key, [], ttl_s=ttl_s)
             logger.info(
-                f"[RayActor] Stored {count_logged} chunks in Redis at key '{redis_key}', value_len={len(serialized)}")
-            return True
+                f"[RayActor] Stored {stats['chunks']} chunks in Redis at key '{redis_key}', "
+                f"segments={stats['segments']}, compressed_len={stats['bytes']}")
+            return stats['chunks']
         except Exception as exc:
             logger.error(
                 f"Failed to store chunks in Redis at key {redis_key}: {exc}")
+            return None
+
+
+@ray.remote(num_cpus=0)
+class ChunkRefRegistryActor:
+    """
+    Keeps processed chunks alive in the Ray object store between the process and forward tasks.
+
+    Used when DATA_PROCESS_CHUNK_TRANSPORT is "object_ref": the process task registers the ObjectRef
+    returned by process_file instead of copying the chunks through Redis, and the forward task fetches
+    them straight from the object store. Entries are released by the forward task or expire after
+    DP_CHUNKS_TTL_S.
+
+    Holding a ref does not keep its object alive past its owner: Ray objects fate-share with the
+    worker that submitted process_file, i.e. the Celery worker of the process task. If that worker
+    exits before the forward task runs (crash, max_tasks_per_child recycling), the chunks are lost
+    and the forward task fails; the "redis" transport has no such dependency.
+    """
+
+    def __init__(self):
+        self._refs: Dict[str, Tuple[Any, float]] = {}
+
+    def put(self, key: str, refs: List[Any]) -> None:
+        """Hold refs[0]; the ref is wrapped in a list so Ray passes it through instead of resolving it"""
+        now = time.monotonic()
+        for expired in [k for k, (_, expires_at) in self._refs.items() if expires_at <= now]:
+            self._refs.pop(expired, None)
+        self._refs[key] = (refs[0], now + DP_CHUNKS_TTL_S)
+
+    def get(self, key: str) -> Optional[List[Any]]:
+        entry = self._refs.get(key)
+        return [entry[0]] if entry else None
+
+    def release(self, key: str) -> None:
+        self._refs.pop(key, None)
+
+
+# Processing lanes of the actor pool. Each lane has its own actors, so a large scanned PDF
+# cannot hold up the plain text files and spreadsheets queued behind it.
+TEXT_LANE = "text"
+SPREADSHEET_LANE = "spreadsheet"
+DOCUMENT_LANE = "document"
+LARGE_DOCUMENT_LANE = "large_document"
+
+# CPUs requested by the actors of each lane
+PROCESSING_LANE_CPUS = {
+    TEXT_LANE: 1,
+    SPREADSHEET_LANE: 1,
+    DOCUMENT_LANE: RAY_ACTOR_NUM_CPUS,
+    LARGE_DOCUMENT_LANE: RAY_ACTOR_NUM_CPUS,
+}
+
+TEXT_EXTENSIONS = {".txt", ".md", ".markdown", ".json", ".html", ".htm", ".xml"}
+SPREADSHEET_EXTENSIONS = {".xlsx", ".xls", ".csv", ".tsv"}
+
+
+def route_processing_lane(filename: str, file_size: int = 0, chunking_strategy: str = "basic") -> str:
+    """
+    Choose the actor pool lane for a file from its extension, size and chunking strategy.
+
+    Args:
+        filename: File name, path or URL of the file
+        file_size: File size in bytes, 0 if unknown
+        chunking_strategy: Chunking strategy of the task; "hi_res" always goes to the large document lane
+
+    Returns:
+        str: One of the PROCESSING_LANE_CPUS lanes
+    """
+    extension = os.path.splitext((filename or "").split("?", 1)[0])[1].lower()
+    if extension in TEXT_EXTENSIONS:
+        return TEXT_LANE
+    if extension in SPREADSHEET_EXTENSIONS:
+        return SPREADSHEET_LANE
+    if chunking_strategy == "hi_res" or file_size >= DP_LARGE_FILE_MB * 1024 * 1024:
+        return LARGE_DOCUMENT_LANE
+    return DOCUMENT_LANE
+
+
+def _create_processor_actor(num_cpus: int) -> Any:
+    return DataProcessorRayActor.options(num_cpus=num_cpus).remote()
+
+
+class _PoolLane:
+    """Actors and waiters of one processing lane"""
+
+    def __init__(self, num_cpus: int):
+        self.num_cpus = num_cpus
+        self.actors: Dict[str, Any] = {}
+        # Idle actor id -> time it became idle
+        self.idle: Dict[str, float] = {}
+        # Leased actor id -> time its lease expires unless renewed
+        self.leased: Dict[str, float] = {}
+        self.waiting = 0
+        self.leases = 0
+        self.condition = asyncio.Condition()
+
+
+@ray.remote(num_cpus=0)
+class DataProcessorPoolActor:
+    """
+    Elastic pool of DataProcessorRayActor instances, shared by all Celery workers of the cluster.
+
+    Every lane keeps between min_actors and max_actors actors. A lease is served by an idle actor,
+    otherwise by a new actor while the lane is below max_actors, otherwise it waits in the lane's
+    queue; actors idle for longer than idle_timeout_s are stopped again down to min_actors.
+
+    A lease lasts lease_ttl_s unless the holder renews it. Expired leases, left behind by Celery
+    workers that were killed while holding an actor, are reclaimed by stopping the actor, which may
+    still be running the dead worker's file, and freeing its slot.
+    """
+
+    def __init__(
+        self,
+        min_actors: int = DP_ACTOR_POOL_MIN_ACTORS,
+        max_actors: int = DP_ACTOR_POOL_MAX_ACTORS,
+        idle_timeout_s: float = DP_ACTOR_POOL_IDLE_TIMEOUT_S,
+        lease_ttl_s: float = DP_ACTOR_LEASE_TTL_S,
+    ):
+        self.max_actors = max(1, max_actors)
+        self.min_actors = max(0, min(min_actors, self.max_actors))
+        self.idle_timeout_s = idle_timeout_s
+        self.lease_ttl_s = lease_ttl_s
+        self._lanes = {lane: _PoolLane(num_cpus) for lane, num_cpus in PROCESSING_LANE_CPUS.items()}
+        self._reaper: Optional[asyncio.Task] = None
+        for lane in self._lanes.values():
+            for _ in range(self.min_actors):
+                lane.idle[self._spawn(lane)] = time.monotonic()
+
+    def _spawn(self, lane: _PoolLane) -> str:
+        actor_id = uuid.uuid4().hex
+        lane.actors[actor_id] = _create_processor_actor(lane.num_cpus)
+        return actor_id
+
+    def _stop(self, lane: _PoolLane, actor_id: str) -> None:
+        lane.idle.pop(actor_id, None)
+        actor = lane.actors.pop(actor_id, None)
+        if actor is not None:
+            try:
+                ray.kill(actor)
+            except Exception as e:
+                logger.warning(f"[ActorPool] Failed to stop actor {actor_id}: {e}")
+
+    def _reap_idle(self, lane: _PoolLane) -> None:
+        """Stop the actors idle for longer than idle_timeout_s, keeping min_actors"""
+        now = time.monotonic()
+        for actor_id, idle_since in sorted(lane.idle.items(), key=lambda item: item[1]):
+            if len(lane.actors) <= self.min_actors or now - idle_since < self.idle_timeout_s:
+                break
+            self._stop(lane, actor_id)
+
+    def _reclaim_expired(self, lane: _PoolLane) -> None:
+        """Stop the actors whose lease was not renewed in time and wake the waiters for their slots"""
+        now = time.monotonic()
+        expired = [actor_id for actor_id, expires_at in lane.leased.items() if expires_at <= now]
+        for actor_id in expired:
+            del lane.leased[actor_id]
+            logger.warning(f"[ActorPool] Lease of actor {actor_id} expired, reclaiming it")
+            self._stop(lane, actor_id)
+        while len(lane.actors) < self.min_actors:
+            lane.idle[self._spawn(lane)] = time.monotonic()
+        if expired:
+            lane.condition.notify(len(expired))
+
+    async def _reap_loop(self) -> None:
+        while True:
+            await asyncio.sleep(max(1.0, min(self.idle_timeout_s, self.lease_ttl_s) / 2))
+            for lane in self._lanes.values():
+                async with lane.condition:
+                    self._reclaim_expired(lane)
+                    self._reap_idle(lane)
+
+    async def acquire(self, lane_name: str, timeout_s: Optional[float] = None) -> Tuple[str, Any]:
+        """
+        Lease an actor of a lane, waiting while all of the lane's max_actors actors are busy.
+
+        Args:
+            lane_name: Lane of the actor
+            timeout_s: Longest wait for a free actor, None to wait indefinitely
+
+        Returns:
+            Tuple of the actor id, to be passed back to renew and release, and the actor handle
+
+        Raises:
+            TimeoutError: If no actor of the lane became free within timeout_s
+        """
+        if self._reaper is None:
+            self._reaper = asyncio.get_running_loop().create_task(self._reap_loop())
+        lane = self._lanes.get(lane_name) or self._lanes[DOCUMENT_LANE]
+        deadline = None if timeout_s is None else time.monotonic() + timeout_s
+        async with lane.condition:
+            lane.waiting += 1
+            try:
+                while True:
+                    if lane.idle:
+                        # The most recently used actor is the warmest one
+                        actor_id = max(lane.idle, key=lane.idle.get)
+                        del lane.idle[actor_id]
+                        break
+                    if len(lane.actors) < self.max_actors:
+                        actor_id = self._spawn(lane)
+                        logger.info(f"[ActorPool] Lane '{lane_name}' scaled up to {len(lane.actors)} actors")
+                        break
+                    if deadline is None:
+                        await lane.condition.wait()
+                        continue
+                    try:
+                        await asyncio.wait_for(lane.condition.wait(), deadline - time.monotonic())
+                    except asyncio.TimeoutError:
+                        # Pass on a wake-up that may have raced with the timeout
+                        lane.condition.notify()
+                        raise TimeoutError(
+                            f"No actor of lane '{lane_name}' became free within {timeout_s}s")
+            finally:
+                lane.waiting -= 1
+            lane.leases += 1
+            lane.leased[actor_id] = time.monotonic() + self.lease_ttl_s
+            return actor_id, lane.actors[actor_id]
+
+    def renew(self, lane_name: str, actor_id: str) -> bool:
+        """
+        Extend a lease by lease_ttl_s.
+
+        Returns:
+            False if the lease was already reclaimed
+        """
+        lane = self._lanes.get(lane_name) or self._lanes[DOCUMENT_LANE]
+        if actor_id not in lane.leased:
             return False
+        lane.leased[actor_id] = time.monotonic() + self.lease_ttl_s
+        return True
+
+    async def release(self, lane_name: str, actor_id: str, healthy: bool = True) -> None:
+        """Return a leased actor; an actor that died is stopped and replaced instead of reused"""
+        lane = self._lanes.get(lane_name) or self._lanes[DOCUMENT_LANE]
+        async with lane.condition:
+            # A lease that expired was reclaimed along with its actor
+            if lane.leased.pop(actor_id, None) is None or actor_id not in lane.actors:
+                return
+            if healthy:
+                lane.idle[actor_id] = time.monotonic()
+            else:
+                self._stop(lane, actor_id)
+                if len(lane.actors) < self.min_actors:
+                    lane.idle[self._spawn(lane)] = time.monotonic()
+            self._reap_idle(lane)
+            lane.condition.notify()
+
+    def stats(self) -> Dict[str, Any]:
+        """Utilization of every lane"""
+        lanes = {}
+        for name, lane in self._lanes.items():
+            busy = len(lane.actors) - len(lane.idle)
+            lanes[name] = {
+                "actors": len(lane.actors),
+                "busy": busy,
+                "idle": len(lane.idle),
+                "waiting": lane.waiting,
+                "leases": lane.leases,
+                "num_cpus_per_actor": lane.num_cpus,
+                "utilization": busy / self.max_actors,
+            }
+        return {"min_actors": self.min_actors, "max_actors": self.max_actors, "lanes": lanes}
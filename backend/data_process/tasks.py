@@ -2,32 +2,54 @@
 Celery tasks for data processing and vector storage
 """
 import asyncio
+import itertools
 import json
 import logging
 import os
 import threading
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import aiohttp
 import ray
 from celery import Task, chain, states
 from celery.exceptions import Retry
+from nexent.core.models.embedding_model import closing_async_http_sessions
 
 from consts.const import ELASTICSEARCH_SERVICE
 from utils.file_management_utils import get_file_size
 from .app import app
-from .ray_actors import DataProcessorRayActor
+from .chunk_transport import delete_chunks, open_chunks
+from .content_store import content_chunks_key, content_key, hash_file, lookup_content
+from .document_stream import Segment, iter_segments
+from .ray_actors import (
+    DOCUMENT_LANE,
+    ChunkRefRegistryActor,
+    DataProcessorPoolActor,
+    resolve_chunk_size_params,
+    route_processing_lane,
+)
 from consts.const import (
     REDIS_BACKEND_URL,
     FORWARD_REDIS_RETRY_DELAY_S,
     FORWARD_REDIS_RETRY_MAX,
     DISABLE_RAY_DASHBOARD,
+    DP_ACTOR_ACQUIRE_TIMEOUT_S,
+    DP_ACTOR_LEASE_TTL_S,
+    DATA_PROCESS_CHUNK_TRANSPORT,
+    DP_CONTENT_DEDUP,
+    DP_CONTENT_CACHE_TTL_S,
+    DP_FORWARD_COMMIT_TIMEOUT_S,
+    DP_FORWARD_SEGMENT_CHUNKS,
+    DP_FORWARD_SEGMENT_TIMEOUT_S,
 )
 
 
 logger = logging.getLogger("data_process.tasks")
 
+# Times a streamed upload starts again after the main service lost the segments of its session
+FORWARD_STREAM_MAX_RESTARTS = 3
+
 # Thread lock for initializing Ray to prevent race conditions
 ray_init_lock = threading.Lock()
 
@@ -72,7 +94,7 @@ def run_async(coro):
             loop = asyncio.get_running_loop()
         except RuntimeError:
             # No running loop, safe to use asyncio.run
-            return asyncio.run(coro)
+            return asyncio.run(closing_async_http_sessions(coro))
 
         # We're in an existing event loop context
         if loop.is_running():
@@ -91,7 +113,7 @@ def run_async(coro):
                     new_loop = asyncio.new_event_loop()
                     asyncio.set_event_loop(new_loop)
                     try:
-                        return new_loop.run_until_complete(coro)
+                        return new_loop.run_until_complete(closing_async_http_sessions(coro))
                     finally:
                         new_loop.close()
                         asyncio.set_event_loop(None)
@@ -108,23 +130,207 @@ def run_async(coro):
         raise
 
 
-# Initialize the data processing core LAZILY
-# This will be initialized on first task run by a worker process
-def get_ray_actor() -> Any:
+ACTOR_POOL_NAME = "nexent_data_processor_pool"
+
+# Leased actor (by id of its handle) -> (lane, pool actor id), for release_ray_actor
+_actor_leases: Dict[int, Tuple[str, str]] = {}
+_actor_leases_lock = threading.Lock()
+_lease_heartbeat: Optional[threading.Thread] = None
+# Extra time given to the pool to answer an acquire call that timed out on its side
+ACTOR_ACQUIRE_GRACE_S = 30
+
+
+def get_actor_pool() -> Any:
     """
-    Creates a new, anonymous DataProcessorRayActor instance for each call.
-    This allows for parallel execution of data processing tasks, with each
-    task running in its own actor.
+    Returns the cluster-wide DataProcessorPoolActor, creating it on first use.
     """
     with ray_init_lock:
         init_ray_in_worker()
-    actor = DataProcessorRayActor.remote()
+    return DataProcessorPoolActor.options(
+        name=ACTOR_POOL_NAME, lifetime="detached", get_if_exists=True).remote()
+
+
+# Actors are created LAZILY by the pool on the first tasks of each lane
+def get_ray_actor(lane: str = DOCUMENT_LANE) -> Any:
+    """
+    Leases a DataProcessorRayActor from the given lane of the actor pool.
+
+    Blocks while every actor of the lane is busy and the lane is at its maximum
+    size, for at most DP_ACTOR_ACQUIRE_TIMEOUT_S. The actor must be handed back
+    with release_ray_actor; until then its lease is renewed in the background.
+    """
+    global _lease_heartbeat
+    actor_id, actor = ray.get(
+        get_actor_pool().acquire.remote(lane, DP_ACTOR_ACQUIRE_TIMEOUT_S),
+        timeout=DP_ACTOR_ACQUIRE_TIMEOUT_S + ACTOR_ACQUIRE_GRACE_S)
+    with _actor_leases_lock:
+        _actor_leases[id(actor)] = (lane, actor_id)
+        if _lease_heartbeat is None:
+            _lease_heartbeat = threading.Thread(
+                target=_lease_heartbeat_loop, name="actor-lease-heartbeat", daemon=True)
+            _lease_heartbeat.start()
 
     logger.debug(
-        "Successfully created a new DataProcessorRayActor for a task.")
+        f"Leased DataProcessorRayActor {actor_id} from lane '{lane}'.")
     return actor
 
 
+def release_ray_actor(actor: Any, error: Optional[BaseException] = None) -> None:
+    """
+    Returns an actor leased with get_ray_actor to the pool.
+
+    An actor whose process died (error is a RayActorError) is dropped from the pool.
+    """
+    if actor is None:
+        return
+    with _actor_leases_lock:
+        lease = _actor_leases.pop(id(actor), None)
+    if lease is None:
+        return
+    lane, actor_id = lease
+    try:
+        healthy = not isinstance(error, ray.exceptions.RayActorError)
+        get_actor_pool().release.remote(lane, actor_id, healthy)
+    except Exception as exc:
+        logger.warning(f"Failed to release actor {actor_id} to lane '{lane}': {exc}")
+
+
+def renew_actor_leases() -> None:
+    """
+    Renews the leases of the actors held by this worker process, so the pool only
+    reclaims the actors of workers that died.
+    """
+    with _actor_leases_lock:
+        leases = list(_actor_leases.values())
+    if not leases:
+        return
+    pool = get_actor_pool()
+    for lane, actor_id in leases:
+        try:
+            pool.renew.remote(lane, actor_id)
+        except Exception as exc:
+            logger.warning(f"Failed to renew the lease of actor {actor_id} in lane '{lane}': {exc}")
+
+
+def _lease_heartbeat_loop() -> None:
+    global _lease_heartbeat
+    while True:
+        time.sleep(DP_ACTOR_LEASE_TTL_S / 3)
+        with _actor_leases_lock:
+            if not _actor_leases:
+                _lease_heartbeat = None
+                return
+        renew_actor_leases()
+
+
+def get_actor_pool_stats() -> Dict[str, Any]:
+    """
+    Returns the utilization of the actor pool lanes, or an empty dict if no pool runs yet.
+    """
+    with ray_init_lock:
+        init_ray_in_worker()
+    try:
+        pool = ray.get_actor(ACTOR_POOL_NAME)
+    except ValueError:
+        return {}
+    return ray.get(pool.stats.remote())
+
+
+CHUNK_REF_REGISTRY_NAME = "nexent_chunk_ref_registry"
+
+
+def get_chunk_ref_registry() -> Any:
+    """
+    Returns the cluster-wide ChunkRefRegistryActor, creating it on first use.
+    """
+    with ray_init_lock:
+        init_ray_in_worker()
+    return ChunkRefRegistryActor.options(
+        name=CHUNK_REF_REGISTRY_NAME, lifetime="detached", get_if_exists=True).remote()
+
+
+def hand_off_chunks(actor: Any, chunks_key: str, chunks_ref: Any) -> Tuple[str, int]:
+    """
+    Make the chunks produced by a process_file call available to the forward task.
+
+    The chunks are passed on as the ObjectRef returned by process_file and never
+    fetched into this worker; only their count comes back from the actor. With the
+    "object_ref" transport they stay in the Ray object store (see ChunkRefRegistryActor
+    for the lifetime of the ref); otherwise the actor writes them to Redis as
+    compressed segments under chunks_key. Both calls wait for process_file to finish.
+
+    Returns:
+        The transport used, to be passed on to the forward task, and the number of chunks
+
+    Raises:
+        RuntimeError: If the actor could not store the chunks in Redis
+    """
+    if DATA_PROCESS_CHUNK_TRANSPORT == "object_ref":
+        chunks_count = ray.get(actor.count_chunks.remote(chunks_ref))
+        # Wait for the registration so the forward task can never look the key up first
+        ray.get(get_chunk_ref_registry().put.remote(chunks_key, [chunks_ref]))
+        return "object_ref", chunks_count
+    chunks_count = ray.get(actor.store_chunks_in_redis.remote(chunks_key, chunks_ref))
+    if chunks_count is None:
+        raise RuntimeError(f"Failed to store chunks in Redis at key '{chunks_key}'")
+    return "redis", chunks_count
+
+
+def release_chunk_hand_off(processed_data: Dict) -> None:
+    """
+    Free the chunks handed off by the process task once they have been indexed.
+    """
+    chunks_key = processed_data.get('redis_key')
+    # Content store entries are shared with other uploads of the same file and expire on their own
+    if not chunks_key or processed_data.get('chunks') or processed_data.get('shared_chunks'):
+        return
+    try:
+        if processed_data.get('chunks_transport') == "object_ref":
+            get_chunk_ref_registry().release.remote(chunks_key)
+        elif REDIS_BACKEND_URL:
+            import redis
+            client = redis.Redis.from_url(
+                REDIS_BACKEND_URL, decode_responses=False)
+            delete_chunks(client, chunks_key)
+    except Exception as exc:
+        # The hand-off expires on its own, so a failed cleanup is not an error
+        logger.warning(f"Failed to release chunks at key '{chunks_key}': {exc}")
+
+
+def find_processed_content(
+        source: str,
+        source_type: str,
+        chunking_strategy: str,
+        embedding_model_id: Optional[int] = None,
+        tenant_id: Optional[str] = None,
+) -> Tuple[Optional[str], Optional[int]]:
+    """
+    Look a file up in the content store by the sha256 of its bytes and its processing parameters.
+
+    Returns:
+        (content key, number of stored chunks); the count is None on a miss and the key is None when
+        deduplication is disabled or the lookup failed
+    """
+    if not (DP_CONTENT_DEDUP and REDIS_BACKEND_URL):
+        return None, None
+    try:
+        chunk_params = resolve_chunk_size_params(embedding_model_id, tenant_id)
+        key = content_key(
+            hash_file(source, source_type),
+            chunking_strategy,
+            chunk_params.get('max_characters'),
+            chunk_params.get('new_after_n_chars'),
+        )
+        import redis
+        client = redis.Redis.from_url(
+            REDIS_BACKEND_URL, decode_responses=False)
+        return key, lookup_content(client, key)
+    except Exception as exc:
+        logger.warning(
+            f"Content store lookup failed for '{source}', processing the file: {exc}")
+        return None, None
+
+
 class LoggingTask(Task):
     """Base task class with enhanced logging"""
 
@@ -193,10 +399,40 @@ def process(
             'stage': 'extracting_text'
         }
     )
-    # Get the data processor instance
-    actor = get_ray_actor()
-
+    actor = None
+    actor_error = None
     try:
+        # A file already processed with the same parameters is only indexed by the forward task
+        content_id, stored_chunks = find_processed_content(
+            source, source_type, chunking_strategy, embedding_model_id, tenant_id)
+        if stored_chunks is not None:
+            elapsed_time = time.time() - start_time
+            logger.info(
+                f"[{self.request.id}] PROCESS TASK: Reusing {stored_chunks} chunks of identical content '{content_id}'")
+            self.update_state(
+                state=states.SUCCESS,
+                meta={
+                    'chunks_count': stored_chunks,
+                    'processing_time': elapsed_time,
+                    'source': source,
+                    'index_name': index_name,
+                    'original_filename': original_filename,
+                    'task_name': 'process',
+                    'stage': 'text_extracted',
+                    'deduplicated': True,
+                }
+            )
+            return {
+                'redis_key': content_chunks_key(content_id),
+                'chunks_transport': "redis",
+                'shared_chunks': True,
+                'chunks': None,
+                'source': source,
+                'index_name': index_name,
+                'original_filename': original_filename,
+                'task_id': task_id
+            }
+
         # Process the file based on the source type
         file_size_mb = 0
         if source_type == "local":
@@ -210,6 +446,11 @@ def process(
             logger.info(
                 f"[{self.request.id}] PROCESS TASK: File size: {file_size_mb:.2f}MB")
 
+            # Lease a data processor from the pool lane matching the file
+            lane = route_processing_lane(
+                original_filename or source, file_size, chunking_strategy)
+            actor = get_ray_actor(lane)
+
             # The unified actor call, mapping 'file' source_type to 'local' destination
             # Submit Ray work and WAIT for processing to complete
             logger.info(
@@ -223,18 +464,14 @@ def process(
                 tenant_id=tenant_id,
                 **params
             )
-            # Wait for Ray processing to complete (this keeps task in STARTED/"PROCESSING" state)
+            # Hand the chunks off to the forward task (Redis segments or Ray object store), waiting for
+            # Ray processing to complete (this keeps task in STARTED/"PROCESSING" state)
             logger.info(
                 f"[{self.request.id}] PROCESS TASK: Waiting for Ray processing to complete...")
-            chunks = ray.get(chunks_ref)
-            logger.info(
-                f"[{self.request.id}] PROCESS TASK: Ray processing completed, got {len(chunks) if chunks else 0} chunks")
-
-            # Persist chunks into Redis via Ray (synchronous to ensure data is ready before forward task)
             redis_key = f"dp:{task_id}:chunks"
-            actor.store_chunks_in_redis.remote(redis_key, chunks)
+            chunks_transport, chunks_count = hand_off_chunks(actor, redis_key, chunks_ref)
             logger.info(
-                f"[{self.request.id}] PROCESS TASK: Stored chunks in Redis at key '{redis_key}'")
+                f"[{self.request.id}] PROCESS TASK: Ray processing completed, handed off {chunks_count} chunks at key '{redis_key}' via {chunks_transport}")
 
             end_time = time.time()
             elapsed_time = end_time - start_time
@@ -247,6 +484,11 @@ def process(
             logger.info(
                 f"[{self.request.id}] PROCESS TASK: Processing from URL: {source}")
 
+            # Lease a data processor from the pool lane matching the file
+            lane = route_processing_lane(
+                original_filename or source, get_file_size(source_type, source), chunking_strategy)
+            actor = get_ray_actor(lane)
+
             # For URL source, core.py expects a non-local destination to trigger URL fetching
             logger.info(
                 f"[{self.request.id}] PROCESS TASK: Submitting Ray processing for URL='{source}', strategy='{chunking_strategy}', destination='{source_type}', model_id={embedding_model_id}")
@@ -259,18 +501,14 @@ def process(
                 tenant_id=tenant_id,
                 **params
             )
-            # Wait for Ray processing to complete (this keeps task in STARTED/"PROCESSING" state)
+            # Hand the chunks off to the forward task (Redis segments or Ray object store), waiting for
+            # Ray processing to complete (this keeps task in STARTED/"PROCESSING" state)
             logger.info(
                 f"[{self.request.id}] PROCESS TASK: Waiting for Ray processing to complete...")
-            chunks = ray.get(chunks_ref)
-            logger.info(
-                f"[{self.request.id}] PROCESS TASK: Ray processing completed, got {len(chunks) if chunks else 0} chunks")
-
-            # Persist chunks into Redis via Ray (synchronous to ensure data is ready before forward task)
             redis_key = f"dp:{task_id}:chunks"
-            actor.store_chunks_in_redis.remote(redis_key, chunks)
+            chunks_transport, chunks_count = hand_off_chunks(actor, redis_key, chunks_ref)
             logger.info(
-                f"[{self.request.id}] PROCESS TASK: Stored chunks in Redis at key '{redis_key}'")
+                f"[{self.request.id}] PROCESS TASK: Ray processing completed, handed off {chunks_count} chunks at key '{redis_key}' via {chunks_transport}")
 
             end_time = time.time()
             elapsed_time = end_time - start_time
@@ -282,12 +520,17 @@ def process(
             raise NotImplementedError(
                 f"Source type '{source_type}' not yet supported")
 
+        # Keep the chunks in the content store for later uploads of the same file
+        if content_id and chunks_count:
+            actor.store_chunks_in_redis.remote(
+                content_chunks_key(content_id), chunks_ref, DP_CONTENT_CACHE_TTL_S)
+
         # Update task state to SUCCESS after Ray processing completes
         # This transitions from STARTED (PROCESSING) to SUCCESS (WAIT_FOR_FORWARDING)
         self.update_state(
             state=states.SUCCESS,
             meta={
-                'chunks_count': len(chunks) if chunks else 0,
+                'chunks_count': chunks_count,
                 'processing_time': elapsed_time,
                 'source': source,
                 'index_name': index_name,
@@ -305,6 +548,7 @@ def process(
         # Prepare data for the next task in the chain; pass redis_key
         returned_data = {
             'redis_key': f"dp:{task_id}:chunks",
+            'chunks_transport': chunks_transport,
             'chunks': None,
             'source': source,
             'index_name': index_name,
@@ -315,6 +559,7 @@ def process(
         return returned_data
 
     except Exception as e:
+        actor_error = e
         logger.error(f"Error processing file {source}: {str(e)}")
         try:
             error_info = {
@@ -344,6 +589,8 @@ def process(
                 }
             )
             raise
+    finally:
+        release_ray_actor(actor, actor_error)
 
 
 @app.task(bind=True, base=LoggingTask, name='data_process.tasks.forward', queue='forward_q')
@@ -378,8 +625,24 @@ def forward(
 
     try:
         chunks = processed_data.get('chunks')
+        # With the object_ref transport the chunks are still in the Ray object store
+        if (not chunks) and processed_data.get('chunks_transport') == "object_ref":
+            chunks_key = processed_data.get('redis_key')
+            try:
+                refs = ray.get(get_chunk_ref_registry().get.remote(chunks_key))
+                if not refs:
+                    raise KeyError(f"no chunks registered under '{chunks_key}'")
+                chunks = ray.get(refs[0])
+            except Exception as exc:
+                raise Exception(json.dumps({
+                    "message": f"Failed to retrieve chunks from Ray object store: {str(exc)}",
+                    "index_name": original_index_name,
+                    "task_name": "forward",
+                    "source": original_source,
+                    "original_filename": filename
+                }, ensure_ascii=False))
         # If chunks are not in payload, try loading from Redis via the redis_key
-        if (not chunks) and processed_data.get('redis_key'):
+        elif (not chunks) and processed_data.get('redis_key'):
             redis_key = processed_data.get('redis_key')
             if not REDIS_BACKEND_URL:
                 raise Exception(json.dumps({
@@ -392,20 +655,17 @@ def forward(
             try:
                 import redis
                 client = redis.Redis.from_url(
-                    REDIS_BACKEND_URL, decode_responses=True)
-                cached = client.get(redis_key)
-                if cached:
-                    try:
-                        logger.debug(
-                            f"[{self.request.id}] FORWARD TASK: Retrieved Redis key '{redis_key}', payload_length={len(cached)}")
-                        chunks = json.loads(cached)
-                    except json.JSONDecodeError as jde:
-                        # Log raw prefix to help diagnose incorrect writes
-                        raw_preview = cached[:120] if isinstance(
-                            cached, str) else str(type(cached))
-                        logger.error(
-                            f"[{self.request.id}] FORWARD TASK: JSON decode error for key '{redis_key}': {str(jde)}; raw_prefix={raw_preview!r}")
-                        raise
+                    REDIS_BACKEND_URL, decode_responses=False)
+                try:
+                    # Segments are fetched and decoded one at a time while the chunks are formatted below
+                    chunks = open_chunks(client, redis_key)
+                except ValueError as ve:
+                    logger.error(
+                        f"[{self.request.id}] FORWARD TASK: Unreadable chunks at key '{redis_key}': {str(ve)}")
+                    raise
+                if chunks is not None:
+                    logger.debug(
+                        f"[{self.request.id}] FORWARD TASK: Opened chunks at Redis key '{redis_key}', chunk_count={len(chunks)}")
                 else:
                     # No busy-wait: release the worker slot and retry later
                     retry_num = getattr(self.request, 'retries', 0)
@@ -465,36 +725,42 @@ def forward(
         if len(chunks) == 0:
             logger.warning(
                 f"[{self.request.id}] FORWARD TASK: Empty chunks list received for source {original_source}")
-        formatted_chunks = []
-        for i, chunk in enumerate(chunks):
-            # Extract text and metadata
-            content = chunk.get("content", "")
-            metadata = chunk.get("metadata", {})
-
-            # Validate chunk content
-            if not content or len(content.strip()) == 0:
-                logger.warning(
-                    f"[{self.request.id}] FORWARD TASK: Chunk {i+1} has empty text content, skipping")
-                continue
-
-            file_size = get_file_size(source_type, original_source) if isinstance(
-                original_source, str) else 0
-
-            # Format as expected by the Elasticsearch API
-            formatted_chunk = {
-                "metadata": metadata,
-                "filename": filename or (os.path.basename(original_source) if original_source and isinstance(original_source, str) else ""),
-                "path_or_url": original_source,
-                "content": content,
-                "process_source": "Unstructured",
-                "source_type": source_type,
-                "file_size": file_size,
-                "create_time": metadata.get("creation_date"),
-                "date": metadata.get("date"),
-            }
-            formatted_chunks.append(formatted_chunk)
+        # File-level metadata is resolved once, not for every chunk
+        file_size = get_file_size(source_type, original_source) if isinstance(
+            original_source, str) else 0
+        document_filename = filename or (os.path.basename(original_source) if original_source and isinstance(
+            original_source, str) else "")
+
+        def iter_formatted_chunks():
+            for i, chunk in enumerate(chunks):
+                # Extract text and metadata
+                content = chunk.get("content", "")
+                metadata = chunk.get("metadata", {})
+
+                # Validate chunk content
+                if not content or len(content.strip()) == 0:
+                    logger.warning(
+                        f"[{self.request.id}] FORWARD TASK: Chunk {i+1} has empty text content, skipping")
+                    continue
+
+                # Format as expected by the Elasticsearch API
+                yield {
+                    "metadata": metadata,
+                    "filename": document_filename,
+                    "path_or_url": original_source,
+                    "content": content,
+                    "process_source": "Unstructured",
+                    "source_type": source_type,
+                    "file_size": file_size,
+                    "create_time": metadata.get("creation_date"),
+                    "date": metadata.get("date"),
+                }
 
-        if len(formatted_chunks) == 0:
+        # Chunks are formatted and packed lazily, one segment at a time; the first one is packed here so an
+        # empty file fails before the main service is contacted
+        segments = iter_segments(iter_formatted_chunks(), DP_FORWARD_SEGMENT_CHUNKS)
+        first_segment = next(segments, None)
+        if first_segment is None:
             raise Exception(json.dumps({
                 "message": "No valid chunks to forward after formatting",
                 "index_name": original_index_name,
@@ -503,52 +769,59 @@ def forward(
                 "original_filename": original_filename
             }, ensure_ascii=False))
 
-        async def index_documents():
-            elasticsearch_url = ELASTICSEARCH_SERVICE
-            if not elasticsearch_url:
-                raise Exception(json.dumps({
-                    "message": "ELASTICSEARCH_SERVICE env is not set",
-                    "index_name": original_index_name,
-                    "task_name": "forward",
-                    "source": original_source,
-                    "original_filename": original_filename
-                }, ensure_ascii=False))
-            route_url = f"/indices/{original_index_name}/documents"
-            full_url = elasticsearch_url + route_url
-            headers = {"Content-Type": "application/json"}
-            if authorization:
-                headers["Authorization"] = authorization
+        def forward_error(message: str) -> Exception:
+            return Exception(json.dumps({
+                "message": message,
+                "index_name": original_index_name,
+                "task_name": "forward",
+                "source": original_source,
+                "original_filename": original_filename
+            }, ensure_ascii=False))
 
+        async def post_segment(session, full_url: str, headers: Dict[str, str], segment: Segment) -> Dict:
+            """Send one segment, retrying only this segment; returns the acknowledgement or the 409 detail"""
+            params = {
+                "session_id": task_id,
+                "offset": segment.offset,
+                "final": "true" if segment.final else "false",
+                # The chunks are the complete new version of the file, unchanged chunks keep their embeddings
+                "incremental": "true",
+            }
+            timeout = aiohttp.ClientTimeout(
+                total=DP_FORWARD_COMMIT_TIMEOUT_S if segment.final else DP_FORWARD_SEGMENT_TIMEOUT_S)
             max_retries = 5
             retry_delay = 5
-            for retry in range(max_retries):
+            busy_waited = 0
+            retry = 0
+            while True:
                 try:
-                    connector = aiohttp.TCPConnector(verify_ssl=False)
-                    # Increased timeout for large documents
-                    timeout = aiohttp.ClientTimeout(total=120)
-
-                    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
-                        async with session.post(
-                            full_url,
-                            headers=headers,
-                            json=formatted_chunks,
-                            raise_for_status=True
-                        ) as response:
-                            result = await response.json()
-                            return result
+                    async with session.post(
+                        full_url,
+                        headers=headers,
+                        params=params,
+                        data=segment.body,
+                        timeout=timeout
+                    ) as response:
+                        if response.status == 429 and busy_waited < DP_FORWARD_COMMIT_TIMEOUT_S:
+                            # Backpressure: the main service is committing other files, wait without
+                            # spending a retry
+                            wait_time = int(response.headers.get("Retry-After", retry_delay))
+                            logger.info(
+                                f"[{self.request.id}] FORWARD TASK: Main service busy, resending segment at chunk {segment.offset} in {wait_time}s")
+                            busy_waited += wait_time
+                            await asyncio.sleep(wait_time)
+                            continue
+                        if response.status == 409:
+                            return (await response.json()).get("detail", {})
+                        response.raise_for_status()
+                        return await response.json()
 
                 except aiohttp.ClientResponseError as e:
                     if e.status == 503 and retry < max_retries - 1:
                         wait_time = retry_delay * (retry + 1)
                         await asyncio.sleep(wait_time)
                     else:
-                        raise Exception(json.dumps({
-                            "message": f"ElasticSearch service unavailable: {str(e)}",
-                            "index_name": original_index_name,
-                            "task_name": "forward",
-                            "source": original_source,
-                            "original_filename": original_filename
-                        }, ensure_ascii=False))
+                        raise forward_error(f"ElasticSearch service unavailable: {str(e)}")
                 except aiohttp.ClientConnectorError as e:
                     logger.error(
                         f"[{self.request.id}] FORWARD TASK: Connection error to {full_url}: {str(e)}")
@@ -558,13 +831,7 @@ def forward(
                             f"[{self.request.id}] FORWARD TASK: Connection error when indexing documents: {str(e)}. Retrying in {wait_time}s...")
                         await asyncio.sleep(wait_time)
                     else:
-                        raise Exception(json.dumps({
-                            "message": f"Failed to connect to API: {str(e)}",
-                            "index_name": original_index_name,
-                            "task_name": "forward",
-                            "source": original_source,
-                            "original_filename": original_filename
-                        }, ensure_ascii=False))
+                        raise forward_error(f"Failed to connect to API: {str(e)}")
                 except asyncio.TimeoutError as e:
                     if retry < max_retries - 1:
                         wait_time = retry_delay * (retry + 1)
@@ -572,13 +839,7 @@ def forward(
                             f"[{self.request.id}] FORWARD TASK: Timeout when indexing documents: {str(e)}. Retrying in {wait_time}s...")
                         await asyncio.sleep(wait_time)
                     else:
-                        raise Exception(json.dumps({
-                            "message": f"Timeout after {max_retries} attempts: {str(e)}",
-                            "index_name": original_index_name,
-                            "task_name": "forward",
-                            "source": original_source,
-                            "original_filename": original_filename
-                        }, ensure_ascii=False))
+                        raise forward_error(f"Timeout after {max_retries} attempts: {str(e)}")
                 except Exception as e:
                     if retry < max_retries - 1:
                         wait_time = retry_delay * (retry + 1)
@@ -586,16 +847,46 @@ def forward(
                             f"[{self.request.id}] FORWARD TASK: Unexpected error when indexing documents: {str(e)}. Retrying in {wait_time}s...")
                         await asyncio.sleep(wait_time)
                     else:
-                        raise Exception(json.dumps({
-                            "message": f"Unexpected error when indexing documents: {str(e)}",
-                            "index_name": original_index_name,
-                            "task_name": "forward",
-                            "source": original_source,
-                            "original_filename": original_filename
-                        }, ensure_ascii=False))
+                        raise forward_error(f"Unexpected error when indexing documents: {str(e)}")
+                retry += 1
+
+        async def index_documents():
+            elasticsearch_url = ELASTICSEARCH_SERVICE
+            if not elasticsearch_url:
+                raise forward_error("ELASTICSEARCH_SERVICE env is not set")
+            full_url = elasticsearch_url + f"/indices/{original_index_name}/documents/stream"
+            headers = {"Content-Type": "application/x-ndjson"}
+            if authorization:
+                headers["Authorization"] = authorization
+
+            connector = aiohttp.TCPConnector(verify_ssl=False)
+            async with aiohttp.ClientSession(connector=connector) as session:
+                pending = itertools.chain([first_segment], segments)
+                resume_offset = 0
+                for _ in range(FORWARD_STREAM_MAX_RESTARTS + 1):
+                    for segment in pending:
+                        # Segments stored by an earlier attempt are skipped, the final one always commits
+                        if segment.offset + segment.count <= resume_offset and not segment.final:
+                            continue
+                        ack = await post_segment(session, full_url, headers, segment)
+                        if ack.get("committed"):
+                            return ack
+                        if "next_offset" not in ack:
+                            raise forward_error(f"Unexpected API response format from main_server: {ack}")
+                        if ack["next_offset"] < segment.offset:
+                            # The ingestion session lost segments (e.g. expired), start again from its offset
+                            logger.warning(
+                                f"[{self.request.id}] FORWARD TASK: Main service expects chunk {ack['next_offset']}, restarting the upload from there")
+                            resume_offset = ack["next_offset"]
+                            break
+                        resume_offset = ack["next_offset"]
+                    else:
+                        raise forward_error("Main service did not commit the final segment")
+                    pending = iter_segments(iter_formatted_chunks(), DP_FORWARD_SEGMENT_CHUNKS)
+                raise forward_error(f"Upload restarted {FORWARD_STREAM_MAX_RESTARTS} times without completing")
 
         logger.info(
-            f"[{self.request.id}] FORWARD TASK: Starting ES indexing for {len(formatted_chunks)} chunks to index '{original_index_name}'...")
+            f"[{self.request.id}] FORWARD TASK: Starting streamed ES indexing to index '{original_index_name}'...")
         es_result = run_async(index_documents())
         logger.debug(
             f"[{self.request.id}] FORWARD TASK: API response from main_server for source '{original_source}': {es_result}")
@@ -603,7 +894,7 @@ def forward(
         if isinstance(es_result, dict) and es_result.get("success"):
             total_indexed = es_result.get("total_indexed", 0)
             total_submitted = es_result.get(
-                "total_submitted", len(formatted_chunks))
+                "total_submitted", es_result.get("next_offset", 0))
             logger.debug(f"[{self.request.id}] FORWARD TASK: main_server reported {total_indexed}/{total_submitted} documents indexed successfully for '{original_source}'. Message: {es_result.get('message')}")
 
             if total_indexed < total_submitted:
@@ -654,6 +945,8 @@ def forward(
             }
         )
 
+        release_chunk_hand_off(processed_data)
+
         logger.info(
             f"[{self.request.id}] FORWARD TASK: Successfully stored {len(chunks)} chunks to index {original_index_name} in {end_time - start_time:.2f}s")
         return {
@@ -801,12 +1094,15 @@ def process_sync(
     logger.info(
         f"Synchronous processing file: {source} with strategy: {chunking_strategy}")
 
-    # Get the data processor instance
-    actor = get_ray_actor()
-
+    actor = None
+    actor_error = None
     try:
         # Process the file based on the source type
         if source_type == "local":
+            # Lease a data processor from the pool lane matching the file
+            file_size = os.path.getsize(source) if os.path.exists(source) else 0
+            actor = get_ray_actor(route_processing_lane(
+                source, file_size, chunking_strategy))
             # The unified actor call, mapping 'file' source_type to 'local' destination
             chunks_ref = actor.process_file.remote(
                 source,
@@ -816,6 +1112,7 @@ def process_sync(
                 **params
             )
 
+            # The chunks are the result of this task, so they are fetched here unlike in process
             chunks = ray.get(chunks_ref)
         else:
             raise NotImplementedError(
@@ -856,6 +1153,7 @@ def process_sync(
         }
 
     except Exception as e:
+        actor_error = e
         logger.error(f"Error synchronously processing file {source}: {str(e)}")
 
         # Update task state to FAILURE with custom metadata only if in Celery context
@@ -872,3 +1170,5 @@ def process_sync(
 
         # Re-raise to let Celery handle exception serialization
         raise
+    finally:
+        release_ray_actor(actor, actor_error)
@@ -17,6 +17,7 @@ Usage:
     QUEUES=forward_q WORKER_CONCURRENCY=2 python worker.py
 """
 
+import json
 import logging
 import os
 import sys
@@ -37,10 +38,13 @@ from celery.signals import (
 from consts.const import (
     CELERY_TASK_TIME_LIMIT,
     CELERY_WORKER_PREFETCH_MULTIPLIER,
+    DP_TASK_REGISTRY,
+    DP_TASK_RESULT_TTL_S,
     ELASTICSEARCH_SERVICE,
     QUEUES,
     RAY_ADDRESS,
     RAY_preallocate_plasma,
+    REDIS_BACKEND_URL,
     REDIS_URL,
     WORKER_CONCURRENCY,
     WORKER_NAME,
@@ -48,6 +52,7 @@ from consts.const import (
 
 from .app import app
 from .ray_config import RayConfig
+from utils.task_registry_utils import record_task_status
 
 # Global worker state for monitoring and debugging
 worker_state = {
@@ -63,6 +68,16 @@ worker_state = {
 
 logger = logging.getLogger("data_process.worker")
 
+# Tasks whose status is kept in the task registry, by Celery task name
+REGISTERED_TASK_NAMES = {
+    'data_process.tasks.process': 'process',
+    'data_process.tasks.forward': 'forward',
+}
+# Result fields copied into the registry record of a successful task
+REGISTERED_RESULT_FIELDS = ('chunks_count', 'processing_time', 'storage_time')
+
+_registry_client = None
+
 
 # ============================================================================
 # WORKER INITIALIZATION SIGNALS
@@ -220,6 +235,7 @@ def worker_shutdown_handler(**kwargs):
 def task_prerun_handler(sender=None, task_id=None, task=None, args=None, kwargs=None, **kwds):
     """Handler before task execution"""
     logger.debug(f"📋 Task started: {task.name}[{task_id}]")
+    update_task_registry(task.name, task_id, kwargs, 'STARTED', created_at=time.time())
 
 
 @task_postrun.connect
@@ -231,6 +247,11 @@ def task_postrun_handler(sender=None, task_id=None, task=None, args=None, kwargs
         pass
     else:
         logger.debug(f"⚠️ Task ended: {task.name}[{task_id}] - State: {state}")
+    if state:
+        result_fields = {}
+        if state == 'SUCCESS' and isinstance(retval, dict):
+            result_fields = {key: retval[key] for key in REGISTERED_RESULT_FIELDS if key in retval}
+        update_task_registry(task.name, task_id, kwargs, state, **result_fields)
 
 
 @task_failure.connect
@@ -239,6 +260,54 @@ def task_failure_handler(sender=None, task_id=None, exception=None, einfo=None,
     worker_state['tasks_failed'] += 1
     logger.error(
         f"❌ Task failed: {sender.name}[{task_id}] - Exception: {str(exception)}")
+    update_task_registry(sender.name, task_id, kwds.get('kwargs'), 'FAILURE',
+                         error=_task_error_message(exception))
+
+
+# ============================================================================
+# Task status registry
+# ============================================================================
+def get_registry_client():
+    """Redis client of the task registry, created on first use in each worker process"""
+    global _registry_client
+    if _registry_client is None:
+        import redis
+        _registry_client = redis.Redis.from_url(REDIS_BACKEND_URL, decode_responses=True)
+    return _registry_client
+
+
+def update_task_registry(celery_task_name: str, task_id: str, task_kwargs: dict, status: str,
+                         created_at: float = None, **fields) -> None:
+    """Record the status of a process or forward task; other tasks and tasks without an index are ignored"""
+    task_name = REGISTERED_TASK_NAMES.get(celery_task_name)
+    task_kwargs = task_kwargs or {}
+    index_name = task_kwargs.get('index_name')
+    if not (DP_TASK_REGISTRY and REDIS_BACKEND_URL and task_name and index_name and task_id):
+        return
+    try:
+        record_task_status(
+            get_registry_client(), task_id, task_name, index_name, status, created_at=created_at,
+            ttl_s=DP_TASK_RESULT_TTL_S,
+            path_or_url=task_kwargs.get('source'),
+            original_filename=task_kwargs.get('original_filename'),
+            source_type=task_kwargs.get('source_type'),
+            **fields,
+        )
+    except Exception as e:
+        # The registry is a read path optimization, a task must not fail because of it
+        logger.warning(f"Failed to update task registry for {task_name}[{task_id}]: {str(e)}")
+
+
+def _task_error_message(exception) -> str:
+    """Error message of a failed task; tasks raise their error info as JSON with a message field"""
+    message = str(exception)
+    try:
+        error_info = json.loads(message)
+    except Exception:
+        return message
+    if isinstance(error_info, dict) and error_info.get('message') is not None:
+        return str(error_info['message'])
+    return message
 
 
 # ============================================================================
@@ -242,6 +242,24 @@ def get_file_stream(object_name: str, bucket: Optional[str] = None) -> Optional[
         return None
 
 
+def open_file_stream(object_name: str, bucket: Optional[str] = None) -> Optional[BinaryIO]:
+    """
+    Open a file of MinIO storage as a stream read straight from storage
+
+    Unlike get_file_stream the object is not loaded into memory, so callers can read large files block by block.
+    The caller must close the stream.
+
+    Args:
+        object_name: Object name in MinIO
+        bucket: Bucket name, if not specified use default bucket
+
+    Returns:
+        Optional[BinaryIO]: The storage stream, or None if failed
+    """
+    success, result = minio_client.get_file_stream(object_name, bucket)
+    return result if success else None
+
+
 def get_content_type(file_path: str) -> str:
     """
     Get content type based on file extension
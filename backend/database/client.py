@@ -211,6 +211,20 @@ class MinioClient:
         """
         return self._storage_client.get_file_stream(object_name, bucket)
 
+    def set_prefix_expiration(self, prefix: str, days: int, bucket: Optional[str] = None) -> Tuple[bool, str]:
+        """
+        Make objects under a prefix expire a number of days after their creation
+
+        Args:
+            prefix: Object name prefix
+            days: Days after creation an object is removed
+            bucket: Bucket name, if not specified use default bucket
+
+        Returns:
+            Tuple[bool, str]: (Success status, Success message or error message)
+        """
+        return self._storage_client.set_prefix_expiration(prefix, days, bucket)
+
 
 # Create global database and MinIO client instances
 db_client = PostgresClient()
@@ -244,6 +244,7 @@ class KnowledgeRecord(TableBase):
     knowledge_describe = Column(String(3000), doc="Knowledge base description")
     knowledge_sources = Column(String(300), doc="Knowledge base sources")
     embedding_model_name = Column(String(200), doc="Embedding model name, used to record the embedding model used by the knowledge base")
+    vector_index_profile = Column(String(30), default="float", doc="Vector index profile chosen at creation time, optional values: float/int8/bbq")
     tenant_id = Column(String(100), doc="Tenant ID")
 
 
@@ -19,6 +19,7 @@ def create_knowledge_record(query: Dict[str, Any]) -> int:
             - user_id: Optional user ID for created_by and updated_by fields
             - tenant_id: Optional tenant ID for created_by and updated_by fields
             - embedding_model_name: embedding model name for the knowledge base
+            - vector_index_profile: Optional vector index profile of the knowledge base
 
     Returns:
         int: Newly created knowledge base ID
@@ -33,7 +34,8 @@ def create_knowledge_record(query: Dict[str, Any]) -> int:
                 "updated_by": query.get("user_id"),
                 "knowledge_sources": query.get("knowledge_sources", "elasticsearch"),
                 "tenant_id": query.get("tenant_id"),
-                "embedding_model_name": query.get("embedding_model_name")
+                "embedding_model_name": query.get("embedding_model_name"),
+                "vector_index_profile": query.get("vector_index_profile")
             }
 
             # Create new record
@@ -7,6 +7,7 @@ import os
 import tempfile
 import threading
 import time
+import uuid
 import warnings
 from typing import Optional, List, Dict, Any
 
@@ -18,11 +19,13 @@ from celery import states, chain
 from transformers import CLIPProcessor, CLIPModel
 from nexent.data_process.core import DataProcessCore
 
-from consts.const import CLIP_MODEL_PATH, IMAGE_FILTER, REDIS_BACKEND_URL, REDIS_URL
+from consts.const import CLIP_MODEL_PATH, DP_TASK_REGISTRY, DP_TASK_RESULT_TTL_S, IMAGE_FILTER, REDIS_BACKEND_URL, REDIS_URL
 from consts.model import BatchTaskRequest
 from data_process.app import app as celery_app
-from data_process.tasks import process, forward
+from data_process.tasks import process, forward, get_actor_pool_stats
+from utils.task_registry_utils import get_all_task_records, get_index_task_records, record_task_status
 from data_process.utils import get_task_info, get_all_task_ids_from_redis
+from utils.file_status_utils import convert_celery_states_to_custom, summarize_file_states
 
 # Configure logging
 logger = logging.getLogger("data_process.service")
@@ -132,6 +135,12 @@ class DataProcessService:
         Returns:
             List[Dict[str, Any]]: List of all tasks
         """
+        if filter:
+            # Registered tasks always carry an index_name and a task_name
+            registered_tasks = await self._get_registered_tasks()
+            if registered_tasks is not None:
+                return registered_tasks
+
         all_tasks = []
         try:
             start_time = time.time()
@@ -211,10 +220,80 @@ class DataProcessService:
         Returns:
             List[Dict[str, Any]]: Tasks for the specified index
         """
+        registered_tasks = await self._get_registered_tasks(index_name)
+        if registered_tasks is not None:
+            return registered_tasks
+
         task_list = await self.get_all_tasks(filter)
         # May got multiple tasks for the same index
         return [task for task in task_list if task.get('index_name') == index_name]
 
+    async def get_index_files_status(self, index_name: str) -> Dict[str, Dict[str, str]]:
+        """Get the state of every file of an index, resolved from the index's tasks
+
+        Args:
+            index_name: Name of the index
+
+        Returns:
+            Dict[str, Dict[str, str]]: path_or_url -> {state, latest_task_id, original_filename, source_type}
+        """
+        return summarize_file_states(await self.get_index_tasks(index_name))
+
+    async def _get_registered_tasks(self, index_name: Optional[str] = None) -> Optional[List[Dict[str, Any]]]:
+        """Read tasks from the task registry, of one index or of all indices
+
+        Returns:
+            Optional[List[Dict[str, Any]]]: Task records, or None if the registry is disabled or unreadable
+        """
+        if not (DP_TASK_REGISTRY and self.redis_client):
+            return None
+        try:
+            start_time = time.time()
+            if index_name is None:
+                tasks = await asyncio.to_thread(get_all_task_records, self.redis_client)
+            else:
+                tasks = await asyncio.to_thread(get_index_task_records, self.redis_client, index_name)
+            logger.debug(
+                f"⏰ Read {len(tasks)} tasks from the task registry in {time.time() - start_time}s")
+            return tasks
+        except Exception as e:
+            logger.warning(
+                f"Failed to read the task registry, falling back to Celery: {str(e)}")
+            return None
+
+    def _register_pending_tasks(self, process_task_id: str, forward_task_id: str,
+                                task_kwargs: Dict[str, Any]) -> None:
+        """
+        Record the process and forward tasks of a new chain as PENDING in the task registry.
+
+        Called before the chain is dispatched, so this write can never overwrite a status the worker already recorded.
+        """
+        if not (DP_TASK_REGISTRY and self.redis_client):
+            return
+        created_at = time.time()
+        try:
+            for task_name, task_id in (('process', process_task_id), ('forward', forward_task_id)):
+                record_task_status(
+                    self.redis_client, task_id, task_name, task_kwargs['index_name'], states.PENDING,
+                    created_at=created_at,
+                    ttl_s=DP_TASK_RESULT_TTL_S,
+                    path_or_url=task_kwargs['source'],
+                    original_filename=task_kwargs.get('original_filename'),
+                    source_type=task_kwargs.get('source_type'),
+                )
+        except Exception as e:
+            # The worker records the tasks once they start
+            logger.warning(
+                f"Failed to register tasks of chain {forward_task_id}: {str(e)}")
+
+    async def get_actor_pool_stats(self) -> Dict[str, Any]:
+        """Get the utilization of the data processing actor pool
+
+        Returns:
+            Dict[str, Any]: Pool size limits and, per lane, actors, busy, idle, waiting and utilization
+        """
+        return await asyncio.to_thread(get_actor_pool_stats)
+
     def check_image_size(self, width: int, height: int, min_width: int = 200, min_height: int = 200) -> bool:
         """Check if the image dimensions meet the minimum requirements
 
@@ -467,6 +546,10 @@ class DataProcessService:
                     f"Missing required field 'index_name' in source config: {source_config}")
                 continue
 
+            # The task IDs are assigned up front so the tasks are registered before a worker can start them
+            process_task_id, forward_task_id = str(uuid.uuid4()), str(uuid.uuid4())
+            self._register_pending_tasks(process_task_id, forward_task_id, source_config)
+
             # Create and submit a chain: process -> forward
             task_chain = chain(
                 process.s(
@@ -475,14 +558,14 @@ class DataProcessService:
                     chunking_strategy=chunking_strategy,
                     index_name=index_name,
                     original_filename=original_filename
-                ).set(queue='process_q'),
+                ).set(queue='process_q', task_id=process_task_id),
                 forward.s(
                     index_name=index_name,
                     source=source,
                     source_type=source_type,
                     original_filename=original_filename,
                     authorization=authorization
-                ).set(queue='forward_q')
+                ).set(queue='forward_q', task_id=forward_task_id)
             )
 
             task_result = task_chain.apply_async()
@@ -556,32 +639,7 @@ class DataProcessService:
 
         This implements the business logic that was previously in the app layer.
         """
-        if process_celery_state == states.FAILURE:
-            return "PROCESS_FAILED"
-        if forward_celery_state == states.FAILURE:
-            return "FORWARD_FAILED"
-
-        if process_celery_state == states.SUCCESS and forward_celery_state == states.SUCCESS:
-            return "COMPLETED"
-
-        forward_state_map = {
-            states.PENDING: "WAIT_FOR_FORWARDING",
-            states.STARTED: "FORWARDING",
-            states.SUCCESS: "COMPLETED",
-            states.FAILURE: "FORWARD_FAILED",
-        }
-        process_state_map = {
-            states.PENDING: "WAIT_FOR_PROCESSING",
-            states.STARTED: "PROCESSING",
-            states.SUCCESS: "WAIT_FOR_FORWARDING",
-            states.FAILURE: "PROCESS_FAILED",
-        }
-
-        if forward_celery_state:
-            return forward_state_map.get(forward_celery_state, "WAIT_FOR_FORWARDING")
-        if process_celery_state:
-            return process_state_map.get(process_celery_state, "WAIT_FOR_PROCESSING")
-        return "WAIT_FOR_PROCESSING"
+        return convert_celery_states_to_custom(process_celery_state or "", forward_celery_state or "")
 
 
 # Global instance to be shared across modules
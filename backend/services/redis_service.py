@@ -1,13 +1,27 @@
+import hashlib
 import json
 import logging
-from typing import Dict, Any
+import urllib.parse
+from itertools import islice
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Set, Tuple
 
 import redis
 
 from consts.const import REDIS_URL, REDIS_BACKEND_URL
+from utils.task_registry_utils import (
+    get_task_ids,
+    get_unregistered_task_ids,
+    legacy_tasks_migrated,
+    mark_legacy_tasks_migrated,
+    remove_task_records,
+)
 
 logger = logging.getLogger(__name__)
 
+TASK_META_PREFIX = 'celery-task-meta-'
+# Keys per SCAN call and per MGET/DEL round trip
+SCAN_BATCH_SIZE = 1000
+
 
 class RedisService:
     """Redis service for managing cache and task data"""
@@ -119,55 +133,164 @@ class RedisService:
 
         return result
 
-    def _recursively_delete_task_and_parents(self, task_id: str) -> tuple[int, set]:
+    def _scan_keys(self, client: redis.Redis, pattern: str) -> Iterator[bytes]:
+        """Iterate the keys matching pattern with SCAN, which never blocks Redis the way KEYS does"""
+        return client.scan_iter(match=pattern, count=SCAN_BATCH_SIZE)
+
+    @staticmethod
+    def _batched(items: Iterable[Any], size: int = SCAN_BATCH_SIZE) -> Iterator[List[Any]]:
+        iterator = iter(items)
+        while True:
+            batch = list(islice(iterator, size))
+            if not batch:
+                return
+            yield batch
+
+    def _delete_keys(self, client: redis.Redis, keys: Iterable[Any]) -> int:
+        """Delete keys with one DEL per batch, returning how many existed"""
+        deleted_count = 0
+        for batch in self._batched(keys):
+            deleted_count += client.delete(*batch)
+        return deleted_count
+
+    def _iter_task_infos(self, task_ids: Iterable[str]) -> Iterator[Tuple[str, Optional[dict]]]:
+        """
+        Load Celery task results with one MGET per batch.
+
+        Yields:
+            (task_id, task_info) pairs, task_info being None for missing or unparsable results
         """
-        Iteratively delete a Celery task and all its parent tasks from Redis.
-        A single task chain is deleted, and the IDs of the deleted tasks are returned.
+        for batch in self._batched(task_ids):
+            values = self.backend_client.mget([f'{TASK_META_PREFIX}{task_id}' for task_id in batch])
+            for task_id, task_data in zip(batch, values):
+                task_info = None
+                if task_data:
+                    try:
+                        task_info = json.loads(task_data)
+                    except (json.JSONDecodeError, TypeError) as e:
+                        logger.warning(f"Failed to parse task data for task {task_id}: {e}")
+                yield task_id, task_info
+
+    def _iter_task_meta_ids(self) -> Iterator[str]:
+        """Iterate the IDs of every stored Celery task result with SCAN"""
+        for key in self._scan_keys(self.backend_client, f'{TASK_META_PREFIX}*'):
+            key_str = key.decode('utf-8') if isinstance(key, bytes) else key
+            yield key_str[len(TASK_META_PREFIX):]
+
+    @staticmethod
+    def _task_index_and_source(task_info: dict) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Find the index name and document source of a Celery task result
 
         Args:
-            task_id: The starting task ID.
+            task_info: Parsed celery-task-meta-* value
 
         Returns:
-            A tuple containing:
-            - int: The number of deleted task records.
-            - set: A set of processed task IDs in the chain.
+            (index_name, source) tuple, with None for what the result does not record
         """
-        deleted_count = 0
-        processed_ids = set()
-        current_task_id = task_id
+        result = task_info.get('result', {})
+        if not isinstance(result, dict):
+            return None, None
+
+        # Standard check for successful tasks
+        task_index_name = (
+            result.get('index_name') or
+            task_info.get('index_name') or
+            result.get('kwargs', {}).get('index_name')
+        )
+        task_source = (
+            result.get('source') or
+            result.get('path_or_url') or
+            task_info.get('source') or
+            task_info.get('path_or_url') or
+            result.get('kwargs', {}).get('source') or
+            result.get('kwargs', {}).get('path_or_url')
+        )
+
+        # Check for failed tasks where metadata is in the exception message
+        if task_index_name is None and 'exc_message' in result:
+            try:
+                exc_str = str(result['exc_message'])
+                if '{' in exc_str and '}' in exc_str:
+                    json_part = exc_str[exc_str.find('{'):exc_str.rfind('}')+1]
+                    cleaned_json_part = json_part.replace('\\"', '"')
+                    error_data = json.loads(cleaned_json_part)
+                    task_index_name = error_data.get('index_name')
+                    task_source = error_data.get('source') or error_data.get('path_or_url')
+            except (json.JSONDecodeError, TypeError, IndexError, AttributeError) as e:
+                logger.warning(f"Could not parse exception metadata for task {task_info.get('task_id')}: {e}")
+
+        return task_index_name, task_source
+
+    def _scan_task_ids(self, index_name: str, path_or_url: Optional[str] = None) -> Tuple[List[str], bool]:
+        """
+        Find the Celery tasks of an index, or of one of its documents, by scanning every task result
+
+        Only needed for tasks created before the task registry recorded them.
 
-        while current_task_id:
-            if current_task_id in processed_ids:
-                logger.warning(f"Detected a cycle or repeated task in parent chain, breaking at: {current_task_id}")
-                break
+        Returns:
+            (task_ids, others_registered) tuple, others_registered telling whether every other result carrying an
+            index name is registered, i.e. nothing but task_ids still needs the scan
+        """
+        task_ids = []
+        other_ids = []
+        for task_id, task_info in self._iter_task_infos(self._iter_task_meta_ids()):
+            if not isinstance(task_info, dict):
+                continue
+            task_index_name, task_source = self._task_index_and_source(task_info)
+            if task_index_name == index_name and (path_or_url is None or task_source == path_or_url):
+                task_ids.append(task_id)
+            elif task_index_name:
+                other_ids.append(task_id)
+        return task_ids, not get_unregistered_task_ids(self.backend_client, other_ids)
+
+    def _find_task_ids(self, index_name: str, path_or_url: Optional[str] = None) -> Tuple[List[str], bool]:
+        """
+        Find the Celery tasks of an index, or of one of its documents.
 
-            processed_ids.add(current_task_id)
-            task_key = f'celery-task-meta-{current_task_id}'
+        The registered task IDs are completed with a scan of the task results until the legacy migration marker is
+        set, since an index may hold both registered tasks and tasks created before the registry existed.
 
-            try:
-                task_data = self.backend_client.get(task_key)
+        Returns:
+            (task_ids, migrated) tuple, migrated telling whether the marker may be set once task_ids are deleted
+        """
+        task_ids = get_task_ids(self.backend_client, index_name, path_or_url)
+        if legacy_tasks_migrated(self.backend_client):
+            return task_ids, False
 
-                parent_id = None
-                if task_data:
-                    # Get parent_id before deleting
-                    try:
-                        task_info = json.loads(task_data)
-                        parent_id = task_info.get('parent_id')
-                    except (json.JSONDecodeError, TypeError) as e:
-                        logger.warning(f"Failed to parse task data for {task_key}, cannot find parent: {e}")
-                        parent_id = None
+        scanned_ids, migrated = self._scan_task_ids(index_name, path_or_url)
+        return list(dict.fromkeys(task_ids + scanned_ids)), migrated
 
-                    # Delete the current task
-                    if self.backend_client.delete(task_key):
-                        deleted_count += 1
-                        logger.debug(f"Deleted task record from chain: {task_key}")
+    def _delete_task_chains(self, task_ids: Iterable[str]) -> Tuple[int, Set[str]]:
+        """
+        Delete Celery task results and all their parent tasks from Redis.
+        Each level of the chains costs one MGET and one DEL per batch instead of a round trip per task.
 
-                current_task_id = parent_id
+        Args:
+            task_ids: The starting task IDs.
 
-            except Exception as e:
-                logger.error(f"Error while processing task {task_key} in recursive delete: {e}")
-                # Stop if any redis error occurs
-                break
+        Returns:
+            A tuple containing:
+            - int: The number of deleted task records.
+            - set: A set of processed task IDs in the chains.
+        """
+        deleted_count = 0
+        processed_ids: Set[str] = set()
+        pending = list(dict.fromkeys(task_ids))
+
+        while pending:
+            processed_ids.update(pending)
+            parent_ids = []
+            existing_keys = []
+            for task_id, task_info in self._iter_task_infos(pending):
+                # Unparsable results are deleted too, only their parents cannot be followed
+                existing_keys.append(f'{TASK_META_PREFIX}{task_id}')
+                parent_id = task_info.get('parent_id') if isinstance(task_info, dict) else None
+                # Parents already processed, shared by several chains or reached through a cycle, are skipped
+                if parent_id and parent_id not in processed_ids:
+                    parent_ids.append(parent_id)
+            deleted_count += self._delete_keys(self.backend_client, existing_keys)
+            pending = list(dict.fromkeys(parent_ids))
 
         return deleted_count, processed_ids
 
@@ -175,69 +298,28 @@ class RedisService:
         """
         Clean up Celery task results related to the knowledge base and their parents.
 
+        The task IDs come from the task registry, plus a scan of the task results for tasks created before it
+        existed until no such task is left.
+
         Args:
             index_name: Name of the knowledge base
 
         Returns:
             Number of task records deleted
         """
-        total_deleted_count = 0
-        processed_tasks = set()  # Track tasks that have been processed to avoid redundant work
-
         try:
-            # Get all Celery task result keys
-            task_keys = self.backend_client.keys('celery-task-meta-*')
+            task_ids, migrated = self._find_task_ids(index_name)
 
-            for key in task_keys:
-                try:
-                    # Get task data
-                    task_data = self.backend_client.get(key)
-                    if task_data:
-                        import json
-                        task_info = json.loads(task_data)
-
-                        # Check if this task is related to our knowledge base
-                        result = task_info.get('result', {})
-                        task_index_name = None
-
-                        if isinstance(result, dict):
-                            # Standard check for successful tasks
-                            task_index_name = (
-                                result.get('index_name') or
-                                task_info.get('index_name') or
-                                result.get('kwargs', {}).get('index_name')
-                            )
-
-                            # Check for failed tasks where metadata is in the exception message
-                            if task_index_name is None and 'exc_message' in result:
-                                try:
-                                    exc_str = str(result['exc_message'])
-                                    if '{' in exc_str and '}' in exc_str:
-                                        json_part = exc_str[exc_str.find('{'):exc_str.rfind('}')+1]
-                                        cleaned_json_part = json_part.replace('\\"', '"')
-                                        error_data = json.loads(cleaned_json_part)
-                                        task_index_name = error_data.get('index_name')
-                                except (json.JSONDecodeError, TypeError, IndexError) as e:
-                                    key_str = key.decode('utf-8') if isinstance(key, bytes) else key
-                                    logger.warning(f"Could not parse exception metadata for task key {key_str}: {e}")
-
-                        if task_index_name == index_name:
-                            key_str = key.decode('utf-8') if isinstance(key, bytes) else key
-                            task_id = key_str.replace('celery-task-meta-', '')
-                            if task_id not in processed_tasks:
-                                deleted, processed_chain = self._recursively_delete_task_and_parents(task_id)
-                                total_deleted_count += deleted
-                                processed_tasks.update(processed_chain)
-
-                except Exception as e:
-                    logger.warning(f"Error processing task key {key} for cleanup: {str(e)}")
-                    continue
+            deleted_count, _ = self._delete_task_chains(task_ids)
+            remove_task_records(self.backend_client, index_name, task_ids)
+            if migrated:
+                mark_legacy_tasks_migrated(self.backend_client)
 
         except Exception as e:
             logger.error(f"Error cleaning up Celery tasks: {str(e)}")
             raise
 
-        return total_deleted_count
+        return deleted_count
 
     def _cleanup_cache_keys(self, index_name: str) -> int:
         """
@@ -249,24 +331,24 @@ class RedisService:
         Returns:
             Number of cache keys deleted
         """
+        # Prefix patterns only: a pattern with a leading wildcard would walk the whole keyspace on every deletion
+        patterns = [
+            f"kb:{index_name}:*",  # Knowledge base specific cache keys
+            f"index:{index_name}:*",  # Index specific cache keys
+            f"search:{index_name}:*",  # Search cache keys
+        ]
+        return self._cleanup_cache_patterns(patterns)
+
+    def _cleanup_cache_patterns(self, patterns: List[str]) -> int:
+        """Delete the cache keys matching any of the patterns, scanning and deleting in batches"""
         deleted_count = 0
 
         try:
-            # Define patterns to search for cache keys related to the knowledge base
-            patterns = [
-                f"*{index_name}*",  # Any key containing the index name
-                f"kb:{index_name}:*",  # Knowledge base specific cache keys
-                f"index:{index_name}:*",  # Index specific cache keys
-                f"search:{index_name}:*",  # Search cache keys
-            ]
-
             for pattern in patterns:
                 try:
-                    keys = self.client.keys(pattern)
-                    if keys:
-                        # Delete keys in batch for efficiency
-                        deleted = self.client.delete(*keys)
-                        deleted_count += deleted
+                    deleted = self._delete_keys(self.client, self._scan_keys(self.client, pattern))
+                    deleted_count += deleted
+                    if deleted:
                         logger.debug(f"Deleted {deleted} cache keys matching pattern: {pattern}")
 
                 except Exception as e:
@@ -290,79 +372,19 @@ class RedisService:
         Returns:
             Number of task records deleted
         """
-        total_deleted_count = 0
-        processed_tasks = set()
-
         try:
-            # Get all Celery task result keys
-            task_keys = self.backend_client.keys('celery-task-meta-*')
+            task_ids, migrated = self._find_task_ids(index_name, path_or_url)
 
-            for key in task_keys:
-                key_str = key.decode('utf-8') if isinstance(key, bytes) else key
-                task_id = key_str.replace('celery-task-meta-', '')
-
-                if task_id in processed_tasks:
-                    continue
-
-                try:
-                    # Get task data
-                    task_data = self.backend_client.get(key)
-                    if task_data:
-                        import json
-                        task_info = json.loads(task_data)
-
-                        # Check if this task is related to our specific document
-                        result = task_info.get('result', {})
-                        task_index_name = None
-                        task_source = None
-
-                        if isinstance(result, dict):
-                            # Standard check for successful tasks
-                            task_index_name = (
-                                result.get('index_name') or
-                                task_info.get('index_name') or
-                                result.get('kwargs', {}).get('index_name')
-                            )
-
-                            task_source = (
-                                result.get('source') or
-                                result.get('path_or_url') or
-                                task_info.get('source') or
-                                task_info.get('path_or_url') or
-                                result.get('kwargs', {}).get('source') or
-                                result.get('kwargs', {}).get('path_or_url')
-                            )
-
-                            # Check for failed tasks where metadata is in the exception message
-                            if task_index_name is None and 'exc_message' in result:
-                                try:
-                                    exc_str = str(result['exc_message'])
-                                    if '{' in exc_str and '}' in exc_str:
-                                        json_part = exc_str[exc_str.find('{'):exc_str.rfind('}')+1]
-                                        cleaned_json_part = json_part.replace('\\"', '"')
-                                        error_data = json.loads(cleaned_json_part)
-                                        task_index_name = error_data.get('index_name')
-                                        task_source = error_data.get('source') or error_data.get('path_or_url')
-                                except (json.JSONDecodeError, TypeError, IndexError) as e:
-                                    logger.warning(f"Could not parse exception metadata for task {task_id}: {e}")
-
-                        # Match both index name and document path/source
-                        if task_index_name == index_name and task_source == path_or_url:
-                            # Recursively delete this task and its parents
-                            if task_id not in processed_tasks:
-                                deleted, processed_chain = self._recursively_delete_task_and_parents(task_id)
-                                total_deleted_count += deleted
-                                processed_tasks.update(processed_chain)
-
-                except Exception as e:
-                    logger.warning(f"Error processing task key {key} for document cleanup: {str(e)}")
-                    continue
+            deleted_count, _ = self._delete_task_chains(task_ids)
+            remove_task_records(self.backend_client, index_name, task_ids, path_or_url)
+            if migrated:
+                mark_legacy_tasks_migrated(self.backend_client)
 
         except Exception as e:
             logger.error(f"Error cleaning up document Celery tasks: {str(e)}")
             raise
 
-        return total_deleted_count
+        return deleted_count
 
     def _cleanup_document_cache_keys(self, index_name: str, path_or_url: str) -> int:
         """
@@ -375,45 +397,18 @@ class RedisService:
         Returns:
             Number of cache keys deleted
         """
-        deleted_count = 0
-
-        try:
-            # Create a safe identifier from the path_or_url for cache key matching
-            import hashlib
-            import urllib.parse
-
-            # Create different possible cache key patterns for the document
-            safe_path = urllib.parse.quote(path_or_url, safe='')
-            path_hash = hashlib.md5(path_or_url.encode()).hexdigest()
-
-            # Define patterns to search for cache keys related to the specific document
-            patterns = [
-                f"*{index_name}*{safe_path}*",  # Cache keys containing both index name and safe path
-                f"*{index_name}*{path_hash}*",  # Cache keys containing both index name and path hash
-                f"kb:{index_name}:doc:{safe_path}*",  # Document specific cache keys
-                f"kb:{index_name}:doc:{path_hash}*",  # Document specific cache keys with hash
-                f"doc:{safe_path}:*",  # Document specific cache
-                f"doc:{path_hash}:*",  # Document specific cache with hash
-            ]
-
-            for pattern in patterns:
-                try:
-                    keys = self.client.keys(pattern)
-                    if keys:
-                        # Delete keys in batch for efficiency
-                        deleted = self.client.delete(*keys)
-                        deleted_count += deleted
-                        logger.debug(f"Deleted {deleted} document cache keys matching pattern: {pattern}")
-
-                except Exception as e:
-                    logger.warning(f"Error processing document cache pattern {pattern}: {str(e)}")
-                    continue
-
-        except Exception as e:
-            logger.error(f"Error cleaning up document cache keys: {str(e)}")
-            raise
-
-        return deleted_count
+        # Create different possible cache key patterns for the document
+        safe_path = urllib.parse.quote(path_or_url, safe='')
+        path_hash = hashlib.md5(path_or_url.encode()).hexdigest()
+
+        # Define patterns to search for cache keys related to the specific document
+        patterns = [
+            f"kb:{index_name}:doc:{safe_path}*",  # Document specific cache keys
+            f"kb:{index_name}:doc:{path_hash}*",  # Document specific cache keys with hash
+            f"doc:{safe_path}:*",  # Document specific cache
+            f"doc:{path_hash}:*",  # Document specific cache with hash
+        ]
+        return self._cleanup_cache_patterns(patterns)
 
     def get_knowledgebase_task_count(self, index_name: str) -> int:
         """
@@ -429,31 +424,14 @@ class RedisService:
 
         try:
             # Count Celery tasks
-            task_keys = self.backend_client.keys('celery-task-meta-*')
-            for key in task_keys:
-                try:
-                    task_data = self.backend_client.get(key)
-                    if task_data:
-                        import json
-                        task_info = json.loads(task_data)
-                        result = task_info.get('result', {})
-                        if isinstance(result, dict):
-                            task_index_name = (
-                                result.get('index_name') or
-                                task_info.get('index_name') or
-                                result.get('kwargs', {}).get('index_name')
-                            )
-                            if task_index_name == index_name:
-                                count += 1
-                except Exception:
-                    continue
+            task_ids, _ = self._find_task_ids(index_name)
+            count += len(task_ids)
 
             # Count cache keys
-            patterns = [f"*{index_name}*", f"kb:{index_name}:*", f"index:{index_name}:*"]
+            patterns = [f"kb:{index_name}:*", f"index:{index_name}:*", f"search:{index_name}:*"]
             for pattern in patterns:
                 try:
-                    keys = self.client.keys(pattern)
-                    count += len(keys)
+                    count += sum(1 for _ in self._scan_keys(self.client, pattern))
                 except Exception:
                     continue
 
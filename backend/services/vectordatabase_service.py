@@ -12,6 +12,7 @@ Main features include:
 import asyncio
 import logging
 import os
+import threading
 import time
 import uuid
 from datetime import datetime, timezone
@@ -21,10 +22,38 @@ from fastapi import Body, Depends, Path, Query
 from fastapi.responses import StreamingResponse
 from nexent.core.models.embedding_model import OpenAICompatibleEmbedding, JinaEmbedding, BaseEmbedding
 from nexent.core.nlp.tokenizer import calculate_term_weights
+from nexent.vector_database.async_base import AsyncVectorDatabaseCore, ThreadedAsyncVectorDatabaseCore
+from nexent.vector_database.async_elasticsearch_core import AsyncElasticSearchCore
 from nexent.vector_database.base import VectorDatabaseCore
-from nexent.vector_database.elasticsearch_core import ElasticSearchCore
-
-from consts.const import ES_API_KEY, ES_HOST, LANGUAGE, VectorDatabaseType
+from nexent.vector_database.elasticsearch_core import ElasticSearchCore, IndexWriteBlockedError
+from nexent.vector_database.index_stats_cache import IndexStatsCache
+from nexent.vector_database.local_core import LocalVectorCore
+
+from consts.const import (
+    DP_INGEST_COMMIT_STALE_S,
+    DP_INGEST_LOCK_TTL_S,
+    DP_INGEST_MAX_CONCURRENT_COMMITS,
+    DP_INGEST_SESSION_TTL_S,
+    ES_API_KEY,
+    ES_ASYNC_CONNECTIONS_PER_NODE,
+    ES_BULK_QUEUE_SIZE,
+    ES_EMBEDDING_CONCURRENCY,
+    ES_EXCLUDE_VECTOR_SOURCE,
+    ES_HNSW_EF_CONSTRUCTION,
+    ES_HNSW_M,
+    ES_HOST,
+    ES_HYBRID_FUSION,
+    ES_INDEX_STATS_CACHE_TTL_S,
+    ES_KNN_NUM_CANDIDATES,
+    ES_REBUILD_LOCK_TTL_S,
+    ES_VECTOR_INDEX_PROFILE,
+    EMBEDDING_HTTP_POOL_MAXSIZE,
+    LOCAL_VECTOR_STORE_PATH,
+    VECTOR_DATABASE_TYPE,
+    LANGUAGE,
+    VectorDatabaseType,
+)
+from consts.exceptions import IngestOffsetConflictError, LimitExceededError
 from consts.model import ChunkCreateRequest, ChunkUpdateRequest
 from database.attachment_db import delete_file
 from database.knowledge_db import (
@@ -35,7 +64,23 @@ from database.knowledge_db import (
 )
 from services.redis_service import get_redis_service
 from utils.config_utils import tenant_config_manager, get_model_name_from_config
+from utils.embedding_cache_utils import get_embedding_cache, get_embedding_coalescer, get_query_embedding_cache
 from utils.file_management_utils import get_all_files_status, get_file_size
+from utils.ingest_session_utils import (
+    acquire_commit_slot,
+    append_segment,
+    clear_committing,
+    complete_session,
+    encode_ndjson,
+    get_session,
+    iter_documents,
+    lock_key,
+    mark_committing,
+    parse_ndjson,
+    refresh_commit,
+    release_commit_slot,
+)
+from utils.partition_cache_utils import evict_partition_cache
 
 ALLOWED_CHUNK_FIELDS = {
     "id",
@@ -52,15 +97,41 @@ ALLOWED_CHUNK_FIELDS = {
 # Configure logging
 logger = logging.getLogger("vectordatabase_service")
 
+# Shared by every core built below so knowledge-base statistics survive across requests
+_index_stats_cache = IndexStatsCache(ttl_seconds=ES_INDEX_STATS_CACHE_TTL_S)
+
+# Async client created on first use, so its connection pool is shared by every request of the worker
+_async_es_client = None
+# The embedded store keeps its indices in memory, so one instance serves the whole process
+_local_vector_core = None
+
+
+def _rebuild_lock_key(index_name: str) -> str:
+    """Redis lock held by the embedding model rebuild of a knowledge base, whichever process runs it"""
+    return f"rebuild:{index_name}:lock"
+
+
+def _get_local_vector_core() -> LocalVectorCore:
+    global _local_vector_core
+    if _local_vector_core is None:
+        _local_vector_core = LocalVectorCore(
+            root_path=LOCAL_VECTOR_STORE_PATH,
+            embedding_cache=get_embedding_cache(),
+            hybrid_fusion=ES_HYBRID_FUSION,
+            query_embedding_cache=get_query_embedding_cache(),
+            embedding_coalescer=get_embedding_coalescer(),
+        )
+    return _local_vector_core
+
 
 def get_vector_db_core(
-    db_type: VectorDatabaseType = VectorDatabaseType.ELASTICSEARCH,
+    db_type: VectorDatabaseType = VECTOR_DATABASE_TYPE,
 ) -> VectorDatabaseCore:
     """
     Return a VectorDatabaseCore implementation based on the requested type.
 
     Args:
-        db_type: Target vector database provider. Defaults to Elasticsearch.
+        db_type: Target vector database provider. Defaults to VECTOR_DATABASE_TYPE.
 
     Returns:
         VectorDatabaseCore: Concrete vector database implementation.
@@ -74,7 +145,64 @@ def get_vector_db_core(
             api_key=ES_API_KEY,
             verify_certs=False,
             ssl_show_warn=False,
+            embedding_concurrency=ES_EMBEDDING_CONCURRENCY,
+            bulk_queue_size=ES_BULK_QUEUE_SIZE,
+            embedding_cache=get_embedding_cache(),
+            hybrid_fusion=ES_HYBRID_FUSION,
+            knn_num_candidates=ES_KNN_NUM_CANDIDATES,
+            query_embedding_cache=get_query_embedding_cache(),
+            hnsw_m=ES_HNSW_M,
+            hnsw_ef_construction=ES_HNSW_EF_CONSTRUCTION,
+            exclude_vector_source=ES_EXCLUDE_VECTOR_SOURCE,
+            index_stats_cache=_index_stats_cache,
+            embedding_coalescer=get_embedding_coalescer(),
         )
+    if db_type == VectorDatabaseType.LOCAL:
+        return _get_local_vector_core()
+
+    raise ValueError(f"Unsupported vector database type: {db_type}")
+
+
+def get_async_vector_db_core(
+    db_type: VectorDatabaseType = VECTOR_DATABASE_TYPE,
+) -> AsyncVectorDatabaseCore:
+    """
+    Return an AsyncVectorDatabaseCore implementation based on the requested type.
+
+    All returned Elasticsearch cores share one client per worker process, so concurrent requests reuse pooled
+    connections instead of opening their own. The local store has no network I/O and runs in worker threads.
+
+    Args:
+        db_type: Target vector database provider. Defaults to VECTOR_DATABASE_TYPE.
+
+    Returns:
+        AsyncVectorDatabaseCore: Concrete asyncio vector database implementation.
+
+    Raises:
+        ValueError: If the requested database type is not supported.
+    """
+    global _async_es_client
+    if db_type == VectorDatabaseType.ELASTICSEARCH:
+        if _async_es_client is None:
+            _async_es_client = AsyncElasticSearchCore.build_client(
+                ES_HOST,
+                ES_API_KEY,
+                verify_certs=False,
+                ssl_show_warn=False,
+                connections_per_node=ES_ASYNC_CONNECTIONS_PER_NODE,
+            )
+        return AsyncElasticSearchCore(
+            host=ES_HOST,
+            api_key=ES_API_KEY,
+            client=_async_es_client,
+            hybrid_fusion=ES_HYBRID_FUSION,
+            knn_num_candidates=ES_KNN_NUM_CANDIDATES,
+            query_embedding_cache=get_query_embedding_cache(),
+            index_stats_cache=_index_stats_cache,
+            embedding_coalescer=get_embedding_coalescer(),
+        )
+    if db_type == VectorDatabaseType.LOCAL:
+        return ThreadedAsyncVectorDatabaseCore(_get_local_vector_core())
 
     raise ValueError(f"Unsupported vector database type: {db_type}")
 
@@ -156,9 +284,9 @@ def get_embedding_model(tenant_id: str):
 
     if model_type == "embedding":
         # Get the es core
-        return OpenAICompatibleEmbedding(api_key=model_config.get("api_key", ""), base_url=model_config.get("base_url", ""), model_name=get_model_name_from_config(model_config) or "", embedding_dim=model_config.get("max_tokens", 1024))
+        return OpenAICompatibleEmbedding(api_key=model_config.get("api_key", ""), base_url=model_config.get("base_url", ""), model_name=get_model_name_from_config(model_config) or "", embedding_dim=model_config.get("max_tokens", 1024), pool_maxsize=EMBEDDING_HTTP_POOL_MAXSIZE)
     elif model_type == "multi_embedding":
-        return JinaEmbedding(api_key=model_config.get("api_key", ""), base_url=model_config.get("base_url", ""), model_name=get_model_name_from_config(model_config) or "", embedding_dim=model_config.get("max_tokens", 1024))
+        return JinaEmbedding(api_key=model_config.get("api_key", ""), base_url=model_config.get("base_url", ""), model_name=get_model_name_from_config(model_config) or "", embedding_dim=model_config.get("max_tokens", 1024), pool_maxsize=EMBEDDING_HTTP_POOL_MAXSIZE)
     else:
         return None
 
@@ -205,6 +333,8 @@ class ElasticSearchService:
                     try:
                         logger.debug(
                             f"Deleting object: '{object_name}' from MinIO for index '{index_name}'")
+                        # Partition results are keyed by the file content, so they go before the file
+                        evict_partition_cache(object_name)
                         delete_result = delete_file(object_name=object_name)
                         if delete_result.get("success"):
                             logger.debug(
@@ -288,19 +418,22 @@ class ElasticSearchService:
                 None, description="ID of the user creating the knowledge base"),
             tenant_id: Optional[str] = Body(
                 None, description="ID of the tenant creating the knowledge base"),
+            index_profile: Optional[str] = None,
     ):
         try:
             if vdb_core.check_index_exists(index_name):
                 raise Exception(f"Index {index_name} already exists")
             embedding_model = get_embedding_model(tenant_id)
+            index_profile = index_profile or ES_VECTOR_INDEX_PROFILE
             success = vdb_core.create_index(index_name, embedding_dim=embedding_dim or (
-                embedding_model.embedding_dim if embedding_model else 1024))
+                embedding_model.embedding_dim if embedding_model else 1024), index_profile=index_profile)
             if not success:
                 raise Exception(f"Failed to create index {index_name}")
             knowledge_data = {"index_name": index_name,
                               "created_by": user_id,
                               "tenant_id": tenant_id,
-                              "embedding_model_name": embedding_model.model}
+                              "embedding_model_name": embedding_model.model,
+                              "vector_index_profile": index_profile}
             create_knowledge_record(knowledge_data)
             return {"status": "success", "message": f"Index {index_name} created successfully"}
         except Exception as e:
@@ -326,6 +459,7 @@ class ElasticSearchService:
                         if object_name and source_type == "minio":
                             logger.info(
                                 f"Deleting file {object_name} from MinIO for index {index_name}")
+                            evict_partition_cache(object_name)
                             delete_file(object_name)
             except Exception as e:
                 # Log the error but don't block the index deletion
@@ -428,7 +562,8 @@ class ElasticSearchService:
             index_name: str = Path(..., description="Name of the index"),
             data: List[Dict[str, Any]
                        ] = Body(..., description="Document List to process"),
-            vdb_core: VectorDatabaseCore = Depends(get_vector_db_core)
+            vdb_core: VectorDatabaseCore = Depends(get_vector_db_core),
+            incremental: bool = False
     ):
         """
         Index documents and create vector embeddings, create index if it doesn't exist
@@ -438,9 +573,16 @@ class ElasticSearchService:
             index_name: Index name
             data: List containing document data to be indexed
             vdb_core: VectorDatabaseCore instance
+            incremental: Treat data as the complete new version of each path_or_url it contains: only changed
+                chunks are embedded and chunks missing from the new version are deleted. Versions are matched
+                by path_or_url, so this covers re-processing the same source (task retries, URLs, local paths);
+                a file uploaded again gets a new object name and is indexed as a new document
 
         Returns:
             IndexingResponse object containing indexing result information
+
+        Raises:
+            IndexWriteBlockedError: If the index is write blocked by a rebuild about to swap it; retry later
         """
         try:
             if not index_name:
@@ -517,6 +659,10 @@ class ElasticSearchService:
                     "total_submitted": 0
                 }
 
+            if incremental:
+                return ElasticSearchService._reindex_documents(
+                    embedding_model, index_name, documents, vdb_core)
+
             # Index documents (use default batch_size and content_field)
             try:
                 total_indexed = vdb_core.vectorize_documents(
@@ -531,22 +677,194 @@ class ElasticSearchService:
                     "total_indexed": total_indexed,
                     "total_submitted": total_submitted
                 }
+            except IndexWriteBlockedError:
+                raise
             except Exception as e:
                 error_msg = str(e)
                 logger.error(f"Error during indexing: {error_msg}")
                 raise Exception(f"Error during indexing: {error_msg}")
 
+        except IndexWriteBlockedError:
+            raise
         except Exception as e:
             error_msg = str(e)
             logger.error(f"Error indexing documents: {error_msg}")
             raise Exception(f"Error indexing documents: {error_msg}")
 
+    @staticmethod
+    def _reindex_documents(
+            embedding_model: BaseEmbedding,
+            index_name: str,
+            documents: List[Dict[str, Any]],
+            vdb_core: VectorDatabaseCore
+    ):
+        """
+        Re-index each document version against its indexed chunks. Unchanged chunks count as indexed, so
+        total_indexed == total_submitted still means the whole new version is searchable.
+        """
+        versions: Dict[str, List[Dict[str, Any]]] = {}
+        for document in documents:
+            versions.setdefault(document["path_or_url"], []).append(document)
+
+        total_indexed = total_embedded = total_deleted = 0
+        try:
+            for path_or_url, chunks in versions.items():
+                counts = vdb_core.reindex_document(
+                    index_name=index_name,
+                    embedding_model=embedding_model,
+                    path_or_url=path_or_url,
+                    documents=chunks,
+                )
+                total_embedded += counts["indexed"]
+                total_indexed += counts["indexed"] + counts["unchanged"]
+                total_deleted += counts["deleted"]
+        except IndexWriteBlockedError:
+            raise
+        except Exception as e:
+            error_msg = str(e)
+            logger.error(f"Error during re-indexing: {error_msg}")
+            raise Exception(f"Error during re-indexing: {error_msg}")
+
+        return {
+            "success": True,
+            "message": f"Successfully indexed {total_indexed} documents, embedded {total_embedded} changed chunks",
+            "total_indexed": total_indexed,
+            "total_submitted": len(documents),
+            "total_embedded": total_embedded,
+            "total_deleted": total_deleted
+        }
+
+    @staticmethod
+    def ingest_document_segment(
+            embedding_model: BaseEmbedding,
+            index_name: str,
+            session_id: str,
+            offset: int,
+            body: bytes,
+            final: bool,
+            vdb_core: VectorDatabaseCore,
+            incremental: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Accept one NDJSON segment of a streamed document upload
+
+        Segments are spooled in Redis and acknowledged with the offset of the next expected chunk. Chunks the
+        session already holds are not stored again, so resending a segment after a lost acknowledgement is safe.
+        The final segment marks the session committing and indexes everything spooled through index_documents; its
+        result is kept, so resending the final segment of a committed session returns the same result, and a
+        resend during the commit is answered with LimitExceededError instead of indexing the file twice.
+
+        Args:
+            embedding_model: Embedding model used when committing
+            index_name: Index name
+            session_id: ID of the ingestion session, the forward task ID
+            offset: Chunk offset of the first line of the segment
+            body: NDJSON body, one document per line in the format accepted by index_documents
+            final: Whether this is the last segment, which commits the upload
+            vdb_core: VectorDatabaseCore instance
+            incremental: Passed to index_documents on commit
+
+        Returns:
+            Dict with session_id, next_offset and committed, plus the IndexingResponse fields once committed
+
+        Raises:
+            IngestOffsetConflictError: If the segment starts after the next chunk the session expects
+            LimitExceededError: If another request of the session is running, the session is being committed or
+                DP_INGEST_MAX_CONCURRENT_COMMITS commits are already running
+            IndexWriteBlockedError: If the commit hit the write block of a rebuild; the final segment can be resent
+        """
+        redis_client = get_redis_service().client
+        # Offset checks and spooling of a session run one request at a time across every process
+        lock = redis_client.lock(lock_key(session_id), timeout=DP_INGEST_LOCK_TTL_S)
+        if not lock.acquire(blocking=False):
+            raise LimitExceededError(f"Ingestion session {session_id} is handling another segment, retry later")
+        try:
+            session = get_session(redis_client, session_id)
+            if session is not None and session['index_name'] != index_name:
+                raise ValueError(f"Ingestion session {session_id} belongs to index {session['index_name']}")
+            next_offset = session['next_offset'] if session else 0
+            if session is not None and session['result'] is not None:
+                return {"session_id": session_id, "next_offset": next_offset, "committed": True, **session['result']}
+            # A commit whose heartbeat stopped was abandoned by a dead process
+            if (session is not None and session['committing'] is not None
+                    and time.time() - session['committing'] < DP_INGEST_COMMIT_STALE_S):
+                raise LimitExceededError(f"Ingestion session {session_id} is being committed, retry later")
+            if offset > next_offset:
+                raise IngestOffsetConflictError(next_offset)
+
+            if not final:
+                next_offset = ElasticSearchService._spool_segment(
+                    redis_client, session_id, index_name, offset, next_offset, body)
+                return {"session_id": session_id, "next_offset": next_offset, "committed": False}
+
+            if not acquire_commit_slot(redis_client, session_id, DP_INGEST_MAX_CONCURRENT_COMMITS,
+                                       DP_INGEST_COMMIT_STALE_S):
+                raise LimitExceededError(
+                    f"{DP_INGEST_MAX_CONCURRENT_COMMITS} streamed uploads are being committed, retry later")
+            try:
+                next_offset = ElasticSearchService._spool_segment(
+                    redis_client, session_id, index_name, offset, next_offset, body)
+                mark_committing(redis_client, session_id)
+            except Exception:
+                release_commit_slot(redis_client, session_id)
+                raise
+        finally:
+            lock.release()
+
+        # The committing mark, not the lock, keeps resent final segments away while the file is indexed. Its
+        # heartbeat must stop before the mark is cleared or replaced by the result.
+        stopped = threading.Event()
+
+        def heartbeat():
+            while not stopped.wait(DP_INGEST_COMMIT_STALE_S / 3):
+                try:
+                    refresh_commit(redis_client, session_id)
+                except Exception as e:
+                    logger.warning(f"Failed to refresh the commit of ingestion session {session_id}: {str(e)}")
+
+        heartbeat_thread = threading.Thread(target=heartbeat, name=f"ingest-commit-{session_id}", daemon=True)
+        heartbeat_thread.start()
+        try:
+            try:
+                result = ElasticSearchService.index_documents(
+                    embedding_model, index_name, iter_documents(redis_client, session_id), vdb_core,
+                    incremental=incremental)
+            finally:
+                stopped.set()
+                heartbeat_thread.join()
+            complete_session(redis_client, session_id, result, DP_INGEST_SESSION_TTL_S)
+        except Exception:
+            clear_committing(redis_client, session_id)
+            raise
+        finally:
+            release_commit_slot(redis_client, session_id)
+
+        logger.info(f"Committed streamed upload {session_id} of {next_offset} chunks to {index_name}")
+        return {"session_id": session_id, "next_offset": next_offset, "committed": True, **result}
+
+    @staticmethod
+    def _spool_segment(redis_client: Any, session_id: str, index_name: str, offset: int, next_offset: int,
+                       body: bytes) -> int:
+        """Spool the chunks of a segment the session does not hold yet and return the new next offset"""
+        documents = parse_ndjson(body)
+        fresh = documents[next_offset - offset:]
+        if not fresh:
+            return next_offset
+        if len(fresh) < len(documents):
+            body = encode_ndjson(fresh)
+        return append_segment(redis_client, session_id, index_name, next_offset, body, len(fresh),
+                              DP_INGEST_SESSION_TTL_S)
+
     @staticmethod
     async def list_files(
             index_name: str = Path(..., description="Name of the index"),
             include_chunks: bool = Query(
                 False, description="Whether to include text chunks for each file"),
-            vdb_core: VectorDatabaseCore = Depends(get_vector_db_core)
+            vdb_core: VectorDatabaseCore = Depends(get_vector_db_core),
+            page_size: Optional[int] = None,
+            cursor: Optional[str] = None,
+            sort_by: str = "create_time",
+            sort_order: str = "desc",
     ):
         """
         Get file list for the specified index, including files that are not yet stored in ES
@@ -555,20 +873,36 @@ class ElasticSearchService:
             index_name: Name of the index
             include_chunks: Whether to include text chunks for each file
             vdb_core: VectorDatabaseCore instance
+            page_size: Return one page of stored files instead of all of them
+            cursor: next_cursor of the previous page
+            sort_by: Sort field of stored files when paginating
+            sort_order: "asc" or "desc" when paginating
 
         Returns:
-            Dictionary containing file list
+            Dictionary containing file list, plus total and next_cursor when paginating
         """
         try:
             files = []
-            # Get existing files from ES
-            existing_files = vdb_core.get_documents_detail(index_name)
+            page = None
+            if page_size is not None:
+                # Get one page of existing files from the document catalog
+                page = vdb_core.list_documents(
+                    index_name, page_size=page_size, cursor=cursor, sort_by=sort_by, sort_order=sort_order)
+                existing_files = page["documents"]
+            else:
+                # Get existing files from ES
+                existing_files = vdb_core.get_documents_detail(index_name)
 
-            # Get unique celery files list and the status of each file
-            celery_task_files = await get_all_files_status(index_name)
+            # Files still being processed are reported on the first page only
+            celery_task_files = await get_all_files_status(index_name) if not cursor else {}
             # Create a set of path_or_urls from existing files for quick lookup
             existing_paths = {file_info.get('path_or_url')
                               for file_info in existing_files}
+            if page is not None and celery_task_files:
+                # Stored files of other pages must not be reported as in progress
+                stored = vdb_core.list_documents(
+                    index_name, page_size=len(celery_task_files), path_or_urls=list(celery_task_files.keys()))
+                existing_paths.update(doc.get('path_or_url') for doc in stored["documents"])
 
             # For files already stored in ES, add to files list
             for file_info in existing_files:
@@ -684,6 +1018,8 @@ class ElasticSearchService:
                     file_data['chunks'] = []
                     file_data['chunk_count'] = file_data.get('chunk_count', 0)
 
+            if page is not None:
+                return {"files": files, "total": page["total"], "next_cursor": page["next_cursor"]}
             return {"files": files}
 
         except Exception as e:
@@ -700,10 +1036,123 @@ class ElasticSearchService:
         # 1. Delete ES documents
         deleted_count = vdb_core.delete_documents(
             index_name, path_or_url)
-        # 2. Delete MinIO file
+        # 2. Delete MinIO file, after the partition results keyed by its content
+        evict_partition_cache(path_or_url)
         minio_result = delete_file(path_or_url)
         return {"status": "success", "deleted_es_count": deleted_count, "deleted_minio": minio_result.get("success")}
 
+    @staticmethod
+    def rebuild_index(
+            index_name: str,
+            tenant_id: str,
+            user_id: str,
+            vdb_core: VectorDatabaseCore = Depends(get_vector_db_core)
+    ):
+        """
+        Start re-embedding a knowledge base with the tenant's current embedding model in a background thread.
+        The stored chunks are reused, so no file is partitioned again. The knowledge base keeps serving its old
+        embeddings until the rebuilt index is swapped in, then its record switches to the new model name.
+        Starting again after a failure resumes from the last checkpoint. A Redis lock per knowledge base keeps a
+        second process from resuming the same rebuild, or dropping its index as stale, while it runs.
+
+        Args:
+            index_name: Name of the knowledge base
+            tenant_id: ID of the tenant owning the knowledge base
+            user_id: ID of the user starting the rebuild
+            vdb_core: VectorDatabaseCore instance
+
+        Returns:
+            Dict with the job status ("started" or "running") and the target embedding model
+        """
+        knowledge_record = get_knowledge_record({"index_name": index_name, "tenant_id": tenant_id})
+        if not knowledge_record:
+            raise Exception(f"Knowledge base {index_name} not found")
+        embedding_model = get_embedding_model(tenant_id)
+        if embedding_model is None:
+            raise Exception("No embedding model configured")
+
+        lock = get_redis_service().client.lock(_rebuild_lock_key(index_name), timeout=ES_REBUILD_LOCK_TTL_S)
+        if not lock.acquire(blocking=False):
+            return {"status": "running", "embedding_model": embedding_model.model}
+        try:
+            thread = threading.Thread(
+                target=ElasticSearchService._run_index_rebuild,
+                args=(index_name, embedding_model, knowledge_record.get("vector_index_profile"),
+                      tenant_id, user_id, vdb_core, lock),
+                name=f"rebuild-{index_name}",
+                daemon=True,
+            )
+            thread.start()
+        except Exception:
+            lock.release()
+            raise
+        return {"status": "started", "embedding_model": embedding_model.model}
+
+    @staticmethod
+    def _run_index_rebuild(
+            index_name: str,
+            embedding_model: BaseEmbedding,
+            index_profile: Optional[str],
+            tenant_id: str,
+            user_id: str,
+            vdb_core: VectorDatabaseCore,
+            lock: Any
+    ):
+        """Run a rebuild while refreshing its lock; the rebuild stops at its next batch if the lock was lost"""
+        stopped = threading.Event()
+        lost = threading.Event()
+
+        def heartbeat():
+            while not stopped.wait(ES_REBUILD_LOCK_TTL_S / 3):
+                try:
+                    lock.reacquire()
+                except Exception as e:
+                    logger.error(f"Lost the rebuild lock of knowledge base {index_name}: {str(e)}")
+                    lost.set()
+                    return
+
+        def check_lock(copied: int, total: int):
+            if lost.is_set():
+                raise RuntimeError(f"Rebuild of {index_name} stopped after {copied}/{total} chunks: lock lost")
+
+        heartbeat_thread = threading.Thread(target=heartbeat, name=f"rebuild-lock-{index_name}", daemon=True)
+        heartbeat_thread.start()
+        try:
+            result = vdb_core.rebuild_index(
+                index_name,
+                embedding_model,
+                embedding_dim=embedding_model.embedding_dim,
+                index_profile=index_profile,
+                progress_callback=check_lock,
+            )
+            update_model_name_by_index_name(index_name, embedding_model.model, tenant_id, user_id)
+            logger.info(f"Rebuilt knowledge base {index_name} with {embedding_model.model}: {result}")
+        except Exception as e:
+            logger.error(f"Error rebuilding knowledge base {index_name}: {str(e)}", exc_info=True)
+        finally:
+            stopped.set()
+            heartbeat_thread.join()
+            try:
+                lock.release()
+            except Exception as e:
+                logger.warning(f"Failed to release the rebuild lock of knowledge base {index_name}: {str(e)}")
+
+    @staticmethod
+    def get_rebuild_status(
+            index_name: str,
+            vdb_core: VectorDatabaseCore = Depends(get_vector_db_core)
+    ):
+        """
+        Get the progress of a knowledge base's embedding model rebuild.
+
+        Returns:
+            Dict with "running" (a process holds the rebuild lock) and the stored "checkpoint"
+        """
+        return {
+            "running": bool(get_redis_service().client.exists(_rebuild_lock_key(index_name))),
+            "checkpoint": vdb_core.get_rebuild_status(index_name),
+        }
+
     @staticmethod
     def health_check(vdb_core: VectorDatabaseCore = Depends(get_vector_db_core)):
         """
@@ -718,11 +1167,21 @@ class ElasticSearchService:
         try:
             # Try to list indices as a health check
             indices = vdb_core.get_user_indices()
-            return {
+            response = {
                 "status": "healthy",
                 "elasticsearch": "connected",
                 "indices_count": len(indices)
             }
+            embedding_cache = get_embedding_cache()
+            if embedding_cache is not None:
+                response["embedding_cache"] = embedding_cache.stats()
+            query_embedding_cache = get_query_embedding_cache()
+            if query_embedding_cache is not None:
+                response["query_embedding_cache"] = query_embedding_cache.stats()
+            embedding_coalescer = get_embedding_coalescer()
+            if embedding_coalescer is not None:
+                response["embedding_coalescer"] = embedding_coalescer.stats()
+            return response
         except Exception as e:
             raise Exception(f"Health check failed: {str(e)}")
 
@@ -956,6 +1415,7 @@ class ElasticSearchService:
         page_size: Optional[int] = None,
         path_or_url: Optional[str] = None,
         vdb_core: VectorDatabaseCore = Depends(get_vector_db_core),
+        cursor: Optional[str] = None,
     ):
         """
         Retrieve chunk records for the specified index with optional pagination.
@@ -966,9 +1426,10 @@ class ElasticSearchService:
             page_size: Page size when paginating
             path_or_url: Optional document filter
             vdb_core: VectorDatabaseCore instance
+            cursor: next_cursor of the previous page, makes deep pages as cheap as the first
 
         Returns:
-            Dictionary containing status, chunk list, total, and pagination metadata
+            Dictionary containing status, chunk list, total, pagination metadata and next_cursor
         """
         try:
             result = vdb_core.get_index_chunks(
@@ -976,38 +1437,73 @@ class ElasticSearchService:
                 page=page,
                 page_size=page_size,
                 path_or_url=path_or_url,
+                cursor=cursor,
             )
-            raw_chunks = result.get("chunks", [])
-            total = result.get("total", len(raw_chunks))
-            result_page = result.get("page", page)
-            result_page_size = result.get("page_size", page_size)
-
-            filtered_chunks: List[Any] = []
-            for chunk in raw_chunks:
-                if isinstance(chunk, dict):
-                    filtered_chunks.append(
-                        {
-                            field: chunk.get(field)
-                            for field in ALLOWED_CHUNK_FIELDS
-                            if field in chunk
-                        }
-                    )
-                else:
-                    filtered_chunks.append(chunk)
+            return ElasticSearchService._format_chunks_result(index_name, result, page, page_size)
+        except Exception as e:
+            error_msg = f"Error retrieving chunks from index {index_name}: {str(e)}"
+            logger.error(error_msg)
+            raise Exception(error_msg)
 
-            return {
-                "status": "success",
-                "message": f"Successfully retrieved {len(filtered_chunks)} chunks from index {index_name}",
-                "chunks": filtered_chunks,
-                "total": total,
-                "page": result_page,
-                "page_size": result_page_size
-            }
+    @staticmethod
+    async def get_index_chunks_async(
+        index_name: str,
+        page: Optional[int] = None,
+        page_size: Optional[int] = None,
+        path_or_url: Optional[str] = None,
+        vdb_core: AsyncVectorDatabaseCore = Depends(get_async_vector_db_core),
+        cursor: Optional[str] = None,
+    ):
+        """
+        Async variant of get_index_chunks, reading through an AsyncVectorDatabaseCore without blocking the event loop.
+        """
+        try:
+            result = await vdb_core.get_index_chunks(
+                index_name,
+                page=page,
+                page_size=page_size,
+                path_or_url=path_or_url,
+                cursor=cursor,
+            )
+            return ElasticSearchService._format_chunks_result(index_name, result, page, page_size)
         except Exception as e:
             error_msg = f"Error retrieving chunks from index {index_name}: {str(e)}"
             logger.error(error_msg)
             raise Exception(error_msg)
 
+    @staticmethod
+    def _format_chunks_result(
+        index_name: str, result: Dict[str, Any], page: Optional[int], page_size: Optional[int]
+    ) -> Dict[str, Any]:
+        """Keep only the public chunk fields and add the response envelope"""
+        raw_chunks = result.get("chunks", [])
+        total = result.get("total", len(raw_chunks))
+        result_page = result.get("page", page)
+        result_page_size = result.get("page_size", page_size)
+
+        filtered_chunks: List[Any] = []
+        for chunk in raw_chunks:
+            if isinstance(chunk, dict):
+                filtered_chunks.append(
+                    {
+                        field: chunk.get(field)
+                        for field in ALLOWED_CHUNK_FIELDS
+                        if field in chunk
+                    }
+                )
+            else:
+                filtered_chunks.append(chunk)
+
+        return {
+            "status": "success",
+            "message": f"Successfully retrieved {len(filtered_chunks)} chunks from index {index_name}",
+            "chunks": filtered_chunks,
+            "total": total,
+            "page": result_page,
+            "page_size": result_page_size,
+            "next_cursor": result.get("next_cursor"),
+        }
+
     @staticmethod
     def create_chunk(
         index_name: str,
@@ -1121,21 +1617,8 @@ class ElasticSearchService:
         Execute a hybrid search that blends accurate and semantic scoring.
         """
         try:
-            if not tenant_id:
-                raise ValueError("Tenant ID is required for hybrid search")
-            if not query or not query.strip():
-                raise ValueError("Query text is required for hybrid search")
-            if not index_names:
-                raise ValueError("At least one index name is required")
-            if top_k <= 0:
-                raise ValueError("top_k must be greater than 0")
-            if weight_accurate < 0 or weight_accurate > 1:
-                raise ValueError("weight_accurate must be between 0 and 1")
-
-            embedding_model = get_embedding_model(tenant_id)
-            if not embedding_model:
-                raise ValueError(
-                    "No embedding model configured for the current tenant")
+            embedding_model = ElasticSearchService._prepare_hybrid_search(
+                index_names, query, tenant_id, top_k, weight_accurate)
 
             start_time = time.perf_counter()
             raw_results = vdb_core.hybrid_search(
@@ -1146,21 +1629,43 @@ class ElasticSearchService:
                 weight_accurate=weight_accurate,
             )
             elapsed_ms = int((time.perf_counter() - start_time) * 1000)
+            return ElasticSearchService._format_hybrid_results(raw_results, elapsed_ms)
+        except ValueError:
+            raise
+        except Exception as exc:
+            logger.error(
+                f"Hybrid search failed for indices {index_names}: {exc}",
+                exc_info=True,
+            )
+            raise Exception(f"Error executing hybrid search: {str(exc)}")
 
-            formatted_results = []
-            for item in raw_results:
-                document = dict(item.get("document", {}))
-                document["score"] = item.get("score")
-                document["index"] = item.get("index")
-                if "scores" in item:
-                    document["score_details"] = item["scores"]
-                formatted_results.append(document)
+    @staticmethod
+    async def search_hybrid_async(
+            *,
+            index_names: List[str],
+            query: str,
+            tenant_id: str,
+            top_k: int = 10,
+            weight_accurate: float = 0.5,
+            vdb_core: AsyncVectorDatabaseCore = Depends(get_async_vector_db_core),
+    ):
+        """
+        Async variant of search_hybrid, awaiting Elasticsearch instead of blocking the worker.
+        """
+        try:
+            embedding_model = ElasticSearchService._prepare_hybrid_search(
+                index_names, query, tenant_id, top_k, weight_accurate)
 
-            return {
-                "results": formatted_results,
-                "total": len(formatted_results),
-                "query_time_ms": elapsed_ms,
-            }
+            start_time = time.perf_counter()
+            raw_results = await vdb_core.hybrid_search(
+                index_names=index_names,
+                query_text=query,
+                embedding_model=embedding_model,
+                top_k=top_k,
+                weight_accurate=weight_accurate,
+            )
+            elapsed_ms = int((time.perf_counter() - start_time) * 1000)
+            return ElasticSearchService._format_hybrid_results(raw_results, elapsed_ms)
         except ValueError:
             raise
         except Exception as exc:
@@ -1170,6 +1675,45 @@ class ElasticSearchService:
             )
             raise Exception(f"Error executing hybrid search: {str(exc)}")
 
+    @staticmethod
+    def _prepare_hybrid_search(
+        index_names: List[str], query: str, tenant_id: str, top_k: int, weight_accurate: float
+    ) -> BaseEmbedding:
+        """Validate hybrid search arguments and return the tenant's embedding model"""
+        if not tenant_id:
+            raise ValueError("Tenant ID is required for hybrid search")
+        if not query or not query.strip():
+            raise ValueError("Query text is required for hybrid search")
+        if not index_names:
+            raise ValueError("At least one index name is required")
+        if top_k <= 0:
+            raise ValueError("top_k must be greater than 0")
+        if weight_accurate < 0 or weight_accurate > 1:
+            raise ValueError("weight_accurate must be between 0 and 1")
+
+        embedding_model = get_embedding_model(tenant_id)
+        if not embedding_model:
+            raise ValueError(
+                "No embedding model configured for the current tenant")
+        return embedding_model
+
+    @staticmethod
+    def _format_hybrid_results(raw_results: List[Dict[str, Any]], elapsed_ms: int) -> Dict[str, Any]:
+        formatted_results = []
+        for item in raw_results:
+            document = dict(item.get("document", {}))
+            document["score"] = item.get("score")
+            document["index"] = item.get("index")
+            if "scores" in item:
+                document["score_details"] = item["scores"]
+            formatted_results.append(document)
+
+        return {
+            "results": formatted_results,
+            "total": len(formatted_results),
+            "query_time_ms": elapsed_ms,
+        }
+
     @staticmethod
     def _generate_chunk_id() -> str:
         """Generate a deterministic chunk id."""
@@ -0,0 +1,107 @@
+import logging
+import threading
+from typing import Optional
+
+from nexent.core.models.embedding_cache import (
+    DiskCacheTier,
+    EmbeddingCache,
+    LRUCacheTier,
+    RedisCacheTier,
+    set_default_embedding_cache,
+)
+from nexent.core.models.embedding_coalescer import EmbeddingRequestCoalescer, set_default_embedding_coalescer
+from nexent.vector_database.query_embedding_cache import QueryEmbeddingCache
+
+from consts.const import (
+    EMBEDDING_CACHE_DISK_PATH,
+    EMBEDDING_CACHE_ENABLED,
+    EMBEDDING_CACHE_MAX_ENTRIES,
+    EMBEDDING_CACHE_REDIS_ENABLED,
+    EMBEDDING_CACHE_REDIS_TTL_S,
+    EMBEDDING_COALESCE_ENABLED,
+    EMBEDDING_COALESCE_MAX_BATCH,
+    EMBEDDING_COALESCE_MAX_WAIT_MS,
+    QUERY_EMBEDDING_CACHE_ENABLED,
+    QUERY_EMBEDDING_CACHE_MAX_ENTRIES,
+    QUERY_EMBEDDING_CACHE_TTL_S,
+    REDIS_URL,
+)
+
+logger = logging.getLogger("embedding_cache_utils")
+
+_embedding_cache: Optional[EmbeddingCache] = None
+_embedding_cache_lock = threading.Lock()
+_query_embedding_cache: Optional[QueryEmbeddingCache] = None
+_embedding_coalescer: Optional[EmbeddingRequestCoalescer] = None
+
+
+def build_embedding_cache() -> Optional[EmbeddingCache]:
+    """Assemble the embedding cache tiers from configuration, or return None when disabled"""
+    if not EMBEDDING_CACHE_ENABLED:
+        return None
+
+    tiers = [LRUCacheTier(max_entries=EMBEDDING_CACHE_MAX_ENTRIES)]
+
+    if EMBEDDING_CACHE_REDIS_ENABLED:
+        if REDIS_URL:
+            import redis
+            client = redis.from_url(
+                REDIS_URL, socket_timeout=5, socket_connect_timeout=5)
+            tiers.append(RedisCacheTier(
+                client, ttl_seconds=EMBEDDING_CACHE_REDIS_TTL_S))
+        else:
+            logger.warning(
+                "EMBEDDING_CACHE_REDIS_ENABLED is set but REDIS_URL is empty, skipping Redis tier")
+
+    if EMBEDDING_CACHE_DISK_PATH:
+        try:
+            tiers.append(DiskCacheTier(EMBEDDING_CACHE_DISK_PATH))
+        except Exception as e:
+            logger.warning(
+                f"Failed to open embedding disk cache at {EMBEDDING_CACHE_DISK_PATH}: {e}")
+
+    return EmbeddingCache(tiers)
+
+
+def get_embedding_cache() -> Optional[EmbeddingCache]:
+    """
+    Return the process-wide embedding cache, creating it on first use.
+    The cache is also registered as the SDK default so the memory embedder shares it.
+    """
+    global _embedding_cache
+    if _embedding_cache is None and EMBEDDING_CACHE_ENABLED:
+        with _embedding_cache_lock:
+            if _embedding_cache is None:
+                _embedding_cache = build_embedding_cache()
+                set_default_embedding_cache(_embedding_cache)
+    return _embedding_cache
+
+
+def get_query_embedding_cache() -> Optional[QueryEmbeddingCache]:
+    """Return the process-wide query-embedding cache shared by all search paths, or None when disabled"""
+    global _query_embedding_cache
+    if _query_embedding_cache is None and QUERY_EMBEDDING_CACHE_ENABLED:
+        with _embedding_cache_lock:
+            if _query_embedding_cache is None:
+                _query_embedding_cache = QueryEmbeddingCache(
+                    max_entries=QUERY_EMBEDDING_CACHE_MAX_ENTRIES,
+                    ttl_seconds=QUERY_EMBEDDING_CACHE_TTL_S,
+                )
+    return _query_embedding_cache
+
+
+def get_embedding_coalescer() -> Optional[EmbeddingRequestCoalescer]:
+    """
+    Return the process-wide query embedding coalescer, or None when disabled.
+    It is also registered as the SDK default so memory searches join the same batches.
+    """
+    global _embedding_coalescer
+    if _embedding_coalescer is None and EMBEDDING_COALESCE_ENABLED:
+        with _embedding_cache_lock:
+            if _embedding_coalescer is None:
+                _embedding_coalescer = EmbeddingRequestCoalescer(
+                    max_batch_size=EMBEDDING_COALESCE_MAX_BATCH,
+                    max_wait_ms=EMBEDDING_COALESCE_MAX_WAIT_MS,
+                )
+                set_default_embedding_coalescer(_embedding_coalescer)
+    return _embedding_coalescer
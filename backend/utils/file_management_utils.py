@@ -124,149 +124,29 @@ async def trigger_data_process(files: List[dict], process_params: ProcessParams)
 
 async def get_all_files_status(index_name: str):
     """
-    Get status for all files according to index_name, matching corresponding tasks, 
-    and then convert to custom state
-    
+    Get status for all files according to index_name, resolved by the data process service
+    from the tasks of the index in a single request
+
     Args:
         index_name: Index name to filter tasks
-        
+
     Returns:
-        Dictionary with path_or_url as keys and dict values: {state, latest_task_id}
+        Dictionary with path_or_url as keys and dict values: {state, latest_task_id, original_filename, source_type}
     """
     try:
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(f"{DATA_PROCESS_SERVICE}/tasks/indices/{index_name}", timeout=10.0)
-            if response.status_code == 200:
-                tasks_list = response.json()
-            else:
-                logger.error(f"Error from data process service: {response.status_code} - {response.text}")
-                return {}
-        except Exception as e:
-            logger.error(f"Failed to connect to data process service: {str(e)}")
-            return {}
-        
-        logging.debug(f"Found {len(tasks_list)} tasks for index '{index_name}'")
-        if not tasks_list:
-            logger.warning(f"No tasks found for index '{index_name}'")
+        async with httpx.AsyncClient() as client:
+            response = await client.get(f"{DATA_PROCESS_SERVICE}/tasks/indices/{index_name}/files", timeout=10.0)
+        if response.status_code != 200:
+            logger.error(f"Error from data process service: {response.status_code} - {response.text}")
             return {}
-        
-        # Dictionary to store file statuses: {path_or_url: {process_state, forward_state, timestamps}}
-        file_states = {}
-        for task_info in tasks_list:
-            # No need to check index_name since get_index_tasks already filters by it
-            task_path_or_url = task_info.get('path_or_url', '')
-            task_name = task_info.get('task_name', '')
-            task_status = task_info.get('status', '')
-            task_created_at = task_info.get('created_at', 0)
-            task_id = task_info.get('id', '')
-            original_filename = task_info.get('original_filename', '')
-            source_type = task_info.get('source_type', '')
-            if task_path_or_url:
-                # Initialize file state if not exists
-                if task_path_or_url not in file_states:
-                    file_states[task_path_or_url] = {
-                        'process_state': '',
-                        'forward_state': '',
-                        'latest_process_created_at': 0,
-                        'latest_forward_created_at': 0,
-                        'latest_task_id': '',
-                        'original_filename': '',
-                        'source_type': ''
-                    }
-                file_state = file_states[task_path_or_url]
-                # Process task
-                if task_name == 'process' and task_created_at > file_state['latest_process_created_at']:
-                    file_state['latest_process_created_at'] = task_created_at
-                    file_state['process_state'] = task_status
-                    file_state['latest_task_id'] = task_id
-                    file_state['original_filename'] = original_filename
-                    file_state['source_type'] = source_type
-                # Forward task
-                elif task_name == 'forward' and task_created_at > file_state['latest_forward_created_at']:
-                    file_state['latest_forward_created_at'] = task_created_at
-                    file_state['forward_state'] = task_status
-                    file_state['latest_task_id'] = task_id
-                    file_state['original_filename'] = original_filename
-                    file_state['source_type'] = source_type
-        result = {}
-        for path_or_url, file_state in file_states.items():
-            # Call remote state conversion API so this service no longer depends on Celery
-            custom_state = await _convert_to_custom_state(
-                process_celery_state=file_state['process_state'] or '',
-                forward_celery_state=file_state['forward_state'] or ''
-            )
-            result[path_or_url] = {
-                'state': custom_state,
-                'latest_task_id': file_state['latest_task_id'] or '',
-                'original_filename': file_state['original_filename'] or '',
-                'source_type': file_state['source_type'] or ''
-            }
-        return result
+        files_status = response.json()
+        logger.debug(f"Found {len(files_status)} files with tasks for index '{index_name}'")
+        return files_status
     except Exception as e:
         logger.error(f"Error getting all files status for index {index_name}, details: {str(e)} {traceback.format_exc()}")
         return {}  # Return empty dict on error
 
 
-async def _convert_to_custom_state(process_celery_state: str, forward_celery_state: str) -> str:
-    """Delegates Celery-state conversion to the data-process service.
-
-    This removes the direct dependency on the *celery* package for callers of
-    `file_management_utils`.
-    """
-    try:
-        payload = {
-            "process_state": process_celery_state,
-            "forward_state": forward_celery_state,
-        }
-
-        async with httpx.AsyncClient() as client:
-            response = await client.post(f"{DATA_PROCESS_SERVICE}/tasks/convert_state", json=payload, timeout=5.0)
-
-        if response.status_code == 200:
-            return response.json().get("state", "WAIT_FOR_PROCESSING")
-        else:
-            logger.warning(
-                "State conversion service error: %s - %s", response.status_code, response.text
-            )
-    except Exception as e:
-        logger.warning("Failed to convert state via service: %s", str(e))
-
-    # Fallback mapping without Celery dependency (string comparison only)
-    success = "SUCCESS"
-    failure = "FAILURE"
-    pending = "PENDING"
-    started = "STARTED"
-
-    if process_celery_state == failure:
-        return "PROCESS_FAILED"
-    if forward_celery_state == failure:
-        return "FORWARD_FAILED"
-    if process_celery_state == success and forward_celery_state == success:
-        return "COMPLETED"
-    if not process_celery_state and not forward_celery_state:
-        return "WAIT_FOR_PROCESSING"
-
-    forward_state_map = {
-        pending: "WAIT_FOR_FORWARDING",
-        started: "FORWARDING",
-        success: "COMPLETED",
-        failure: "FORWARD_FAILED",
-    }
-    process_state_map = {
-        pending: "WAIT_FOR_PROCESSING",
-        started: "PROCESSING",
-        success: "WAIT_FOR_FORWARDING",
-        failure: "PROCESS_FAILED",
-    }
-
-    if forward_celery_state:
-        return forward_state_map.get(forward_celery_state, "WAIT_FOR_FORWARDING")
-    if process_celery_state:
-        return process_state_map.get(process_celery_state, "WAIT_FOR_PROCESSING")
-    return "WAIT_FOR_PROCESSING"
-
-
 def get_file_size(source_type: str, path_or_url: str) -> int:
     """Query the actual size(bytes) of the file."""
     try:
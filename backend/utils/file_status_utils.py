@@ -0,0 +1,95 @@
+from typing import Any, Dict, Iterable
+
+# Celery state names, compared as strings so callers do not depend on Celery
+PENDING = "PENDING"
+STARTED = "STARTED"
+SUCCESS = "SUCCESS"
+FAILURE = "FAILURE"
+
+FORWARD_STATE_MAP = {
+    PENDING: "WAIT_FOR_FORWARDING",
+    STARTED: "FORWARDING",
+    SUCCESS: "COMPLETED",
+    FAILURE: "FORWARD_FAILED",
+}
+PROCESS_STATE_MAP = {
+    PENDING: "WAIT_FOR_PROCESSING",
+    STARTED: "PROCESSING",
+    SUCCESS: "WAIT_FOR_FORWARDING",
+    FAILURE: "PROCESS_FAILED",
+}
+
+
+def convert_celery_states_to_custom(process_celery_state: str, forward_celery_state: str) -> str:
+    """
+    Map the Celery states of a file's latest process and forward tasks to its frontend state
+
+    Args:
+        process_celery_state: State of the latest process task, empty if none
+        forward_celery_state: State of the latest forward task, empty if none
+
+    Returns:
+        Custom state string such as PROCESSING, FORWARDING, COMPLETED or PROCESS_FAILED
+    """
+    if process_celery_state == FAILURE:
+        return "PROCESS_FAILED"
+    if forward_celery_state == FAILURE:
+        return "FORWARD_FAILED"
+    if process_celery_state == SUCCESS and forward_celery_state == SUCCESS:
+        return "COMPLETED"
+
+    if forward_celery_state:
+        return FORWARD_STATE_MAP.get(forward_celery_state, "WAIT_FOR_FORWARDING")
+    if process_celery_state:
+        return PROCESS_STATE_MAP.get(process_celery_state, "WAIT_FOR_PROCESSING")
+    return "WAIT_FOR_PROCESSING"
+
+
+def summarize_file_states(tasks: Iterable[Dict[str, Any]]) -> Dict[str, Dict[str, str]]:
+    """
+    Resolve the state of every file from the tasks of an index
+
+    The latest process and forward task of each file decide its state.
+
+    Args:
+        tasks: Task status records with path_or_url, task_name, status, created_at, id, original_filename and
+            source_type
+
+    Returns:
+        Dictionary with path_or_url as keys and dict values: {state, latest_task_id, original_filename, source_type}
+    """
+    # Dictionary to store file statuses: {path_or_url: {process_state, forward_state, timestamps}}
+    file_states = {}
+    for task_info in tasks:
+        task_path_or_url = task_info.get('path_or_url', '')
+        if not task_path_or_url:
+            continue
+        task_name = task_info.get('task_name', '')
+        task_created_at = task_info.get('created_at', 0) or 0
+        file_state = file_states.setdefault(task_path_or_url, {
+            'process_state': '',
+            'forward_state': '',
+            'latest_process_created_at': 0,
+            'latest_forward_created_at': 0,
+            'latest_task_id': '',
+            'original_filename': '',
+            'source_type': ''
+        })
+        if task_name not in ('process', 'forward') or task_created_at <= file_state[f'latest_{task_name}_created_at']:
+            continue
+        file_state[f'latest_{task_name}_created_at'] = task_created_at
+        file_state[f'{task_name}_state'] = task_info.get('status', '')
+        file_state['latest_task_id'] = task_info.get('id', '')
+        file_state['original_filename'] = task_info.get('original_filename', '')
+        file_state['source_type'] = task_info.get('source_type', '')
+
+    return {
+        path_or_url: {
+            'state': convert_celery_states_to_custom(file_state['process_state'] or '',
+                                                     file_state['forward_state'] or ''),
+            'latest_task_id': file_state['latest_task_id'] or '',
+            'original_filename': file_state['original_filename'] or '',
+            'source_type': file_state['source_type'] or ''
+        }
+        for path_or_url, file_state in file_states.items()
+    }
@@ -0,0 +1,191 @@
+"""
+Redis spool of the documents streamed to /indices/{index_name}/documents/stream.
+
+The forward task sends the chunks of one file as NDJSON segments. Each segment is stored here and acknowledged
+with the offset of the next chunk the session expects, so a failed request resends one segment and a new attempt
+of the task resumes where the previous one stopped. The final segment commits the file from the spool, after
+which only the commit result is kept, letting a resent final segment get the same answer.
+
+Requests of a session are serialized by a Redis lock, so a resent segment racing the original cannot move the
+offset twice, and a session is marked committing while its final segment is indexed, so a resent final segment
+served by another process does not index the file again. Commits running across all processes are bounded by
+the commit slots. A running commit refreshes its committing mark and its slot as a heartbeat; only a commit whose
+heartbeat stopped is taken for abandoned, however long the indexing takes.
+
+Key layout (values are bytes, clients use decode_responses=False):
+    dp:ingest:{session_id}              hash {index_name, next_offset, committing, result}
+    dp:ingest:{session_id}:lock         lock held while a request of the session reads and moves its offset
+    dp:ingest:{session_id}:segments     sorted set of the stored segment offsets
+    dp:ingest:{session_id}:{offset}     NDJSON body of the segment starting at chunk offset
+    dp:ingest_commits                   sorted set of the committing session IDs, scored by their last heartbeat
+"""
+import json
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+SESSION_KEY_PREFIX = "dp:ingest"
+COMMITS_KEY = "dp:ingest_commits"
+
+
+def session_key(session_id: str) -> str:
+    return f"{SESSION_KEY_PREFIX}:{session_id}"
+
+
+def lock_key(session_id: str) -> str:
+    return f"{session_key(session_id)}:lock"
+
+
+def segments_key(session_id: str) -> str:
+    return f"{session_key(session_id)}:segments"
+
+
+def segment_key(session_id: str, offset: int) -> str:
+    return f"{session_key(session_id)}:{offset}"
+
+
+def _decode(value: Any) -> str:
+    return value.decode('utf-8') if isinstance(value, bytes) else value
+
+
+def encode_ndjson(documents: Iterable[Dict[str, Any]]) -> bytes:
+    return b"".join(json.dumps(document, ensure_ascii=False).encode("utf-8") + b"\n" for document in documents)
+
+
+def parse_ndjson(body: bytes) -> List[Dict[str, Any]]:
+    """
+    Parse an NDJSON segment, skipping blank lines
+
+    Raises:
+        ValueError: If a line is not a JSON object
+    """
+    documents = []
+    for line_number, line in enumerate(body.splitlines(), start=1):
+        if not line.strip():
+            continue
+        document = json.loads(line)
+        if not isinstance(document, dict):
+            raise ValueError(f"Line {line_number} of the segment is not a JSON object")
+        documents.append(document)
+    return documents
+
+
+def get_session(client: Any, session_id: str) -> Optional[Dict[str, Any]]:
+    """
+    State of an ingestion session
+
+    Returns:
+        Dict with index_name, next_offset, committing (start time of a running commit, None otherwise) and the
+        commit result (None until committed), or None for an unknown or expired session
+    """
+    raw = client.hgetall(session_key(session_id))
+    if not raw:
+        return None
+    raw = {_decode(key): _decode(value) for key, value in raw.items()}
+    return {
+        'index_name': raw.get('index_name', ''),
+        'next_offset': int(raw.get('next_offset') or 0),
+        'committing': float(raw['committing']) if raw.get('committing') else None,
+        'result': json.loads(raw['result']) if raw.get('result') else None,
+    }
+
+
+def append_segment(client: Any, session_id: str, index_name: str, offset: int, body: bytes, count: int,
+                   ttl_s: int) -> int:
+    """
+    Store a segment and move the session past it
+
+    Args:
+        client: Redis client
+        session_id: ID of the ingestion session
+        index_name: Index the session writes to
+        offset: Chunk offset of the first line of the segment
+        body: NDJSON body of the segment
+        count: Number of chunks in the segment
+        ttl_s: Expiration of the session, refreshed by every segment
+
+    Returns:
+        Offset of the next chunk the session expects
+    """
+    next_offset = offset + count
+    pipe = client.pipeline(transaction=True)
+    if count:
+        pipe.set(segment_key(session_id, offset), body, ex=ttl_s)
+        pipe.zadd(segments_key(session_id), {offset: offset})
+    pipe.hset(session_key(session_id), mapping={'index_name': index_name, 'next_offset': next_offset})
+    pipe.expire(session_key(session_id), ttl_s)
+    pipe.expire(segments_key(session_id), ttl_s)
+    pipe.execute()
+    return next_offset
+
+
+def iter_documents(client: Any, session_id: str) -> Iterator[Dict[str, Any]]:
+    """
+    Documents spooled by a session in offset order, one segment in memory at a time
+
+    Raises:
+        ValueError: If a segment expired before the commit
+    """
+    for offset in client.zrange(segments_key(session_id), 0, -1):
+        offset = int(_decode(offset))
+        body = client.get(segment_key(session_id, offset))
+        if body is None:
+            raise ValueError(f"Segment at chunk {offset} of ingestion session '{session_id}' is missing")
+        yield from parse_ndjson(body)
+
+
+def acquire_commit_slot(client: Any, session_id: str, limit: int, timeout_s: int) -> bool:
+    """
+    Take one of the limit commit slots shared by every process
+
+    Sessions hold their slot in the order they asked for it, so concurrent callers never admit more than limit
+    commits. Slots without a heartbeat for timeout_s belong to commits whose process died and are reclaimed.
+
+    Returns:
+        Whether the slot was taken; release it with release_commit_slot
+    """
+    now = time.time()
+    pipe = client.pipeline(transaction=True)
+    pipe.zremrangebyscore(COMMITS_KEY, '-inf', now - timeout_s)
+    pipe.zadd(COMMITS_KEY, {session_id: now})
+    pipe.zrank(COMMITS_KEY, session_id)
+    rank = pipe.execute()[-1]
+    if rank is not None and rank < limit:
+        return True
+    client.zrem(COMMITS_KEY, session_id)
+    return False
+
+
+def release_commit_slot(client: Any, session_id: str) -> None:
+    client.zrem(COMMITS_KEY, session_id)
+
+
+def mark_committing(client: Any, session_id: str) -> None:
+    client.hset(session_key(session_id), mapping={'committing': time.time()})
+
+
+def refresh_commit(client: Any, session_id: str) -> None:
+    """Heartbeat of a running commit, keeping its committing mark and its slot from being reclaimed"""
+    now = time.time()
+    pipe = client.pipeline(transaction=False)
+    pipe.hset(session_key(session_id), mapping={'committing': now})
+    # A slot already reclaimed is not taken again, that could exceed the limit
+    pipe.zadd(COMMITS_KEY, {session_id: now}, xx=True)
+    pipe.execute()
+
+
+def clear_committing(client: Any, session_id: str) -> None:
+    """Drop the committing mark of a failed commit so the final segment can be resent"""
+    client.hdel(session_key(session_id), 'committing')
+
+
+def complete_session(client: Any, session_id: str, result: Dict[str, Any], ttl_s: int) -> None:
+    """Drop the spooled segments of a committed session and keep its result until the session expires"""
+    offsets = [int(_decode(offset)) for offset in client.zrange(segments_key(session_id), 0, -1)]
+    pipe = client.pipeline(transaction=False)
+    if offsets:
+        pipe.delete(*(segment_key(session_id, offset) for offset in offsets))
+    pipe.delete(segments_key(session_id))
+    pipe.hdel(session_key(session_id), 'committing')
+    pipe.hset(session_key(session_id), mapping={'result': json.dumps(result, ensure_ascii=False)})
+    pipe.expire(session_key(session_id), ttl_s)
+    pipe.execute()
@@ -5,6 +5,7 @@ from urllib.parse import urlparse
 from consts import const as _c
 from consts.const import MODEL_CONFIG_MAPPING
 from utils.config_utils import get_model_name_from_config, tenant_config_manager
+from utils.embedding_cache_utils import get_embedding_cache
 
 logger = logging.getLogger("memory_utils")
 
@@ -69,4 +70,7 @@ def build_memory_config(tenant_id: str) -> Dict[str, Any]:
         },
         "telemetry": {"enabled": False},
     }
+
+    # Make sure the shared embedding cache is registered before mem0 starts embedding
+    get_embedding_cache()
     return memory_config 
\ No newline at end of file
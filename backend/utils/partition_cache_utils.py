@@ -0,0 +1,70 @@
+"""
+Partition result cache of the data processing actors, and its cleanup when files are deleted.
+
+Entries are keyed by the sha256 of the file bytes, so removing the entries of a deleted file means hashing it
+first: evict_partition_cache must run before the file itself is deleted. With DP_PARTITION_CACHE=local the
+entries only reach this process when DP_PARTITION_CACHE_DIR is shared with the data process workers; the TTL
+removes them otherwise.
+"""
+import logging
+from typing import Any, Optional
+
+from consts.const import (
+    DP_PARTITION_CACHE,
+    DP_PARTITION_CACHE_DIR,
+    DP_PARTITION_CACHE_PREFIX,
+    DP_PARTITION_CACHE_TTL_S,
+)
+
+logger = logging.getLogger("partition_cache_utils")
+
+
+def create_partition_cache() -> Optional[Any]:
+    """
+    Partition result cache selected by DP_PARTITION_CACHE.
+
+    Returns:
+        A PartitionCache storing MinIO objects or local files, or None when the cache is disabled
+    """
+    if DP_PARTITION_CACHE == "minio":
+        from database.client import minio_client
+        from nexent.data_process import StoragePartitionCache
+        return StoragePartitionCache(minio_client, prefix=DP_PARTITION_CACHE_PREFIX, ttl_s=DP_PARTITION_CACHE_TTL_S)
+    if DP_PARTITION_CACHE == "local":
+        from nexent.data_process import LocalPartitionCache
+        return LocalPartitionCache(DP_PARTITION_CACHE_DIR, ttl_s=DP_PARTITION_CACHE_TTL_S)
+    if DP_PARTITION_CACHE != "none":
+        logger.warning(f"Unknown DP_PARTITION_CACHE '{DP_PARTITION_CACHE}', partition results are not cached")
+    return None
+
+
+def evict_partition_cache(object_name: str) -> int:
+    """
+    Remove the cached partition results of a MinIO file, before the file is deleted.
+
+    Errors are logged and reported as nothing evicted, so they never block the deletion.
+
+    Args:
+        object_name: Object name of the file in MinIO
+
+    Returns:
+        Number of cache entries removed
+    """
+    partition_cache = create_partition_cache()
+    if partition_cache is None:
+        return 0
+    from database.attachment_db import open_file_stream
+    from nexent.data_process import hash_file_stream
+
+    try:
+        stream = open_file_stream(object_name)
+        if stream is None:
+            return 0
+        try:
+            file_hash = hash_file_stream(stream)
+        finally:
+            stream.close()
+        return partition_cache.evict_file(file_hash)
+    except Exception as e:
+        logger.warning(f"Failed to evict the partition results of {object_name}: {e}")
+        return 0
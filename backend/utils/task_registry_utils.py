@@ -0,0 +1,213 @@
+"""
+Redis registry of data processing task statuses, kept per knowledge base index.
+
+Listing the tasks of an index used to scan every celery-task-meta-* key with KEYS and load each result through
+AsyncResult before filtering by index name, so the cost grew with every task ever run across all tenants. The
+registry is written when tasks are created and by the Celery signal handlers of the worker, and an index's tasks
+are read with one pipelined round trip whose cost grows with that index only. The same sorted sets, plus one per
+document, let a knowledge base or document deletion find its Celery results without scanning the keyspace.
+
+Key layout (values are strings; readers also accept the bytes of a decode_responses=False client):
+    dp:task:{task_id}                       hash of the task status record, see TASK_RECORD_FIELDS
+    dp:index_tasks:{index_name}             sorted set of the task IDs of an index, scored by created_at
+    dp:doc_tasks:{index_name}:{path_md5}    sorted set of the task IDs of one document of an index
+    dp:task_indices                         set of the index names having registered tasks
+    dp:legacy_tasks_migrated                set once no indexed Celery result is left outside the registry
+
+Records and task sets written with a ttl_s expire like the Celery results they mirror; sorted set members older
+than ttl_s are trimmed on every write.
+"""
+import hashlib
+import logging
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger("task_registry_utils")
+
+TASK_KEY_PREFIX = "dp:task"
+INDEX_TASKS_KEY_PREFIX = "dp:index_tasks"
+DOCUMENT_TASKS_KEY_PREFIX = "dp:doc_tasks"
+TASK_INDICES_KEY = "dp:task_indices"
+LEGACY_TASKS_MIGRATED_KEY = "dp:legacy_tasks_migrated"
+
+# Fields of a record, in the shape returned by get_task_info
+TASK_RECORD_FIELDS = ('id', 'index_name', 'task_name', 'path_or_url', 'original_filename', 'source_type',
+                      'status', 'created_at', 'updated_at', 'error')
+FLOAT_FIELDS = ('created_at', 'updated_at', 'processing_time', 'storage_time')
+INT_FIELDS = ('chunks_count',)
+
+
+def task_key(task_id: str) -> str:
+    return f"{TASK_KEY_PREFIX}:{task_id}"
+
+
+def index_tasks_key(index_name: str) -> str:
+    return f"{INDEX_TASKS_KEY_PREFIX}:{index_name}"
+
+
+def document_tasks_key(index_name: str, path_or_url: str) -> str:
+    # Hash the path so URLs and object names of any length give a short key
+    path_hash = hashlib.md5(path_or_url.encode()).hexdigest()
+    return f"{DOCUMENT_TASKS_KEY_PREFIX}:{index_name}:{path_hash}"
+
+
+def _decode(value: Any) -> str:
+    return value.decode('utf-8') if isinstance(value, bytes) else value
+
+
+def record_task_status(
+    client: Any,
+    task_id: str,
+    task_name: str,
+    index_name: str,
+    status: str,
+    created_at: Optional[float] = None,
+    ttl_s: Optional[int] = None,
+    **fields: Any,
+) -> None:
+    """
+    Create or update the record of a task.
+
+    Args:
+        client: Redis client
+        task_id: Celery task ID
+        task_name: Short task name, e.g. process or forward
+        index_name: Index the task belongs to
+        status: Celery state
+        created_at: Creation (or start) time; kept from the first write when None
+        ttl_s: Lifetime of the record and of its task sets from this write, None to keep them
+        **fields: Further record fields such as path_or_url, original_filename, source_type, error or
+            chunks_count; None values are stored as empty strings
+    """
+    now = time.time()
+    mapping = {'id': task_id, 'task_name': task_name, 'index_name': index_name, 'status': status,
+               'updated_at': now}
+    mapping.update({key: '' if value is None else value for key, value in fields.items()})
+
+    set_keys = [index_tasks_key(index_name)]
+    if fields.get('path_or_url'):
+        set_keys.append(document_tasks_key(index_name, fields['path_or_url']))
+
+    pipe = client.pipeline(transaction=False)
+    if created_at is None:
+        pipe.hsetnx(task_key(task_id), 'created_at', now)
+        for set_key in set_keys:
+            pipe.zadd(set_key, {task_id: now}, nx=True)
+    else:
+        mapping['created_at'] = created_at
+        for set_key in set_keys:
+            pipe.zadd(set_key, {task_id: created_at})
+    pipe.hset(task_key(task_id), mapping=mapping)
+    pipe.sadd(TASK_INDICES_KEY, index_name)
+    if ttl_s:
+        pipe.expire(task_key(task_id), ttl_s)
+        for set_key in set_keys:
+            pipe.zremrangebyscore(set_key, '-inf', now - ttl_s)
+            pipe.expire(set_key, ttl_s)
+    pipe.execute()
+
+
+def _decode_record(raw: Dict[Any, Any]) -> Dict[str, Any]:
+    raw = {_decode(key): _decode(value) for key, value in raw.items()}
+    record: Dict[str, Any] = {field: raw.get(field, '') for field in TASK_RECORD_FIELDS}
+    record.update(raw)
+    for field in FLOAT_FIELDS:
+        if record.get(field):
+            record[field] = float(record[field])
+    for field in INT_FIELDS:
+        if record.get(field):
+            record[field] = int(record[field])
+    record['status'] = record['status'] or 'PENDING'
+    record['error'] = record['error'] or None
+    return record
+
+
+def _read_records(client: Any, task_ids: Iterable[str]) -> List[Dict[str, Any]]:
+    task_ids = list(task_ids)
+    if not task_ids:
+        return []
+    pipe = client.pipeline(transaction=False)
+    for task_id in task_ids:
+        pipe.hgetall(task_key(task_id))
+    return [_decode_record(raw) for raw in pipe.execute() if raw]
+
+
+def get_index_task_records(client: Any, index_name: str) -> List[Dict[str, Any]]:
+    """Records of the tasks of an index, oldest first"""
+    return _read_records(client, get_task_ids(client, index_name))
+
+
+def get_all_task_records(client: Any) -> List[Dict[str, Any]]:
+    """Records of the tasks of every index"""
+    index_names = [_decode(index_name) for index_name in client.smembers(TASK_INDICES_KEY)]
+    if not index_names:
+        return []
+    pipe = client.pipeline(transaction=False)
+    for index_name in index_names:
+        pipe.zrange(index_tasks_key(index_name), 0, -1)
+    return _read_records(client, (_decode(task_id) for task_ids in pipe.execute() for task_id in task_ids))
+
+
+def get_task_ids(client: Any, index_name: str, path_or_url: Optional[str] = None) -> List[str]:
+    """IDs of the registered tasks of an index, or of one of its documents when path_or_url is given, oldest first"""
+    key = document_tasks_key(index_name, path_or_url) if path_or_url else index_tasks_key(index_name)
+    return [_decode(task_id) for task_id in client.zrange(key, 0, -1)]
+
+
+def get_unregistered_task_ids(client: Any, task_ids: Iterable[str]) -> List[str]:
+    """IDs among task_ids that have no record, i.e. tasks created before the registry or whose record expired"""
+    task_ids = list(task_ids)
+    if not task_ids:
+        return []
+    pipe = client.pipeline(transaction=False)
+    for task_id in task_ids:
+        pipe.exists(task_key(task_id))
+    return [task_id for task_id, exists in zip(task_ids, pipe.execute()) if not exists]
+
+
+def legacy_tasks_migrated(client: Any) -> bool:
+    """Whether every indexed Celery result is known to be registered, so deletions no longer need to scan"""
+    return bool(client.exists(LEGACY_TASKS_MIGRATED_KEY))
+
+
+def mark_legacy_tasks_migrated(client: Any) -> None:
+    client.set(LEGACY_TASKS_MIGRATED_KEY, int(time.time()))
+
+
+def remove_task_records(client: Any, index_name: str, task_ids: Iterable[str],
+                        path_or_url: Optional[str] = None) -> None:
+    """
+    Remove the records of the given tasks of an index.
+
+    Without path_or_url the whole index is dropped from the registry, including the task sets of its documents.
+
+    Args:
+        client: Redis client
+        index_name: Index the tasks belong to
+        task_ids: IDs of the tasks to remove, usually from get_task_ids
+        path_or_url: Document the tasks belong to, or None for every task of the index
+    """
+    task_ids = list(task_ids)
+    if path_or_url:
+        pipe = client.pipeline(transaction=False)
+        if task_ids:
+            pipe.delete(*(task_key(task_id) for task_id in task_ids))
+            pipe.zrem(index_tasks_key(index_name), *task_ids)
+        pipe.delete(document_tasks_key(index_name, path_or_url))
+        pipe.execute()
+        return
+
+    # Document sets are only reachable through the path_or_url of the records, so read them before deleting
+    pipe = client.pipeline(transaction=False)
+    for task_id in task_ids:
+        pipe.hget(task_key(task_id), 'path_or_url')
+    paths = {_decode(path) for path in pipe.execute() if path} if task_ids else set()
+
+    pipe = client.pipeline(transaction=False)
+    if task_ids:
+        pipe.delete(*(task_key(task_id) for task_id in task_ids))
+    for path in paths:
+        pipe.delete(document_tasks_key(index_name, path))
+    pipe.delete(index_tasks_key(index_name))
+    pipe.srem(TASK_INDICES_KEY, index_name)
+    pipe.execute()
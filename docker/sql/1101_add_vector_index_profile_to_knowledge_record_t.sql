@@ -0,0 +1,11 @@
+-- Add vector_index_profile column to knowledge_record_t table, used to record how the knowledge base stores its vectors
+
+-- Switch to nexent schema
+SET search_path TO nexent;
+
+-- Add vector_index_profile column
+ALTER TABLE "knowledge_record_t"
+ADD COLUMN IF NOT EXISTS "vector_index_profile" varchar(30) COLLATE "pg_catalog"."default" DEFAULT 'float';
+
+-- Add column comment
+COMMENT ON COLUMN "knowledge_record_t"."vector_index_profile" IS 'Vector index profile chosen at creation time, optional values: float/int8/bbq';
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+
+"""
+Peak memory and run time of OpenPyxlProcessor on large workbooks: the default mode, which loads the whole workbook
+and a deep copy of it, versus the streaming mode, which reads each sheet row by row in read-only mode.
+
+A workbook of --rows x --cols cells is generated with a few remark rows above the title and a vertical merge every
+--merge-every rows. Each mode processes it in a fresh interpreter, so the peak RSS of one mode does not hide the
+other. The digest column shows whether both modes produced the same chunks.
+
+Run from the repository root:
+    python -m experimental.data_process.benchmark_excel_streaming --rows 100000 --cols 12
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict
+
+import openpyxl
+
+
+def build_workbook(path: str, rows: int, cols: int, merge_every: int) -> None:
+    wb = openpyxl.Workbook()
+    sheet = wb.active
+    sheet.title = "Data"
+    sheet.append(["Generated benchmark data"])
+    sheet.append([f"{rows} rows x {cols} columns"])
+    sheet.append([f"Column {col}" for col in range(cols)])
+    for row in range(rows):
+        # Leave the first cell empty below each merge start so the merged value is filled in
+        first = f"group {row // merge_every}" if row % merge_every == 0 else None
+        sheet.append([first] + [f"r{row}c{col}" if col % 3 else row * col for col in range(1, cols)])
+    for start in range(4, rows + 4, merge_every):
+        end = min(start + merge_every - 1, rows + 3)
+        if end > start:
+            sheet.merge_cells(start_row=start, start_column=1, end_row=end, end_column=1)
+    wb.save(path)
+
+
+def max_rss_mb() -> float:
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale
+
+
+def run_mode(path: str, streaming: bool) -> Dict[str, float]:
+    """Process the workbook in this interpreter and report time, peak RSS and a digest of the chunks"""
+    from sdk.nexent.data_process.openpyxl_processor import OpenPyxlProcessor
+
+    with open(path, "rb") as f:
+        file_data = f.read()
+    baseline_mb = max_rss_mb()
+    start = time.perf_counter()
+    digest = hashlib.sha256()
+    count = 0
+    for chunk in OpenPyxlProcessor(streaming=streaming).process_file(file_data, "basic", os.path.basename(path)):
+        digest.update(json.dumps(chunk, ensure_ascii=False, sort_keys=True).encode("utf-8"))
+        count += 1
+    return {
+        "seconds": time.perf_counter() - start,
+        "peak_rss_mb": max_rss_mb(),
+        "baseline_rss_mb": baseline_mb,
+        "chunks": count,
+        "digest": digest.hexdigest()[:12],
+    }
+
+
+def run_in_subprocess(path: str, mode: str) -> Dict[str, float]:
+    output = subprocess.run(
+        [sys.executable, "-m", "experimental.data_process.benchmark_excel_streaming", "--worker", mode, path],
+        check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--cols", type=int, default=12)
+    parser.add_argument("--merge-every", type=int, default=5, help="Rows per vertical merge in the first column")
+    parser.add_argument("--worker", nargs=2, metavar=("MODE", "PATH"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        mode, path = args.worker
+        print(json.dumps(run_mode(path, streaming=mode == "streaming")))
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "benchmark.xlsx")
+        build_workbook(path, args.rows, args.cols, args.merge_every)
+        print(f"workbook: {args.rows} rows x {args.cols} cols, {os.path.getsize(path) / 1024 / 1024:.1f} MB")
+        print(f"{'mode':<10} {'seconds':>9} {'peak_rss_mb':>12} {'delta_mb':>9} {'chunks':>8} {'digest':>13}")
+        for mode in ("default", "streaming"):
+            result = run_in_subprocess(path, mode)
+            print(f"{mode:<10} {result['seconds']:>9.2f} {result['peak_rss_mb']:>12.1f} "
+                  f"{result['peak_rss_mb'] - result['baseline_rss_mb']:>9.1f} {result['chunks']:>8} "
+                  f"{result['digest']:>13}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+
+"""
+Per-request latency of embedding API calls with a fresh connection per request versus the pooled keep-alive
+sessions shared by OpenAICompatibleEmbedding and JinaEmbedding.
+
+A local stand-in for an OpenAI compatible /v1/embeddings endpoint is started in-process. It answers every request
+with zero vectors after an optional simulated model latency and counts the TCP connections it accepted. Both
+modes run the same number of requests from the same number of client threads. The stand-in speaks plain HTTP, so
+the difference shown is the TCP handshake only; against a TLS endpoint the gap per request is larger.
+
+Run from the repository root:
+    python -m experimental.embedding.benchmark_http_pool --requests 2000 --threads 8 --batch 16
+"""
+
+import argparse
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List
+
+import numpy as np
+import requests
+
+from sdk.nexent.core.models.embedding_model import OpenAICompatibleEmbedding, close_http_sessions
+
+
+class StandInEmbeddingHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately, Nagle would hold the body back for a delayed ACK on reused connections
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        if self.server.delay_s:
+            time.sleep(self.server.delay_s)
+        data = [{"index": i, "embedding": [0.0] * self.server.dims} for i in range(len(body["input"]))]
+        payload = json.dumps({"data": data, "model": body["model"]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server(dims: int, delay_ms: float) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInEmbeddingHandler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.connections = 0
+    server.dims = dims
+    server.delay_s = delay_ms / 1000
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run(call: Callable[[], None], total: int, threads: int) -> List[float]:
+    def timed(_):
+        start = time.perf_counter()
+        call()
+        return (time.perf_counter() - start) * 1000
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        return list(executor.map(timed, range(total)))
+
+
+def summarize(latencies: List[float], wall_s: float, connections: int) -> Dict[str, float]:
+    return {
+        "p50_ms": float(np.percentile(latencies, 50)),
+        "p95_ms": float(np.percentile(latencies, 95)),
+        "req_per_s": len(latencies) / wall_s,
+        "connections": connections,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--batch", type=int, default=16, help="Texts per embedding request")
+    parser.add_argument("--dims", type=int, default=1024)
+    parser.add_argument("--delay-ms", type=float, default=0.0, help="Simulated model latency of the stand-in server")
+    parser.add_argument("--pool-maxsize", type=int, default=16)
+    args = parser.parse_args()
+
+    server = start_server(args.dims, args.delay_ms)
+    url = f"http://127.0.0.1:{server.server_address[1]}/v1/embeddings"
+    texts = [f"chunk {i}" for i in range(args.batch)]
+    model = OpenAICompatibleEmbedding("stand-in", url, "key", args.dims, pool_maxsize=args.pool_maxsize)
+
+    def fresh_connection():
+        response = requests.post(url, headers=model.headers, json=model._prepare_input(texts), timeout=30)
+        response.raise_for_status()
+        response.json()
+
+    def pooled_session():
+        model.get_embeddings(texts, timeout=30)
+
+    print(f"{'mode':<8} {'p50_ms':>8} {'p95_ms':>8} {'req/s':>9} {'connections':>12}")
+    try:
+        for mode, call in (("fresh", fresh_connection), ("pooled", pooled_session)):
+            server.connections = 0
+            start = time.perf_counter()
+            latencies = run(call, args.requests, args.threads)
+            result = summarize(latencies, time.perf_counter() - start, server.connections)
+            print(f"{mode:<8} {result['p50_ms']:>8.2f} {result['p95_ms']:>8.2f} {result['req_per_s']:>9.1f} "
+                  f"{result['connections']:>12}")
+    finally:
+        close_http_sessions()
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+
+"""
+Recall versus latency benchmark of the vector index profiles supported by ElasticSearchCore.create_index.
+
+For every profile (float, int8, bbq) an index is created through ElasticSearchCore, filled with the same
+random unit vectors and queried with kNN at several num_candidates values. Recall@k is measured against an
+exact brute-force cosine ranking, latency is the client-side wall time of each search.
+
+Start a local Elasticsearch first, for example:
+    docker run -d --name es-bench -p 9200:9200 -e discovery.type=single-node \\
+        -e xpack.security.enabled=false docker.elastic.co/elasticsearch/elasticsearch:8.17.2
+
+Then run from the repository root:
+    python -m experimental.vector_index.benchmark_index_profiles --docs 100000 --dims 1024
+"""
+
+import argparse
+import time
+from logging import getLogger
+from typing import Dict, List
+
+import numpy as np
+from elasticsearch import helpers
+
+from sdk.nexent.vector_database.elasticsearch_core import VECTOR_INDEX_PROFILES, ElasticSearchCore
+
+logger = getLogger(__name__)
+
+
+def random_unit_vectors(count: int, dims: int, rng: np.random.Generator) -> np.ndarray:
+    vectors = rng.standard_normal((count, dims)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def exact_top_k(corpus: np.ndarray, queries: np.ndarray, k: int) -> List[set]:
+    """Brute-force cosine ground truth (vectors are already normalized)"""
+    scores = queries @ corpus.T
+    top = np.argpartition(-scores, k, axis=1)[:, :k]
+    return [set(row.tolist()) for row in top]
+
+
+def load_index(core: ElasticSearchCore, index_name: str, corpus: np.ndarray, batch_size: int) -> None:
+    actions = (
+        {"_index": index_name, "_id": str(i), "_source": {"id": str(i), "embedding": vector.tolist()}}
+        for i, vector in enumerate(corpus)
+    )
+    helpers.bulk(core.client, actions, chunk_size=batch_size, request_timeout=120)
+    core.client.indices.refresh(index=index_name)
+    # Merge to a single segment so every profile is measured on one HNSW graph
+    core.client.indices.forcemerge(index=index_name, max_num_segments=1, request_timeout=600)
+
+
+def run_queries(core: ElasticSearchCore, index_name: str, queries: np.ndarray, truth: List[set], k: int,
+                num_candidates: int) -> Dict[str, float]:
+    latencies = []
+    recalls = []
+    for query, expected in zip(queries, truth):
+        body = core._build_semantic_query(query.tolist(), k, num_candidates)
+        body["_source"] = False
+        start = time.perf_counter()
+        response = core.client.search(index=index_name, body=body)
+        latencies.append((time.perf_counter() - start) * 1000)
+        found = {int(hit["_id"]) for hit in response["hits"]["hits"]}
+        recalls.append(len(found & expected) / k)
+    return {
+        "recall": float(np.mean(recalls)),
+        "p50_ms": float(np.percentile(latencies, 50)),
+        "p95_ms": float(np.percentile(latencies, 95)),
+    }
+
+
+def index_size_mb(core: ElasticSearchCore, index_name: str) -> float:
+    stats = core.client.indices.stats(index=index_name, metric="store")
+    return stats["indices"][index_name]["total"]["store"]["size_in_bytes"] / (1024 * 1024)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="http://localhost:9200")
+    parser.add_argument("--api-key", default=None)
+    parser.add_argument("--docs", type=int, default=50000)
+    parser.add_argument("--dims", type=int, default=1024)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--num-candidates", type=int, nargs="+", default=[20, 50, 100, 200, 500])
+    parser.add_argument("--profiles", nargs="+", default=list(VECTOR_INDEX_PROFILES), choices=list(VECTOR_INDEX_PROFILES))
+    parser.add_argument("--hnsw-m", type=int, default=16)
+    parser.add_argument("--hnsw-ef-construction", type=int, default=100)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--keep", action="store_true", help="Keep the benchmark indices after the run")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    corpus = random_unit_vectors(args.docs, args.dims, rng)
+    queries = random_unit_vectors(args.queries, args.dims, rng)
+    truth = exact_top_k(corpus, queries, args.k)
+
+    core = ElasticSearchCore(
+        host=args.host,
+        api_key=args.api_key,
+        hnsw_m=args.hnsw_m,
+        hnsw_ef_construction=args.hnsw_ef_construction,
+        exclude_vector_source=True,
+    )
+
+    print(f"{'profile':<8} {'size_mb':>9} {'num_cand':>9} {'recall@' + str(args.k):>10} {'p50_ms':>8} {'p95_ms':>8}")
+    for profile in args.profiles:
+        index_name = f"bench_vector_profile_{profile}"
+        core.delete_index(index_name)
+        core.create_index(index_name, embedding_dim=args.dims, index_profile=profile)
+        try:
+            load_index(core, index_name, corpus, args.batch_size)
+            size_mb = index_size_mb(core, index_name)
+            for num_candidates in args.num_candidates:
+                result = run_queries(core, index_name, queries, truth, args.k, num_candidates)
+                print(f"{profile:<8} {size_mb:>9.1f} {num_candidates:>9} {result['recall']:>10.3f} "
+                      f"{result['p50_ms']:>8.2f} {result['p95_ms']:>8.2f}")
+        finally:
+            if not args.keep:
+                core.delete_index(index_name)
+
+
+if __name__ == "__main__":
+    main()
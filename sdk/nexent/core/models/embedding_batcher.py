@@ -0,0 +1,291 @@
+"""
+Adaptive batching of embedding requests on the event loop.
+
+Texts are grouped into batches by estimated token count instead of a fixed number of items, so a batch of long
+chunks does not exceed the model's request limit while short texts still travel in large batches. A batch that is
+rejected with HTTP 429 or times out is split in half and retried. Single texts are retried with a backoff scaled to
+the observed server latency. The number of requests in flight follows an AIMD policy: it grows by one per window of
+fast responses and shrinks when latency rises above its baseline or the server pushes back.
+"""
+import asyncio
+import logging
+import random
+import threading
+import weakref
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple, Union
+
+import requests
+
+from .embedding_cache import EmbeddingCache
+from .embedding_model import BaseEmbedding
+
+
+logger = logging.getLogger("embedding_batcher")
+
+# HTTP statuses meaning the embedding server is overloaded rather than the request being invalid
+OVERLOAD_STATUS_CODES = (429, 503)
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate: about four ASCII characters per token, one token per other character (e.g. CJK)"""
+    ascii_chars = len(text.encode("ascii", "ignore"))
+    return (len(text) - ascii_chars) + (ascii_chars + 3) // 4 + 1
+
+
+def plan_batches(
+    texts: List[str],
+    max_batch_tokens: int,
+    max_batch_size: int,
+    token_estimator: Callable[[str], int] = estimate_tokens,
+) -> List[Tuple[int, int]]:
+    """
+    Split texts into consecutive batches under a token and an item budget.
+
+    A single text larger than max_batch_tokens gets a batch of its own.
+
+    Returns:
+        List of (start, end) slices of texts
+    """
+    batches = []
+    start = 0
+    batch_tokens = 0
+    for index, text in enumerate(texts):
+        tokens = token_estimator(text)
+        if index > start and (batch_tokens + tokens > max_batch_tokens or index - start >= max_batch_size):
+            batches.append((start, index))
+            start = index
+            batch_tokens = 0
+        batch_tokens += tokens
+    if start < len(texts):
+        batches.append((start, len(texts)))
+    return batches
+
+
+def is_overload_error(error: BaseException) -> bool:
+    """Whether an embedding call failed because the server is overloaded (timeout, 429 or 503)"""
+    if isinstance(error, (asyncio.TimeoutError, requests.exceptions.Timeout)):
+        return True
+    status = getattr(error, "status", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    return status in OVERLOAD_STATUS_CODES
+
+
+class _LoopSlots:
+    """In-flight request counter of one event loop"""
+
+    def __init__(self):
+        self.condition = asyncio.Condition()
+        self.in_flight = 0
+
+
+class AdaptiveEmbeddingBatcher:
+    """
+    Embed any number of texts with token-sized batches and an adaptive concurrency limit.
+
+    One batcher should be shared by all callers of the same embedding endpoint (see get_embedding_batcher), so the
+    learned concurrency limit and latency baseline reflect the server's real load.
+
+    Usage:
+        batcher = get_embedding_batcher(embedding_model)
+        vectors = await batcher.embed(embedding_model, texts)
+    """
+
+    def __init__(
+        self,
+        max_batch_tokens: int = 8192,
+        max_batch_size: int = 256,
+        max_concurrency: int = 8,
+        min_batch_tokens: int = 512,
+        latency_tolerance: float = 2.0,
+        max_retries: int = 5,
+        base_backoff_s: float = 0.5,
+        max_backoff_s: float = 30.0,
+        request_timeout: Optional[float] = None,
+        token_estimator: Callable[[str], int] = estimate_tokens,
+    ):
+        """
+        Args:
+            max_batch_tokens: Upper bound of estimated tokens per request
+            max_batch_size: Upper bound of texts per request
+            max_concurrency: Upper bound of requests in flight per event loop
+            min_batch_tokens: Lower bound the token budget shrinks to under pushback
+            latency_tolerance: Concurrency shrinks when seconds per token exceed this multiple of the baseline
+            max_retries: Retries of a single text that keeps being rejected
+            base_backoff_s: Smallest backoff before retrying a single text
+            max_backoff_s: Largest backoff before retrying a single text
+            request_timeout: Timeout of one embedding request, None for the model's default
+            token_estimator: Function estimating the token count of a text
+        """
+        self.max_batch_tokens = max_batch_tokens
+        self.max_batch_size = max_batch_size
+        self.max_concurrency = max(1, max_concurrency)
+        self.min_batch_tokens = min(min_batch_tokens, max_batch_tokens)
+        self.latency_tolerance = latency_tolerance
+        self.max_retries = max_retries
+        self.base_backoff_s = base_backoff_s
+        self.max_backoff_s = max_backoff_s
+        self.request_timeout = request_timeout
+        self.token_estimator = token_estimator
+
+        self.concurrency_limit = float(self.max_concurrency)
+        self.batch_tokens = max_batch_tokens
+        self._baseline_s_per_token: Optional[float] = None
+        self._ewma_s_per_token: Optional[float] = None
+        self._ewma_latency_s = 0.0
+        self._state_lock = threading.Lock()
+        self._slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopSlots]" = weakref.WeakKeyDictionary()
+
+    async def embed(
+        self,
+        embedding_model: BaseEmbedding,
+        inputs: Union[str, List[str]],
+        embedding_cache: Optional[EmbeddingCache] = None,
+    ) -> List[List[float]]:
+        """
+        Embed texts with embedding_model.aget_embeddings, in as many concurrent requests as the server sustains.
+
+        Args:
+            embedding_model: Model to embed with
+            inputs: A text or a list of texts
+            embedding_cache: Optional cache; only misses are sent to the API
+
+        Returns:
+            One vector per input, in order
+        """
+        texts = [inputs] if isinstance(inputs, str) else list(inputs)
+        if not texts:
+            return []
+
+        cached: List[Optional[List[float]]] = [None] * len(texts)
+        if embedding_cache is not None:
+            model_name, embedding_dim = EmbeddingCache.model_identity(embedding_model)
+            cached = embedding_cache.get_many(model_name, embedding_dim, texts)
+        # Duplicate misses are embedded once
+        miss_texts = list(dict.fromkeys(text for text, vector in zip(texts, cached) if vector is None))
+
+        computed: Dict[str, List[float]] = {}
+        if miss_texts:
+            batches = plan_batches(miss_texts, self.batch_tokens, self.max_batch_size, self.token_estimator)
+            results = await asyncio.gather(
+                *(self._embed_batch(embedding_model, miss_texts[start:end]) for start, end in batches))
+            for (start, end), vectors in zip(batches, results):
+                computed.update(zip(miss_texts[start:end], vectors))
+            if embedding_cache is not None:
+                embedding_cache.put_many(model_name, embedding_dim, miss_texts, [computed[text] for text in miss_texts])
+
+        return [vector if vector is not None else computed[text] for text, vector in zip(texts, cached)]
+
+    async def _embed_batch(self, embedding_model: BaseEmbedding, texts: List[str], attempt: int = 0) -> List[List[float]]:
+        """Embed one batch, halving it on overload and backing off once it is down to a single text"""
+        loop = asyncio.get_running_loop()
+        async with self._slot():
+            start = loop.time()
+            try:
+                vectors = await embedding_model.aget_embeddings(texts, timeout=self.request_timeout, retries=0)
+            except Exception as e:
+                if not is_overload_error(e):
+                    raise
+                error = e
+            else:
+                if len(vectors) != len(texts):
+                    raise ValueError(f"Embedding model returned {len(vectors)} vectors for {len(texts)} inputs")
+                self._record_latency(loop.time() - start, sum(self.token_estimator(text) for text in texts))
+                return vectors
+
+        self._record_overload()
+        if len(texts) > 1:
+            middle = len(texts) // 2
+            logger.warning(f"Embedding server overloaded ({error!r}), splitting a batch of {len(texts)} texts")
+            halves = await asyncio.gather(
+                self._embed_batch(embedding_model, texts[:middle], attempt),
+                self._embed_batch(embedding_model, texts[middle:], attempt),
+            )
+            return halves[0] + halves[1]
+        if attempt >= self.max_retries:
+            raise error
+        backoff = self._backoff(attempt)
+        logger.warning(f"Embedding server overloaded ({error!r}), retrying in {backoff:.2f}s "
+                       f"({attempt + 1}/{self.max_retries})")
+        await asyncio.sleep(backoff)
+        return await self._embed_batch(embedding_model, texts, attempt + 1)
+
+    @asynccontextmanager
+    async def _slot(self) -> AsyncIterator[None]:
+        """Wait until fewer requests than the current concurrency limit are in flight on this event loop"""
+        loop = asyncio.get_running_loop()
+        slots = self._slots.get(loop)
+        if slots is None:
+            slots = self._slots[loop] = _LoopSlots()
+        async with slots.condition:
+            await slots.condition.wait_for(lambda: slots.in_flight < int(self.concurrency_limit))
+            slots.in_flight += 1
+        try:
+            yield
+        finally:
+            async with slots.condition:
+                slots.in_flight -= 1
+                # The limit may have grown as well, so wake every waiter
+                slots.condition.notify_all()
+
+    def _record_latency(self, elapsed_s: float, tokens: int) -> None:
+        """AIMD on a successful request: grow while latency stays near the baseline, shrink when it degrades"""
+        s_per_token = elapsed_s / max(tokens, 1)
+        with self._state_lock:
+            self._ewma_latency_s = elapsed_s if not self._ewma_latency_s else 0.8 * self._ewma_latency_s + 0.2 * elapsed_s
+            if self._baseline_s_per_token is None or s_per_token < self._baseline_s_per_token:
+                self._baseline_s_per_token = s_per_token
+            self._ewma_s_per_token = s_per_token if self._ewma_s_per_token is None else \
+                0.8 * self._ewma_s_per_token + 0.2 * s_per_token
+            if self._ewma_s_per_token > self.latency_tolerance * self._baseline_s_per_token:
+                self.concurrency_limit = max(1.0, self.concurrency_limit * 0.9)
+            else:
+                self.concurrency_limit = min(float(self.max_concurrency),
+                                             self.concurrency_limit + 1 / self.concurrency_limit)
+                self.batch_tokens = min(self.max_batch_tokens, int(self.batch_tokens * 1.1) + 1)
+
+    def _record_overload(self) -> None:
+        """Multiplicative decrease of concurrency and batch size when the server pushes back"""
+        with self._state_lock:
+            self.concurrency_limit = max(1.0, self.concurrency_limit / 2)
+            self.batch_tokens = max(self.min_batch_tokens, self.batch_tokens // 2)
+
+    def _backoff(self, attempt: int) -> float:
+        """Exponential backoff starting from the typical request latency, with jitter"""
+        base = max(self.base_backoff_s, self._ewma_latency_s)
+        return min(self.max_backoff_s, base * 2 ** attempt) * random.uniform(0.5, 1.0)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._state_lock:
+            return {
+                "concurrency_limit": self.concurrency_limit,
+                "batch_tokens": self.batch_tokens,
+                "latency_s": self._ewma_latency_s,
+                "baseline_s_per_token": self._baseline_s_per_token,
+            }
+
+
+# Batchers shared per embedding endpoint, so adaptive limits reflect the load of all callers
+_embedding_batchers: Dict[Tuple[Optional[str], str], AdaptiveEmbeddingBatcher] = {}
+_embedding_batchers_lock = threading.Lock()
+
+
+def get_embedding_batcher(embedding_model: BaseEmbedding, **kwargs: Any) -> AdaptiveEmbeddingBatcher:
+    """
+    Return the batcher shared by all clients of the model's endpoint, creating it with kwargs on first use.
+
+    Args:
+        embedding_model: Model whose api_url and model name identify the endpoint
+        **kwargs: AdaptiveEmbeddingBatcher arguments used when the batcher is created
+
+    Returns:
+        AdaptiveEmbeddingBatcher: The shared batcher
+    """
+    key = (getattr(embedding_model, "api_url", None), EmbeddingCache.model_identity(embedding_model)[0])
+    with _embedding_batchers_lock:
+        batcher = _embedding_batchers.get(key)
+        if batcher is None:
+            batcher = AdaptiveEmbeddingBatcher(**kwargs)
+            _embedding_batchers[key] = batcher
+        return batcher
@@ -0,0 +1,286 @@
+"""
+Content-addressed embedding cache.
+
+Embeddings are keyed by (model name, embedding dimension, sha256 of the normalized text), so identical chunks
+re-uploaded into another knowledge base, or re-embedded by the memory module, are only sent to the embedding API once.
+The cache is made of ordered tiers (fastest first). A hit in a lower tier is promoted into the tiers above it.
+"""
+import hashlib
+import logging
+import sqlite3
+import threading
+import unicodedata
+from abc import ABC, abstractmethod
+from array import array
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+
+logger = logging.getLogger("embedding_cache")
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text before hashing: unicode NFC and collapsed whitespace"""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def _encode_vector(vector: Sequence[float]) -> bytes:
+    return array("f", vector).tobytes()
+
+
+def _decode_vector(payload: bytes) -> List[float]:
+    values = array("f")
+    values.frombytes(payload)
+    return values.tolist()
+
+
+class EmbeddingCacheTier(ABC):
+    """A single storage tier of the embedding cache"""
+
+    name: str = "tier"
+
+    @abstractmethod
+    def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        """Return the vectors found for the given keys (missing keys are omitted)"""
+        pass
+
+    @abstractmethod
+    def put_many(self, items: Dict[str, List[float]]) -> None:
+        """Store the given key -> vector mapping"""
+        pass
+
+
+class LRUCacheTier(EmbeddingCacheTier):
+    """
+    Bounded in-process LRU tier.
+
+    Vectors are kept as packed float32 arrays, 4 bytes per dimension instead of the ~32 of a list of Python floats,
+    so 10000 entries of 1024 dimensions take about 40 MB per process.
+    """
+
+    name = "memory"
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[str, array]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        found = {}
+        with self._lock:
+            for key in keys:
+                vector = self._entries.get(key)
+                if vector is not None:
+                    self._entries.move_to_end(key)
+                    found[key] = vector
+        return {key: vector.tolist() for key, vector in found.items()}
+
+    def put_many(self, items: Dict[str, List[float]]) -> None:
+        with self._lock:
+            for key, vector in items.items():
+                self._entries[key] = array("f", vector)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RedisCacheTier(EmbeddingCacheTier):
+    """
+    Shared Redis tier. Vectors are stored as packed float32 bytes.
+    The client is any redis-py compatible client created by the caller.
+    """
+
+    name = "redis"
+
+    def __init__(self, client: Any, key_prefix: str = "emb_cache:", ttl_seconds: Optional[int] = 7 * 24 * 3600):
+        self.client = client
+        self.key_prefix = key_prefix
+        self.ttl_seconds = ttl_seconds
+
+    def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        if not keys:
+            return {}
+        try:
+            payloads = self.client.mget([self.key_prefix + key for key in keys])
+        except Exception as e:
+            logger.warning(f"Redis embedding cache read failed: {e}")
+            return {}
+        return {key: _decode_vector(payload) for key, payload in zip(keys, payloads) if payload}
+
+    def put_many(self, items: Dict[str, List[float]]) -> None:
+        if not items:
+            return
+        try:
+            pipeline = self.client.pipeline(transaction=False)
+            for key, vector in items.items():
+                pipeline.set(self.key_prefix + key, _encode_vector(vector), ex=self.ttl_seconds)
+            pipeline.execute()
+        except Exception as e:
+            logger.warning(f"Redis embedding cache write failed: {e}")
+
+
+class DiskCacheTier(EmbeddingCacheTier):
+    """Persistent local tier backed by a single SQLite file"""
+
+    name = "disk"
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock:
+            self._conn.execute("CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL)")
+            self._conn.commit()
+
+    def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        found = {}
+        # Stay below SQLite's default host parameter limit
+        for start in range(0, len(keys), 500):
+            batch = keys[start: start + 500]
+            placeholders = ",".join("?" for _ in batch)
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", batch
+                ).fetchall()
+            for key, payload in rows:
+                found[key] = _decode_vector(payload)
+        return found
+
+    def put_many(self, items: Dict[str, List[float]]) -> None:
+        if not items:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                [(key, _encode_vector(vector)) for key, vector in items.items()],
+            )
+            self._conn.commit()
+
+
+class EmbeddingCache:
+    """
+    Multi-tier embedding cache with bulk get/put and hit-rate counters.
+
+    Usage:
+        cache = EmbeddingCache([LRUCacheTier(10000), RedisCacheTier(redis_client)])
+        vectors = cache.get_embeddings(embedding_model, texts)  # only misses reach the API
+    """
+
+    def __init__(self, tiers: Optional[List[EmbeddingCacheTier]] = None):
+        self.tiers = tiers if tiers else [LRUCacheTier()]
+        self._stats_lock = threading.Lock()
+        self.reset_stats()
+
+    @staticmethod
+    def make_key(model_name: str, embedding_dim: Optional[int], text: str) -> str:
+        digest = hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+        return f"{model_name}:{embedding_dim}:{digest}"
+
+    @staticmethod
+    def model_identity(embedding_model: Any) -> tuple:
+        """Return the (model name, dimension) pair used to namespace cache keys"""
+        model_name = getattr(embedding_model, "model", None) or getattr(
+            embedding_model, "embedding_model_name", None) or "unknown"
+        return str(model_name), getattr(embedding_model, "embedding_dim", None)
+
+    def get_many(self, model_name: str, embedding_dim: Optional[int], texts: List[str]) -> List[Optional[List[float]]]:
+        """Look up texts in order; returns None for each miss"""
+        keys = [self.make_key(model_name, embedding_dim, text) for text in texts]
+        found: Dict[str, List[float]] = {}
+        tier_hits: Dict[str, int] = {}
+        remaining = list(dict.fromkeys(keys))
+
+        for tier_index, tier in enumerate(self.tiers):
+            if not remaining:
+                break
+            hits = tier.get_many(remaining)
+            if not hits:
+                continue
+            tier_hits[tier.name] = len(hits)
+            found.update(hits)
+            # Promote into faster tiers
+            for upper_tier in self.tiers[:tier_index]:
+                upper_tier.put_many(hits)
+            remaining = [key for key in remaining if key not in hits]
+
+        results = [found.get(key) for key in keys]
+        hit_count = sum(1 for vector in results if vector is not None)
+        with self._stats_lock:
+            self._hits += hit_count
+            self._misses += len(results) - hit_count
+            for tier_name, count in tier_hits.items():
+                self._tier_hits[tier_name] = self._tier_hits.get(tier_name, 0) + count
+        return results
+
+    def put_many(self, model_name: str, embedding_dim: Optional[int], texts: List[str],
+                 vectors: List[List[float]]) -> None:
+        items = {self.make_key(model_name, embedding_dim, text): vector for text, vector in zip(texts, vectors)}
+        for tier in self.tiers:
+            tier.put_many(items)
+
+    def get_embeddings(self, embedding_model: Any, inputs: Union[str, List[str]]) -> List[List[float]]:
+        """
+        Drop-in replacement for embedding_model.get_embeddings(inputs) that only sends cache misses to the API.
+        Duplicate texts inside one call are embedded once.
+        """
+        texts = [inputs] if isinstance(inputs, str) else list(inputs)
+        if not texts:
+            return []
+
+        model_name, embedding_dim = self.model_identity(embedding_model)
+        results = self.get_many(model_name, embedding_dim, texts)
+
+        miss_texts: Dict[str, str] = {}
+        for text, vector in zip(texts, results):
+            if vector is None:
+                miss_texts.setdefault(self.make_key(model_name, embedding_dim, text), text)
+
+        if miss_texts:
+            to_embed = list(miss_texts.values())
+            embeddings = embedding_model.get_embeddings(to_embed)
+            if len(embeddings) != len(to_embed):
+                raise ValueError(
+                    f"Embedding model returned {len(embeddings)} vectors for {len(to_embed)} inputs")
+            with self._stats_lock:
+                self._api_calls += 1
+            self.put_many(model_name, embedding_dim, to_embed, embeddings)
+            computed = dict(zip(miss_texts.keys(), embeddings))
+            results = [
+                vector if vector is not None else computed[self.make_key(model_name, embedding_dim, text)]
+                for text, vector in zip(texts, results)
+            ]
+        return results
+
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "api_calls": self._api_calls,
+                "tier_hits": dict(self._tier_hits),
+            }
+
+    def reset_stats(self) -> None:
+        with self._stats_lock:
+            self._hits = 0
+            self._misses = 0
+            self._api_calls = 0
+            self._tier_hits: Dict[str, int] = {}
+
+
+# Process-wide cache shared by components that cannot receive one explicitly (e.g. mem0 embedders)
+_default_embedding_cache: Optional[EmbeddingCache] = None
+
+
+def set_default_embedding_cache(cache: Optional[EmbeddingCache]) -> None:
+    global _default_embedding_cache
+    _default_embedding_cache = cache
+
+
+def get_default_embedding_cache() -> Optional[EmbeddingCache]:
+    return _default_embedding_cache
@@ -0,0 +1,246 @@
+"""
+Cross-request coalescing of single-text embedding calls.
+
+Under load many agent runs embed one query each at nearly the same moment: a knowledge base search plus a few
+memory searches per run. The coalescer holds each single-text request for at most a few milliseconds, sends the
+texts gathered for the same endpoint in one batched API call and hands every caller its own vector. Identical texts
+in a window are embedded once.
+
+Batches are awaited through the async embedding clients on an event loop owned by the coalescer, so in-flight calls
+hold connections of one long-lived aiohttp session per endpoint rather than worker threads.
+"""
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import Future, wait
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .embedding_cache import EmbeddingCache
+from .embedding_model import close_async_http_sessions
+
+
+logger = logging.getLogger("embedding_coalescer")
+
+DEFAULT_COALESCE_MAX_BATCH_SIZE = 32
+DEFAULT_COALESCE_MAX_WAIT_MS = 5.0
+DEFAULT_COALESCE_MAX_IN_FLIGHT = 8
+
+
+class _PendingBatch:
+    """Texts waiting for the same endpoint, with the futures of every caller per text"""
+
+    def __init__(self, embedding_model: Any, deadline: float):
+        self.embedding_model = embedding_model
+        self.deadline = deadline
+        self.futures: Dict[str, List[Future]] = {}
+
+
+class EmbeddingRequestCoalescer:
+    """
+    Gather single-text embedding requests that arrive within max_wait_ms into one aget_embeddings call.
+
+    A batch is sent when its window closes or when it holds max_batch_size distinct texts, whichever comes first.
+    Requests are only batched with requests for the same model class, endpoint, model name and API key. When a
+    batched call fails, its texts are retried one by one so only the callers of a failing text get the error.
+
+    Usage:
+        coalescer = EmbeddingRequestCoalescer(max_batch_size=32, max_wait_ms=5)
+        vector = coalescer.embed(embedding_model, "what is nexent?")         # from a worker thread
+        vector = await coalescer.aembed(embedding_model, "what is nexent?")  # from the event loop
+    """
+
+    def __init__(
+        self,
+        max_batch_size: int = DEFAULT_COALESCE_MAX_BATCH_SIZE,
+        max_wait_ms: float = DEFAULT_COALESCE_MAX_WAIT_MS,
+        max_in_flight: int = DEFAULT_COALESCE_MAX_IN_FLIGHT,
+    ):
+        """
+        Args:
+            max_batch_size: Maximum distinct texts per batched API call
+            max_wait_ms: Longest time a request waits for others to join its batch
+            max_in_flight: Maximum batched API calls running at once
+        """
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait_s = max(0.0, max_wait_ms) / 1000
+        self._pending: Dict[Tuple, _PendingBatch] = {}
+        self._condition = threading.Condition()
+        self._loop = asyncio.new_event_loop()
+        self._in_flight = asyncio.Semaphore(max(1, max_in_flight))
+        self._batches: Set[Future] = set()
+        self._loop_thread: Optional[threading.Thread] = None
+        self._dispatcher: Optional[threading.Thread] = None
+        self._closed = False
+        self._stats_lock = threading.Lock()
+        self.reset_stats()
+
+    @staticmethod
+    def batch_key(embedding_model: Any) -> Tuple:
+        """Requests with equal keys can share one API call"""
+        model_name, embedding_dim = EmbeddingCache.model_identity(embedding_model)
+        return (type(embedding_model), getattr(embedding_model, "api_url", None), model_name, embedding_dim,
+                getattr(embedding_model, "api_key", None))
+
+    def submit(self, embedding_model: Any, text: str) -> "Future[List[float]]":
+        """Queue one text and return a future resolved with its vector"""
+        future: "Future[List[float]]" = Future()
+        key = self.batch_key(embedding_model)
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Embedding coalescer is closed")
+            batch = self._pending.get(key)
+            if batch is None:
+                batch = _PendingBatch(embedding_model, time.monotonic() + self.max_wait_s)
+                self._pending[key] = batch
+                self._ensure_dispatcher()
+                self._condition.notify()
+            batch.futures.setdefault(text, []).append(future)
+            if len(batch.futures) >= self.max_batch_size:
+                del self._pending[key]
+                self._schedule(batch)
+        with self._stats_lock:
+            self._requests += 1
+        return future
+
+    def embed(self, embedding_model: Any, text: str) -> List[float]:
+        """Embed one text, blocking until its batch returns"""
+        return self.submit(embedding_model, text).result()
+
+    async def aembed(self, embedding_model: Any, text: str) -> List[float]:
+        """Embed one text without blocking the event loop"""
+        return await asyncio.wrap_future(self.submit(embedding_model, text))
+
+    def _ensure_dispatcher(self) -> None:
+        """Start the batch event loop and the thread that flushes closed windows (caller holds the condition)"""
+        if self._loop_thread is None:
+            self._loop_thread = threading.Thread(target=self._loop.run_forever, name="embedding-coalescer-loop",
+                                                 daemon=True)
+            self._loop_thread.start()
+        if self._dispatcher is None:
+            self._dispatcher = threading.Thread(target=self._dispatch_loop, name="embedding-coalescer-dispatch",
+                                                daemon=True)
+            self._dispatcher.start()
+
+    def _dispatch_loop(self) -> None:
+        with self._condition:
+            while not self._closed:
+                now = time.monotonic()
+                for key in [key for key, batch in self._pending.items() if batch.deadline <= now]:
+                    self._schedule(self._pending.pop(key))
+                if self._pending:
+                    self._condition.wait(min(batch.deadline for batch in self._pending.values()) - now)
+                else:
+                    self._condition.wait()
+
+    def _schedule(self, batch: _PendingBatch) -> None:
+        """Start a batch on the coalescer event loop (caller holds the condition)"""
+        done = asyncio.run_coroutine_threadsafe(self._run_batch(batch), self._loop)
+        self._batches.add(done)
+        done.add_done_callback(self._batches.discard)
+
+    async def _call(self, embedding_model: Any, texts: List[str]) -> List[List[float]]:
+        async with self._in_flight:
+            with self._stats_lock:
+                self._api_calls += 1
+                self._batched_texts += len(texts)
+            vectors = await embedding_model.aget_embeddings(texts)
+        if len(vectors) != len(texts):
+            raise ValueError(f"Embedding model returned {len(vectors)} vectors for {len(texts)} inputs")
+        return vectors
+
+    async def _run_batch(self, batch: _PendingBatch) -> None:
+        """Send one batched API call and resolve every caller's future"""
+        texts = list(batch.futures)
+        try:
+            vectors = await self._call(batch.embedding_model, texts)
+        except Exception as e:
+            if len(texts) == 1:
+                self._resolve(batch, texts[0], error=e)
+                return
+            logger.warning(f"Coalesced embedding call of {len(texts)} texts failed, retrying one by one: {e}")
+            await asyncio.gather(*(self._run_single(batch, text) for text in texts))
+            return
+        for text, vector in zip(texts, vectors):
+            self._resolve(batch, text, vector)
+
+    async def _run_single(self, batch: _PendingBatch, text: str) -> None:
+        try:
+            vector = (await self._call(batch.embedding_model, [text]))[0]
+        except Exception as e:
+            self._resolve(batch, text, error=e)
+            return
+        self._resolve(batch, text, vector)
+
+    @staticmethod
+    def _resolve(batch: _PendingBatch, text: str, vector: Optional[List[float]] = None,
+                 error: Optional[Exception] = None) -> None:
+        for future in batch.futures[text]:
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(vector)
+
+    def close(self) -> None:
+        """Flush pending requests, wait for running batches and stop the dispatcher and event loop"""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            started = self._loop_thread is not None
+            for batch in self._pending.values():
+                self._schedule(batch)
+            self._pending.clear()
+            batches = list(self._batches)
+            self._condition.notify()
+        if not started:
+            self._loop.close()
+            return
+        wait(batches)
+        asyncio.run_coroutine_threadsafe(close_async_http_sessions(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop_thread.join()
+        self._loop.close()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            return {
+                "requests": self._requests,
+                "api_calls": self._api_calls,
+                "avg_batch_size": self._batched_texts / self._api_calls if self._api_calls else 0.0,
+            }
+
+    def reset_stats(self) -> None:
+        with self._stats_lock:
+            self._requests = 0
+            self._api_calls = 0
+            self._batched_texts = 0
+
+
+def embed_query(embedding_model: Any, query_text: str,
+                coalescer: Optional[EmbeddingRequestCoalescer] = None) -> List[float]:
+    """Embed a single query text, through the coalescer when one is given"""
+    if coalescer is not None:
+        return coalescer.embed(embedding_model, query_text)
+    return embedding_model.get_embeddings(query_text)[0]
+
+
+async def aembed_query(embedding_model: Any, query_text: str,
+                       coalescer: Optional[EmbeddingRequestCoalescer] = None) -> List[float]:
+    """Embed a single query text on the event loop, through the coalescer when one is given"""
+    if coalescer is not None:
+        return await coalescer.aembed(embedding_model, query_text)
+    return (await embedding_model.aget_embeddings(query_text))[0]
+
+
+# Process-wide coalescer shared by components that cannot receive one explicitly (e.g. mem0 embedders)
+_default_embedding_coalescer: Optional[EmbeddingRequestCoalescer] = None
+
+
+def set_default_embedding_coalescer(coalescer: Optional[EmbeddingRequestCoalescer]) -> None:
+    global _default_embedding_coalescer
+    _default_embedding_coalescer = coalescer
+
+
+def get_default_embedding_coalescer() -> Optional[EmbeddingRequestCoalescer]:
+    return _default_embedding_coalescer
@@ -1,9 +1,130 @@
 import asyncio
 import logging
+import threading
+import weakref
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+from urllib.parse import urlsplit
 
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
+
+# Keep-alive connections kept per embedding API host
+DEFAULT_HTTP_POOL_MAXSIZE = 16
+
+_http_sessions: Dict[Tuple[str, int], requests.Session] = {}
+_http_sessions_lock = threading.Lock()
+
+
+def get_http_session(url: str, pool_maxsize: int = DEFAULT_HTTP_POOL_MAXSIZE) -> requests.Session:
+    """
+    Return the keep-alive session shared by all embedding clients calling the same scheme://host:port.
+
+    Reusing pooled connections saves a TCP and TLS handshake per batch and keeps ingestion from exhausting
+    ephemeral ports.
+
+    Args:
+        url: Any URL of the embedding API
+        pool_maxsize: Maximum number of idle connections kept open to that host
+
+    Returns:
+        requests.Session: The shared session
+    """
+    parts = urlsplit(url)
+    key = (f"{parts.scheme}://{parts.netloc}", pool_maxsize)
+    with _http_sessions_lock:
+        session = _http_sessions.get(key)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _http_sessions[key] = session
+        return session
+
+
+def close_http_sessions() -> None:
+    """Close all pooled embedding API connections"""
+    with _http_sessions_lock:
+        sessions = list(_http_sessions.values())
+        _http_sessions.clear()
+    for session in sessions:
+        session.close()
+
+
+# aiohttp sessions are bound to the event loop they were created on
+_async_http_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[str, int], aiohttp.ClientSession]]" = \
+    weakref.WeakKeyDictionary()
+
+
+def get_async_http_session(url: str, pool_maxsize: int = DEFAULT_HTTP_POOL_MAXSIZE) -> aiohttp.ClientSession:
+    """
+    Return the keep-alive aiohttp session of the running event loop for the url's scheme://host:port.
+
+    The connector limit caps the number of requests in flight to that host from this event loop.
+
+    Args:
+        url: Any URL of the embedding API
+        pool_maxsize: Maximum number of concurrent connections to that host
+
+    Returns:
+        aiohttp.ClientSession: The shared session
+    """
+    loop = asyncio.get_running_loop()
+    # Sessions hold their loop, so entries of loops closed without close_async_http_sessions are never collected
+    for stale_loop in [stale for stale in _async_http_sessions if stale.is_closed()]:
+        _async_http_sessions.pop(stale_loop, None)
+    parts = urlsplit(url)
+    key = (f"{parts.scheme}://{parts.netloc}", pool_maxsize)
+    sessions = _async_http_sessions.setdefault(loop, {})
+    session = sessions.get(key)
+    if session is None or session.closed:
+        session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=pool_maxsize))
+        sessions[key] = session
+    return session
+
+
+async def close_async_http_sessions() -> None:
+    """Close the pooled aiohttp sessions of the running event loop"""
+    sessions = _async_http_sessions.pop(asyncio.get_running_loop(), {})
+    for session in sessions.values():
+        await session.close()
+
+
+async def closing_async_http_sessions(coro: Awaitable[Any]) -> Any:
+    """
+    Await coro, then close the aiohttp sessions opened on the running event loop.
+
+    Wrap the coroutine given to asyncio.run or another short-lived loop, whose pooled connections would otherwise
+    stay open once the loop is gone.
+    """
+    try:
+        return await coro
+    finally:
+        await close_async_http_sessions()
+
+
+async def _retry_on_timeout(
+    request: Callable[[float], Awaitable[Any]],
+    label: str,
+    timeout: Optional[float],
+    retries: int,
+    retry_timeout_step: float,
+) -> Any:
+    """Await request(timeout), retrying timeouts with a linearly growing timeout like the blocking clients do"""
+    base_timeout = timeout if timeout is not None else retry_timeout_step
+    attempts = retries + 1
+    for attempt_index in range(attempts):
+        current_timeout = base_timeout + attempt_index * retry_timeout_step
+        try:
+            return await request(current_timeout)
+        except asyncio.TimeoutError:
+            logging.warning(f"{label} API request timed out in {current_timeout}s ({attempt_index + 1}/{attempts})")
+            if attempt_index == attempts - 1:
+                logging.error(f"{label} API request timed out.")
+                raise
+    return None
 
 
 class BaseEmbedding(ABC):
@@ -48,6 +169,31 @@ class BaseEmbedding(ABC):
         """
         pass
 
+    async def aget_embeddings(
+        self,
+        inputs: Union[str, List[str]],
+        timeout: Optional[float] = None,
+        retries: int = 3,
+        retry_timeout_step: float = 5.0,
+    ) -> List[List[float]]:
+        """
+        Get the embedding vectors for the input without blocking the event loop.
+
+        Subclasses with a native async client override this; the default runs get_embeddings in a worker thread.
+
+        Args:
+            inputs: Objects to be embedded
+            timeout: Base timeout in seconds for the first attempt. If None, uses retry_timeout_step.
+            retries: Number of retries on timeout (not counting the first attempt)
+            retry_timeout_step: Linear increment in seconds for each retry timeout
+
+        Returns:
+            A list of embedding vectors
+        """
+        return await asyncio.to_thread(
+            self.get_embeddings, inputs, timeout=timeout, retries=retries, retry_timeout_step=retry_timeout_step
+        )
+
     @abstractmethod
     async def dimension_check(self, timeout: float = 5.0) -> List[List[float]]:
         """
@@ -139,12 +285,14 @@ class JinaEmbedding(MultimodalEmbedding):
         base_url: str = "https://api.jina.ai/v1/embeddings",
         model_name: str = "jina-clip-v2",
         embedding_dim: int = 1024,
+        pool_maxsize: int = DEFAULT_HTTP_POOL_MAXSIZE,
     ):
         """Initialize JinaEmbedding with configuration."""
         self.api_key = api_key
         self.api_url = base_url
         self.model = model_name
         self.embedding_dim = embedding_dim
+        self.pool_maxsize = pool_maxsize
 
         self.headers = {"Content-Type": "application/json", "Authorization": f"Bearer {self.api_key}"}
 
@@ -163,10 +311,29 @@ class JinaEmbedding(MultimodalEmbedding):
         Returns:
             Dict[str, Any]: API response
         """
-        response = requests.post(self.api_url, headers=self.headers, json=data, timeout=timeout)
+        session = get_http_session(self.api_url, self.pool_maxsize)
+        response = session.post(self.api_url, headers=self.headers, json=data, timeout=timeout)
         response.raise_for_status()
         return response.json()
 
+    async def _amake_request(self, data: Dict[str, Any], timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Make the API request on the event loop's pooled aiohttp session and return the response.
+
+        Args:
+            data: Request data
+            timeout: Timeout in seconds
+
+        Returns:
+            Dict[str, Any]: API response
+        """
+        session = get_async_http_session(self.api_url, self.pool_maxsize)
+        async with session.post(
+            self.api_url, headers=self.headers, json=data, timeout=aiohttp.ClientTimeout(total=timeout)
+        ) as response:
+            response.raise_for_status()
+            return await response.json()
+
     def get_embeddings(
         self,
         inputs: Union[str, List[str]],
@@ -214,6 +381,33 @@ class JinaEmbedding(MultimodalEmbedding):
             raise last_timeout
         return []
 
+    async def aget_embeddings(
+        self,
+        inputs: Union[str, List[str]],
+        timeout: Optional[float] = None,
+        retries: int = 3,
+        retry_timeout_step: float = 5.0,
+    ) -> List[List[float]]:
+        """
+        Get embeddings for text inputs on the event loop.
+
+        Args:
+            inputs: A single text string or a list of text strings.
+            timeout: Base timeout in seconds for the first attempt. If None, uses retry_timeout_step.
+            retries: Number of retries on timeout (not counting the first attempt).
+            retry_timeout_step: Linear increment in seconds for each retry timeout.
+
+        Returns:
+            A list of embedding vectors.
+        """
+        texts = [inputs] if isinstance(inputs, str) else inputs
+        data = self._prepare_multimodal_input([{"text": item} for item in texts])
+        response = await _retry_on_timeout(
+            lambda current_timeout: self._amake_request(data, timeout=current_timeout),
+            "JinaEmbedding", timeout, retries, retry_timeout_step,
+        )
+        return [item["embedding"] for item in response["data"]] if response else []
+
     def get_multimodal_embeddings(
         self,
         inputs: List[Dict[str, str]],
@@ -295,12 +489,20 @@ class JinaEmbedding(MultimodalEmbedding):
 
 
 class OpenAICompatibleEmbedding(TextEmbedding):
-    def __init__(self, model_name: str, base_url: str, api_key: str, embedding_dim: int):
+    def __init__(
+        self,
+        model_name: str,
+        base_url: str,
+        api_key: str,
+        embedding_dim: int,
+        pool_maxsize: int = DEFAULT_HTTP_POOL_MAXSIZE,
+    ):
         """Initialize OpenAICompatibleEmbedding with configuration from environment variables or provided parameters."""
         self.api_key = api_key
         self.api_url = base_url
         self.model = model_name
         self.embedding_dim = embedding_dim
+        self.pool_maxsize = pool_maxsize
 
         self.headers = {"Content-Type": "application/json", "Authorization": f"Bearer {self.api_key}"}
 
@@ -321,10 +523,29 @@ class OpenAICompatibleEmbedding(TextEmbedding):
         Returns:
             Dict[str, Any]: API response
         """
-        response = requests.post(self.api_url, headers=self.headers, json=data, timeout=timeout)
+        session = get_http_session(self.api_url, self.pool_maxsize)
+        response = session.post(self.api_url, headers=self.headers, json=data, timeout=timeout)
         response.raise_for_status()
         return response.json()
 
+    async def _amake_request(self, data: Dict[str, Any], timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Make the API request on the event loop's pooled aiohttp session and return the response.
+
+        Args:
+            data: Request data
+            timeout: Timeout in seconds
+
+        Returns:
+            Dict[str, Any]: API response
+        """
+        session = get_async_http_session(self.api_url, self.pool_maxsize)
+        async with session.post(
+            self.api_url, headers=self.headers, json=data, timeout=aiohttp.ClientTimeout(total=timeout)
+        ) as response:
+            response.raise_for_status()
+            return await response.json()
+
     def get_embeddings(
         self,
         inputs: Union[str, List[str]],
@@ -375,6 +596,32 @@ class OpenAICompatibleEmbedding(TextEmbedding):
             raise last_timeout
         return []
 
+    async def aget_embeddings(
+        self,
+        inputs: Union[str, List[str]],
+        timeout: Optional[float] = None,
+        retries: int = 3,
+        retry_timeout_step: float = 5.0,
+    ) -> List[List[float]]:
+        """
+        Get embeddings for text inputs on the event loop.
+
+        Args:
+            inputs: A single text string or a list of text strings
+            timeout: Base timeout in seconds for the first attempt. If None, uses retry_timeout_step.
+            retries: Number of retries on timeout (not counting the first attempt)
+            retry_timeout_step: Linear increment in seconds for each retry timeout
+
+        Returns:
+            List of embedding vectors
+        """
+        data = self._prepare_input(inputs)
+        response = await _retry_on_timeout(
+            lambda current_timeout: self._amake_request(data, timeout=current_timeout),
+            "OpenAI", timeout, retries, retry_timeout_step,
+        )
+        return [item["embedding"] for item in response["data"]] if response else []
+
     async def dimension_check(self, timeout: float = 5.0) -> List[List[float]]:
         try:
             # Create a simple test input
@@ -1,6 +1,7 @@
 import math
 from collections import defaultdict
 
+import jieba
 import jieba.posseg as pseg
 from jieba import analyse
 
@@ -100,3 +101,21 @@ def calculate_term_weights(text, use_idf=False, doc_freqs=None, total_docs=1):
     # Re-normalize
     max_weight = max(weight for _, weight in meaningful_terms)
     return {term: weight / max_weight for term, weight in meaningful_terms}
+
+
+def tokenize(text):
+    """
+    Split text into lowercase index terms for keyword search
+
+    Uses jieba's search-engine mode so that long Chinese words also yield their sub-words,
+    stop words, whitespace and punctuation are dropped.
+
+    Args:
+        text (str): Text to be tokenized
+
+    Returns:
+        list: Terms in text order, repeated terms are kept
+    """
+    stop_words = analyse.default_tfidf.stop_words
+    return [word for word in jieba.cut_for_search(text.lower())
+            if any(char.isalnum() for char in word) and word not in stop_words]
@@ -5,5 +5,6 @@ This module provides core functionality for processing various types of data fil
 """
 
 from .core import DataProcessCore
+from .partition_cache import LocalPartitionCache, PartitionCache, StoragePartitionCache, hash_file_stream
 
-__all__ = ['DataProcessCore'] 
\ No newline at end of file
+__all__ = ['DataProcessCore', 'PartitionCache', 'LocalPartitionCache', 'StoragePartitionCache', 'hash_file_stream'] 
\ No newline at end of file
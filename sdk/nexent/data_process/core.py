@@ -4,7 +4,13 @@ from typing import Dict, List, Optional
 
 from .base import FileProcessor
 from .openpyxl_processor import OpenPyxlProcessor
-from .unstructured_processor import UnstructuredProcessor
+from .partition_cache import PartitionCache
+from .unstructured_processor import (
+    DEFAULT_MIN_PAGES_TO_SPLIT,
+    DEFAULT_PAGES_PER_RANGE,
+    PageRangeMap,
+    UnstructuredProcessor,
+)
 
 
 logger = logging.getLogger("data_process.core")
@@ -32,13 +38,34 @@ class DataProcessCore:
     # Supported processors
     PROCESSORS = {"Unstructured", "OpenPyxl"}
 
-    def __init__(self):
+    def __init__(
+        self,
+        page_range_map: Optional[PageRangeMap] = None,
+        pages_per_range: int = DEFAULT_PAGES_PER_RANGE,
+        min_pages_to_split: int = DEFAULT_MIN_PAGES_TO_SPLIT,
+        excel_streaming: bool = False,
+        partition_cache: Optional[PartitionCache] = None,
+    ):
         """
         Initialize the core data processing component
+
+        Args:
+            page_range_map: map(func, *iterables) compatible callable used to partition large PDFs page range by
+                page range in parallel; None partitions every file in a single call
+            pages_per_range: Pages per range
+            min_pages_to_split: Minimum page count of a PDF before it is split
+            excel_streaming: Read Excel workbooks row by row in read-only mode instead of loading them whole
+            partition_cache: Cache of the unchunked partition results of generic files, so processing a file
+                again only re-chunks its elements; None partitions every file again
         """
         self.processors: Dict[str, FileProcessor] = {
-            "Unstructured": UnstructuredProcessor(),
-            "OpenPyxl": OpenPyxlProcessor(),
+            "Unstructured": UnstructuredProcessor(
+                page_range_map=page_range_map,
+                pages_per_range=pages_per_range,
+                min_pages_to_split=min_pages_to_split,
+                partition_cache=partition_cache,
+            ),
+            "OpenPyxl": OpenPyxlProcessor(streaming=excel_streaming),
         }
         logger.debug("DataProcessCore initialization completed")
 
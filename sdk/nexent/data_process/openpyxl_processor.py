@@ -1,24 +1,183 @@
 import io
 import os
+from collections import defaultdict
 from copy import deepcopy
-from typing import Dict, List
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 import openpyxl
+from openpyxl.utils.cell import range_boundaries
+from openpyxl.xml.constants import SHEET_MAIN_NS
+from openpyxl.xml.functions import iterparse
 
 from .base import FileProcessor
 
 
+MERGE_CELL_TAG = "{%s}mergeCell" % SHEET_MAIN_NS
+ROW_TAG = "{%s}row" % SHEET_MAIN_NS
+
+# Merged range as (min_col, min_row, max_col, max_row, filled with the top-left value)
+MergedRange = Tuple[int, int, int, int, bool]
+
+
 class OpenPyxlProcessor(FileProcessor):
     """
     Unified Excel file processing class, supports in-memory file processing
+
+    In streaming mode the workbook is opened read-only and each sheet is read row by row: merged ranges come from
+    the sheet XML and are applied to the rows as they stream by, so neither the whole workbook nor a copy of it is
+    held in memory. The chunks are the same as those of the default mode.
     """
 
+    def __init__(self, streaming: bool = False):
+        """
+        Args:
+            streaming: Read workbooks row by row in read-only mode instead of loading and copying them whole
+        """
+        self.streaming = streaming
+
     def process_file(self, file_data: bytes, chunking_strategy: str, filename: str, **params) -> List[Dict]:
         """Process Excel file in memory"""
+        if self.streaming:
+            return list(self.iter_chunks(file_data, filename))
         return self._process_excel(
             file_data=file_data, chunking_strategy=chunking_strategy, filename=filename, **params
         )
 
+    def iter_chunks(self, file_data: bytes, filename: str = "") -> Iterator[Dict]:
+        """
+        Generate the chunks of an Excel file one by one, reading the workbook row by row.
+
+        Args:
+            file_data: Excel file byte data
+            filename: Filename
+
+        Returns:
+            Iterator of standardized chunk dictionaries
+        """
+        file_type = self._determine_file_type(filename)
+        try:
+            wb = openpyxl.load_workbook(io.BytesIO(file_data), read_only=True)
+        except Exception as e:
+            raise Exception(f"Failed to load Excel file: {str(e)}")
+
+        try:
+            for i, content_text in enumerate(self._iter_workbook_content(wb)):
+                yield {
+                    "content": content_text,
+                    "filename": filename,
+                    "metadata": {"chunk_index": i, "file_type": file_type},
+                }
+        finally:
+            wb.close()
+
+    def _iter_workbook_content(self, wb) -> Iterator[str]:
+        """Generate the content of all worksheets of a read-only workbook"""
+        for sheet_name in wb.sheetnames:
+            sheet = wb[sheet_name]
+            if not hasattr(sheet, "iter_rows"):
+                # Chart sheets hold no cells
+                continue
+            # Size the sheet from its cells like a fully loaded one, not from the stored dimension
+            sheet.reset_dimensions()
+            merged_ranges = self._read_merged_ranges(sheet)
+            begin_row, max_col, width = self._scan_rows(sheet, merged_ranges)
+
+            rows = self._iter_merged_rows(sheet, merged_ranges, width)
+            if max_col < 2:
+                yield self._join_single_column(rows, sheet_name)
+            else:
+                yield from self._iter_table_content(rows, begin_row, sheet_name)
+
+    def _read_merged_ranges(self, sheet) -> List[MergedRange]:
+        """
+        Read the merged ranges of a read-only sheet from its XML, which stores them after the cell data.
+
+        Column merges are filled with their top-left value like _merge_columns does; the other cells of the
+        remaining merges are blanked, as in a fully loaded sheet.
+        """
+        merged_ranges = []
+        with sheet._get_source() as source:
+            for _, element in iterparse(source):
+                if element.tag == MERGE_CELL_TAG:
+                    ref = element.get("ref")
+                    min_col, min_row, max_col, max_row = range_boundaries(ref)
+                    merged_ranges.append((min_col, min_row, max_col, max_row, self._is_column_merge(ref)))
+                elif element.tag == ROW_TAG:
+                    element.clear()
+        return merged_ranges
+
+    def _iter_merged_rows(
+        self, sheet, merged_ranges: List[MergedRange], width: Optional[int] = None
+    ) -> Iterator[tuple]:
+        """Generate the row values of a read-only sheet with the merged ranges applied"""
+        starting: Dict[int, List[MergedRange]] = defaultdict(list)
+        for merged_range in merged_ranges:
+            starting[merged_range[1]].append(merged_range)
+        last_merged_row = max((merged_range[3] for merged_range in merged_ranges), default=0)
+        # Merged range -> value of its top-left cell, for the ranges covering the current row
+        active: Dict[MergedRange, object] = {}
+
+        def apply(row_idx: int, row: Iterable) -> tuple:
+            for merged_range in [r for r in active if r[3] < row_idx]:
+                del active[merged_range]
+            if not active and row_idx not in starting:
+                return tuple(row)
+            values = list(row)
+            for merged_range in starting.get(row_idx, ()):
+                min_col = merged_range[0]
+                active[merged_range] = values[min_col - 1] if len(values) >= min_col else None
+            for (min_col, min_row, max_col, _, fill), top_left in active.items():
+                if len(values) < max_col:
+                    values.extend([None] * (max_col - len(values)))
+                for col in range(min_col, max_col + 1):
+                    if fill:
+                        values[col - 1] = top_left
+                    elif row_idx != min_row or col != min_col:
+                        values[col - 1] = None
+            return tuple(values)
+
+        row_idx = 0
+        for row_idx, row in enumerate(sheet.iter_rows(max_col=width, values_only=True), start=1):
+            yield apply(row_idx, row)
+        # Merged ranges reaching past the last stored row still add rows to a fully loaded sheet
+        for row_idx in range(row_idx + 1, last_merged_row + 1):
+            yield apply(row_idx, (None,) * (width or 0))
+
+    def _scan_rows(self, sheet, merged_ranges: List[MergedRange]) -> Tuple[int, int, int]:
+        """
+        One pass over a read-only sheet for what _get_title_row computes on a loaded one.
+
+        Returns:
+            Title row position, its count of non-empty cells and the width of the widest row
+        """
+        max_col = 0
+        position_max_col = 0
+        width = max((merged_range[2] for merged_range in merged_ranges), default=0)
+
+        for row_idx, row in enumerate(self._iter_merged_rows(sheet, merged_ranges), start=1):
+            width = max(width, len(row))
+            non_empty_cells = sum(1 for cell in row if cell is not None)
+            if non_empty_cells > max_col:
+                max_col = non_empty_cells
+                position_max_col = row_idx
+
+        return position_max_col, max_col, width
+
+    def _iter_table_content(self, rows: Iterable[tuple], begin_row: int, sheet_name: str) -> Iterator[str]:
+        """Generate the markdown rows of a table in a single pass: remarks and title precede the data rows"""
+        remark = ""
+        title_key: List[str] = []
+
+        for row_idx, row in enumerate(rows, start=1):
+            if not any(cell is not None for cell in row):
+                continue
+            if row_idx < begin_row:
+                remark += "<br>" + self._join_tuple_elements(row)
+            elif row_idx == begin_row:
+                title_key = [str(cell) if cell is not None else "" for cell in row]
+            else:
+                yield self._build_row_content(title_key, row, remark, sheet_name)
+
     def _process_excel(
         self, file_data: bytes, chunking_strategy: str = "basic", filename: str = "", **params
     ) -> List[Dict]:
@@ -98,15 +257,20 @@ class OpenPyxlProcessor(FileProcessor):
 
     def _process_single_column(self, sheet, sheet_name: str) -> List[str]:
         """Process single column data"""
+        return [self._join_single_column(sheet.iter_rows(values_only=True), sheet_name)]
+
+    @staticmethod
+    def _join_single_column(rows: Iterable[tuple], sheet_name: str) -> str:
+        """Join the first non-empty cell of every row"""
         content_str = ""
 
-        for row in sheet.iter_rows(values_only=True):
+        for row in rows:
             if any(cell is not None for cell in row):
                 # Process first non-empty cell
                 cell_value = next((cell for cell in row if cell is not None), "")
                 content_str += str(cell_value).replace("\n", "<br>") + "\n"
 
-        return [content_str + "\n————" + sheet_name]
+        return content_str + "\n————" + sheet_name
 
     def _process_multi_column(self, sheet, sheet_copy, sheet_name: str) -> List[str]:
         """Process multi-column table data"""
@@ -208,13 +372,13 @@ class OpenPyxlProcessor(FileProcessor):
 
         # Unmerge cells
         for merged_range in merged_ranges:
-            if str(merged_range)[0] != str(merged_range)[3]:
+            if not self._is_column_merge(str(merged_range)):
                 continue
             sheet.unmerge_cells(str(merged_range))
 
         # Fill merged area values
         for merged_range in merged_ranges:
-            if str(merged_range)[0] != str(merged_range)[3]:
+            if not self._is_column_merge(str(merged_range)):
                 continue
             min_col, min_row, max_col, max_row = merged_range.bounds
             top_left_value = sheet.cell(row=min_row, column=min_col).value
@@ -240,6 +404,11 @@ class OpenPyxlProcessor(FileProcessor):
                 for col in range(min_col, max_col + 1):
                     sheet.cell(row=row, column=col).value = top_left_value
 
+    @staticmethod
+    def _is_column_merge(range_ref: str) -> bool:
+        """Whether _merge_columns fills a merged range, given by its reference such as A1:A5"""
+        return range_ref[0] == range_ref[3]
+
     @staticmethod
     def _dict_to_markdown_table(data: Dict[str, str]) -> str:
         """Convert dictionary to markdown table"""
@@ -0,0 +1,200 @@
+import glob
+import gzip
+import hashlib
+import io
+import json
+import logging
+import math
+import os
+import tempfile
+import time
+from abc import ABC, abstractmethod
+from typing import Any, BinaryIO, Dict, List, Optional
+
+logger = logging.getLogger("partition_cache")
+
+HASH_BLOCK_BYTES = 1024 * 1024
+
+
+class PartitionCache(ABC):
+    """
+    Store of serialized partition results, the elements of a file before chunking.
+
+    Values are opaque bytes. Errors of get and put are logged by the processor and treated as a cache miss.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        pass
+
+    @abstractmethod
+    def put(self, key: str, data: bytes) -> None:
+        pass
+
+    @abstractmethod
+    def evict_file(self, file_hash: str) -> int:
+        """Remove the entries of a file under every partition strategy, file_hash being its sha256; returns the count"""
+        pass
+
+
+class LocalPartitionCache(PartitionCache):
+    """
+    Partition results kept as files under a local directory, fanned out by the first two key characters.
+
+    With a ttl_s, entries older than ttl_s are misses and are removed when read, and every put removes the expired
+    entries sharing its fan-out directory.
+    """
+
+    def __init__(self, directory: str, ttl_s: Optional[int] = None):
+        self.directory = directory
+        self.ttl_s = ttl_s
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.json.gz")
+
+    def _expired(self, path: str) -> bool:
+        return bool(self.ttl_s) and time.time() - os.path.getmtime(path) > self.ttl_s
+
+    def get(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        try:
+            if self._expired(path):
+                os.unlink(path)
+                return None
+            with open(path, "rb") as file:
+                return file.read()
+        except FileNotFoundError:
+            return None
+
+    def put(self, key: str, data: bytes) -> None:
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        if self.ttl_s:
+            self._purge_expired(os.path.dirname(path))
+        # Write then rename so concurrent readers never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(data)
+            os.replace(tmp_path, path)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+
+    def _purge_expired(self, directory: str) -> None:
+        for path in glob.glob(os.path.join(directory, "*.json.gz")):
+            try:
+                if self._expired(path):
+                    os.unlink(path)
+            except FileNotFoundError:
+                continue
+
+    def evict_file(self, file_hash: str) -> int:
+        evicted = 0
+        for path in glob.glob(os.path.join(self.directory, file_hash[:2], f"{file_hash}-*.json.gz")):
+            try:
+                os.unlink(path)
+                evicted += 1
+            except FileNotFoundError:
+                continue
+        return evicted
+
+
+class StoragePartitionCache(PartitionCache):
+    """
+    Partition results kept as objects of a storage client (e.g. MinIO), under prefix.
+
+    The client needs the upload_fileobj, get_file_stream, list_files and delete_file methods of the nexent storage
+    clients. With a ttl_s, the first put installs an expiration rule of ttl_s rounded up to whole days on the
+    prefix through set_prefix_expiration; storage without lifecycle support keeps entries until they are evicted.
+    """
+
+    def __init__(self, storage_client: Any, prefix: str = "partition_cache", bucket: Optional[str] = None,
+                 ttl_s: Optional[int] = None):
+        self.storage_client = storage_client
+        self.prefix = prefix.strip("/")
+        self.bucket = bucket
+        self.ttl_s = ttl_s
+        self._expiration_set = False
+
+    def _object_name(self, key: str) -> str:
+        return f"{self.prefix}/{key}.json.gz"
+
+    def get(self, key: str) -> Optional[bytes]:
+        success, stream = self.storage_client.get_file_stream(self._object_name(key), self.bucket)
+        if not success:
+            return None
+        try:
+            return stream.read()
+        finally:
+            if hasattr(stream, "close"):
+                stream.close()
+
+    def put(self, key: str, data: bytes) -> None:
+        if self.ttl_s and not self._expiration_set:
+            self._set_expiration()
+        success, message = self.storage_client.upload_fileobj(io.BytesIO(data), self._object_name(key), self.bucket)
+        if not success:
+            raise IOError(f"Failed to store partition result {key}: {message}")
+
+    def _set_expiration(self) -> None:
+        # Tried once per instance: a refusal is not retried on every put
+        self._expiration_set = True
+        days = max(1, math.ceil(self.ttl_s / 86400))
+        success, message = self.storage_client.set_prefix_expiration(f"{self.prefix}/", days, self.bucket)
+        if not success:
+            logger.warning(f"Partition results under {self.prefix}/ do not expire: {message}")
+
+    def evict_file(self, file_hash: str) -> int:
+        evicted = 0
+        for file_info in self.storage_client.list_files(f"{self.prefix}/{file_hash}-", self.bucket):
+            success, message = self.storage_client.delete_file(file_info["key"], self.bucket)
+            if success:
+                evicted += 1
+            else:
+                logger.warning(f"Failed to evict partition result {file_info['key']}: {message}")
+        return evicted
+
+
+def _unstructured_version() -> str:
+    try:
+        from importlib.metadata import version
+
+        return version("unstructured")
+    except Exception:
+        return "unknown"
+
+
+def hash_file_stream(stream: BinaryIO) -> str:
+    """sha256 of a file read block by block, the file part of partition_cache_key and the argument of evict_file"""
+    digest = hashlib.sha256()
+    for block in iter(lambda: stream.read(HASH_BLOCK_BYTES), b""):
+        digest.update(block)
+    return digest.hexdigest()
+
+
+def partition_cache_key(file_data: bytes, partition_params: Dict[str, Any]) -> str:
+    """
+    Key of the partition result of a file.
+
+    Combines the sha256 of the file bytes with the parameters that shape the elements and the unstructured
+    version, so an upgrade that changes layout analysis does not reuse older results. Chunk sizes are not part of
+    the key: chunking runs over the cached elements.
+    """
+    params = json.dumps({**partition_params, "unstructured": _unstructured_version()}, sort_keys=True)
+    return f"{hashlib.sha256(file_data).hexdigest()}-{hashlib.sha256(params.encode()).hexdigest()[:16]}"
+
+
+def serialize_elements(elements: List[Any]) -> bytes:
+    """Serialize unstructured elements as gzip compressed JSON"""
+    from unstructured.staging.base import elements_to_dicts
+
+    payload = json.dumps(elements_to_dicts(elements), ensure_ascii=False, separators=(",", ":"))
+    return gzip.compress(payload.encode("utf-8"), compresslevel=6)
+
+
+def deserialize_elements(data: bytes) -> List[Any]:
+    """Rebuild unstructured elements serialized by serialize_elements"""
+    from unstructured.staging.base import elements_from_dicts
+
+    return elements_from_dicts(json.loads(gzip.decompress(data).decode("utf-8")))
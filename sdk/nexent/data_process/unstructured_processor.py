@@ -1,18 +1,103 @@
 import io
+import logging
 import os
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 from .base import FileProcessor
+from .partition_cache import PartitionCache, deserialize_elements, partition_cache_key, serialize_elements
+
+
+logger = logging.getLogger("data_process.unstructured_processor")
+
+# Formats that can be cut into page ranges and partitioned independently
+PAGE_RANGE_SPLIT_EXTENSIONS = {".pdf"}
+DEFAULT_PAGES_PER_RANGE = 32
+DEFAULT_MIN_PAGES_TO_SPLIT = 64
+
+# map(func, *iterables) compatible callable: builtin map, Executor.map or a Ray backed equivalent
+PageRangeMap = Callable[..., Iterable[List[Any]]]
+
+
+def split_pdf_page_ranges(file_data: bytes, pages_per_range: int, min_pages: int = 0) -> List[Tuple[int, bytes]]:
+    """
+    Cut a PDF into standalone PDFs of at most pages_per_range pages each.
+
+    Args:
+        file_data: PDF byte data
+        pages_per_range: Pages per range
+        min_pages: Documents with fewer pages are not split
+
+    Returns:
+        List of (starting page number, PDF bytes of the range); empty when the document is not split
+    """
+    from pypdf import PdfReader, PdfWriter
+
+    reader = PdfReader(io.BytesIO(file_data))
+    if reader.is_encrypted:
+        return []
+    page_count = len(reader.pages)
+    if page_count < max(min_pages, 2) or page_count <= pages_per_range:
+        return []
+
+    ranges = []
+    for start in range(0, page_count, pages_per_range):
+        writer = PdfWriter()
+        for page in reader.pages[start:start + pages_per_range]:
+            writer.add_page(page)
+        buffer = io.BytesIO()
+        writer.write(buffer)
+        ranges.append((start + 1, buffer.getvalue()))
+    return ranges
+
+
+def partition_page_range(range_data: bytes, starting_page_number: int, partition_kwargs: Dict) -> List[Any]:
+    """
+    Partition one page range without chunking.
+
+    Module level so it can be shipped to process pools and Ray workers.
+    """
+    from unstructured.partition.auto import partition
+
+    return partition(file=io.BytesIO(range_data), starting_page_number=starting_page_number, **partition_kwargs)
 
 
 class UnstructuredProcessor(FileProcessor):
     """
     Unified generic file processing class that supports in-memory file processing.
     Uses unified internal methods to reduce code duplication.
+
+    When a page_range_map is given, PDFs of at least min_pages_to_split pages are cut into ranges of
+    pages_per_range pages that are partitioned through the map. The elements are merged in page order and
+    chunked and language tagged once over the whole document, the same steps partition() applies, so the
+    chunks equal those of the serial path.
+
+    When a partition_cache is given, the elements are partitioned without chunking and stored in the cache
+    before being chunked the same way, so processing the file again, with other chunk sizes or after a failed
+    forward, only re-chunks the cached elements instead of running layout analysis and OCR again.
     """
 
-    def __init__(self):
-        """Initialize generic file processor"""
+    def __init__(
+        self,
+        page_range_map: Optional[PageRangeMap] = None,
+        pages_per_range: int = DEFAULT_PAGES_PER_RANGE,
+        min_pages_to_split: int = DEFAULT_MIN_PAGES_TO_SPLIT,
+        partition_cache: Optional[PartitionCache] = None,
+    ):
+        """
+        Initialize generic file processor
+
+        Args:
+            page_range_map: map(func, *iterables) compatible callable used to partition page ranges in parallel;
+                None partitions every file in a single call
+            pages_per_range: Pages per range
+            min_pages_to_split: Minimum page count of a document before it is split
+            partition_cache: Cache of partition results keyed by file hash and partition strategy; None
+                partitions every file again
+        """
+        self.page_range_map = page_range_map
+        self.pages_per_range = max(1, pages_per_range)
+        self.min_pages_to_split = min_pages_to_split
+        self.partition_cache = partition_cache
         self.default_params = {
             "max_characters": 1536,
             "new_after_n_chars": 1024,
@@ -62,6 +147,19 @@ class UnstructuredProcessor(FileProcessor):
         # Merge parameters
         processed_params = self._merge_params(params)
 
+        # Cached partition results only need chunking
+        if self.partition_cache is not None:
+            elements = self._partition_with_cache(file_data, filename, processed_params)
+            elements = self._chunk_elements(elements, chunking_strategy, processed_params)
+            return self._process_elements(elements, chunking_strategy, filename)
+
+        # Large paginated files are partitioned range by range
+        page_ranges = self._split_page_ranges(file_data, filename)
+        if page_ranges:
+            elements = self._partition_page_ranges(page_ranges, processed_params)
+            elements = self._chunk_elements(elements, chunking_strategy, processed_params)
+            return self._process_elements(elements, chunking_strategy, filename)
+
         # Prepare partition parameters
         partition_kwargs = self._prepare_partition_kwargs(
             file_data, chunking_strategy, processed_params)
@@ -72,6 +170,126 @@ class UnstructuredProcessor(FileProcessor):
         # Process results
         return self._process_elements(elements, chunking_strategy, filename)
 
+    def _split_page_ranges(self, file_data: bytes, filename: Optional[str]) -> List[Tuple[int, bytes]]:
+        """
+        Cut the file into page ranges when parallel partitioning applies to it.
+
+        Returns:
+            List of (starting page number, range bytes); empty to partition the file in a single call
+        """
+        if self.page_range_map is None or not filename:
+            return []
+        _, ext = os.path.splitext(filename.lower())
+        if ext not in PAGE_RANGE_SPLIT_EXTENSIONS:
+            return []
+        try:
+            return split_pdf_page_ranges(file_data, self.pages_per_range, self.min_pages_to_split)
+        except Exception as e:
+            logger.warning(f"Could not split {filename} into page ranges, partitioning it whole: {e}")
+            return []
+
+    def _partition_with_cache(self, file_data: bytes, filename: Optional[str], params: Dict) -> List:
+        """
+        Elements of the file before chunking, read from partition_cache or partitioned and stored there.
+
+        Cache errors are logged and the file is partitioned as if the cache missed.
+
+        Args:
+            file_data: File byte data
+            filename: Filename
+            params: Processing parameters
+
+        Returns:
+            Unchunked elements in document order
+        """
+        key = partition_cache_key(file_data, {
+            "strategy": params["strategy"],
+            "skip_infer_table_types": params["skip_infer_table_types"],
+        })
+        try:
+            cached = self.partition_cache.get(key)
+            if cached is not None:
+                elements = deserialize_elements(cached)
+                logger.info(f"Reusing {len(elements)} cached partition elements of {filename}")
+                return elements
+        except Exception as e:
+            logger.warning(f"Could not read the cached partition result of {filename}, partitioning it: {e}")
+
+        elements = self._partition_elements(file_data, filename, params)
+        try:
+            self.partition_cache.put(key, serialize_elements(elements))
+        except Exception as e:
+            logger.warning(f"Could not cache the partition result of {filename}: {e}")
+        return elements
+
+    def _partition_elements(self, file_data: bytes, filename: Optional[str], params: Dict) -> List:
+        """
+        Partition the file without chunking, range by range when it is split into page ranges.
+
+        Returns:
+            Unchunked elements in document order
+        """
+        from unstructured.partition.auto import partition
+
+        page_ranges = self._split_page_ranges(file_data, filename)
+        if page_ranges:
+            return self._partition_page_ranges(page_ranges, params)
+        return partition(
+            file=io.BytesIO(file_data),
+            strategy=params["strategy"],
+            skip_infer_table_types=params["skip_infer_table_types"],
+        )
+
+    def _partition_page_ranges(self, page_ranges: List[Tuple[int, bytes]], params: Dict) -> List:
+        """
+        Partition page ranges through page_range_map without chunking and merge their elements.
+
+        Args:
+            page_ranges: List of (starting page number, range bytes)
+            params: Processing parameters
+
+        Returns:
+            Elements in document order
+        """
+        range_kwargs = {
+            "strategy": params["strategy"],
+            "skip_infer_table_types": params["skip_infer_table_types"],
+        }
+        results = self.page_range_map(
+            partition_page_range,
+            [range_data for _, range_data in page_ranges],
+            [starting_page for starting_page, _ in page_ranges],
+            [range_kwargs] * len(page_ranges),
+        )
+        elements = [element for range_elements in results for element in range_elements]
+        logger.info(f"Partitioned {len(page_ranges)} page ranges into {len(elements)} elements")
+        return elements
+
+    def _chunk_elements(self, elements: List, chunking_strategy: str, params: Dict) -> List:
+        """
+        Chunk unchunked elements and tag languages over the whole document, as partition() does.
+
+        Args:
+            elements: Unchunked elements in document order
+            chunking_strategy: Chunking strategy
+            params: Processing parameters
+
+        Returns:
+            Elements or chunks in document order
+        """
+        from unstructured.chunking.dispatch import chunk
+        from unstructured.partition.common.lang import apply_lang_metadata
+
+        # partition() chunks before detecting languages, so chunk first and re-detect over the whole document
+        if chunking_strategy != "none":
+            elements = chunk(
+                elements,
+                chunking_strategy,
+                max_characters=params["max_characters"],
+                new_after_n_chars=params["new_after_n_chars"],
+            )
+        return list(apply_lang_metadata(elements, languages=None))
+
     def _merge_params(self, user_params: Dict) -> Dict:
         """
         Merge default parameters with user-provided parameters.
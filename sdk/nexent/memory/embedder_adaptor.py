@@ -1,5 +1,7 @@
 from typing import Literal, Optional, Union
 from mem0.embeddings.base import EmbeddingBase
+from nexent.core.models.embedding_cache import EmbeddingCache, get_default_embedding_cache
+from nexent.core.models.embedding_coalescer import get_default_embedding_coalescer
 from nexent.core.models.embedding_model import OpenAICompatibleEmbedding
 from mem0.configs.embeddings.base import BaseEmbedderConfig
 
@@ -9,7 +11,11 @@ class EmbedderAdaptor(EmbeddingBase):
     EmbedderAdaptor is a class that adapts the OpenAICompatibleEmbedding to Mem0 embedders.
     """
 
-    def __init__(self, config: Optional[Union[BaseEmbedderConfig, dict]] = None):
+    def __init__(
+        self,
+        config: Optional[Union[BaseEmbedderConfig, dict]] = None,
+        embedding_cache: Optional[EmbeddingCache] = None,
+    ):
         if isinstance(config, dict):
             config = BaseEmbedderConfig(**config)
 
@@ -21,6 +27,25 @@ class EmbedderAdaptor(EmbeddingBase):
             api_key=self.config.api_key,
             embedding_dim=self.config.embedding_dims,
         )
+        # Falls back to the process-wide cache at call time, so it may be registered after construction
+        self._embedding_cache = embedding_cache
+
+    def _get_embeddings(self, inputs: Union[str, list[str]]) -> list[list[float]]:
+        cache = self._embedding_cache or get_default_embedding_cache()
+        coalescer = get_default_embedding_coalescer()
+        if isinstance(inputs, str) and coalescer is not None:
+            # Single texts of concurrent memory searches share batched API calls
+            if cache is None:
+                return [coalescer.embed(self._embedder, inputs)]
+            model_name, embedding_dim = EmbeddingCache.model_identity(self._embedder)
+            vector = cache.get_many(model_name, embedding_dim, [inputs])[0]
+            if vector is None:
+                vector = coalescer.embed(self._embedder, inputs)
+                cache.put_many(model_name, embedding_dim, [inputs], [vector])
+            return [vector]
+        if cache is not None:
+            return cache.get_embeddings(self._embedder, inputs)
+        return self._embedder.get_embeddings(inputs)
 
     def embed(
         self,
@@ -44,11 +69,10 @@ class EmbedderAdaptor(EmbeddingBase):
         if isinstance(text, str):
             # follow mem0 logic
             cleaned_text = text.replace("\n", " ")
-            vectors = self._embedder.get_embeddings(cleaned_text)
+            vectors = self._get_embeddings(cleaned_text)
             return vectors[0]
         elif isinstance(text, list):
             # follow mem0 logic
             cleaned_batch = [t.replace("\n", " ") for t in text]
-            vectors = self._embedder.get_embeddings(cleaned_batch)
+            vectors = self._get_embeddings(cleaned_batch)
             return vectors
-
@@ -396,3 +396,48 @@ class MinIOStorageClient(StorageClient):
         except ClientError:
             return False
 
+
+    def set_prefix_expiration(
+        self,
+        prefix: str,
+        days: int,
+        bucket: Optional[str] = None
+    ) -> Tuple[bool, str]:
+        """
+        Make objects under a prefix expire with a bucket lifecycle rule
+
+        The rule is identified by its prefix, so calling again replaces it; other rules of the bucket are kept.
+
+        Args:
+            prefix: Object name prefix the rule applies to
+            days: Days after creation an object is removed
+            bucket: Bucket name, if not specified use default bucket
+
+        Returns:
+            Tuple[bool, str]: (Success status, Success message or error message)
+        """
+        bucket = bucket or self.default_bucket
+        if bucket is None:
+            return False, "Bucket name is required"
+
+        rule_id = f"expire-{prefix}"
+        try:
+            try:
+                rules = self.client.get_bucket_lifecycle_configuration(Bucket=bucket).get('Rules', [])
+            except ClientError as e:
+                if e.response.get('Error', {}).get('Code', '') != 'NoSuchLifecycleConfiguration':
+                    raise
+                rules = []
+            rules = [rule for rule in rules if rule.get('ID') != rule_id]
+            rules.append({
+                'ID': rule_id,
+                'Filter': {'Prefix': prefix},
+                'Status': 'Enabled',
+                'Expiration': {'Days': days},
+            })
+            self.client.put_bucket_lifecycle_configuration(
+                Bucket=bucket, LifecycleConfiguration={'Rules': rules})
+            return True, f"Objects under {prefix} expire after {days} days"
+        except Exception as e:
+            logger.error(f"Failed to set expiration of {prefix} in bucket {bucket}: {e}")
+            return False, str(e)
@@ -217,3 +217,24 @@ class StorageClient(ABC):
         """
         pass
 
+
+    def set_prefix_expiration(
+        self,
+        prefix: str,
+        days: int,
+        bucket: Optional[str] = None
+    ) -> Tuple[bool, str]:
+        """
+        Make objects under a prefix expire a number of days after their creation
+
+        Storage without object lifecycle support keeps this default, which changes nothing.
+
+        Args:
+            prefix: Object name prefix the rule applies to
+            days: Days after creation an object is removed
+            bucket: Bucket name, if not specified use default bucket
+
+        Returns:
+            Tuple[bool, str]: (Success status, Success message or error message)
+        """
+        return False, f"{type(self).__name__} does not support object expiration"
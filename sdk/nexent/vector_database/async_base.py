@@ -0,0 +1,438 @@
+import asyncio
+import itertools
+from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from ..core.models.embedding_model import BaseEmbedding
+from .base import VectorDatabaseCore
+
+
+class AsyncVectorDatabaseCore(ABC):
+    """
+    Asyncio counterpart of VectorDatabaseCore for request-serving code.
+
+    It covers the operations on the request path: index lookup and deletion, chunk reads and edits, search,
+    document listings and statistics. Index creation and bulk vectorization stay on VectorDatabaseCore, they
+    run in background workers where blocking I/O is harmless.
+    Arguments and return values match the synchronous methods of the same name.
+    """
+
+    # ---- INDEX MANAGEMENT ----
+
+    @abstractmethod
+    async def delete_index(self, index_name: str) -> bool:
+        """
+        Delete an entire index.
+
+        Args:
+            index_name: Name of the index to delete
+
+        Returns:
+            bool: True if deletion was successful
+        """
+        pass
+
+    @abstractmethod
+    async def get_user_indices(self, index_pattern: str = "*") -> List[str]:
+        """
+        Get list of user created indices.
+
+        Args:
+            index_pattern: Pattern to match index names
+
+        Returns:
+            List of index names
+        """
+        pass
+
+    @abstractmethod
+    async def check_index_exists(self, index_name: str) -> bool:
+        """
+        Check if an index exists.
+
+        Args:
+            index_name: Name of the index to check
+
+        Returns:
+            bool: True if index exists, False otherwise
+        """
+        pass
+
+    # ---- DOCUMENT OPERATIONS ----
+
+    @abstractmethod
+    async def delete_documents(self, index_name: str, path_or_url: str) -> int:
+        """
+        Delete documents based on their path_or_url field.
+
+        Args:
+            index_name: Name of the index to delete documents from
+            path_or_url: The URL or path of the documents to delete
+
+        Returns:
+            int: Number of documents deleted
+        """
+        pass
+
+    @abstractmethod
+    async def get_index_chunks(
+        self,
+        index_name: str,
+        page: Optional[int] = None,
+        page_size: Optional[int] = None,
+        path_or_url: Optional[str] = None,
+        cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Retrieve chunk records for the specified index with optional pagination.
+
+        Args:
+            index_name: Name of the index to query
+            page: Page number (1-based)
+            page_size: Number of records per page
+            path_or_url: Optional path_or_url filter
+            cursor: next_cursor returned by the previous page
+
+        Returns:
+            Dictionary containing chunks, total, page, page_size and next_cursor
+        """
+        pass
+
+    @abstractmethod
+    def iter_index_chunks(
+        self,
+        index_name: str,
+        path_or_url: Optional[str] = None,
+        batch_size: int = 1000,
+        cursor: Optional[str] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream every chunk of an index without holding the whole index in memory.
+
+        Args:
+            index_name: Name of the index to read
+            path_or_url: Optional path_or_url filter
+            batch_size: Number of chunks fetched per request
+            cursor: Resume token pointing right after an already consumed chunk
+
+        Yields:
+            Chunk dictionaries without the embedding field
+        """
+        pass
+
+    @abstractmethod
+    async def create_chunk(self, index_name: str, chunk: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Create a single chunk document.
+
+        Args:
+            index_name: Name of the index
+            chunk: Chunk payload
+
+        Returns:
+            Dict with id, result and version of the created chunk
+        """
+        pass
+
+    @abstractmethod
+    async def update_chunk(self, index_name: str, chunk_id: str, chunk_updates: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Update an existing chunk document.
+
+        Args:
+            index_name: Name of the index
+            chunk_id: Chunk identifier
+            chunk_updates: Partial fields to update
+
+        Returns:
+            Dict with id, result and version of the updated chunk
+        """
+        pass
+
+    @abstractmethod
+    async def delete_chunk(self, index_name: str, chunk_id: str) -> bool:
+        """
+        Delete a chunk document by id.
+
+        Args:
+            index_name: Name of the index
+            chunk_id: Chunk identifier
+
+        Returns:
+            bool: True if the chunk was deleted
+        """
+        pass
+
+    @abstractmethod
+    async def count_documents(self, index_name: str) -> int:
+        """
+        Count the total number of documents in an index.
+
+        Args:
+            index_name: Name of the index
+
+        Returns:
+            int: Number of documents
+        """
+        pass
+
+    @abstractmethod
+    async def search(self, index_name: str, query: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute a search query on an index.
+
+        Args:
+            index_name: Name of the index to search
+            query: Search query dictionary
+
+        Returns:
+            Dict containing search results
+        """
+        pass
+
+    @abstractmethod
+    async def multi_search(self, body: List[Dict[str, Any]], index_name: str) -> Dict[str, Any]:
+        """
+        Execute multiple search queries in a single request.
+
+        Args:
+            body: List of search queries (alternating index and query)
+            index_name: Name of the index to search
+
+        Returns:
+            Dict containing responses for all queries
+        """
+        pass
+
+    # ---- SEARCH OPERATIONS ----
+
+    @abstractmethod
+    async def accurate_search(self, index_names: List[str], query_text: str, top_k: int = 5) -> List[Dict[str, Any]]:
+        """
+        Search for documents using fuzzy text matching across multiple indices.
+
+        Args:
+            index_names: List of index names to search in
+            query_text: The text query to search for
+            top_k: Number of results to return
+
+        Returns:
+            List of search results with scores and document content
+        """
+        pass
+
+    @abstractmethod
+    async def semantic_search(
+        self, index_names: List[str], query_text: str, embedding_model: BaseEmbedding, top_k: int = 5
+    ) -> List[Dict[str, Any]]:
+        """
+        Search for similar documents using vector similarity across multiple indices.
+
+        Args:
+            index_names: List of index names to search in
+            query_text: The text query to search for
+            embedding_model: The embedding model to use
+            top_k: Number of results to return
+
+        Returns:
+            List of search results with scores and document content
+        """
+        pass
+
+    @abstractmethod
+    async def hybrid_search(
+        self,
+        index_names: List[str],
+        query_text: str,
+        embedding_model: BaseEmbedding,
+        top_k: int = 5,
+        weight_accurate: float = 0.3,
+    ) -> List[Dict[str, Any]]:
+        """
+        Hybrid search combining accurate matching and semantic search results across multiple indices.
+
+        Args:
+            index_names: List of index names to search in
+            query_text: The text query to search for
+            embedding_model: The embedding model to use
+            top_k: Number of results to return
+            weight_accurate: The weight of the accurate matching score (0-1)
+
+        Returns:
+            List of search results sorted by combined score
+        """
+        pass
+
+    # ---- STATISTICS AND MONITORING ----
+
+    @abstractmethod
+    async def get_documents_detail(self, index_name: str) -> List[Dict[str, Any]]:
+        """
+        Get a list of unique source files with metadata.
+
+        Args:
+            index_name: Name of the index to query
+
+        Returns:
+            List of dictionaries with path_or_url, filename, file_size, create_time and chunk_count
+        """
+        pass
+
+    @abstractmethod
+    async def list_documents(
+        self,
+        index_name: str,
+        page_size: int = 100,
+        cursor: Optional[str] = None,
+        sort_by: str = "create_time",
+        sort_order: str = "desc",
+        path_or_urls: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Page through the source files of an index.
+
+        Args:
+            index_name: Name of the index to query
+            page_size: Number of files per page
+            cursor: next_cursor returned by the previous page
+            sort_by: One of create_time, file_size, chunk_count, filename, path_or_url
+            sort_order: "asc" or "desc"
+            path_or_urls: Optional restriction to these files
+
+        Returns:
+            Dictionary containing documents, total and next_cursor
+        """
+        pass
+
+    @abstractmethod
+    async def get_indices_detail(
+        self, index_names: List[str], embedding_dim: Optional[int] = None
+    ) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        Get formatted statistics for multiple indices.
+
+        Args:
+            index_names: List of index names to get stats for
+            embedding_dim: Optional embedding dimension reported in base_info
+
+        Returns:
+            Dict mapping each index name to its statistics
+        """
+        pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Release the connections held by this core"""
+        pass
+
+
+class ThreadedAsyncVectorDatabaseCore(AsyncVectorDatabaseCore):
+    """
+    AsyncVectorDatabaseCore over a synchronous core, running each call in a worker thread.
+
+    Used for backends without a native asyncio client, e.g. the in-process LocalVectorCore.
+    """
+
+    def __init__(self, core: VectorDatabaseCore):
+        self.core = core
+
+    async def delete_index(self, index_name: str) -> bool:
+        return await asyncio.to_thread(self.core.delete_index, index_name)
+
+    async def get_user_indices(self, index_pattern: str = "*") -> List[str]:
+        return await asyncio.to_thread(self.core.get_user_indices, index_pattern)
+
+    async def check_index_exists(self, index_name: str) -> bool:
+        return await asyncio.to_thread(self.core.check_index_exists, index_name)
+
+    async def delete_documents(self, index_name: str, path_or_url: str) -> int:
+        return await asyncio.to_thread(self.core.delete_documents, index_name, path_or_url)
+
+    async def get_index_chunks(
+        self,
+        index_name: str,
+        page: Optional[int] = None,
+        page_size: Optional[int] = None,
+        path_or_url: Optional[str] = None,
+        cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        return await asyncio.to_thread(
+            self.core.get_index_chunks, index_name, page=page, page_size=page_size, path_or_url=path_or_url,
+            cursor=cursor)
+
+    async def iter_index_chunks(
+        self,
+        index_name: str,
+        path_or_url: Optional[str] = None,
+        batch_size: int = 1000,
+        cursor: Optional[str] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        chunks = self.core.iter_index_chunks(index_name, path_or_url=path_or_url, batch_size=batch_size, cursor=cursor)
+        while True:
+            batch = await asyncio.to_thread(list, itertools.islice(chunks, batch_size))
+            for chunk in batch:
+                yield chunk
+            if len(batch) < batch_size:
+                break
+
+    async def create_chunk(self, index_name: str, chunk: Dict[str, Any]) -> Dict[str, Any]:
+        return await asyncio.to_thread(self.core.create_chunk, index_name, chunk)
+
+    async def update_chunk(self, index_name: str, chunk_id: str, chunk_updates: Dict[str, Any]) -> Dict[str, Any]:
+        return await asyncio.to_thread(self.core.update_chunk, index_name, chunk_id, chunk_updates)
+
+    async def delete_chunk(self, index_name: str, chunk_id: str) -> bool:
+        return await asyncio.to_thread(self.core.delete_chunk, index_name, chunk_id)
+
+    async def count_documents(self, index_name: str) -> int:
+        return await asyncio.to_thread(self.core.count_documents, index_name)
+
+    async def search(self, index_name: str, query: Dict[str, Any]) -> Dict[str, Any]:
+        return await asyncio.to_thread(self.core.search, index_name, query)
+
+    async def multi_search(self, body: List[Dict[str, Any]], index_name: str) -> Dict[str, Any]:
+        return await asyncio.to_thread(self.core.multi_search, body, index_name)
+
+    async def accurate_search(self, index_names: List[str], query_text: str, top_k: int = 5) -> List[Dict[str, Any]]:
+        return await asyncio.to_thread(self.core.accurate_search, index_names, query_text, top_k)
+
+    async def semantic_search(
+        self, index_names: List[str], query_text: str, embedding_model: BaseEmbedding, top_k: int = 5
+    ) -> List[Dict[str, Any]]:
+        return await asyncio.to_thread(self.core.semantic_search, index_names, query_text, embedding_model, top_k)
+
+    async def hybrid_search(
+        self,
+        index_names: List[str],
+        query_text: str,
+        embedding_model: BaseEmbedding,
+        top_k: int = 5,
+        weight_accurate: float = 0.3,
+    ) -> List[Dict[str, Any]]:
+        return await asyncio.to_thread(
+            self.core.hybrid_search, index_names=index_names, query_text=query_text,
+            embedding_model=embedding_model, top_k=top_k, weight_accurate=weight_accurate)
+
+    async def get_documents_detail(self, index_name: str) -> List[Dict[str, Any]]:
+        return await asyncio.to_thread(self.core.get_documents_detail, index_name)
+
+    async def list_documents(
+        self,
+        index_name: str,
+        page_size: int = 100,
+        cursor: Optional[str] = None,
+        sort_by: str = "create_time",
+        sort_order: str = "desc",
+        path_or_urls: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        return await asyncio.to_thread(
+            self.core.list_documents, index_name, page_size=page_size, cursor=cursor, sort_by=sort_by,
+            sort_order=sort_order, path_or_urls=path_or_urls)
+
+    async def get_indices_detail(
+        self, index_names: List[str], embedding_dim: Optional[int] = None
+    ) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        return await asyncio.to_thread(self.core.get_indices_detail, index_names, embedding_dim)
+
+    async def close(self) -> None:
+        pass
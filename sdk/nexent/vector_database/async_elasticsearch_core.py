@@ -0,0 +1,623 @@
+import asyncio
+import logging
+import time
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional
+
+from elasticsearch import AsyncElasticsearch, exceptions
+
+from ..core.models.embedding_coalescer import EmbeddingRequestCoalescer, aembed_query
+from ..core.models.embedding_model import BaseEmbedding
+from .async_base import AsyncVectorDatabaseCore
+from .elasticsearch_core import (
+    DEFAULT_CHUNK_BATCH_SIZE,
+    DEFAULT_DOCUMENT_PAGE_SIZE,
+    DEFAULT_HYBRID_FUSION,
+    DEFAULT_KNN_NUM_CANDIDATES,
+    DOCUMENT_CATALOG_BATCH_SIZE,
+    DOCUMENT_CATALOG_INDEX,
+    DOCUMENT_CATALOG_MAPPINGS,
+    DOCUMENT_CATALOG_SETTINGS,
+    INDEX_STATS_AGGS,
+    PIT_KEEP_ALIVE,
+    ElasticSearchCore,
+)
+from .index_stats_cache import IndexStatsCache
+from .query_embedding_cache import QueryEmbeddingCache
+from .utils import decode_cursor
+
+
+logger = logging.getLogger("async_elasticsearch_core")
+
+DEFAULT_CONNECTIONS_PER_NODE = 64
+
+
+class AsyncElasticSearchCore(AsyncVectorDatabaseCore):
+    """
+    Elasticsearch operations on the asyncio client, for request-serving code.
+
+    Queries are built and parsed by the same helpers as ElasticSearchCore, so both cores return identical
+    results. Pass a client from build_client to share one connection pool between all core instances:
+
+        client = AsyncElasticSearchCore.build_client(host, api_key)
+        vdb_core = AsyncElasticSearchCore(host, api_key, client=client)
+        results = await vdb_core.hybrid_search(["kb"], "query", embedding_model)
+    """
+
+    def __init__(
+        self,
+        host: Optional[str],
+        api_key: Optional[str],
+        verify_certs: bool = False,
+        ssl_show_warn: bool = False,
+        client: Optional[AsyncElasticsearch] = None,
+        connections_per_node: int = DEFAULT_CONNECTIONS_PER_NODE,
+        hybrid_fusion: str = DEFAULT_HYBRID_FUSION,
+        knn_num_candidates: int = DEFAULT_KNN_NUM_CANDIDATES,
+        query_embedding_cache: Optional[QueryEmbeddingCache] = None,
+        index_stats_cache: Optional[IndexStatsCache] = None,
+        embedding_coalescer: Optional[EmbeddingRequestCoalescer] = None,
+    ):
+        """
+        Initialize AsyncElasticSearchCore.
+
+        Args:
+            host: Elasticsearch host URL
+            api_key: Elasticsearch API key
+            verify_certs: Whether to verify SSL certificates
+            ssl_show_warn: Whether to show SSL warnings
+            client: Shared AsyncElasticsearch client; when omitted the core builds and owns its own client
+            connections_per_node: Connection pool size per node of a client built by this core
+            hybrid_fusion: Default rank fusion for hybrid search, "weighted" or "rrf"
+            knn_num_candidates: Default kNN candidates per shard for hybrid search
+            query_embedding_cache: Optional TTL'd LRU of query embeddings used by semantic and hybrid search
+            index_stats_cache: Optional short-TTL cache for get_indices_detail, invalidated by writes to an index
+            embedding_coalescer: Optional coalescer batching concurrent query embeddings into shared API calls
+        """
+        self.host = host
+        self.api_key = api_key
+        self._owns_client = client is None
+        self.client = client or self.build_client(
+            host, api_key, verify_certs=verify_certs, ssl_show_warn=ssl_show_warn,
+            connections_per_node=connections_per_node)
+
+        self.hybrid_fusion = hybrid_fusion
+        self.knn_num_candidates = knn_num_candidates
+        self.query_embedding_cache = query_embedding_cache
+        self.index_stats_cache = index_stats_cache
+        self.embedding_coalescer = embedding_coalescer
+
+    @staticmethod
+    def build_client(
+        host: Optional[str],
+        api_key: Optional[str],
+        verify_certs: bool = False,
+        ssl_show_warn: bool = False,
+        connections_per_node: int = DEFAULT_CONNECTIONS_PER_NODE,
+    ) -> AsyncElasticsearch:
+        """Build an AsyncElasticsearch client with the same retry policy as ElasticSearchCore"""
+        return AsyncElasticsearch(
+            host,
+            api_key=api_key,
+            verify_certs=verify_certs,
+            ssl_show_warn=ssl_show_warn,
+            request_timeout=20,
+            max_retries=3,
+            retry_on_timeout=True,
+            retry_on_status=[502, 503, 504],
+            connections_per_node=connections_per_node,
+        )
+
+    async def close(self) -> None:
+        # A shared client outlives the cores using it
+        if self._owns_client:
+            await self.client.close()
+
+    # ---- INDEX MANAGEMENT ----
+
+    async def delete_index(self, index_name: str) -> bool:
+        self._invalidate_index_stats(index_name)
+        try:
+            try:
+                indices = await self.client.indices.get_alias(index=f"{index_name}*")
+                targets = list(ElasticSearchCore._filter_knowledge_base_indices(index_name, indices)) or [index_name]
+            except Exception as e:
+                logger.warning(f"Failed to resolve the indices of {index_name}: {e}")
+                targets = [index_name]
+            await self.client.indices.delete(index=",".join(targets))
+            logger.info(f"Successfully deleted the index: {index_name}")
+            await self._delete_document_catalog(index_name)
+            return True
+        except exceptions.NotFoundError:
+            logger.info(f"Index {index_name} not found")
+            return False
+        except Exception as e:
+            logger.error(f"Error deleting index: {str(e)}")
+            return False
+
+    async def get_user_indices(self, index_pattern: str = "*") -> List[str]:
+        try:
+            indices = await self.client.indices.get_alias(index=index_pattern)
+            return ElasticSearchCore._user_index_names(indices)
+        except Exception as e:
+            logger.error(f"Error getting user indices: {str(e)}")
+            return []
+
+    async def check_index_exists(self, index_name: str) -> bool:
+        return bool(await self.client.indices.exists(index=index_name))
+
+    # ---- DOCUMENT OPERATIONS ----
+
+    async def delete_documents(self, index_name: str, path_or_url: str) -> int:
+        try:
+            result = await self.client.delete_by_query(
+                index=index_name, body={
+                    "query": {"term": {"path_or_url": path_or_url}}}
+            )
+            self._invalidate_index_stats(index_name)
+            await self._delete_document_summary(index_name, path_or_url)
+            logger.info(
+                f"Successfully deleted {result['deleted']} documents with path_or_url: {path_or_url} from index: {index_name}"
+            )
+            return result["deleted"]
+        except Exception as e:
+            logger.error(f"Error deleting documents: {str(e)}")
+            return 0
+
+    async def count_documents(self, index_name: str) -> int:
+        try:
+            count_response = await self.client.count(index=index_name)
+            return count_response["count"]
+        except Exception as e:
+            logger.error(f"Error counting documents: {str(e)}")
+            return 0
+
+    async def get_index_chunks(
+        self,
+        index_name: str,
+        page: Optional[int] = None,
+        page_size: Optional[int] = None,
+        path_or_url: Optional[str] = None,
+        cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        chunks: List[Dict[str, Any]] = []
+        total = 0
+        next_cursor: Optional[str] = None
+        paginate = page_size is not None and (page is not None or cursor is not None)
+        result_page = page if paginate else None
+        result_page_size = page_size if paginate else None
+        position = decode_cursor(cursor)
+
+        try:
+            count_response = await self.client.count(
+                index=index_name,
+                body={"query": ElasticSearchCore._build_chunk_query(path_or_url)},
+            )
+            total = count_response.get("count", 0)
+
+            if total == 0:
+                return {
+                    "chunks": [],
+                    "total": 0,
+                    "page": result_page,
+                    "page_size": result_page_size,
+                    "next_cursor": None,
+                }
+
+            if paginate:
+                body, search_kwargs = ElasticSearchCore._build_chunk_page_search(
+                    path_or_url, page, page_size, position)
+                response = await self.client.search(
+                    index=index_name, body=body, **search_kwargs)
+                chunks, next_cursor = ElasticSearchCore._parse_chunk_page(
+                    response, search_kwargs["size"], position)
+            else:
+                chunks = [chunk async for chunk in self.iter_index_chunks(
+                    index_name, path_or_url=path_or_url, cursor=cursor)]
+
+        except exceptions.NotFoundError:
+            logger.info(f"Index {index_name} not found when fetching chunks")
+            chunks = []
+            total = 0
+        except Exception as e:
+            logger.error(f"Error fetching chunks for index {index_name}: {e}")
+            raise
+
+        return {
+            "chunks": chunks,
+            "total": total,
+            "page": result_page,
+            "page_size": result_page_size,
+            "next_cursor": next_cursor,
+        }
+
+    async def iter_index_chunks(
+        self,
+        index_name: str,
+        path_or_url: Optional[str] = None,
+        batch_size: int = DEFAULT_CHUNK_BATCH_SIZE,
+        cursor: Optional[str] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        query = ElasticSearchCore._build_chunk_query(path_or_url, decode_cursor(cursor))
+        pit_id = (await self.client.open_point_in_time(
+            index=index_name, keep_alive=PIT_KEEP_ALIVE))["id"]
+        search_after: Optional[List[Any]] = None
+        try:
+            while True:
+                response = await self.client.search(
+                    body=ElasticSearchCore._build_chunk_stream_body(query, pit_id, search_after), size=batch_size)
+                # The PIT id may change between requests, always continue with the latest one
+                pit_id = response.get("pit_id", pit_id)
+
+                hits = response.get("hits", {}).get("hits", [])
+                for hit in hits:
+                    yield ElasticSearchCore._hit_to_chunk(hit)
+                if len(hits) < batch_size:
+                    break
+                search_after = hits[-1]["sort"]
+        finally:
+            try:
+                await self.client.close_point_in_time(body={"id": pit_id})
+            except Exception as cleanup_error:
+                logger.warning(
+                    f"Failed to close point in time for index {index_name}: {cleanup_error}")
+
+    async def create_chunk(self, index_name: str, chunk: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            payload = chunk.copy()
+            response = await self.client.index(
+                index=index_name,
+                id=payload.get("id"),
+                document=payload,
+                refresh="wait_for",
+            )
+            self._invalidate_index_stats(index_name)
+            await self._sync_document_summaries(index_name, [payload.get("path_or_url")])
+            logger.info(
+                "Created chunk %s in index %s", response.get("_id"), index_name
+            )
+            return {
+                "id": response.get("_id"),
+                "result": response.get("result"),
+                "version": response.get("_version"),
+            }
+        except Exception as exc:
+            logger.error(
+                "Error creating chunk in index %s: %s", index_name, exc, exc_info=True
+            )
+            raise
+
+    async def update_chunk(self, index_name: str, chunk_id: str, chunk_updates: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            document_id = await self._resolve_chunk_document_id(index_name, chunk_id)
+            response = await self.client.update(
+                index=index_name,
+                id=document_id,
+                body={"doc": chunk_updates},
+                refresh="wait_for",
+                retry_on_conflict=3,
+            )
+            self._invalidate_index_stats(index_name)
+            logger.info(
+                "Updated chunk %s in index %s", document_id, index_name
+            )
+            return {
+                "id": response.get("_id"),
+                "result": response.get("result"),
+                "version": response.get("_version"),
+            }
+        except Exception as exc:
+            logger.error(
+                "Error updating chunk %s in index %s: %s",
+                chunk_id,
+                index_name,
+                exc,
+                exc_info=True,
+            )
+            raise
+
+    async def delete_chunk(self, index_name: str, chunk_id: str) -> bool:
+        try:
+            document_id = await self._resolve_chunk_document_id(index_name, chunk_id)
+            path_or_url = await self._get_chunk_path_or_url(index_name, document_id)
+            response = await self.client.delete(
+                index=index_name,
+                id=document_id,
+                refresh="wait_for",
+            )
+            self._invalidate_index_stats(index_name)
+            await self._sync_document_summaries(index_name, [path_or_url])
+            logger.info(
+                "Deleted chunk %s in index %s", document_id, index_name
+            )
+            return response.get("result") == "deleted"
+        except exceptions.NotFoundError:
+            logger.warning(
+                "Chunk %s not found in index %s", chunk_id, index_name
+            )
+            return False
+        except Exception as exc:
+            logger.error(
+                "Error deleting chunk %s in index %s: %s",
+                chunk_id,
+                index_name,
+                exc,
+                exc_info=True,
+            )
+            raise
+
+    async def search(self, index_name: str, query: Dict[str, Any]) -> Dict[str, Any]:
+        return await self.client.search(index=index_name, body=query)
+
+    async def multi_search(self, body: List[Dict[str, Any]], index_name: str) -> Dict[str, Any]:
+        return await self.client.msearch(body=body, index=index_name)
+
+    # ---- SEARCH OPERATIONS ----
+
+    async def accurate_search(self, index_names: List[str], query_text: str, top_k: int = 5) -> List[Dict[str, Any]]:
+        response = await self.client.search(
+            index=",".join(index_names), body=ElasticSearchCore._build_accurate_query(query_text, top_k))
+        return ElasticSearchCore._parse_hits(response)
+
+    async def semantic_search(
+        self, index_names: List[str], query_text: str, embedding_model: BaseEmbedding, top_k: int = 5
+    ) -> List[Dict[str, Any]]:
+        query_embedding = await self._get_query_embedding(embedding_model, query_text)
+        response = await self.client.search(
+            index=",".join(index_names),
+            body=ElasticSearchCore._build_semantic_query(query_embedding, top_k, num_candidates=top_k * 2),
+        )
+        return ElasticSearchCore._parse_hits(response)
+
+    async def hybrid_search(
+        self,
+        index_names: List[str],
+        query_text: str,
+        embedding_model: BaseEmbedding,
+        top_k: int = 5,
+        weight_accurate: float = 0.3,
+        fusion: Optional[str] = None,
+        num_candidates: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        fusion = ElasticSearchCore._check_fusion(fusion or self.hybrid_fusion)
+        num_candidates = num_candidates or self.knn_num_candidates
+
+        query_embedding = await self._get_query_embedding(embedding_model, query_text)
+        body = ElasticSearchCore._build_hybrid_body(query_text, query_embedding, top_k, num_candidates)
+        response = await self.client.msearch(index=",".join(index_names), body=body)
+        return ElasticSearchCore._fuse_hybrid_response(response, fusion, weight_accurate, top_k)
+
+    async def _get_query_embedding(self, embedding_model: BaseEmbedding, query_text: str) -> List[float]:
+        """Embed a search query on the event loop, only on a cache miss and through the coalescer when configured"""
+        key = None
+        if self.query_embedding_cache is not None:
+            key = self.query_embedding_cache.make_key(embedding_model, query_text)
+            vector = self.query_embedding_cache.get(key)
+            if vector is not None:
+                return vector
+        vector = await aembed_query(embedding_model, query_text, self.embedding_coalescer)
+        if key is not None:
+            self.query_embedding_cache.put(key, vector)
+        return vector
+
+    # ---- DOCUMENT CATALOG ----
+
+    async def _ensure_document_catalog(self) -> None:
+        if await self.client.indices.exists(index=DOCUMENT_CATALOG_INDEX):
+            return
+        try:
+            await self.client.indices.create(
+                index=DOCUMENT_CATALOG_INDEX, settings=DOCUMENT_CATALOG_SETTINGS, mappings=DOCUMENT_CATALOG_MAPPINGS)
+        except exceptions.RequestError as e:
+            if "resource_already_exists_exception" not in str(e):
+                raise
+
+    async def _iter_document_summaries(
+        self, index_name: str, query: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        after_key = None
+        while True:
+            response = await self.client.search(
+                index=index_name, body=ElasticSearchCore._build_document_summary_body(query, after_key))
+            summaries, after_key = ElasticSearchCore._parse_document_summaries(index_name, response)
+            for summary in summaries:
+                yield summary
+            if after_key is None:
+                break
+
+    async def _write_document_summaries(self, index_name: str, summaries: Iterable[Dict[str, Any]],
+                                        stale_paths: Iterable[str] = ()) -> None:
+        operations = ElasticSearchCore._build_summary_operations(index_name, summaries, stale_paths)
+        if operations:
+            response = await self.client.bulk(operations=operations, refresh="wait_for")
+            if response.get("errors"):
+                raise RuntimeError(f"Failed to write catalog records of index {index_name}")
+
+    async def _sync_document_summaries(self, index_name: str, path_or_urls: Iterable[Optional[str]]) -> None:
+        paths = sorted({path for path in path_or_urls if path})
+        if not paths:
+            return
+        try:
+            await self._ensure_document_catalog()
+            for i in range(0, len(paths), DOCUMENT_CATALOG_BATCH_SIZE):
+                batch = paths[i: i + DOCUMENT_CATALOG_BATCH_SIZE]
+                summaries = [summary async for summary in self._iter_document_summaries(
+                    index_name, {"terms": {"path_or_url": batch}})]
+                found = {summary["path_or_url"] for summary in summaries}
+                await self._write_document_summaries(
+                    index_name, summaries, [path for path in batch if path not in found])
+        except Exception as e:
+            logger.warning(f"Failed to update document catalog for index {index_name}, it will be rebuilt: {e}")
+            await self._invalidate_document_catalog(index_name)
+
+    async def _invalidate_document_catalog(self, index_name: str) -> None:
+        await self._delete_document_summary(index_name, "")
+
+    async def _delete_document_summary(self, index_name: str, path_or_url: str) -> None:
+        try:
+            await self.client.delete(
+                index=DOCUMENT_CATALOG_INDEX,
+                id=ElasticSearchCore._document_summary_id(index_name, path_or_url),
+                refresh="wait_for",
+            )
+        except exceptions.NotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Failed to delete catalog record of {path_or_url} in index {index_name}: {e}")
+
+    async def _delete_document_catalog(self, index_name: str, updated_before: Optional[int] = None) -> None:
+        try:
+            await self.client.delete_by_query(
+                index=DOCUMENT_CATALOG_INDEX,
+                body=ElasticSearchCore._build_catalog_delete_query(index_name, updated_before),
+                ignore_unavailable=True,
+                refresh=True,
+            )
+        except Exception as e:
+            logger.warning(f"Failed to delete document catalog of index {index_name}: {e}")
+
+    async def _get_chunk_path_or_url(self, index_name: str, document_id: str) -> Optional[str]:
+        try:
+            response = await self.client.get(index=index_name, id=document_id, _source_includes=["path_or_url"])
+            return response.get("_source", {}).get("path_or_url")
+        except Exception:
+            return None
+
+    async def rebuild_document_catalog(self, index_name: str) -> int:
+        """Async counterpart of ElasticSearchCore.rebuild_document_catalog"""
+        await self._ensure_document_catalog()
+        started_at = int(time.time() * 1000)
+        total = 0
+        batch: List[Dict[str, Any]] = []
+        async for summary in self._iter_document_summaries(index_name):
+            batch.append(summary)
+            if len(batch) >= DOCUMENT_CATALOG_BATCH_SIZE:
+                await self._write_document_summaries(index_name, batch)
+                total += len(batch)
+                batch = []
+        await self._write_document_summaries(index_name, batch)
+        total += len(batch)
+        await self._delete_document_catalog(index_name, updated_before=started_at)
+        await self.client.index(
+            index=DOCUMENT_CATALOG_INDEX,
+            id=ElasticSearchCore._document_summary_id(index_name, ""),
+            document=ElasticSearchCore._catalog_marker(index_name),
+            refresh="wait_for",
+        )
+        logger.info(f"Rebuilt document catalog of index {index_name}: {total} documents")
+        return total
+
+    async def _ensure_document_catalog_built(self, index_name: str) -> None:
+        if await self.client.exists(index=DOCUMENT_CATALOG_INDEX,
+                                    id=ElasticSearchCore._document_summary_id(index_name, "")):
+            return
+        await self.rebuild_document_catalog(index_name)
+
+    # ---- STATISTICS AND MONITORING ----
+
+    async def list_documents(
+        self,
+        index_name: str,
+        page_size: int = DEFAULT_DOCUMENT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+        sort_by: str = "create_time",
+        sort_order: str = "desc",
+        path_or_urls: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        position = ElasticSearchCore._decode_document_cursor(cursor, sort_by, sort_order)
+        if position is None:
+            await self._ensure_document_catalog_built(index_name)
+
+        response = await self.client.search(
+            index=DOCUMENT_CATALOG_INDEX,
+            body=ElasticSearchCore._build_list_documents_body(index_name, sort_by, sort_order, position, path_or_urls),
+            size=max(page_size, 1),
+        )
+        return ElasticSearchCore._parse_list_documents(response, max(page_size, 1), sort_by, sort_order)
+
+    async def get_documents_detail(self, index_name: str) -> List[Dict[str, Any]]:
+        try:
+            file_list = []
+            cursor = None
+            while True:
+                page = await self.list_documents(
+                    index_name, page_size=DOCUMENT_CATALOG_BATCH_SIZE, cursor=cursor)
+                file_list.extend(page["documents"])
+                cursor = page["next_cursor"]
+                if not cursor:
+                    return file_list
+        except Exception as e:
+            logger.error(f"Error getting file list: {str(e)}")
+            return []
+
+    async def get_indices_detail(
+        self, index_names: List[str], embedding_dim: Optional[int] = None
+    ) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        all_stats = {}
+        if self.index_stats_cache is not None:
+            all_stats.update(self.index_stats_cache.get_many(index_names))
+        pending = [name for name in index_names if name not in all_stats]
+        if not pending:
+            return all_stats
+
+        try:
+            index_pattern = ",".join(pending)
+            msearch_body = []
+            for index_name in pending:
+                msearch_body.extend([{"index": index_name}, {"size": 0, "aggs": INDEX_STATS_AGGS}])
+            # The three calls are independent, issue them concurrently
+            stats, settings, agg_responses = await asyncio.gather(
+                self.client.indices.stats(index=index_pattern, ignore_unavailable=True),
+                self.client.indices.get_settings(index=index_pattern, ignore_unavailable=True),
+                self.client.msearch(body=msearch_body),
+            )
+            agg_responses = agg_responses["responses"]
+            # Rebuilt knowledge bases are aliases, their stats come back under the generation index name
+            aliased = [name for name in pending if name not in stats.get("indices", {})]
+            if aliased:
+                stats, settings = ElasticSearchCore._rekey_alias_stats(
+                    stats, settings,
+                    await self.client.indices.get_alias(index=",".join(aliased), ignore_unavailable=True), aliased)
+        except Exception as e:
+            logger.error(
+                f"Error getting stats for indices {pending}: {str(e)}")
+            for index_name in pending:
+                all_stats[index_name] = {"error": str(e)}
+            return all_stats
+
+        for index_name, agg_result in zip(pending, agg_responses):
+            all_stats[index_name] = ElasticSearchCore._format_index_stats(
+                index_name, stats, settings, agg_result, embedding_dim)
+            if self.index_stats_cache is not None and "error" not in all_stats[index_name]:
+                self.index_stats_cache.put(index_name, all_stats[index_name])
+
+        return all_stats
+
+    def _invalidate_index_stats(self, index_name: str) -> None:
+        if self.index_stats_cache is not None:
+            self.index_stats_cache.invalidate(index_name)
+
+    async def _resolve_chunk_document_id(self, index_name: str, chunk_id: str) -> str:
+        try:
+            await self.client.get(index=index_name, id=chunk_id, _source=False)
+            return chunk_id
+        except exceptions.NotFoundError:
+            pass
+
+        # Search by stored chunk id field
+        response = await self.client.search(
+            index=index_name,
+            body={
+                "size": 1,
+                "query": {"term": {"id": {"value": chunk_id}}},
+                "_source": False,
+            },
+        )
+        hits = response.get("hits", {}).get("hits", [])
+        if hits:
+            return hits[0].get("_id")
+
+        raise exceptions.NotFoundError(
+            404,
+            {"error": {"reason": f"Chunk {chunk_id} not found in index {index_name}"}},
+            chunk_id,
+        )
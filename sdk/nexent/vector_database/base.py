@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional
 
 from ..core.models.embedding_model import BaseEmbedding
 
@@ -17,13 +17,16 @@ class VectorDatabaseCore(ABC):
     # ---- INDEX MANAGEMENT ----
 
     @abstractmethod
-    def create_index(self, index_name: str, embedding_dim: Optional[int] = None) -> bool:
+    def create_index(
+        self, index_name: str, embedding_dim: Optional[int] = None, index_profile: Optional[str] = None
+    ) -> bool:
         """
         Create a new vector search index with appropriate mappings.
 
         Args:
             index_name: Name of the index to create
             embedding_dim: Dimension of the embedding vectors (optional, will use model's dim if not provided)
+            index_profile: Vector storage profile, e.g. "float" or a quantized profile (optional, backend default)
 
         Returns:
             bool: True if creation was successful
@@ -69,6 +72,49 @@ class VectorDatabaseCore(ABC):
         """
         pass
 
+    @abstractmethod
+    def rebuild_index(
+        self,
+        index_name: str,
+        embedding_model: BaseEmbedding,
+        embedding_dim: Optional[int] = None,
+        index_profile: Optional[str] = None,
+        batch_size: int = 1000,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Re-embed all chunks of an index with another embedding model while the index stays searchable.
+
+        The chunks are copied into a shadow index and swapped in once complete. Progress is checkpointed,
+        so calling this again with the same model after a failure resumes the copy.
+
+        Args:
+            index_name: Name of the index to rebuild
+            embedding_model: The new embedding model
+            embedding_dim: Dimension of the new embeddings, defaults to the model's dimension
+            index_profile: Vector index profile of the rebuilt index
+            batch_size: Number of chunks copied per checkpoint
+            progress_callback: Called with (copied, total) after every batch
+
+        Returns:
+            Dict with the rebuilt "index" and the number of chunks "copied" and "deleted" to catch up with
+            writes made during the copy
+        """
+        pass
+
+    @abstractmethod
+    def get_rebuild_status(self, index_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the checkpoint of the latest rebuild of an index.
+
+        Args:
+            index_name: Name of the index
+
+        Returns:
+            Dict with state, embedding_model, copied, total and error, or None if the index was never rebuilt
+        """
+        pass
+
     # ---- DOCUMENT OPERATIONS ----
 
     @abstractmethod
@@ -109,6 +155,35 @@ class VectorDatabaseCore(ABC):
         """
         pass
 
+    @abstractmethod
+    def reindex_document(
+        self,
+        index_name: str,
+        embedding_model: BaseEmbedding,
+        path_or_url: str,
+        documents: List[Dict[str, Any]],
+        batch_size: int = 64,
+        content_field: str = "content",
+    ) -> Dict[str, int]:
+        """
+        Replace the indexed chunks of one document with a new version, embedding only the chunks that changed.
+
+        The previous version is whatever is stored under path_or_url, so only a source indexed again under the
+        same path_or_url is matched; anything else is indexed as a new document.
+
+        Args:
+            index_name: Name of the index holding the document
+            embedding_model: Model used to generate embeddings for new chunks
+            path_or_url: The URL or path of the document
+            documents: All chunks of the new document version
+            batch_size: Number of documents to process at once
+            content_field: Field to use for generating embeddings
+
+        Returns:
+            Dict with the "indexed", "deleted" and "unchanged" chunk counts
+        """
+        pass
+
     @abstractmethod
     def get_index_chunks(
         self,
@@ -116,6 +191,7 @@ class VectorDatabaseCore(ABC):
         page: Optional[int] = None,
         page_size: Optional[int] = None,
         path_or_url: Optional[str] = None,
+        cursor: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Retrieve chunk records for the specified index with optional pagination.
@@ -123,11 +199,34 @@ class VectorDatabaseCore(ABC):
         Args:
             index_name: Name of the index to query
             page: Page number to return (1-based). If None, all chunks are returned.
-            page_size: Page size for pagination. Must be provided together with page.
+            page_size: Page size for pagination. Must be provided together with page or cursor.
             path_or_url: Optional filter for a specific document path or URL.
+            cursor: Opaque token from a previous page's next_cursor, seeks directly to the next page.
 
         Returns:
-            Dict containing chunks, total count, and pagination metadata
+            Dict containing chunks, total count, pagination metadata and next_cursor
+        """
+        pass
+
+    @abstractmethod
+    def iter_index_chunks(
+        self,
+        index_name: str,
+        path_or_url: Optional[str] = None,
+        batch_size: int = 1000,
+        cursor: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream all chunk records of an index in a stable order with bounded memory.
+
+        Args:
+            index_name: Name of the index to read
+            path_or_url: Optional filter for a specific document path or URL.
+            batch_size: Number of chunks fetched per round trip
+            cursor: Optional token to resume after a previously returned chunk
+
+        Yields:
+            Chunk dictionaries
         """
         pass
 
@@ -291,6 +390,36 @@ class VectorDatabaseCore(ABC):
                 - filename: Optional display name
                 - file_size: Size in bytes
                 - create_time: ISO timestamp string
+                - chunk_count: Number of chunks of the file
+        """
+        pass
+
+    @abstractmethod
+    def list_documents(
+        self,
+        index_name: str,
+        page_size: int = 100,
+        cursor: Optional[str] = None,
+        sort_by: str = "create_time",
+        sort_order: str = "desc",
+        path_or_urls: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Page through the source files of an index.
+
+        Args:
+            index_name: Name of the index to query
+            page_size: Number of files per page
+            cursor: next_cursor returned by the previous page
+            sort_by: One of create_time, file_size, chunk_count, filename, path_or_url
+            sort_order: "asc" or "desc"
+            path_or_urls: Optional restriction to these files
+
+        Returns:
+            Dictionary containing:
+                - documents: Entries shaped like those of get_documents_detail
+                - total: Number of files matching
+                - next_cursor: Token for the next page, None on the last page
         """
         pass
 
@@ -1,17 +1,27 @@
+import hashlib
 import logging
+import queue
+import re
 import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from elasticsearch import Elasticsearch, exceptions
 
+from ..core.models.embedding_batcher import is_overload_error, plan_batches
+from ..core.models.embedding_cache import EmbeddingCache
+from ..core.models.embedding_coalescer import EmbeddingRequestCoalescer, embed_query
 from ..core.models.embedding_model import BaseEmbedding
 from ..core.nlp.tokenizer import calculate_term_weights
 from .base import VectorDatabaseCore
-from .utils import build_weighted_query, format_size
+from .index_stats_cache import IndexStatsCache
+from .query_embedding_cache import QueryEmbeddingCache
+from .utils import build_weighted_query, content_hash, decode_cursor, diff_chunks, encode_cursor, format_size
 
 
 logger = logging.getLogger("elasticsearch_core")
@@ -27,8 +37,118 @@ class BulkOperation:
     expected_duration: timedelta
 
 
-SCROLL_TTL = "2m"
-DEFAULT_SCROLL_SIZE = 1000
+class IndexWriteBlockedError(RuntimeError):
+    """Bulk writes were rejected by a write block on the index, e.g. while a rebuild swaps it; retry them later"""
+
+
+@dataclass
+class IngestionStats:
+    """Per-stage counters for the pipelined embed-and-bulk ingestion"""
+
+    total_docs: int
+    embedded_docs: int = 0
+    embedding_failed_docs: int = 0
+    embedding_seconds: float = 0.0
+    indexed_docs: int = 0
+    bulk_failed_docs: int = 0
+    write_blocked_docs: int = 0
+    bulk_seconds: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record_embedding(self, doc_count: int, elapsed: float, success: bool) -> None:
+        with self._lock:
+            if success:
+                self.embedded_docs += doc_count
+            else:
+                self.embedding_failed_docs += doc_count
+            self.embedding_seconds += elapsed
+
+    def record_bulk(self, doc_count: int, elapsed: float, success: bool, write_blocked: int = 0) -> None:
+        """write_blocked: how many of the failed docs were rejected by a write block"""
+        with self._lock:
+            if success:
+                self.indexed_docs += doc_count
+            else:
+                self.bulk_failed_docs += doc_count
+                self.write_blocked_docs += write_blocked
+            self.bulk_seconds += elapsed
+
+    def throughput(self) -> Dict[str, float]:
+        """Docs per second of busy time for each stage"""
+        with self._lock:
+            embedding_rate = self.embedded_docs / self.embedding_seconds if self.embedding_seconds > 0 else 0.0
+            bulk_rate = self.indexed_docs / self.bulk_seconds if self.bulk_seconds > 0 else 0.0
+        return {"embedding_docs_per_s": embedding_rate, "bulk_docs_per_s": bulk_rate}
+
+
+# Chunk streaming: point-in-time keep alive and batch size, chunks are read in stable "id" order.
+# Chunk ids are not unique, so PIT reads break ties on _shard_doc; cursor pages skip the tied _ids already read.
+PIT_KEEP_ALIVE = "2m"
+DEFAULT_CHUNK_BATCH_SIZE = 1000
+CHUNK_SORT = [{"id": {"order": "asc", "missing": "_last"}}]
+CHUNK_STREAM_SORT = CHUNK_SORT + [{"_shard_doc": {"order": "asc"}}]
+# Pipelined ingestion defaults, embedding sub-batches are capped by item count and estimated tokens
+EMBEDDING_SUB_BATCH_SIZE = 64
+EMBEDDING_SUB_BATCH_TOKENS = 8192
+DEFAULT_EMBEDDING_CONCURRENCY = 4
+DEFAULT_BULK_QUEUE_SIZE = 4
+# Hybrid search defaults
+HYBRID_FUSION_WEIGHTED = "weighted"
+HYBRID_FUSION_RRF = "rrf"
+DEFAULT_HYBRID_FUSION = HYBRID_FUSION_WEIGHTED
+DEFAULT_KNN_NUM_CANDIDATES = 100
+MAX_KNN_NUM_CANDIDATES = 10000
+RRF_RANK_CONSTANT = 60
+# Vector index profiles: profile name -> dense_vector index_options type
+VECTOR_INDEX_PROFILES = {
+    "float": "hnsw",
+    "int8": "int8_hnsw",
+    "bbq": "bbq_hnsw",
+}
+DEFAULT_VECTOR_INDEX_PROFILE = "float"
+DEFAULT_HNSW_M = 16
+DEFAULT_HNSW_EF_CONSTRUCTION = 100
+# Better binary quantization is only supported for vectors with at least 64 dimensions
+BBQ_MIN_DIMS = 64
+# Document catalog: one summary record per (index, path_or_url), kept in a shared hidden index
+# A knowledge base keeps its name as an alias over generation indices "<name>__gen<N>" once it has been rebuilt
+INDEX_GENERATION_SEPARATOR = "__gen"
+INDEX_GENERATION_PATTERN = re.compile(re.escape(INDEX_GENERATION_SEPARATOR) + r"(\d+)$")
+
+# File-level fields refreshed on unchanged chunks when a new document version is re-indexed. create_time is
+# left out: it defaults to the indexing time, so it would differ on every run.
+DOCUMENT_VERSION_FIELDS = ("filename", "file_size")
+# Chunk fields a rebuild compares to find chunks updated in place, under the same _id, since they were copied
+REBUILD_COMPARED_FIELDS = ("title", "path_or_url") + DOCUMENT_VERSION_FIELDS
+# Error type of bulk items rejected by an index block, e.g. the write block a rebuild sets before its swap
+BULK_BLOCK_ERROR_TYPE = "cluster_block_exception"
+
+DOCUMENT_CATALOG_INDEX = "nexent_document_catalog"
+DOCUMENT_CATALOG_BATCH_SIZE = 500
+DEFAULT_DOCUMENT_PAGE_SIZE = 100
+DOCUMENT_SORT_FIELDS = ("create_time", "file_size", "chunk_count", "filename", "path_or_url")
+CATALOG_RECORD_DOCUMENT = "document"
+CATALOG_RECORD_MARKER = "catalog_marker"
+DOCUMENT_CATALOG_SETTINGS = {"number_of_shards": 1, "number_of_replicas": 0, "index": {"hidden": True}}
+DOCUMENT_CATALOG_MAPPINGS = {
+    "dynamic": False,
+    "properties": {
+        "record_type": {"type": "keyword"},
+        "index_name": {"type": "keyword"},
+        "path_or_url": {"type": "keyword"},
+        "filename": {"type": "keyword"},
+        "file_size": {"type": "long"},
+        "create_time": {"type": "date"},
+        "chunk_count": {"type": "integer"},
+        "update_time": {"type": "long"},
+    },
+}
+# Per-index aggregations of get_indices_detail
+INDEX_STATS_AGGS = {
+    "unique_path_or_url_count": {"cardinality": {"field": "path_or_url"}},
+    "process_sources": {"terms": {"field": "process_source", "size": 10}},
+    "embedding_models": {"terms": {"field": "embedding_model_name", "size": 10}},
+}
 
 
 class ElasticSearchCore(VectorDatabaseCore):
@@ -49,6 +169,17 @@ class ElasticSearchCore(VectorDatabaseCore):
         api_key: Optional[str],
         verify_certs: bool = False,
         ssl_show_warn: bool = False,
+        embedding_concurrency: int = DEFAULT_EMBEDDING_CONCURRENCY,
+        bulk_queue_size: int = DEFAULT_BULK_QUEUE_SIZE,
+        embedding_cache: Optional[EmbeddingCache] = None,
+        hybrid_fusion: str = DEFAULT_HYBRID_FUSION,
+        knn_num_candidates: int = DEFAULT_KNN_NUM_CANDIDATES,
+        query_embedding_cache: Optional[QueryEmbeddingCache] = None,
+        hnsw_m: int = DEFAULT_HNSW_M,
+        hnsw_ef_construction: int = DEFAULT_HNSW_EF_CONSTRUCTION,
+        exclude_vector_source: bool = False,
+        index_stats_cache: Optional[IndexStatsCache] = None,
+        embedding_coalescer: Optional[EmbeddingRequestCoalescer] = None,
     ):
         """
         Initialize ElasticSearchCore with Elasticsearch client and JinaEmbedding model.
@@ -58,6 +189,18 @@ class ElasticSearchCore(VectorDatabaseCore):
             api_key: Elasticsearch API key (defaults to env variable)
             verify_certs: Whether to verify SSL certificates
             ssl_show_warn: Whether to show SSL warnings
+            embedding_concurrency: Max in-flight embedding requests during large batch insertion
+            bulk_queue_size: Max embedded ES batches waiting for the bulk writer before embedding pauses
+            embedding_cache: Optional content-hash cache; when set, only cache misses are sent to the embedding API
+            hybrid_fusion: Default rank fusion for hybrid search, "weighted" or "rrf"
+            knn_num_candidates: Default kNN candidates per shard for hybrid search, independent of top_k
+            query_embedding_cache: Optional TTL'd LRU of query embeddings used by semantic and hybrid search
+            hnsw_m: HNSW graph connections per node for newly created indices
+            hnsw_ef_construction: HNSW candidate list size while building the graph for newly created indices
+            exclude_vector_source: Drop the embedding from _source in newly created indices to save disk.
+                                   Partial chunk updates on such indices lose the vector, so re-embed on edit.
+            index_stats_cache: Optional short-TTL cache for get_indices_detail, invalidated by writes to an index
+            embedding_coalescer: Optional coalescer batching concurrent query embeddings into shared API calls
         """
         # Get credentials from environment if not provided
         self.host = host
@@ -86,22 +229,50 @@ class ElasticSearchCore(VectorDatabaseCore):
         self.max_total_tokens = 100000
         self.max_retries = 3  # Number of retries for failed embedding batches
 
+        # Pipelined ingestion limits
+        self.embedding_concurrency = max(1, embedding_concurrency)
+        self.bulk_queue_size = max(1, bulk_queue_size)
+        self.embedding_cache = embedding_cache
+
+        # Hybrid search defaults
+        self.hybrid_fusion = hybrid_fusion
+        self.knn_num_candidates = knn_num_candidates
+        self.query_embedding_cache = query_embedding_cache
+        self.embedding_coalescer = embedding_coalescer
+
+        # Vector index build parameters
+        self.hnsw_m = hnsw_m
+        self.hnsw_ef_construction = hnsw_ef_construction
+        self.exclude_vector_source = exclude_vector_source
+
+        self.index_stats_cache = index_stats_cache
+
     # ---- INDEX MANAGEMENT ----
 
-    def create_index(self, index_name: str, embedding_dim: Optional[int] = None) -> bool:
+    def create_index(
+        self, index_name: str, embedding_dim: Optional[int] = None, index_profile: Optional[str] = None
+    ) -> bool:
         """
         Create a new vector search index with appropriate mappings in a celery-friendly way.
 
         Args:
             index_name: Name of the index to create
             embedding_dim: Dimension of the embedding vectors (optional, will use model's dim if not provided)
+            index_profile: Vector storage profile: "float", "int8" (int8-quantized) or "bbq" (binary-quantized),
+                           defaults to "float"
 
         Returns:
             bool: True if creation was successful
+
+        Raises:
+            ValueError: If the profile is unknown or not supported for the embedding dimension
         """
+        # Use provided embedding_dim or get from model
+        actual_embedding_dim = embedding_dim or 1024
+        embedding_mapping = self._build_embedding_mapping(
+            actual_embedding_dim, index_profile or DEFAULT_VECTOR_INDEX_PROFILE)
+
         try:
-            # Use provided embedding_dim or get from model
-            actual_embedding_dim = embedding_dim or 1024
 
             # Use balanced fixed settings to avoid dynamic adjustment
             settings = {
@@ -135,18 +306,16 @@ class ElasticSearchCore(VectorDatabaseCore):
                     "author": {"type": "keyword"},
                     "date": {"type": "date"},
                     "content": {"type": "text"},
+                    "content_hash": {"type": "keyword"},
                     "process_source": {"type": "keyword"},
                     "embedding_model_name": {"type": "keyword"},
                     "file_size": {"type": "long"},
                     "create_time": {"type": "date"},
-                    "embedding": {
-                        "type": "dense_vector",
-                        "dims": actual_embedding_dim,
-                        "index": "true",
-                        "similarity": "cosine",
-                    },
+                    "embedding": embedding_mapping,
                 }
             }
+            if self.exclude_vector_source:
+                mappings["_source"] = {"excludes": ["embedding"]}
 
             # Create the index with the defined mappings
             self.client.indices.create(
@@ -173,6 +342,28 @@ class ElasticSearchCore(VectorDatabaseCore):
             logger.error(f"Error creating index: {str(e)}")
             return False
 
+    def _build_embedding_mapping(self, embedding_dim: int, index_profile: str) -> Dict[str, Any]:
+        """Build the dense_vector mapping for a vector index profile"""
+        index_type = VECTOR_INDEX_PROFILES.get(index_profile)
+        if index_type is None:
+            raise ValueError(
+                f"Unsupported vector index profile: {index_profile}, only support: {', '.join(VECTOR_INDEX_PROFILES)}")
+        if index_profile == "bbq" and embedding_dim < BBQ_MIN_DIMS:
+            raise ValueError(
+                f"Vector index profile bbq requires at least {BBQ_MIN_DIMS} dimensions, got {embedding_dim}")
+
+        return {
+            "type": "dense_vector",
+            "dims": embedding_dim,
+            "index": "true",
+            "similarity": "cosine",
+            "index_options": {
+                "type": index_type,
+                "m": self.hnsw_m,
+                "ef_construction": self.hnsw_ef_construction,
+            },
+        }
+
     def _force_refresh_with_retry(self, index_name: str, max_retries: int = 3) -> bool:
         """
         Force refresh with retry - synchronous version
@@ -288,9 +479,17 @@ class ElasticSearchCore(VectorDatabaseCore):
         Returns:
             bool: True if deletion was successful
         """
+        self._invalidate_index_stats(index_name)
         try:
-            self.client.indices.delete(index=index_name)
+            try:
+                # The generations behind a rebuilt knowledge base's alias, and any rebuild still in progress
+                targets = list(self._knowledge_base_indices(index_name)) or [index_name]
+            except Exception as e:
+                logger.warning(f"Failed to resolve the indices of {index_name}: {e}")
+                targets = [index_name]
+            self.client.indices.delete(index=",".join(targets))
             logger.info(f"Successfully deleted the index: {index_name}")
+            self._delete_document_catalog(index_name)
             return True
         except exceptions.NotFoundError:
             logger.info(f"Index {index_name} not found")
@@ -311,12 +510,29 @@ class ElasticSearchCore(VectorDatabaseCore):
         """
         try:
             indices = self.client.indices.get_alias(index=index_pattern)
-            # Filter out system indices (starting with '.')
-            return [index_name for index_name in indices.keys() if not index_name.startswith(".")]
+            return self._user_index_names(indices)
         except Exception as e:
             logger.error(f"Error getting user indices: {str(e)}")
             return []
 
+    @staticmethod
+    def _user_index_names(indices: Dict[str, Any]) -> List[str]:
+        """
+        Knowledge base names from a get_alias response: a generation index is listed under its knowledge base
+        alias, a generation still being built is hidden, system indices and the document catalog are skipped.
+        """
+        names: List[str] = []
+        for index_name, info in indices.items():
+            aliases = [alias for alias in ((info or {}).get("aliases") or {})
+                       if index_name.startswith(alias + INDEX_GENERATION_SEPARATOR)]
+            if aliases:
+                names.extend(alias for alias in aliases if alias not in names)
+            elif INDEX_GENERATION_PATTERN.search(index_name):
+                continue
+            elif not index_name.startswith(".") and index_name != DOCUMENT_CATALOG_INDEX:
+                names.append(index_name)
+        return names
+
     def check_index_exists(self, index_name: str) -> bool:
         """
         Check if an index exists.
@@ -329,6 +545,258 @@ class ElasticSearchCore(VectorDatabaseCore):
         """
         return self.client.indices.exists(index=index_name)
 
+    # ---- EMBEDDING MODEL REBUILD ----
+
+    @staticmethod
+    def _index_generation(index_name: str, physical_name: str) -> int:
+        """Generation number of a physical index of a knowledge base, 0 for the original index"""
+        if physical_name.startswith(index_name + INDEX_GENERATION_SEPARATOR):
+            match = INDEX_GENERATION_PATTERN.search(physical_name)
+            if match and match.start() == len(index_name):
+                return int(match.group(1))
+        return 0
+
+    @staticmethod
+    def _filter_knowledge_base_indices(index_name: str, indices: Dict[str, Any]) -> Dict[str, List[str]]:
+        return {
+            physical_name: list(((info or {}).get("aliases") or {}).keys())
+            for physical_name, info in indices.items()
+            if physical_name == index_name or ElasticSearchCore._index_generation(index_name, physical_name)
+        }
+
+    def _knowledge_base_indices(self, index_name: str) -> Dict[str, List[str]]:
+        """Physical indices of a knowledge base with their aliases: the original index and all its generations"""
+        try:
+            indices = self.client.indices.get_alias(index=f"{index_name}*")
+        except exceptions.NotFoundError:
+            return {}
+        return self._filter_knowledge_base_indices(index_name, indices)
+
+    @staticmethod
+    def _current_index(index_name: str, indices: Dict[str, List[str]]) -> Optional[str]:
+        """The physical index a knowledge base name resolves to: its alias target, or the index of that name"""
+        for physical_name, aliases in indices.items():
+            if index_name in aliases:
+                return physical_name
+        return index_name if index_name in indices else None
+
+    def resolve_index(self, index_name: str) -> str:
+        """
+        Resolve a knowledge base name to the physical index currently serving it.
+
+        Args:
+            index_name: Knowledge base name, either an index or an alias over a generation index
+
+        Returns:
+            str: Name of the physical index
+
+        Raises:
+            ValueError: If no index serves the knowledge base
+        """
+        physical_name = self._current_index(index_name, self._knowledge_base_indices(index_name))
+        if physical_name is None:
+            raise ValueError(f"Index {index_name} not found")
+        return physical_name
+
+    @staticmethod
+    def _alias_targets(indices: Dict[str, Any], names: Iterable[str]) -> Dict[str, str]:
+        """Map each of names that is an alias in a get_alias response to the physical index behind it"""
+        wanted = set(names)
+        return {alias: physical_name
+                for physical_name, info in indices.items()
+                for alias in ((info or {}).get("aliases") or {})
+                if alias in wanted}
+
+    @staticmethod
+    def _embedding_model_name(embedding_model: BaseEmbedding) -> str:
+        model_name = getattr(embedding_model, "model", None)
+        if not isinstance(model_name, str) or not model_name:
+            model_name = getattr(embedding_model, "embedding_model_name", "unknown")
+        return model_name
+
+    def _read_rebuild_checkpoint(self, physical_name: str) -> Optional[Dict[str, Any]]:
+        mapping = self.client.indices.get_mapping(index=physical_name).get(physical_name, {})
+        return (mapping.get("mappings", {}).get("_meta") or {}).get("rebuild")
+
+    def _write_rebuild_checkpoint(self, physical_name: str, checkpoint: Dict[str, Any]) -> None:
+        checkpoint["updated"] = int(time.time() * 1000)
+        self.client.indices.put_mapping(index=physical_name, meta={"rebuild": checkpoint})
+
+    def get_rebuild_status(self, index_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Progress of the latest embedding model rebuild of a knowledge base.
+
+        Args:
+            index_name: Knowledge base name
+
+        Returns:
+            The checkpoint of the newest generation (index, state, source, embedding_model, copied, total,
+            cursor, updated and error), or None if the knowledge base was never rebuilt
+        """
+        generations = sorted((name for name in self._knowledge_base_indices(index_name)
+                              if self._index_generation(index_name, name)),
+                             key=lambda name: self._index_generation(index_name, name))
+        if not generations:
+            return None
+        checkpoint = self._read_rebuild_checkpoint(generations[-1])
+        return {**checkpoint, "index": generations[-1]} if checkpoint is not None else None
+
+    def rebuild_index(
+        self,
+        index_name: str,
+        embedding_model: BaseEmbedding,
+        embedding_dim: Optional[int] = None,
+        index_profile: Optional[str] = None,
+        batch_size: int = DEFAULT_CHUNK_BATCH_SIZE,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Re-embed a knowledge base with another embedding model without taking it offline.
+
+        The stored chunks are copied in "id" order into a shadow generation index "<name>__gen<N>" and
+        re-embedded on the way through the bounded embedding pipeline of large batch inserts; nothing is
+        partitioned again. The position is checkpointed in the shadow index's mapping metadata after every
+        batch, so a failed or interrupted rebuild started again with the same model resumes where it stopped.
+        A reconcile pass copies chunks added and drops chunks deleted during the copy. The old index is then
+        write blocked and reconciled once more, so writes landing before the swap are not lost with it, and a
+        single alias update points the knowledge base name at the shadow index and removes the old one.
+        Searches keep hitting the old index until that swap. Writes landing in the short blocked window raise
+        IndexWriteBlockedError, so callers retry them against the new index once the alias moved.
+
+        Args:
+            index_name: Knowledge base name
+            embedding_model: The new embedding model
+            embedding_dim: Dimension of the new embeddings, defaults to the model's dimension
+            index_profile: Vector index profile of the shadow index
+            batch_size: Number of chunks copied per checkpoint
+            progress_callback: Called with (copied, total) after every batch
+
+        Returns:
+            Dict with the new physical "index" and the number of chunks "copied" and "deleted" by the final pass
+
+        Raises:
+            ValueError: If the knowledge base does not exist
+        """
+        indices = self._knowledge_base_indices(index_name)
+        source = self._current_index(index_name, indices)
+        if source is None:
+            raise ValueError(f"Index {index_name} not found")
+        model_name = self._embedding_model_name(embedding_model)
+
+        shadow: Optional[str] = None
+        checkpoint: Dict[str, Any] = {}
+        for physical_name in indices:
+            if physical_name == source or not self._index_generation(index_name, physical_name):
+                continue
+            previous = self._read_rebuild_checkpoint(physical_name)
+            if shadow is None and previous and previous.get("source") == source \
+                    and previous.get("embedding_model") == model_name:
+                shadow, checkpoint = physical_name, previous
+                logger.info(f"Resuming rebuild of {index_name} into {shadow} after {previous.get('copied', 0)} chunks")
+            else:
+                logger.info(f"Dropping stale rebuild index {physical_name} of {index_name}")
+                self.client.indices.delete(index=physical_name)
+        if shadow is None:
+            generation = max((self._index_generation(index_name, name) for name in indices), default=0) + 1
+            shadow = f"{index_name}{INDEX_GENERATION_SEPARATOR}{generation}"
+            if not self.create_index(shadow, embedding_dim or getattr(embedding_model, "embedding_dim", None),
+                                     index_profile):
+                raise RuntimeError(f"Failed to create rebuild index {shadow}")
+            checkpoint = {"source": source, "embedding_model": model_name, "cursor": None, "copied": 0}
+
+        checkpoint.update(state="copying", total=self.count_documents(source), error=None)
+        write_blocked = False
+        try:
+            self._write_rebuild_checkpoint(shadow, checkpoint)
+            with self.bulk_operation_context(shadow, max(60, checkpoint["total"] // 100)):
+                while True:
+                    position = decode_cursor(checkpoint["cursor"])
+                    body, search_kwargs = self._build_chunk_page_search(None, None, batch_size, position)
+                    response = self.client.search(index=source, body=body, **search_kwargs)
+                    hits = response.get("hits", {}).get("hits", [])
+                    if hits:
+                        self._copy_chunks(shadow, hits, embedding_model, model_name)
+                        checkpoint["copied"] += len(hits)
+                        checkpoint["cursor"] = encode_cursor(self._next_chunk_position(hits, position))
+                        self._write_rebuild_checkpoint(shadow, checkpoint)
+                        if progress_callback is not None:
+                            progress_callback(checkpoint["copied"], checkpoint["total"])
+                    if len(hits) < search_kwargs["size"]:
+                        break
+
+                checkpoint["state"] = "reconciling"
+                self._write_rebuild_checkpoint(shadow, checkpoint)
+                copied, deleted = self._reconcile_rebuild(source, shadow, embedding_model, model_name)
+                # The swap deletes the old index: block its writes and catch up with the last ones first
+                self.client.indices.add_block(index=source, block="write")
+                write_blocked = True
+                late_copied, late_deleted = self._reconcile_rebuild(source, shadow, embedding_model, model_name)
+                copied, deleted = copied + late_copied, deleted + late_deleted
+
+            self.client.indices.update_aliases(actions=[
+                {"add": {"index": shadow, "alias": index_name}},
+                {"remove_index": {"index": source}},
+            ])
+        except Exception as e:
+            if write_blocked:
+                try:
+                    self.client.indices.put_settings(index=source, settings={"index.blocks.write": False})
+                except Exception as unblock_error:
+                    logger.error(f"Failed to lift the write block of {source} after a failed rebuild: {unblock_error}")
+            checkpoint.update(state="failed", error=str(e))
+            try:
+                self._write_rebuild_checkpoint(shadow, checkpoint)
+            except Exception as checkpoint_error:
+                logger.warning(f"Failed to record the failed rebuild of {index_name}: {checkpoint_error}")
+            raise
+        finally:
+            self._invalidate_index_stats(index_name)
+
+        checkpoint["state"] = "completed"
+        self._write_rebuild_checkpoint(shadow, checkpoint)
+        logger.info(f"Rebuilt {index_name} with {model_name}: {source} replaced by {shadow}")
+        return {"index": shadow, "copied": copied, "deleted": deleted}
+
+    def _copy_chunks(
+        self, shadow: str, hits: List[Dict[str, Any]], embedding_model: BaseEmbedding, model_name: str
+    ) -> None:
+        """Re-embed the chunks of source hits into the shadow index under their _id, so a retried batch overwrites itself"""
+        documents = [{**{key: value for key, value in hit.get("_source", {}).items() if key != "embedding"},
+                      "_id": hit["_id"], "embedding_model_name": model_name} for hit in hits]
+        indexed = self._large_batch_insert(
+            shadow, documents, EMBEDDING_SUB_BATCH_SIZE, "content", embedding_model, keep_ids=True)
+        if indexed < len(documents):
+            raise RuntimeError(f"Only {indexed} of {len(documents)} chunks were re-embedded into {shadow}")
+
+    def _reconcile_rebuild(
+        self, source: str, shadow: str, embedding_model: BaseEmbedding, model_name: str
+    ) -> Tuple[int, int]:
+        """
+        Bring the shadow index in line with the writes the source received during the copy, matched by _id.
+        Chunks added or updated in place since they were copied are copied again, deleted ones are dropped.
+        """
+        # Point in time readers only see refreshed writes
+        self.client.indices.refresh(index=[source, shadow])
+        extra = {hit["_id"]: self._rebuild_signature(hit) for hit in self._iter_chunk_hits(shadow)}
+        missing: List[Dict[str, Any]] = []
+        for hit in self._iter_chunk_hits(source):
+            if extra.pop(hit["_id"], None) != self._rebuild_signature(hit):
+                missing.append(hit)
+        extra_ids = set(extra)
+        if missing:
+            self._copy_chunks(shadow, missing, embedding_model, model_name)
+        if extra_ids:
+            self.client.delete_by_query(
+                index=shadow, body={"query": {"ids": {"values": list(extra_ids)}}}, refresh=True, conflicts="proceed")
+        return len(missing), len(extra_ids)
+
+    @staticmethod
+    def _rebuild_signature(hit: Dict[str, Any]) -> Tuple[Any, ...]:
+        """Content hash and compared fields of a chunk hit; copying fills empty fields with defaults"""
+        source = hit.get("_source", {})
+        return (source.get("content_hash") or content_hash(source.get("content")),
+                *(source.get(name) or None for name in REBUILD_COMPARED_FIELDS))
+
     # ---- DOCUMENT OPERATIONS ----
 
     def vectorize_documents(
@@ -351,6 +819,9 @@ class ElasticSearchCore(VectorDatabaseCore):
 
         Returns:
             int: Number of documents successfully indexed
+
+        Raises:
+            IndexWriteBlockedError: If chunks were rejected by a write block, e.g. of a rebuild about to swap the index
         """
         logger.info(f"Indexing {len(documents)} chunks to {index_name}")
 
@@ -360,14 +831,21 @@ class ElasticSearchCore(VectorDatabaseCore):
 
         # Smart strategy selection
         total_docs = len(documents)
-        if total_docs < 64:
-            # Small data: direct insertion, using wait_for refresh
-            return self._small_batch_insert(index_name, documents, content_field, embedding_model)
-        else:
-            # Large data: using context manager
-            estimated_duration = max(60, total_docs // 100)
-            with self.bulk_operation_context(index_name, estimated_duration):
-                return self._large_batch_insert(index_name, documents, batch_size, content_field, embedding_model)
+        try:
+            if total_docs < 64:
+                # Small data: direct insertion, using wait_for refresh
+                indexed = self._small_batch_insert(index_name, documents, content_field, embedding_model)
+            else:
+                # Large data: using context manager
+                estimated_duration = max(60, total_docs // 100)
+                with self.bulk_operation_context(index_name, estimated_duration):
+                    indexed = self._large_batch_insert(index_name, documents, batch_size, content_field, embedding_model)
+            if indexed:
+                self._sync_document_summaries(
+                    index_name, [doc.get("path_or_url") for doc in documents])
+            return indexed
+        finally:
+            self._invalidate_index_stats(index_name)
 
     def _small_batch_insert(
         self, index_name: str, documents: List[Dict[str, Any]], content_field: str, embedding_model: BaseEmbedding
@@ -380,7 +858,7 @@ class ElasticSearchCore(VectorDatabaseCore):
 
             # Get embeddings
             inputs = [doc[content_field] for doc in processed_docs]
-            embeddings = embedding_model.get_embeddings(inputs)
+            embeddings = self._get_document_embeddings(embedding_model, inputs)
 
             # Prepare bulk operations
             operations = []
@@ -396,12 +874,15 @@ class ElasticSearchCore(VectorDatabaseCore):
                 index=index_name, operations=operations, refresh="wait_for")
 
             # Handle errors
-            self._handle_bulk_errors(response)
+            errors = self._handle_bulk_errors(response)
+            self._raise_if_write_blocked(index_name, self._count_write_blocked(errors))
 
             logger.info(
-                f"Small batch insert completed: {len(documents)} chunks indexed.")
-            return len(documents)
+                f"Small batch insert completed: {len(documents) - len(errors)} chunks indexed.")
+            return len(documents) - len(errors)
 
+        except IndexWriteBlockedError:
+            raise
         except Exception as e:
             logger.error(f"Small batch insert failed: {e}")
             return 0
@@ -413,113 +894,226 @@ class ElasticSearchCore(VectorDatabaseCore):
         batch_size: int,
         content_field: str,
         embedding_model: BaseEmbedding,
+        keep_ids: bool = False,
     ) -> int:
         """
-        Large batch insertion with sub-batching for embedding API.
-        Splits large document batches into smaller chunks to respect embedding API limits before bulk inserting into Elasticsearch.
+        Large batch insertion as a two-stage pipeline.
+        A bounded pool of embedding workers embeds sub-batches while a separate bulk writer thread
+        indexes finished ES batches. The two stages are connected by a bounded queue, so embedding
+        pauses when Elasticsearch falls behind. ES batches are handed to the writer in order so that
+        progress is reported in order.
         """
         try:
             processed_docs = self._preprocess_documents(
                 documents, content_field)
-            total_indexed = 0
             total_docs = len(processed_docs)
             es_total_batches = (total_docs + batch_size - 1) // batch_size
+            stats = IngestionStats(total_docs=total_docs)
             start_time = time.time()
 
             logger.info(
-                f"=== [INDEXING START] Total chunks: {total_docs}, ES batch size: {batch_size}, Total ES batches: {es_total_batches} ==="
+                f"=== [INDEXING START] Total chunks: {total_docs}, ES batch size: {batch_size}, Total ES batches: {es_total_batches}, "
+                f"embedding concurrency: {self.embedding_concurrency}, bulk queue size: {self.bulk_queue_size} ==="
             )
 
-            for i in range(0, total_docs, batch_size):
-                es_batch = processed_docs[i: i + batch_size]
-                es_batch_num = i // batch_size + 1
-                es_batch_start_time = time.time()
-
-                # Store documents and their embeddings for this Elasticsearch batch
-                doc_embedding_pairs = []
-
-                # Sub-batch for embedding API
-                embedding_batch_size = 64
-                for j in range(0, len(es_batch), embedding_batch_size):
-                    embedding_sub_batch = es_batch[j: j + embedding_batch_size]
-                    # Retry logic for embedding API call (3 retries, 1s delay)
-                    # Note: embedding_model.get_embeddings() already has built-in retries with exponential backoff
-                    # This outer retry handles additional failures
-                    max_retries = 3
-                    retry_delay = 1.0
-                    success = False
-
-                    for retry_attempt in range(max_retries):
-                        try:
-                            inputs = [doc[content_field]
-                                      for doc in embedding_sub_batch]
-                            embeddings = embedding_model.get_embeddings(inputs)
-
-                            for doc, embedding in zip(embedding_sub_batch, embeddings):
-                                doc_embedding_pairs.append((doc, embedding))
-
-                            success = True
-                            break  # Success, exit retry loop
-
-                        except Exception as e:
-                            if retry_attempt < max_retries - 1:
-                                logger.warning(
-                                    f"Embedding API error (attempt {retry_attempt + 1}/{max_retries}): {e}, ES batch num: {es_batch_num}, sub-batch start: {j}, size: {len(embedding_sub_batch)}. Retrying in {retry_delay}s..."
-                                )
-                                time.sleep(retry_delay)
-                            else:
-                                logger.error(
-                                    f"Embedding API error after {max_retries} attempts: {e}, ES batch num: {es_batch_num}, sub-batch start: {j}, size: {len(embedding_sub_batch)}"
-                                )
-
-                    if not success:
-                        # Skip this sub-batch after all retries failed
-                        continue
+            bulk_queue: "queue.Queue[Optional[tuple]]" = queue.Queue(
+                maxsize=self.bulk_queue_size)
+            writer = threading.Thread(
+                target=self._bulk_writer,
+                args=(index_name, bulk_queue, es_total_batches,
+                      embedding_model, stats, keep_ids),
+                name=f"es-bulk-writer-{index_name}",
+                daemon=True,
+            )
+            writer.start()
+
+            try:
+                with ThreadPoolExecutor(max_workers=self.embedding_concurrency,
+                                        thread_name_prefix="es-embedding") as executor:
+                    # ES batches whose embedding sub-batches are submitted but not yet handed to the writer
+                    pending: deque = deque()
+                    for i in range(0, total_docs, batch_size):
+                        es_batch = processed_docs[i: i + batch_size]
+                        es_batch_num = i // batch_size + 1
+                        sub_batches = plan_batches(
+                            [doc[content_field] for doc in es_batch], EMBEDDING_SUB_BATCH_TOKENS, EMBEDDING_SUB_BATCH_SIZE)
+                        futures = [
+                            executor.submit(
+                                self._embed_sub_batch,
+                                es_batch[start:end],
+                                content_field,
+                                embedding_model,
+                                es_batch_num,
+                                start,
+                                stats,
+                            )
+                            for start, end in sub_batches
+                        ]
+                        pending.append((es_batch_num, time.time(), futures))
+
+                        # Bound the number of in-flight embedding requests
+                        while sum(len(item[2]) for item in pending) > self.embedding_concurrency:
+                            self._hand_off_oldest_batch(pending, bulk_queue)
+
+                    while pending:
+                        self._hand_off_oldest_batch(pending, bulk_queue)
+            finally:
+                # Sentinel tells the writer no more batches are coming
+                bulk_queue.put(None)
+                writer.join()
+
+            self._force_refresh_with_retry(index_name)
+            total_elapsed = time.time() - start_time
+            throughput = stats.throughput()
+            logger.info(
+                f"=== [INDEXING COMPLETE] Successfully indexed {stats.indexed_docs}/{total_docs} chunks in {total_elapsed:.2f}s "
+                f"(avg: {total_elapsed / max(es_total_batches, 1):.2f}s/batch). "
+                f"Embedding: {stats.embedded_docs} docs, {throughput['embedding_docs_per_s']:.1f} docs/s, "
+                f"{stats.embedding_failed_docs} failed. "
+                f"Bulk: {stats.indexed_docs} docs, {throughput['bulk_docs_per_s']:.1f} docs/s, "
+                f"{stats.bulk_failed_docs} failed ==="
+            )
+            self._raise_if_write_blocked(index_name, stats.write_blocked_docs)
+            return stats.indexed_docs
+        except IndexWriteBlockedError:
+            raise
+        except Exception as e:
+            logger.error(f"Large batch insert failed: {e}")
+            return 0
 
-                # Perform a single bulk insert for the entire Elasticsearch batch
-                if not doc_embedding_pairs:
+    def _get_document_embeddings(self, embedding_model: BaseEmbedding, inputs: List[str]) -> List[List[float]]:
+        """Embed document texts, going through the embedding cache when one is configured"""
+        if self.embedding_cache is not None:
+            return self.embedding_cache.get_embeddings(embedding_model, inputs)
+        return embedding_model.get_embeddings(inputs)
+
+    def _embed_sub_batch(
+        self,
+        embedding_sub_batch: List[Dict[str, Any]],
+        content_field: str,
+        embedding_model: BaseEmbedding,
+        es_batch_num: int,
+        sub_batch_start: int,
+        stats: IngestionStats,
+    ) -> List[tuple]:
+        """
+        Embed one sub-batch inside the embedding worker pool.
+        A sub-batch rejected as overloaded (HTTP 429, 503 or timeout) is split in half instead of being resent whole.
+        Returns (doc, embedding) pairs, or an empty list when all retries failed so the sub-batch is skipped.
+        """
+        # Retry logic for embedding API call (3 retries, 1s delay)
+        # Note: embedding_model.get_embeddings() already has built-in retries with exponential backoff
+        # This outer retry handles additional failures
+        max_retries = 3
+        retry_delay = 1.0
+        start_time = time.time()
+
+        for retry_attempt in range(max_retries):
+            try:
+                inputs = [doc[content_field] for doc in embedding_sub_batch]
+                embeddings = self._get_document_embeddings(
+                    embedding_model, inputs)
+                stats.record_embedding(
+                    len(embedding_sub_batch), time.time() - start_time, success=True)
+                return list(zip(embedding_sub_batch, embeddings))
+            except Exception as e:
+                if is_overload_error(e) and len(embedding_sub_batch) > 1:
+                    middle = len(embedding_sub_batch) // 2
                     logger.warning(
-                        f"No documents with embeddings to index for ES batch {es_batch_num}")
-                    continue
+                        f"Embedding API overloaded: {e}, ES batch num: {es_batch_num}, sub-batch start: {sub_batch_start}, "
+                        f"splitting {len(embedding_sub_batch)} documents in half"
+                    )
+                    return (
+                        self._embed_sub_batch(embedding_sub_batch[:middle], content_field, embedding_model,
+                                              es_batch_num, sub_batch_start, stats)
+                        + self._embed_sub_batch(embedding_sub_batch[middle:], content_field, embedding_model,
+                                                es_batch_num, sub_batch_start + middle, stats)
+                    )
+                if retry_attempt < max_retries - 1:
+                    logger.warning(
+                        f"Embedding API error (attempt {retry_attempt + 1}/{max_retries}): {e}, ES batch num: {es_batch_num}, sub-batch start: {sub_batch_start}, size: {len(embedding_sub_batch)}. Retrying in {retry_delay}s..."
+                    )
+                    time.sleep(retry_delay)
+                else:
+                    logger.error(
+                        f"Embedding API error after {max_retries} attempts: {e}, ES batch num: {es_batch_num}, sub-batch start: {sub_batch_start}, size: {len(embedding_sub_batch)}"
+                    )
+
+        stats.record_embedding(len(embedding_sub_batch),
+                               time.time() - start_time, success=False)
+        return []
+
+    @staticmethod
+    def _hand_off_oldest_batch(pending: deque, bulk_queue: "queue.Queue[Optional[tuple]]") -> None:
+        """Wait for the oldest ES batch's embeddings and pass them to the bulk writer (blocks when the queue is full)"""
+        es_batch_num, batch_start_time, futures = pending.popleft()
+        doc_embedding_pairs = []
+        for future in futures:
+            doc_embedding_pairs.extend(future.result())
+        bulk_queue.put((es_batch_num, batch_start_time, doc_embedding_pairs))
 
+    def _bulk_writer(
+        self,
+        index_name: str,
+        bulk_queue: "queue.Queue[Optional[tuple]]",
+        es_total_batches: int,
+        embedding_model: BaseEmbedding,
+        stats: IngestionStats,
+        keep_ids: bool = False,
+    ) -> None:
+        """
+        Bulk writer stage: index embedded ES batches in order until the sentinel arrives.
+        With keep_ids each document's "_id" key becomes its document _id, so writing the same chunk again
+        overwrites it.
+
+        A batch that fails for any reason, building its operations included, is recorded as failed and the
+        writer moves on: it must keep draining the queue until the sentinel, or the producer blocks forever on
+        the full queue.
+        """
+        while True:
+            item = bulk_queue.get()
+            if item is None:
+                break
+
+            es_batch_num, es_batch_start_time, doc_embedding_pairs = item
+            # Perform a single bulk insert for the entire Elasticsearch batch
+            if not doc_embedding_pairs:
+                logger.warning(
+                    f"No documents with embeddings to index for ES batch {es_batch_num}")
+                continue
+
+            bulk_start_time = time.time()
+            try:
                 operations = []
                 for doc, embedding in doc_embedding_pairs:
-                    operations.append({"index": {"_index": index_name}})
+                    action = {"_index": index_name, "_id": doc.pop("_id")} if keep_ids else {"_index": index_name}
+                    operations.append({"index": action})
                     doc["embedding"] = embedding
                     if "embedding_model_name" not in doc:
                         doc["embedding_model_name"] = getattr(
                             embedding_model, "embedding_model_name", "unknown")
                     operations.append(doc)
 
-                try:
-                    response = self.client.bulk(
-                        index=index_name, operations=operations, refresh=False)
-                    self._handle_bulk_errors(response)
-                    total_indexed += len(doc_embedding_pairs)
-                    es_batch_elapsed = time.time() - es_batch_start_time
-                    logger.info(
-                        f"[ES BATCH {es_batch_num}/{es_total_batches}] Indexed {len(doc_embedding_pairs)} documents in {es_batch_elapsed:.2f}s. Total progress: {total_indexed}/{total_docs}"
-                    )
-
-                except Exception as e:
-                    logger.error(
-                        f"Bulk insert error: {e}, ES batch num: {es_batch_num}")
-                    continue
-
-                # Add 0.1s delay between batches to avoid overloading embedding API
-                time.sleep(0.1)
-
-            self._force_refresh_with_retry(index_name)
-            total_elapsed = time.time() - start_time
-            logger.info(
-                f"=== [INDEXING COMPLETE] Successfully indexed {total_indexed}/{total_docs} chunks in {total_elapsed:.2f}s (avg: {total_elapsed / es_total_batches:.2f}s/batch) ==="
-            )
-            return total_indexed
-        except Exception as e:
-            logger.error(f"Large batch insert failed: {e}")
-            return 0
+                response = self.client.bulk(
+                    index=index_name, operations=operations, refresh=False)
+                errors = self._handle_bulk_errors(response)
+                bulk_elapsed = time.time() - bulk_start_time
+                stats.record_bulk(len(doc_embedding_pairs) - len(errors), bulk_elapsed, success=True)
+                if errors:
+                    stats.record_bulk(len(errors), 0.0, success=False,
+                                      write_blocked=self._count_write_blocked(errors))
+                es_batch_elapsed = time.time() - es_batch_start_time
+                logger.info(
+                    f"[ES BATCH {es_batch_num}/{es_total_batches}] Indexed {len(doc_embedding_pairs)} documents in {es_batch_elapsed:.2f}s. Total progress: {stats.indexed_docs}/{stats.total_docs}"
+                )
+            except Exception as e:
+                stats.record_bulk(len(doc_embedding_pairs),
+                                  time.time() - bulk_start_time, success=False)
+                logger.error(
+                    f"Bulk insert error: {e}, ES batch num: {es_batch_num}")
 
-    def _preprocess_documents(self, documents: List[Dict[str, Any]], content_field: str) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _preprocess_documents(documents: List[Dict[str, Any]], content_field: str) -> List[Dict[str, Any]]:
         """Ensure all documents have the required fields and set default values"""
         current_time = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime())
         current_date = time.strftime("%Y-%m-%d", time.gmtime())
@@ -545,6 +1139,8 @@ class ElasticSearchCore(VectorDatabaseCore):
             if not doc_copy.get("process_source"):
                 doc_copy["process_source"] = "Unstructured"
 
+            doc_copy["content_hash"] = content_hash(doc_copy.get(content_field))
+
             # Ensure all documents have an ID
             if not doc_copy.get("id"):
                 doc_copy["id"] = f"{int(time.time())}_{hash(doc_copy[content_field])}"[
@@ -554,8 +1150,9 @@ class ElasticSearchCore(VectorDatabaseCore):
 
         return processed_docs
 
-    def _handle_bulk_errors(self, response: Dict[str, Any]) -> None:
-        """Handle bulk operation errors"""
+    def _handle_bulk_errors(self, response: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Log the failed items of a bulk response and return their errors; version conflicts do not count"""
+        errors: List[Dict[str, Any]] = []
         if response.get("errors"):
             for item in response["items"]:
                 if "error" in item.get("index", {}):
@@ -568,11 +1165,22 @@ class ElasticSearchCore(VectorDatabaseCore):
                         # ignore version conflict
                         continue
                     else:
+                        errors.append(error_info)
                         logger.error(
                             f"FATAL ERROR {error_type}: {error_reason}")
                         if error_cause:
                             logger.error(
                                 f"Caused By: {error_cause.get('type')}: {error_cause.get('reason')}")
+        return errors
+
+    @staticmethod
+    def _count_write_blocked(errors: List[Dict[str, Any]]) -> int:
+        return sum(1 for error in errors if error.get("type") == BULK_BLOCK_ERROR_TYPE)
+
+    @staticmethod
+    def _raise_if_write_blocked(index_name: str, blocked: int) -> None:
+        if blocked:
+            raise IndexWriteBlockedError(f"{blocked} chunks were rejected by a write block on {index_name}")
 
     def delete_documents(self, index_name: str, path_or_url: str) -> int:
         """
@@ -590,6 +1198,8 @@ class ElasticSearchCore(VectorDatabaseCore):
                 index=index_name, body={
                     "query": {"term": {"path_or_url": path_or_url}}}
             )
+            self._invalidate_index_stats(index_name)
+            self._delete_document_summary(index_name, path_or_url)
             logger.info(
                 f"Successfully deleted {result['deleted']} documents with path_or_url: {path_or_url} from index: {index_name}"
             )
@@ -598,6 +1208,131 @@ class ElasticSearchCore(VectorDatabaseCore):
             logger.error(f"Error deleting documents: {str(e)}")
             return 0
 
+    def reindex_document(
+        self,
+        index_name: str,
+        embedding_model: BaseEmbedding,
+        path_or_url: str,
+        documents: List[Dict[str, Any]],
+        batch_size: int = 64,
+        content_field: str = "content",
+    ) -> Dict[str, int]:
+        """
+        Replace the indexed chunks of one document with a new version, embedding only the chunks that changed.
+
+        The stored chunks are matched against the new ones by content hash. Added chunks are embedded and
+        indexed first, so the document never disappears from search; removed chunks are deleted only once all
+        additions succeeded, which keeps a failed run safe to retry. Unchanged chunks keep their embeddings and
+        only receive the new file-level metadata. Removed and stale chunks are addressed by their _id, since the
+        stored "id" of a chunk is not unique.
+
+        Updating the metadata in place rewrites chunks from _source, which lacks the embedding when the index
+        excludes it from _source. On such an index a version with new metadata replaces every chunk instead.
+
+        The previous version is the set of chunks stored under the same path_or_url, so this applies when the
+        same source is indexed again: a retried or redelivered processing task, a re-processed object, a URL or
+        a local path. A file uploaded again through file management gets a new object name and is renamed when
+        its name is taken, so it is indexed as a new document next to the old one.
+
+        Args:
+            index_name: Name of the index holding the document
+            embedding_model: Model used to generate embeddings for new chunks
+            path_or_url: The URL or path of the document
+            documents: All chunks of the new document version
+            batch_size: Number of documents to process at once
+            content_field: Field to use for generating embeddings
+
+        Returns:
+            Dict with the "indexed", "deleted" and "unchanged" chunk counts
+
+        Raises:
+            IndexWriteBlockedError: If the index is write blocked, e.g. by a rebuild about to swap it
+        """
+        try:
+            # Chunks carry their _id as "_id" through the diff
+            added, removed, unchanged = diff_chunks(
+                ({**self._hit_to_chunk(hit), "_id": hit["_id"]}
+                 for hit in self._iter_chunk_hits(index_name, path_or_url=path_or_url)),
+                documents, content_field)
+        except exceptions.NotFoundError:
+            added, removed, unchanged = documents, [], []
+        version_fields = self._document_version_fields(documents, content_field)
+        stale = [chunk for chunk in unchanged
+                 if any(chunk.get(name) != value for name, value in version_fields.items())]
+        if stale and self._excludes_vector_source(index_name):
+            logger.info(f"{index_name} keeps no embeddings in _source, replacing every chunk of {path_or_url}")
+            added, removed, unchanged, stale = documents, removed + unchanged, [], []
+        logger.info(
+            f"Re-indexing {path_or_url} in {index_name}: {len(added)} added, {len(removed)} removed, "
+            f"{len(unchanged)} unchanged chunks")
+
+        indexed = self.vectorize_documents(index_name, embedding_model, added, batch_size, content_field)
+        result = {"indexed": indexed, "deleted": 0, "unchanged": len(unchanged)}
+        if indexed < len(added):
+            logger.warning(
+                f"Only {indexed} of {len(added)} new chunks of {path_or_url} were indexed, keeping the previous version")
+            return result
+
+        try:
+            if removed:
+                response = self.client.delete_by_query(
+                    index=index_name,
+                    body={"query": self._build_chunk_ids_query(path_or_url, [chunk["_id"] for chunk in removed])},
+                    refresh=True,
+                    conflicts="proceed",
+                )
+                result["deleted"] = response.get("deleted", 0)
+
+            if stale:
+                self.client.update_by_query(
+                    index=index_name,
+                    body={
+                        "query": self._build_chunk_ids_query(path_or_url, [chunk["_id"] for chunk in stale]),
+                        "script": {
+                            "source": "for (entry in params.fields.entrySet()) "
+                                      "{ ctx._source[entry.getKey()] = entry.getValue(); }",
+                            "params": {"fields": version_fields},
+                        },
+                    },
+                    refresh=True,
+                    conflicts="proceed",
+                )
+            if removed or stale:
+                self._sync_document_summaries(index_name, [path_or_url])
+        except Exception as e:
+            if BULK_BLOCK_ERROR_TYPE in str(e):
+                raise IndexWriteBlockedError(f"Chunks of {path_or_url} were rejected by a write block on {index_name}") from e
+            raise
+        finally:
+            self._invalidate_index_stats(index_name)
+        return result
+
+    def _excludes_vector_source(self, index_name: str) -> bool:
+        """Whether the index, or the generation behind its alias, drops the embedding from _source"""
+        for mapping in self.client.indices.get_mapping(index=index_name).values():
+            if "embedding" in (mapping.get("mappings", {}).get("_source") or {}).get("excludes", []):
+                return True
+        return False
+
+    @classmethod
+    def _document_version_fields(cls, documents: List[Dict[str, Any]], content_field: str) -> Dict[str, Any]:
+        if not documents:
+            return {}
+        first = cls._preprocess_documents(documents[:1], content_field)[0]
+        return {name: first[name] for name in DOCUMENT_VERSION_FIELDS if first.get(name) is not None}
+
+    @staticmethod
+    def _build_chunk_ids_query(path_or_url: str, doc_ids: List[str]) -> Dict[str, Any]:
+        """Chunks of one document by Elasticsearch _id"""
+        return {
+            "bool": {
+                "filter": [
+                    {"term": {"path_or_url": path_or_url}},
+                    {"ids": {"values": doc_ids}},
+                ]
+            }
+        }
+
     def count_documents(self, index_name: str) -> int:
         """
         Count the total number of documents in an index.
@@ -621,34 +1356,36 @@ class ElasticSearchCore(VectorDatabaseCore):
         page: Optional[int] = None,
         page_size: Optional[int] = None,
         path_or_url: Optional[str] = None,
+        cursor: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Retrieve chunk records for the specified index with optional pagination.
 
+        Pages are read in stable "id" order. Passing the next_cursor of the previous page seeks directly to the
+        next page, so deep pages cost the same as the first one; page alone falls back to from/size.
+
         Args:
             index_name: Name of the index to query
             page: Page number (1-based). Provide together with page_size.
-            page_size: Number of records per page. Provide together with page.
+            page_size: Number of records per page. Provide together with page or cursor.
             path_or_url: Optional path_or_url filter.
+            cursor: Opaque token from a previous page's next_cursor.
 
         Returns:
-            Dictionary containing chunks, total count, page, and page_size
+            Dictionary containing chunks, total count, page, page_size and next_cursor
         """
         chunks: List[Dict[str, Any]] = []
         total = 0
-        scroll_id: Optional[str] = None
-        paginate = page is not None and page_size is not None
+        next_cursor: Optional[str] = None
+        paginate = page_size is not None and (page is not None or cursor is not None)
         result_page = page if paginate else None
         result_page_size = page_size if paginate else None
+        position = decode_cursor(cursor)
 
         try:
-            query: Dict[str, Any] = {"match_all": {}}
-            if path_or_url:
-                query = {"term": {"path_or_url": path_or_url}}
-
             count_response = self.client.count(
                 index=index_name,
-                body={"query": query},
+                body={"query": self._build_chunk_query(path_or_url)},
             )
             total = count_response.get("count", 0)
 
@@ -658,60 +1395,19 @@ class ElasticSearchCore(VectorDatabaseCore):
                     "total": 0,
                     "page": result_page,
                     "page_size": result_page_size,
+                    "next_cursor": None,
                 }
 
-            source_filter = {"_source": {"excludes": ["embedding"]}}
-
             if paginate:
-                safe_page = max(page, 1)
-                safe_page_size = max(page_size, 1)
-                from_index = (safe_page - 1) * safe_page_size
+                body, search_kwargs = self._build_chunk_page_search(
+                    path_or_url, page, page_size, position)
                 response = self.client.search(
-                    index=index_name,
-                    body={
-                        "query": query,
-                        **source_filter,
-                    },
-                    from_=from_index,
-                    size=safe_page_size,
-                )
-                hits = response.get("hits", {}).get("hits", [])
-                for hit in hits:
-                    chunk = hit.get("_source", {}).copy()
-                    if "id" not in chunk:
-                        chunk["id"] = hit.get("_id")
-                    chunks.append(chunk)
+                    index=index_name, body=body, **search_kwargs)
+                chunks, next_cursor = self._parse_chunk_page(
+                    response, search_kwargs["size"], position)
             else:
-                response = self.client.search(
-                    index=index_name,
-                    body={
-                        "query": query,
-                        **source_filter,
-                    },
-                    size=DEFAULT_SCROLL_SIZE,
-                    scroll=SCROLL_TTL,
-                )
-                scroll_id = response.get("_scroll_id")
-
-                while True:
-                    hits = response.get("hits", {}).get("hits", [])
-                    if not hits:
-                        break
-
-                    for hit in hits:
-                        chunk = hit.get("_source", {}).copy()
-                        if "id" not in chunk:
-                            chunk["id"] = hit.get("_id")
-                        chunks.append(chunk)
-
-                    if not scroll_id:
-                        break
-
-                    response = self.client.scroll(
-                        scroll_id=scroll_id,
-                        scroll=SCROLL_TTL,
-                    )
-                    scroll_id = response.get("_scroll_id")
+                chunks = list(self.iter_index_chunks(
+                    index_name, path_or_url=path_or_url, cursor=cursor))
 
         except exceptions.NotFoundError:
             logger.info(f"Index {index_name} not found when fetching chunks")
@@ -720,21 +1416,178 @@ class ElasticSearchCore(VectorDatabaseCore):
         except Exception as e:
             logger.error(f"Error fetching chunks for index {index_name}: {e}")
             raise
-        finally:
-            if scroll_id:
-                try:
-                    self.client.clear_scroll(scroll_id=scroll_id)
-                except Exception as cleanup_error:
-                    logger.warning(
-                        f"Failed to clear scroll context for index {index_name}: {cleanup_error}"
-                    )
 
         return {
             "chunks": chunks,
             "total": total,
             "page": result_page,
             "page_size": result_page_size,
+            "next_cursor": next_cursor,
+        }
+
+    def iter_index_chunks(
+        self,
+        index_name: str,
+        path_or_url: Optional[str] = None,
+        batch_size: int = DEFAULT_CHUNK_BATCH_SIZE,
+        cursor: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream every chunk of an index in stable "id" order with point-in-time + search_after.
+
+        Only one batch is held in memory at a time. The PIT gives a consistent snapshot for the whole read
+        and is closed when the generator finishes or is closed early.
+
+        Args:
+            index_name: Name of the index to read
+            path_or_url: Optional path_or_url filter
+            batch_size: Number of chunks fetched per request
+            cursor: Resume after the position encoded in this token (see chunk_cursor)
+
+        Yields:
+            Chunk dictionaries without the embedding field
+        """
+        for hit in self._iter_chunk_hits(index_name, path_or_url, batch_size, cursor):
+            yield self._hit_to_chunk(hit)
+
+    def _iter_chunk_hits(
+        self,
+        index_name: str,
+        path_or_url: Optional[str] = None,
+        batch_size: int = DEFAULT_CHUNK_BATCH_SIZE,
+        cursor: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Raw search hits behind iter_index_chunks, for callers that need the document _id"""
+        query = self._build_chunk_query(path_or_url, decode_cursor(cursor))
+        pit_id = self.client.open_point_in_time(
+            index=index_name, keep_alive=PIT_KEEP_ALIVE)["id"]
+        search_after: Optional[List[Any]] = None
+        try:
+            while True:
+                response = self.client.search(
+                    body=self._build_chunk_stream_body(query, pit_id, search_after), size=batch_size)
+                # The PIT id may change between requests, always continue with the latest one
+                pit_id = response.get("pit_id", pit_id)
+
+                hits = response.get("hits", {}).get("hits", [])
+                yield from hits
+                if len(hits) < batch_size:
+                    break
+                search_after = hits[-1]["sort"]
+        finally:
+            try:
+                self.client.close_point_in_time(body={"id": pit_id})
+            except Exception as cleanup_error:
+                logger.warning(
+                    f"Failed to close point in time for index {index_name}: {cleanup_error}")
+
+    @staticmethod
+    def chunk_cursor(hits: List[Dict[str, Any]], position: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Cursor token that resumes iter_index_chunks / get_index_chunks right after the last of these hits.
+
+        Args:
+            hits: Search hits read so far, in CHUNK_SORT order
+            position: Decoded cursor the hits were read after, so ties spanning several pages add up
+        """
+        return encode_cursor(ElasticSearchCore._next_chunk_position(hits, position))
+
+    @staticmethod
+    def _next_chunk_position(
+        hits: List[Dict[str, Any]], position: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Position right after the last hit: its "id" sort key and the _id of every chunk read with that key.
+
+        The key is the stored "id" the search sorts on, None for chunks without one (they sort last). The
+        _ids settle ties between chunks sharing an id, since ES 8 does not sort on _id.
+        """
+        if not hits:
+            return position
+        after_id = hits[-1].get("_source", {}).get("id")
+        tied = [hit["_id"] for hit in hits if hit.get("_source", {}).get("id") == after_id]
+        if position is not None and "after_doc_ids" in position and position.get("after_id") == after_id:
+            tied = position["after_doc_ids"] + tied
+        return {"after_id": after_id, "after_doc_ids": tied}
+
+    @staticmethod
+    def _build_chunk_page_search(
+        path_or_url: Optional[str], page: Optional[int], page_size: int, position: Optional[Dict[str, Any]]
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Body and search kwargs of one chunk page, seeking after position when a cursor was given"""
+        safe_page_size = max(page_size, 1)
+        search_kwargs: Dict[str, Any] = {"size": safe_page_size}
+        if position is None and page is not None and page > 1:
+            # No cursor: fall back to offset paging for callers that jump straight to a page
+            search_kwargs["from_"] = (page - 1) * safe_page_size
+        body = {
+            "query": ElasticSearchCore._build_chunk_query(path_or_url, position),
+            "sort": CHUNK_SORT,
+            "_source": {"excludes": ["embedding"]},
         }
+        return body, search_kwargs
+
+    @staticmethod
+    def _parse_chunk_page(
+        response: Dict[str, Any], page_size: int, position: Optional[Dict[str, Any]] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Chunks of one page and the cursor of the next page (None when this page is the last)"""
+        hits = response.get("hits", {}).get("hits", [])
+        chunks = [ElasticSearchCore._hit_to_chunk(hit) for hit in hits]
+        next_cursor = ElasticSearchCore.chunk_cursor(hits, position) if len(hits) == page_size else None
+        return chunks, next_cursor
+
+    @staticmethod
+    def _build_chunk_stream_body(
+        query: Dict[str, Any], pit_id: str, search_after: Optional[List[Any]]
+    ) -> Dict[str, Any]:
+        body: Dict[str, Any] = {
+            "query": query,
+            "sort": CHUNK_STREAM_SORT,
+            "pit": {"id": pit_id, "keep_alive": PIT_KEEP_ALIVE},
+            "_source": {"excludes": ["embedding"]},
+        }
+        if search_after is not None:
+            body["search_after"] = search_after
+        return body
+
+    @staticmethod
+    def _build_chunk_query(
+        path_or_url: Optional[str] = None, position: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        filters: List[Dict[str, Any]] = []
+        if path_or_url:
+            filters.append({"term": {"path_or_url": path_or_url}})
+        if position is not None:
+            filters.append(ElasticSearchCore._build_chunk_seek(position))
+        if not filters:
+            return {"match_all": {}}
+        return {"bool": {"filter": filters}}
+
+    @staticmethod
+    def _build_chunk_seek(position: Dict[str, Any]) -> Dict[str, Any]:
+        """Filter matching the chunks that sort after a position from _next_chunk_position"""
+        after_id = position.get("after_id")
+        seen = position.get("after_doc_ids")
+        without_id = {"bool": {"must_not": [{"exists": {"field": "id"}}]}}
+        if after_id is None:
+            # Inside the trailing chunks that have no "id"
+            return {"bool": {"must_not": [{"exists": {"field": "id"}}, {"ids": {"values": seen or []}}]}}
+        if seen is None:
+            # Cursor issued before ties were tracked
+            return {"range": {"id": {"gt": after_id}}}
+        return {"bool": {"should": [
+            {"range": {"id": {"gt": after_id}}},
+            {"bool": {"filter": [{"term": {"id": after_id}}], "must_not": [{"ids": {"values": seen}}]}},
+            without_id,
+        ], "minimum_should_match": 1}}
+
+    @staticmethod
+    def _hit_to_chunk(hit: Dict[str, Any]) -> Dict[str, Any]:
+        chunk = hit.get("_source", {}).copy()
+        if "id" not in chunk:
+            chunk["id"] = hit.get("_id")
+        return chunk
 
     def create_chunk(self, index_name: str, chunk: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -743,12 +1596,16 @@ class ElasticSearchCore(VectorDatabaseCore):
         try:
             payload = chunk.copy()
             document_id = payload.get("id")
+            if "content" in payload:
+                payload["content_hash"] = content_hash(payload["content"])
             response = self.client.index(
                 index=index_name,
                 id=document_id,
                 document=payload,
                 refresh="wait_for",
             )
+            self._invalidate_index_stats(index_name)
+            self._sync_document_summaries(index_name, [payload.get("path_or_url")])
             logger.info(
                 "Created chunk %s in index %s", response.get("_id"), index_name
             )
@@ -769,6 +1626,8 @@ class ElasticSearchCore(VectorDatabaseCore):
         """
         try:
             document_id = self._resolve_chunk_document_id(index_name, chunk_id)
+            if "content" in chunk_updates:
+                chunk_updates = {**chunk_updates, "content_hash": content_hash(chunk_updates["content"])}
             response = self.client.update(
                 index=index_name,
                 id=document_id,
@@ -776,6 +1635,7 @@ class ElasticSearchCore(VectorDatabaseCore):
                 refresh="wait_for",
                 retry_on_conflict=3,
             )
+            self._invalidate_index_stats(index_name)
             logger.info(
                 "Updated chunk %s in index %s", document_id, index_name
             )
@@ -800,11 +1660,14 @@ class ElasticSearchCore(VectorDatabaseCore):
         """
         try:
             document_id = self._resolve_chunk_document_id(index_name, chunk_id)
+            path_or_url = self._get_chunk_path_or_url(index_name, document_id)
             response = self.client.delete(
                 index=index_name,
                 id=document_id,
                 refresh="wait_for",
             )
+            self._invalidate_index_stats(index_name)
+            self._sync_document_summaries(index_name, [path_or_url])
             logger.info(
                 "Deleted chunk %s in index %s", document_id, index_name
             )
@@ -867,20 +1730,19 @@ class ElasticSearchCore(VectorDatabaseCore):
         # Join index names for multi-index search
         index_pattern = ",".join(index_names)
 
-        weights = calculate_term_weights(query_text)
-
         # Prepare the search query using match query for fuzzy matching
-        search_query = build_weighted_query(query_text, weights) | {
-            "size": top_k,
-            "_source": {"excludes": ["embedding"]},
-        }
+        search_query = self._build_accurate_query(query_text, top_k)
 
         # Execute the search across multiple indices
         return self.exec_query(index_pattern, search_query)
 
     def exec_query(self, index_pattern, search_query):
         response = self.client.search(index=index_pattern, body=search_query)
-        # Process and return results
+        return self._parse_hits(response)
+
+    @staticmethod
+    def _parse_hits(response: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Convert an ES search response into score/document/index results"""
         results = []
         for hit in response["hits"]["hits"]:
             results.append(
@@ -911,23 +1773,44 @@ class ElasticSearchCore(VectorDatabaseCore):
         index_pattern = ",".join(index_names)
 
         # Get query embedding
-        query_embedding = embedding_model.get_embeddings(query_text)[0]
+        query_embedding = self._get_query_embedding(embedding_model, query_text)
 
         # Prepare the search query
-        search_query = {
+        search_query = self._build_semantic_query(
+            query_embedding, top_k, num_candidates=top_k * 2)
+
+        # Execute the search across multiple indices
+        return self.exec_query(index_pattern, search_query)
+
+    def _get_query_embedding(self, embedding_model: BaseEmbedding, query_text: str) -> List[float]:
+        """Embed a search query, going through the query embedding cache and coalescer when configured"""
+        if self.query_embedding_cache is not None:
+            return self.query_embedding_cache.get_embedding(embedding_model, query_text, self.embedding_coalescer)
+        return embed_query(embedding_model, query_text, self.embedding_coalescer)
+
+    @staticmethod
+    def _build_accurate_query(query_text: str, size: int) -> Dict[str, Any]:
+        """Weighted BM25 query body shared by accurate and hybrid search"""
+        weights = calculate_term_weights(query_text)
+        return build_weighted_query(query_text, weights) | {
+            "size": size,
+            "_source": {"excludes": ["embedding"]},
+        }
+
+    @staticmethod
+    def _build_semantic_query(query_embedding: List[float], k: int, num_candidates: int) -> Dict[str, Any]:
+        """kNN query body shared by semantic and hybrid search"""
+        return {
             "knn": {
                 "field": "embedding",
                 "query_vector": query_embedding,
-                "k": top_k,
-                "num_candidates": top_k * 2,
+                "k": k,
+                "num_candidates": max(k, min(num_candidates, MAX_KNN_NUM_CANDIDATES)),
             },
-            "size": top_k,
+            "size": k,
             "_source": {"excludes": ["embedding"]},
         }
 
-        # Execute the search across multiple indices
-        return self.exec_query(index_pattern, search_query)
-
     def hybrid_search(
         self,
         index_names: List[str],
@@ -935,9 +1818,13 @@ class ElasticSearchCore(VectorDatabaseCore):
         embedding_model: BaseEmbedding,
         top_k: int = 5,
         weight_accurate: float = 0.3,
+        fusion: Optional[str] = None,
+        num_candidates: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """
         Hybrid search method, combining accurate matching and semantic search results across multiple indices.
+        The BM25 and kNN legs are sent in a single msearch request, executed concurrently by Elasticsearch,
+        and fused client-side.
 
         Args:
             index_names: List of index names to search in
@@ -945,137 +1832,485 @@ class ElasticSearchCore(VectorDatabaseCore):
             embedding_model: The embedding model to use
             top_k: Number of results to return
             weight_accurate: The weight of the accurate matching score (0-1), the semantic search weight is 1-weight_accurate
+            fusion: "weighted" (max-normalized weighted sum) or "rrf" (weighted reciprocal rank fusion),
+                    defaults to the instance setting
+            num_candidates: kNN candidates per shard, defaults to the instance setting
 
         Returns:
             List of search results sorted by combined score
         """
-        # Get results from both searches
-        accurate_results = self.accurate_search(
-            index_names, query_text, top_k=top_k)
-        semantic_results = self.semantic_search(
-            index_names, query_text, embedding_model=embedding_model, top_k=top_k)
+        fusion = self._check_fusion(fusion or self.hybrid_fusion)
+        num_candidates = num_candidates or self.knn_num_candidates
+
+        query_embedding = self._get_query_embedding(embedding_model, query_text)
+        body = self._build_hybrid_body(query_text, query_embedding, top_k, num_candidates)
+        response = self.client.msearch(index=",".join(index_names), body=body)
+        return self._fuse_hybrid_response(response, fusion, weight_accurate, top_k)
+
+    @staticmethod
+    def _check_fusion(fusion: str) -> str:
+        if fusion not in (HYBRID_FUSION_WEIGHTED, HYBRID_FUSION_RRF):
+            raise ValueError(
+                f"Unsupported hybrid fusion: {fusion}, only support: {HYBRID_FUSION_WEIGHTED}, {HYBRID_FUSION_RRF}")
+        return fusion
+
+    @staticmethod
+    def _build_hybrid_body(
+        query_text: str, query_embedding: List[float], top_k: int, num_candidates: int
+    ) -> List[Dict[str, Any]]:
+        """msearch body carrying the BM25 leg and the kNN leg of a hybrid search"""
+        # Fetch a wider window per leg so documents ranked just below top_k in one leg can still be fused in
+        window_size = top_k * 2
+        return [
+            {},
+            ElasticSearchCore._build_accurate_query(query_text, window_size),
+            {},
+            ElasticSearchCore._build_semantic_query(query_embedding, window_size, num_candidates),
+        ]
+
+    @staticmethod
+    def _fuse_hybrid_response(
+        response: Dict[str, Any], fusion: str, weight_accurate: float, top_k: int
+    ) -> List[Dict[str, Any]]:
+        """Fuse the two legs of a hybrid msearch response and return the top k results"""
+        accurate_response, semantic_response = response["responses"]
+        accurate_results = ElasticSearchCore._parse_leg_response(accurate_response, "accurate")
+        semantic_results = ElasticSearchCore._parse_leg_response(semantic_response, "semantic")
+
+        if fusion == HYBRID_FUSION_RRF:
+            results = ElasticSearchCore._fuse_rrf(
+                accurate_results, semantic_results, weight_accurate)
+        else:
+            results = ElasticSearchCore._fuse_weighted(
+                accurate_results, semantic_results, weight_accurate)
 
-        # Create a mapping from document ID to results
-        combined_results = {}
+        # Sort by combined score and return top k results
+        results.sort(key=lambda x: x["score"], reverse=True)
+        return results[:top_k]
 
-        # Process accurate matching results
-        for result in accurate_results:
-            try:
-                doc_id = result["document"]["id"]
-                combined_results[doc_id] = {
+    @staticmethod
+    def _parse_leg_response(leg_response: Dict[str, Any], leg_name: str) -> List[Dict[str, Any]]:
+        """Parse one msearch sub-response; a failed leg is logged and contributes no results"""
+        if "error" in leg_response:
+            logger.warning(
+                f"Hybrid search {leg_name} leg failed: {leg_response['error']}")
+            return []
+        return ElasticSearchCore._parse_hits(leg_response)
+
+    @staticmethod
+    def _collect_by_doc_id(
+        accurate_results: List[Dict[str, Any]], semantic_results: List[Dict[str, Any]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Group both legs by document id, keeping each leg's (rank, score)"""
+        combined_results = {}
+        for leg_name, leg_results in (("accurate", accurate_results), ("semantic", semantic_results)):
+            for rank, result in enumerate(leg_results, start=1):
+                try:
+                    doc_id = result["document"]["id"]
+                except KeyError as e:
+                    logger.warning(
+                        f"Warning: Missing required field in {leg_name} result: {e}")
+                    continue
+                entry = combined_results.setdefault(doc_id, {
                     "document": result["document"],
-                    "accurate_score": result.get("score", 0),
-                    "semantic_score": 0,
                     "index": result["index"],  # Keep track of source index
-                }
-            except KeyError as e:
-                logger.warning(
-                    f"Warning: Missing required field in accurate result: {e}")
-                continue
+                })
+                entry[leg_name] = (rank, result.get("score", 0))
+        return combined_results
 
-        # Process semantic search results
-        for result in semantic_results:
-            try:
-                doc_id = result["document"]["id"]
-                if doc_id in combined_results:
-                    combined_results[doc_id]["semantic_score"] = result.get(
-                        "score", 0)
-                else:
-                    combined_results[doc_id] = {
-                        "document": result["document"],
-                        "accurate_score": 0,
-                        "semantic_score": result.get("score", 0),
-                        "index": result["index"],  # Keep track of source index
-                    }
-            except KeyError as e:
-                logger.warning(
-                    f"Warning: Missing required field in semantic result: {e}")
-                continue
+    @staticmethod
+    def _fuse_weighted(
+        accurate_results: List[Dict[str, Any]], semantic_results: List[Dict[str, Any]], weight_accurate: float
+    ) -> List[Dict[str, Any]]:
+        """Weighted sum of max-normalized leg scores"""
+        combined_results = ElasticSearchCore._collect_by_doc_id(
+            accurate_results, semantic_results)
 
-        # Calculate maximum scores
         max_accurate = max([r.get("score", 0)
                            for r in accurate_results]) if accurate_results else 1
         max_semantic = max([r.get("score", 0)
                            for r in semantic_results]) if semantic_results else 1
 
-        # Calculate combined scores and sort
         results = []
-        for doc_id, result in combined_results.items():
-            try:
-                # Get scores safely
-                accurate_score = result.get("accurate_score", 0)
-                semantic_score = result.get("semantic_score", 0)
-
-                # Normalize scores
-                normalized_accurate = accurate_score / max_accurate if max_accurate > 0 else 0
-                normalized_semantic = semantic_score / max_semantic if max_semantic > 0 else 0
-
-                # Calculate weighted combined score
-                combined_score = weight_accurate * normalized_accurate + \
-                    (1 - weight_accurate) * normalized_semantic
-
-                results.append(
-                    {
-                        "score": combined_score,
-                        "document": result["document"],
-                        # Include source index in results
-                        "index": result["index"],
-                        "scores": {"accurate": normalized_accurate, "semantic": normalized_semantic},
-                    }
-                )
-            except KeyError as e:
-                logger.warning(
-                    f"Warning: Error processing result for doc_id {doc_id}: {e}")
-                continue
+        for result in combined_results.values():
+            accurate_score = result.get("accurate", (0, 0))[1]
+            semantic_score = result.get("semantic", (0, 0))[1]
 
-        # Sort by combined score and return top k results
-        results.sort(key=lambda x: x["score"], reverse=True)
-        return results[:top_k]
+            normalized_accurate = accurate_score / max_accurate if max_accurate > 0 else 0
+            normalized_semantic = semantic_score / max_semantic if max_semantic > 0 else 0
 
-    # ---- STATISTICS AND MONITORING ----
-    def get_documents_detail(self, index_name: str) -> List[Dict[str, Any]]:
-        """
-        Get a list of unique path_or_url values with their file_size and create_time
+            combined_score = weight_accurate * normalized_accurate + \
+                (1 - weight_accurate) * normalized_semantic
 
-        Args:
-            index_name: Name of the index to query
+            results.append(
+                {
+                    "score": combined_score,
+                    "document": result["document"],
+                    "index": result["index"],
+                    "scores": {"accurate": normalized_accurate, "semantic": normalized_semantic},
+                }
+            )
+        return results
 
-        Returns:
-            List of dictionaries with path_or_url, file_size, and create_time
+    @staticmethod
+    def _fuse_rrf(
+        accurate_results: List[Dict[str, Any]], semantic_results: List[Dict[str, Any]], weight_accurate: float
+    ) -> List[Dict[str, Any]]:
+        """Weighted reciprocal rank fusion: sum of weight / (RRF_RANK_CONSTANT + rank) over both legs"""
+        combined_results = ElasticSearchCore._collect_by_doc_id(
+            accurate_results, semantic_results)
+
+        results = []
+        for result in combined_results.values():
+            accurate_rrf = weight_accurate / (RRF_RANK_CONSTANT + result["accurate"][0]) \
+                if "accurate" in result else 0
+            semantic_rrf = (1 - weight_accurate) / (RRF_RANK_CONSTANT + result["semantic"][0]) \
+                if "semantic" in result else 0
+
+            results.append(
+                {
+                    "score": accurate_rrf + semantic_rrf,
+                    "document": result["document"],
+                    "index": result["index"],
+                    "scores": {"accurate": accurate_rrf, "semantic": semantic_rrf},
+                }
+            )
+        return results
+
+    # ---- DOCUMENT CATALOG ----
+
+    @staticmethod
+    def _document_summary_id(index_name: str, path_or_url: str) -> str:
+        return hashlib.sha1(f"{index_name}\n{path_or_url}".encode("utf-8")).hexdigest()
+
+    def _ensure_document_catalog(self) -> None:
+        """Create the shared hidden catalog index on first use"""
+        if self.client.indices.exists(index=DOCUMENT_CATALOG_INDEX):
+            return
+        try:
+            self.client.indices.create(
+                index=DOCUMENT_CATALOG_INDEX, settings=DOCUMENT_CATALOG_SETTINGS, mappings=DOCUMENT_CATALOG_MAPPINGS)
+        except exceptions.RequestError as e:
+            if "resource_already_exists_exception" not in str(e):
+                raise
+
+    def _iter_document_summaries(
+        self, index_name: str, query: Optional[Dict[str, Any]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Build one summary per path_or_url of an index with a paged composite aggregation.
+        Unlike a terms aggregation this has no bucket limit, each page costs one request.
         """
-        agg_query = {
+        after_key = None
+        while True:
+            response = self.client.search(
+                index=index_name, body=self._build_document_summary_body(query, after_key))
+            summaries, after_key = self._parse_document_summaries(index_name, response)
+            yield from summaries
+            if after_key is None:
+                break
+
+    @staticmethod
+    def _build_document_summary_body(
+        query: Optional[Dict[str, Any]], after_key: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        composite: Dict[str, Any] = {
+            "size": DOCUMENT_CATALOG_BATCH_SIZE,
+            "sources": [{"path_or_url": {"terms": {"field": "path_or_url"}}}],
+        }
+        if after_key:
+            composite["after"] = after_key
+        return {
             "size": 0,
+            "query": query or {"match_all": {}},
             "aggs": {
-                "unique_sources": {
-                    "terms": {
-                        "field": "path_or_url",
-                        "size": 1000,  # Limit to 1000 files for performance
-                    },
+                "documents": {
+                    "composite": composite,
                     "aggs": {
                         "file_sample": {
-                            "top_hits": {"size": 1, "_source": ["path_or_url", "file_size", "create_time", "filename"]}
+                            "top_hits": {"size": 1, "_source": ["filename", "file_size", "create_time"]}
                         }
                     },
                 }
             },
         }
 
+    @staticmethod
+    def _parse_document_summaries(
+        index_name: str, response: Dict[str, Any]
+    ) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """Catalog records of one composite page and the after_key of the next page (None on the last page)"""
+        documents = response["aggregations"]["documents"]
+        buckets = documents.get("buckets", [])
+        summaries = []
+        for bucket in buckets:
+            sample_hits = bucket["file_sample"]["hits"]["hits"]
+            source = sample_hits[0]["_source"] if sample_hits else {}
+            summaries.append({
+                "record_type": CATALOG_RECORD_DOCUMENT,
+                "index_name": index_name,
+                "path_or_url": bucket["key"]["path_or_url"],
+                "filename": source.get("filename", ""),
+                "file_size": source.get("file_size", 0),
+                "create_time": source.get("create_time"),
+                "chunk_count": bucket.get("doc_count", 0),
+                "update_time": int(time.time() * 1000),
+            })
+        after_key = documents.get("after_key")
+        if len(buckets) < DOCUMENT_CATALOG_BATCH_SIZE:
+            after_key = None
+        return summaries, after_key
+
+    @staticmethod
+    def _build_summary_operations(index_name: str, summaries: Iterable[Dict[str, Any]],
+                                  stale_paths: Iterable[str] = ()) -> List[Dict[str, Any]]:
+        operations = []
+        for summary in summaries:
+            operations.append({"index": {"_index": DOCUMENT_CATALOG_INDEX,
+                                         "_id": ElasticSearchCore._document_summary_id(index_name, summary["path_or_url"])}})
+            operations.append(summary)
+        for path_or_url in stale_paths:
+            operations.append({"delete": {"_index": DOCUMENT_CATALOG_INDEX,
+                                          "_id": ElasticSearchCore._document_summary_id(index_name, path_or_url)}})
+        return operations
+
+    def _write_document_summaries(self, index_name: str, summaries: Iterable[Dict[str, Any]],
+                                  stale_paths: Iterable[str] = ()) -> None:
+        operations = self._build_summary_operations(index_name, summaries, stale_paths)
+        if operations:
+            response = self.client.bulk(operations=operations, refresh="wait_for")
+            if response.get("errors"):
+                raise RuntimeError(f"Failed to write catalog records of index {index_name}")
+
+    def _sync_document_summaries(self, index_name: str, path_or_urls: Iterable[Optional[str]]) -> None:
+        """
+        Recompute the catalog records of the given documents after their chunks changed.
+        The catalog is derived data: on failure the index's catalog marker is dropped, so the next listing
+        rebuilds the whole catalog instead of serving the stale records.
+        """
+        paths = sorted({path for path in path_or_urls if path})
+        if not paths:
+            return
         try:
-            result = self.client.search(index=index_name, body=agg_query)
+            self._ensure_document_catalog()
+            for i in range(0, len(paths), DOCUMENT_CATALOG_BATCH_SIZE):
+                batch = paths[i: i + DOCUMENT_CATALOG_BATCH_SIZE]
+                summaries = list(self._iter_document_summaries(
+                    index_name, {"terms": {"path_or_url": batch}}))
+                found = {summary["path_or_url"] for summary in summaries}
+                self._write_document_summaries(
+                    index_name, summaries, [path for path in batch if path not in found])
+        except Exception as e:
+            logger.warning(f"Failed to update document catalog for index {index_name}, it will be rebuilt: {e}")
+            self._invalidate_document_catalog(index_name)
 
-            file_list = []
-            for bucket in result["aggregations"]["unique_sources"]["buckets"]:
-                source = bucket["file_sample"]["hits"]["hits"][0]["_source"]
-                file_info = {
-                    "path_or_url": source["path_or_url"],
-                    "filename": source.get("filename", ""),
-                    "file_size": source.get("file_size", 0),
-                    "create_time": source.get("create_time", None),
-                    "chunk_count": bucket.get("doc_count", 0),
-                }
-                file_list.append(file_info)
+    def _invalidate_document_catalog(self, index_name: str) -> None:
+        """Drop the marker of a cataloged index so the next listing rebuilds its catalog from the chunks"""
+        self._delete_document_summary(index_name, "")
+
+    def _delete_document_summary(self, index_name: str, path_or_url: str) -> None:
+        try:
+            self.client.delete(
+                index=DOCUMENT_CATALOG_INDEX,
+                id=self._document_summary_id(index_name, path_or_url),
+                refresh="wait_for",
+            )
+        except exceptions.NotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Failed to delete catalog record of {path_or_url} in index {index_name}: {e}")
+
+    @staticmethod
+    def _build_catalog_delete_query(index_name: str, updated_before: Optional[int] = None) -> Dict[str, Any]:
+        filters: List[Dict[str, Any]] = [{"term": {"index_name": index_name}}]
+        if updated_before is not None:
+            filters.append({"term": {"record_type": CATALOG_RECORD_DOCUMENT}})
+            filters.append({"range": {"update_time": {"lt": updated_before}}})
+        return {"query": {"bool": {"filter": filters}}}
+
+    def _delete_document_catalog(self, index_name: str, updated_before: Optional[int] = None) -> None:
+        try:
+            self.client.delete_by_query(
+                index=DOCUMENT_CATALOG_INDEX,
+                body=self._build_catalog_delete_query(index_name, updated_before),
+                ignore_unavailable=True,
+                refresh=True,
+            )
+        except Exception as e:
+            logger.warning(f"Failed to delete document catalog of index {index_name}: {e}")
+
+    def _get_chunk_path_or_url(self, index_name: str, document_id: str) -> Optional[str]:
+        try:
+            response = self.client.get(index=index_name, id=document_id, _source_includes=["path_or_url"])
+            return response.get("_source", {}).get("path_or_url")
+        except Exception:
+            return None
+
+    def rebuild_document_catalog(self, index_name: str) -> int:
+        """
+        Rebuild the catalog records of an index from its chunks.
+        Used to backfill indices created before the catalog existed, and to repair it. Records are overwritten
+        in place and only records older than the rebuild are dropped afterwards, so listings stay complete.
+
+        Returns:
+            int: Number of documents in the rebuilt catalog
+        """
+        self._ensure_document_catalog()
+        started_at = int(time.time() * 1000)
+        total = 0
+        batch: List[Dict[str, Any]] = []
+        for summary in self._iter_document_summaries(index_name):
+            batch.append(summary)
+            if len(batch) >= DOCUMENT_CATALOG_BATCH_SIZE:
+                self._write_document_summaries(index_name, batch)
+                total += len(batch)
+                batch = []
+        self._write_document_summaries(index_name, batch)
+        total += len(batch)
+        self._delete_document_catalog(index_name, updated_before=started_at)
+        self.client.index(
+            index=DOCUMENT_CATALOG_INDEX,
+            id=self._document_summary_id(index_name, ""),
+            document=self._catalog_marker(index_name),
+            refresh="wait_for",
+        )
+        logger.info(f"Rebuilt document catalog of index {index_name}: {total} documents")
+        return total
+
+    @staticmethod
+    def _catalog_marker(index_name: str) -> Dict[str, Any]:
+        """Record marking an index as fully cataloged, stored under the summary id of an empty path"""
+        return {"record_type": CATALOG_RECORD_MARKER, "index_name": index_name}
+
+    def _ensure_document_catalog_built(self, index_name: str) -> None:
+        """Backfill the catalog of an index that has never been cataloged"""
+        if self.client.exists(index=DOCUMENT_CATALOG_INDEX, id=self._document_summary_id(index_name, "")):
+            return
+        self.rebuild_document_catalog(index_name)
+
+    # ---- STATISTICS AND MONITORING ----
+    def list_documents(
+        self,
+        index_name: str,
+        page_size: int = DEFAULT_DOCUMENT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+        sort_by: str = "create_time",
+        sort_order: str = "desc",
+        path_or_urls: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Page through the documents of an index using the per-document catalog records.
+
+        Each page is one query on the catalog, independent of the number of chunks or documents. Indices
+        that were never cataloged are backfilled on their first listing.
+
+        Args:
+            index_name: Name of the index to list
+            page_size: Number of documents per page
+            cursor: next_cursor of the previous page
+            sort_by: One of create_time, file_size, chunk_count, filename, path_or_url
+            sort_order: "asc" or "desc"
+            path_or_urls: Optional restriction to these documents
+
+        Returns:
+            Dictionary containing documents (path_or_url, filename, file_size, create_time, chunk_count),
+            total and next_cursor (None on the last page)
+
+        Raises:
+            ValueError: If the sort options or the cursor are invalid
+        """
+        position = self._decode_document_cursor(cursor, sort_by, sort_order)
+        if position is None:
+            self._ensure_document_catalog_built(index_name)
+
+        response = self.client.search(
+            index=DOCUMENT_CATALOG_INDEX,
+            body=self._build_list_documents_body(index_name, sort_by, sort_order, position, path_or_urls),
+            size=max(page_size, 1),
+        )
+        return self._parse_list_documents(response, max(page_size, 1), sort_by, sort_order)
+
+    @staticmethod
+    def _decode_document_cursor(cursor: Optional[str], sort_by: str, sort_order: str) -> Optional[Dict[str, Any]]:
+        if sort_by not in DOCUMENT_SORT_FIELDS:
+            raise ValueError(f"Unsupported sort field: {sort_by}. Supported: {', '.join(DOCUMENT_SORT_FIELDS)}")
+        if sort_order not in ("asc", "desc"):
+            raise ValueError(f"Unsupported sort order: {sort_order}")
+        position = decode_cursor(cursor)
+        if position is not None and (position.get("sort_by"), position.get("sort_order")) != (sort_by, sort_order):
+            raise ValueError("Cursor was issued for a different sort order")
+        return position
+
+    @staticmethod
+    def _build_list_documents_body(
+        index_name: str,
+        sort_by: str,
+        sort_order: str,
+        position: Optional[Dict[str, Any]],
+        path_or_urls: Optional[List[str]],
+    ) -> Dict[str, Any]:
+        filters: List[Dict[str, Any]] = [
+            {"term": {"index_name": index_name}},
+            {"term": {"record_type": CATALOG_RECORD_DOCUMENT}},
+        ]
+        if path_or_urls is not None:
+            filters.append({"terms": {"path_or_url": path_or_urls}})
+        sort: List[Dict[str, Any]] = [{sort_by: {"order": sort_order, "missing": "_last"}}]
+        if sort_by != "path_or_url":
+            # Tie breaker keeps search_after pages stable
+            sort.append({"path_or_url": {"order": "asc"}})
+        body: Dict[str, Any] = {
+            "query": {"bool": {"filter": filters}},
+            "sort": sort,
+            "track_total_hits": True,
+        }
+        if position is not None:
+            body["search_after"] = position["search_after"]
+        return body
+
+    @staticmethod
+    def _parse_list_documents(response: Dict[str, Any], page_size: int, sort_by: str, sort_order: str) -> Dict[str, Any]:
+        hits = response.get("hits", {}).get("hits", [])
+        documents = [
+            {
+                "path_or_url": hit["_source"]["path_or_url"],
+                "filename": hit["_source"].get("filename", ""),
+                "file_size": hit["_source"].get("file_size", 0),
+                "create_time": hit["_source"].get("create_time"),
+                "chunk_count": hit["_source"].get("chunk_count", 0),
+            }
+            for hit in hits
+        ]
+        next_cursor = None
+        if hits and len(hits) == page_size:
+            next_cursor = encode_cursor(
+                {"search_after": hits[-1]["sort"], "sort_by": sort_by, "sort_order": sort_order})
+        return {
+            "documents": documents,
+            "total": response.get("hits", {}).get("total", {}).get("value", len(documents)),
+            "next_cursor": next_cursor,
+        }
 
-            return file_list
+    def get_documents_detail(self, index_name: str) -> List[Dict[str, Any]]:
+        """
+        Get a list of unique path_or_url values with their file_size and create_time
+
+        Args:
+            index_name: Name of the index to query
+
+        Returns:
+            List of dictionaries with path_or_url, file_size, and create_time
+        """
+        try:
+            file_list = []
+            cursor = None
+            while True:
+                page = self.list_documents(
+                    index_name, page_size=DOCUMENT_CATALOG_BATCH_SIZE, cursor=cursor)
+                file_list.extend(page["documents"])
+                cursor = page["next_cursor"]
+                if not cursor:
+                    return file_list
         except Exception as e:
             logger.error(f"Error getting file list: {str(e)}")
             return []
@@ -1083,69 +2318,121 @@ class ElasticSearchCore(VectorDatabaseCore):
     def get_indices_detail(
         self, index_names: List[str], embedding_dim: Optional[int] = None
     ) -> Dict[str, Dict[str, Dict[str, Any]]]:
-        """Get formatted statistics for multiple indices"""
+        """
+        Get formatted statistics for multiple indices.
+        Uses a constant number of round trips: one multi-index stats call, one multi-index settings call
+        and one msearch carrying every index's aggregations. Cached entries are served without any call.
+        """
         all_stats = {}
-        for index_name in index_names:
-            try:
-                stats = self.client.indices.stats(index=index_name)
-                settings = self.client.indices.get_settings(index=index_name)
+        if self.index_stats_cache is not None:
+            all_stats.update(self.index_stats_cache.get_many(index_names))
+        pending = [name for name in index_names if name not in all_stats]
+        if not pending:
+            return all_stats
 
-                # Merge query
-                agg_query = {
-                    "size": 0,
-                    "aggs": {
-                        "unique_path_or_url_count": {"cardinality": {"field": "path_or_url"}},
-                        "process_sources": {"terms": {"field": "process_source", "size": 10}},
-                        "embedding_models": {"terms": {"field": "embedding_model_name", "size": 10}},
-                    },
-                }
+        try:
+            index_pattern = ",".join(pending)
+            stats = self.client.indices.stats(
+                index=index_pattern, ignore_unavailable=True)
+            settings = self.client.indices.get_settings(
+                index=index_pattern, ignore_unavailable=True)
+
+            msearch_body = []
+            for index_name in pending:
+                msearch_body.extend([{"index": index_name}, {"size": 0, "aggs": INDEX_STATS_AGGS}])
+            agg_responses = self.client.msearch(body=msearch_body)["responses"]
+            # Rebuilt knowledge bases are aliases, their stats come back under the generation index name
+            aliased = [name for name in pending if name not in stats.get("indices", {})]
+            if aliased:
+                stats, settings = self._rekey_alias_stats(
+                    stats, settings, self.client.indices.get_alias(index=",".join(aliased), ignore_unavailable=True),
+                    aliased)
+        except Exception as e:
+            logger.error(
+                f"Error getting stats for indices {pending}: {str(e)}")
+            for index_name in pending:
+                all_stats[index_name] = {"error": str(e)}
+            return all_stats
 
-                # Execute query
-                agg_result = self.client.search(
-                    index=index_name, body=agg_query)
+        for index_name, agg_result in zip(pending, agg_responses):
+            all_stats[index_name] = self._format_index_stats(
+                index_name, stats, settings, agg_result, embedding_dim)
+            if self.index_stats_cache is not None and "error" not in all_stats[index_name]:
+                self.index_stats_cache.put(index_name, all_stats[index_name])
 
-                unique_sources_count = agg_result["aggregations"]["unique_path_or_url_count"]["value"]
-                process_source = (
-                    agg_result["aggregations"]["process_sources"]["buckets"][0]["key"]
-                    if agg_result["aggregations"]["process_sources"]["buckets"]
-                    else ""
-                )
-                embedding_model = (
-                    agg_result["aggregations"]["embedding_models"]["buckets"][0]["key"]
-                    if agg_result["aggregations"]["embedding_models"]["buckets"]
-                    else ""
-                )
+        return all_stats
 
-                index_stats = stats["indices"][index_name]["primaries"]
-
-                # Get creation and update timestamps from settings
-                creation_date = int(
-                    settings[index_name]["settings"]["index"]["creation_date"])
-                # Update time defaults to creation time if not modified
-                update_time = creation_date
-
-                all_stats[index_name] = {
-                    "base_info": {
-                        "doc_count": unique_sources_count,
-                        "chunk_count": index_stats["docs"]["count"],
-                        "store_size": format_size(index_stats["store"]["size_in_bytes"]),
-                        "process_source": process_source,
-                        "embedding_model": embedding_model,
-                        "embedding_dim": embedding_dim or 1024,
-                        "creation_date": creation_date,
-                        "update_date": update_time,
-                    },
-                    "search_performance": {
-                        "total_search_count": index_stats["search"]["query_total"],
-                        "hit_count": index_stats["request_cache"]["hit_count"],
-                    },
-                }
-            except Exception as e:
-                logger.error(
-                    f"Error getting stats for index {index_name}: {str(e)}")
-                all_stats[index_name] = {"error": str(e)}
+    @staticmethod
+    def _rekey_alias_stats(
+        stats: Dict[str, Any], settings: Dict[str, Any], aliases: Dict[str, Any], names: List[str]
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Copy the stats and settings entries of alias targets under the alias names"""
+        stats = {**stats, "indices": dict(stats.get("indices", {}))}
+        settings = dict(settings)
+        for alias, physical_name in ElasticSearchCore._alias_targets(aliases, names).items():
+            if physical_name in stats["indices"]:
+                stats["indices"][alias] = stats["indices"][physical_name]
+            if physical_name in settings:
+                settings[alias] = settings[physical_name]
+        return stats, settings
+
+    @staticmethod
+    def _format_index_stats(
+        index_name: str,
+        stats: Dict[str, Any],
+        settings: Dict[str, Any],
+        agg_result: Dict[str, Any],
+        embedding_dim: Optional[int],
+    ) -> Dict[str, Dict[str, Any]]:
+        """Combine the stats, settings and aggregation responses of one index into its detail record"""
+        try:
+            if "error" in agg_result:
+                raise Exception(agg_result["error"])
+
+            unique_sources_count = agg_result["aggregations"]["unique_path_or_url_count"]["value"]
+            process_source = (
+                agg_result["aggregations"]["process_sources"]["buckets"][0]["key"]
+                if agg_result["aggregations"]["process_sources"]["buckets"]
+                else ""
+            )
+            embedding_model = (
+                agg_result["aggregations"]["embedding_models"]["buckets"][0]["key"]
+                if agg_result["aggregations"]["embedding_models"]["buckets"]
+                else ""
+            )
 
-        return all_stats
+            index_stats = stats["indices"][index_name]["primaries"]
+
+            # Get creation and update timestamps from settings
+            creation_date = int(
+                settings[index_name]["settings"]["index"]["creation_date"])
+            # Update time defaults to creation time if not modified
+            update_time = creation_date
+
+            return {
+                "base_info": {
+                    "doc_count": unique_sources_count,
+                    "chunk_count": index_stats["docs"]["count"],
+                    "store_size": format_size(index_stats["store"]["size_in_bytes"]),
+                    "process_source": process_source,
+                    "embedding_model": embedding_model,
+                    "embedding_dim": embedding_dim or 1024,
+                    "creation_date": creation_date,
+                    "update_date": update_time,
+                },
+                "search_performance": {
+                    "total_search_count": index_stats["search"]["query_total"],
+                    "hit_count": index_stats["request_cache"]["hit_count"],
+                },
+            }
+        except Exception as e:
+            logger.error(
+                f"Error getting stats for index {index_name}: {str(e)}")
+            return {"error": str(e)}
+
+    def _invalidate_index_stats(self, index_name: str) -> None:
+        if self.index_stats_cache is not None:
+            self.index_stats_cache.invalidate(index_name)
 
     def _resolve_chunk_document_id(self, index_name: str, chunk_id: str) -> str:
         """
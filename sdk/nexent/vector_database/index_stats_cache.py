@@ -0,0 +1,56 @@
+"""
+Short-lived cache of per-index statistics.
+
+Knowledge-base listings ask for the stats of every index a tenant owns on each page load. Stats only change when
+documents are ingested or deleted, so they are cached for a few seconds and invalidated by those writes.
+"""
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+
+DEFAULT_INDEX_STATS_TTL_S = 30
+
+
+class IndexStatsCache:
+    """
+    TTL cache of formatted index statistics keyed by index name.
+
+    Usage:
+        cache = IndexStatsCache(ttl_seconds=30)
+        cached = cache.get_many(["kb_a", "kb_b"])  # only unexpired entries are returned
+        cache.put("kb_c", stats)
+        cache.invalidate("kb_a")  # after ingest or delete
+    """
+
+    def __init__(self, ttl_seconds: float = DEFAULT_INDEX_STATS_TTL_S):
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def get_many(self, index_names: List[str]) -> Dict[str, Dict[str, Any]]:
+        now = time.monotonic()
+        found = {}
+        with self._lock:
+            for index_name in index_names:
+                entry = self._entries.get(index_name)
+                if entry is None:
+                    continue
+                expires_at, stats = entry
+                if expires_at < now:
+                    del self._entries[index_name]
+                    continue
+                found[index_name] = stats
+        return found
+
+    def put(self, index_name: str, stats: Dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[index_name] = (time.monotonic() + self.ttl_seconds, stats)
+
+    def invalidate(self, index_name: Optional[str] = None) -> None:
+        """Drop one index, or every index when index_name is None"""
+        with self._lock:
+            if index_name is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(index_name, None)
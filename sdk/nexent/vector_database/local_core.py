@@ -0,0 +1,1101 @@
+import fnmatch
+import heapq
+import json
+import logging
+import math
+import os
+import shutil
+import threading
+import time
+import uuid
+from collections import Counter
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: writes are only serialized within one process
+    fcntl = None
+
+from ..core.models.embedding_cache import EmbeddingCache
+from ..core.models.embedding_coalescer import EmbeddingRequestCoalescer, embed_query
+from ..core.models.embedding_model import BaseEmbedding
+from ..core.nlp.tokenizer import calculate_term_weights, tokenize
+from .base import VectorDatabaseCore
+from .elasticsearch_core import (
+    DEFAULT_CHUNK_BATCH_SIZE,
+    DEFAULT_DOCUMENT_PAGE_SIZE,
+    DEFAULT_HYBRID_FUSION,
+    DOCUMENT_CATALOG_BATCH_SIZE,
+    HYBRID_FUSION_RRF,
+    ElasticSearchCore,
+)
+from .query_embedding_cache import QueryEmbeddingCache
+from .utils import content_hash, decode_cursor, diff_chunks, encode_cursor, format_size
+
+logger = logging.getLogger("local_core")
+
+# Storage dtype per vector index profile; quantized Elasticsearch profiles map to the closest lossy local format
+LOCAL_VECTOR_PROFILES = {
+    "float": "float32",
+    "float16": "float16",
+    "int8": "float16",
+    "bbq": "float16",
+}
+DEFAULT_LOCAL_VECTOR_PROFILE = "float"
+DEFAULT_EMBEDDING_DIM = 1024
+
+META_FILE = "meta.json"
+VECTORS_FILE = "vectors.bin"
+TOMBSTONES_FILE = "tombstones.bin"
+CHUNKS_FILE = "chunks.jsonl"
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+# Rows scored per matrix product, bounds the float32 copy made of float16 vectors
+SEARCH_BLOCK_ROWS = 65536
+# Indices are rewritten without deleted rows once this share of their rows is tombstoned
+COMPACT_TOMBSTONE_RATIO = 0.3
+# Shadow directories of rebuilds in progress, hidden from get_user_indices by the leading dot
+REBUILD_DIR_PREFIX = ".rebuild-"
+
+
+class _LocalIndex:
+    """
+    One index on disk: append-only vector, tombstone and chunk files plus a small meta file.
+
+    Row i of vectors.bin, tombstones.bin and chunks.jsonl describe the same chunk. Vectors are read through a
+    read-only memory map, so the OS page cache holds them instead of the Python heap. Deleting a chunk only
+    flips its tombstone byte; compact() drops deleted rows for good. Norms and the BM25 inverted index are
+    rebuilt in memory on load.
+
+    Rows are keyed by a document id stored as "_id" in chunks.jsonl, like the Elasticsearch _id, so chunks
+    sharing an "id" are all kept. Every write rewrites the meta file, whose stat stamp tells other processes
+    to reload the index. Writes run inside writing(), which holds an flock on the index directory and reloads
+    first when another process wrote since, so processes sharing the directory never overwrite each other.
+    """
+
+    def __init__(self, path: str, meta: Dict[str, Any]):
+        self.path = path
+        self.meta = meta
+        self.dim = int(meta["embedding_dim"])
+        self.dtype = np.dtype(meta["dtype"])
+        self.lock = threading.RLock()
+        self._write_depth = 0
+        self.search_count = 0
+        self.stamp: Optional[Tuple[int, int]] = None
+        self._reset()
+
+    @classmethod
+    def create(cls, path: str, embedding_dim: int, dtype: str) -> "_LocalIndex":
+        os.makedirs(path)
+        now = int(time.time() * 1000)
+        meta = {"embedding_dim": embedding_dim, "dtype": dtype, "creation_date": now, "update_date": now}
+        for name in (VECTORS_FILE, TOMBSTONES_FILE, CHUNKS_FILE):
+            open(os.path.join(path, name), "wb").close()
+        index = cls(path, meta)
+        index._write_meta()
+        return index
+
+    @classmethod
+    def load(cls, path: str) -> "_LocalIndex":
+        # Stamp before reading, so a write landing during the load triggers another one
+        stamp = cls.meta_stamp(path)
+        with open(os.path.join(path, META_FILE), encoding="utf-8") as f:
+            index = cls(path, json.load(f))
+        index._load_rows()
+        index.stamp = stamp
+        return index
+
+    @staticmethod
+    def meta_stamp(path: str) -> Optional[Tuple[int, int]]:
+        """Inode and mtime of the meta file, which is replaced on every write; None if the index is gone"""
+        try:
+            stat = os.stat(os.path.join(path, META_FILE))
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns
+
+    @contextmanager
+    def writing(self) -> Iterator[None]:
+        """
+        Hold the index for a write: the thread lock, an exclusive flock on the index directory shared with
+        other processes, and a reload when another process wrote since this copy was loaded. Reentrant, so
+        callers reading rows before writing them hold it around both.
+
+        Raises:
+            KeyError: If the index directory is gone
+        """
+        with self.lock:
+            if self._write_depth:
+                self._write_depth += 1
+                try:
+                    yield
+                finally:
+                    self._write_depth -= 1
+                return
+            fd = self._lock_directory()
+            try:
+                self._write_depth = 1
+                self._refresh()
+                yield
+            finally:
+                self._write_depth = 0
+                if fd is not None:
+                    # Closing the descriptor releases the flock
+                    os.close(fd)
+
+    def _lock_directory(self) -> Optional[int]:
+        if fcntl is None:
+            return None
+        while True:
+            try:
+                fd = os.open(self.path, os.O_RDONLY)
+            except FileNotFoundError:
+                raise KeyError(f"Index {self.path} not found")
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            # A rebuild may have swapped another directory in while this one waited for the lock
+            try:
+                if os.stat(self.path).st_ino == os.fstat(fd).st_ino:
+                    return fd
+            except FileNotFoundError:
+                os.close(fd)
+                raise KeyError(f"Index {self.path} not found")
+            os.close(fd)
+
+    def _refresh(self) -> None:
+        """Reload from disk if another process wrote the index since it was loaded"""
+        stamp = self.meta_stamp(self.path)
+        if stamp is None:
+            raise KeyError(f"Index {self.path} not found")
+        if stamp == self.stamp:
+            return
+        with open(self._file(META_FILE), encoding="utf-8") as f:
+            self.meta = json.load(f)
+        self._load_rows()
+        self.stamp = stamp
+
+    def _reset(self) -> None:
+        self.chunks: List[Optional[Dict[str, Any]]] = []
+        self.doc_ids: List[str] = []
+        self.deleted = np.zeros(0, dtype=bool)
+        self.norms = np.zeros(0, dtype=np.float32)
+        self.vectors: Optional[np.memmap] = None
+        self.doc_rows: Dict[str, int] = {}
+        self.id_rows: Dict[str, List[int]] = {}
+        self.postings: Dict[str, Dict[int, int]] = {}
+        self.doc_lens: Dict[int, int] = {}
+        self.total_len = 0
+
+    def _file(self, name: str) -> str:
+        return os.path.join(self.path, name)
+
+    def _write_meta(self) -> None:
+        tmp_path = self._file(META_FILE + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.meta, f)
+        # The rename keeps the inode and mtime, so this process never mistakes its own write for a foreign one
+        stat = os.stat(tmp_path)
+        self.stamp = (stat.st_ino, stat.st_mtime_ns)
+        os.replace(tmp_path, self._file(META_FILE))
+
+    def _load_rows(self) -> None:
+        with open(self._file(CHUNKS_FILE), encoding="utf-8") as f:
+            chunks = [json.loads(line) for line in f if line.strip()]
+        tombstones = np.fromfile(self._file(TOMBSTONES_FILE), dtype=np.uint8)
+        vector_rows = os.path.getsize(self._file(VECTORS_FILE)) // (self.dim * self.dtype.itemsize)
+
+        # An interrupted append can leave the three files with different lengths, keep the common prefix
+        rows = min(len(chunks), len(tombstones), vector_rows)
+        if rows < max(len(chunks), len(tombstones), vector_rows):
+            logger.warning(f"Truncating {self.path} to {rows} consistent rows after an interrupted write")
+            self._truncate(rows, chunks[:rows])
+
+        self._reset()
+        self.chunks = chunks[:rows]
+        # Rows written before document ids existed are keyed by their chunk id, which was unique then
+        self.doc_ids = [chunk.pop("_id", None) or str(chunk["id"]) for chunk in self.chunks]
+        self.deleted = tombstones[:rows].astype(bool)
+        self._open_vectors()
+        self.norms = self._vector_norms(0, rows)
+        for row, chunk in enumerate(self.chunks):
+            if self.deleted[row]:
+                self.chunks[row] = None
+            else:
+                self._add_live_row(row, chunk)
+
+    def _truncate(self, rows: int, chunks: List[Dict[str, Any]]) -> None:
+        with open(self._file(VECTORS_FILE), "r+b") as f:
+            f.truncate(rows * self.dim * self.dtype.itemsize)
+        with open(self._file(TOMBSTONES_FILE), "r+b") as f:
+            f.truncate(rows)
+        self._write_chunks_file(self._file(CHUNKS_FILE), chunks)
+
+    @staticmethod
+    def _write_chunks_file(path: str, chunks: Sequence[Dict[str, Any]]) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            for chunk in chunks:
+                f.write(json.dumps(chunk, ensure_ascii=False, default=str) + "\n")
+
+    def _open_vectors(self) -> None:
+        rows = len(self.chunks)
+        self.vectors = np.memmap(self._file(VECTORS_FILE), dtype=self.dtype, mode="r",
+                                 shape=(rows, self.dim)) if rows else None
+
+    def _vector_norms(self, start: int, end: int) -> np.ndarray:
+        norms = np.zeros(end - start, dtype=np.float32)
+        for block_start in range(start, end, SEARCH_BLOCK_ROWS):
+            block_end = min(block_start + SEARCH_BLOCK_ROWS, end)
+            block = np.asarray(self.vectors[block_start:block_end], dtype=np.float32)
+            norms[block_start - start:block_end - start] = np.linalg.norm(block, axis=1)
+        return norms
+
+    # ---- ROW MAINTENANCE ----
+
+    def _add_live_row(self, row: int, chunk: Dict[str, Any]) -> None:
+        self.doc_rows[self.doc_ids[row]] = row
+        self.id_rows.setdefault(str(chunk["id"]), []).append(row)
+        terms = Counter(tokenize(f"{chunk.get('title') or ''} {chunk.get('content') or ''}"))
+        for term, tf in terms.items():
+            self.postings.setdefault(term, {})[row] = tf
+        length = sum(terms.values())
+        self.doc_lens[row] = length
+        self.total_len += length
+
+    def _remove_live_row(self, row: int) -> None:
+        chunk = self.chunks[row]
+        self.doc_rows.pop(self.doc_ids[row], None)
+        rows = self.id_rows.get(str(chunk["id"]), [])
+        if row in rows:
+            rows.remove(row)
+            if not rows:
+                del self.id_rows[str(chunk["id"])]
+        for term in set(tokenize(f"{chunk.get('title') or ''} {chunk.get('content') or ''}")):
+            postings = self.postings.get(term)
+            if postings is not None:
+                postings.pop(row, None)
+                if not postings:
+                    del self.postings[term]
+        self.total_len -= self.doc_lens.pop(row, 0)
+        self.chunks[row] = None
+
+    def append(self, chunks: List[Dict[str, Any]], vectors: np.ndarray, doc_ids: Optional[List[str]] = None) -> None:
+        """
+        Append chunks with their vectors. A chunk given the document id of a live row replaces that row;
+        without doc_ids every chunk gets a new one, so chunks sharing an "id" never replace each other.
+        """
+        vectors = np.asarray(vectors, dtype=self.dtype).reshape(len(chunks), -1)
+        if vectors.shape[1] != self.dim:
+            raise ValueError(f"Embedding dimension {vectors.shape[1]} does not match index dimension {self.dim}")
+        if doc_ids is None:
+            doc_ids = [uuid.uuid4().hex for _ in chunks]
+        else:
+            # The last occurrence of a document id repeated within the batch wins
+            keep = sorted({doc_id: position for position, doc_id in enumerate(doc_ids)}.values())
+            if len(keep) < len(chunks):
+                chunks, vectors = [chunks[position] for position in keep], vectors[keep]
+                doc_ids = [doc_ids[position] for position in keep]
+
+        with self.writing():
+            replaced = [self.doc_rows[doc_id] for doc_id in doc_ids if doc_id in self.doc_rows]
+            start = len(self.chunks)
+            with open(self._file(VECTORS_FILE), "ab") as f:
+                f.write(vectors.tobytes())
+            with open(self._file(TOMBSTONES_FILE), "ab") as f:
+                f.write(bytes(len(chunks)))
+            with open(self._file(CHUNKS_FILE), "a", encoding="utf-8") as f:
+                for doc_id, chunk in zip(doc_ids, chunks):
+                    f.write(json.dumps({"_id": doc_id, **chunk}, ensure_ascii=False, default=str) + "\n")
+
+            self.chunks.extend(chunks)
+            self.doc_ids.extend(doc_ids)
+            self.deleted = np.concatenate([self.deleted, np.zeros(len(chunks), dtype=bool)])
+            self._open_vectors()
+            self.norms = np.concatenate([self.norms, self._vector_norms(start, len(self.chunks))])
+            self.tombstone(replaced)
+            for offset, chunk in enumerate(chunks):
+                self._add_live_row(start + offset, chunk)
+            self._touch()
+
+    def tombstone(self, rows: List[int]) -> None:
+        """Delete rows; callers resolve them inside writing(), rows may move when another process wrote"""
+        with self.writing():
+            rows = [row for row in rows if not self.deleted[row]]
+            if not rows:
+                return
+            with open(self._file(TOMBSTONES_FILE), "r+b") as f:
+                for row in rows:
+                    f.seek(row)
+                    f.write(b"\x01")
+            for row in rows:
+                self.deleted[row] = True
+                self._remove_live_row(row)
+            self._touch()
+
+    def _touch(self) -> None:
+        self.meta["update_date"] = int(time.time() * 1000)
+        self._write_meta()
+
+    def needs_compaction(self) -> bool:
+        return len(self.chunks) > 0 and self.deleted.sum() / len(self.chunks) >= COMPACT_TOMBSTONE_RATIO
+
+    def compact(self) -> int:
+        """Rewrite the index without deleted rows, returning the number of rows dropped"""
+        with self.writing():
+            live_rows = np.flatnonzero(~self.deleted)
+            dropped = len(self.chunks) - len(live_rows)
+            if not dropped:
+                return 0
+            with open(self._file(VECTORS_FILE + ".tmp"), "wb") as f:
+                for block_start in range(0, len(live_rows), SEARCH_BLOCK_ROWS):
+                    f.write(np.asarray(self.vectors[live_rows[block_start:block_start + SEARCH_BLOCK_ROWS]]).tobytes())
+            with open(self._file(TOMBSTONES_FILE + ".tmp"), "wb") as f:
+                f.write(bytes(len(live_rows)))
+            self._write_chunks_file(self._file(CHUNKS_FILE + ".tmp"),
+                                    [{"_id": self.doc_ids[row], **self.chunks[row]} for row in live_rows])
+
+            # Drop the map before replacing the file underneath it
+            self.vectors = None
+            for name in (VECTORS_FILE, TOMBSTONES_FILE, CHUNKS_FILE):
+                os.replace(self._file(name + ".tmp"), self._file(name))
+            self._load_rows()
+            # Rows moved, so other processes must reload
+            self._touch()
+            return dropped
+
+    # ---- QUERIES ----
+
+    def live_chunks(self) -> List[Dict[str, Any]]:
+        return [chunk for chunk in self.chunks if chunk is not None]
+
+    def live_entries(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """(document id, chunk) of every live row"""
+        return [(self.doc_ids[row], chunk) for row, chunk in enumerate(self.chunks) if chunk is not None]
+
+    def vector(self, row: int) -> np.ndarray:
+        return np.array(self.vectors[row])
+
+    def cosine_top_k(self, query_vector: np.ndarray, k: int) -> List[Tuple[float, Dict[str, Any]]]:
+        """Exact top-k by cosine similarity, scored blockwise over the memory-mapped vectors"""
+        if query_vector.shape[0] != self.dim:
+            raise ValueError(
+                f"Query embedding dimension {query_vector.shape[0]} does not match index dimension {self.dim}")
+        # Score a snapshot so concurrent searches do not hold the lock; appends and compaction replace
+        # vectors and norms instead of mutating them
+        with self.lock:
+            self.search_count += 1
+            vectors, norms, deleted, chunks = self.vectors, self.norms, self.deleted.copy(), list(self.chunks)
+        rows = len(chunks)
+        if not rows or k <= 0:
+            return []
+
+        similarities = np.empty(rows, dtype=np.float32)
+        for start in range(0, rows, SEARCH_BLOCK_ROWS):
+            end = min(start + SEARCH_BLOCK_ROWS, rows)
+            similarities[start:end] = np.asarray(vectors[start:end], dtype=np.float32) @ query_vector
+        query_norm = float(np.linalg.norm(query_vector)) or 1.0
+        np.divide(similarities, norms * query_norm, out=similarities, where=norms > 0)
+        # Deleted rows and chunks stored without an embedding never match
+        similarities[deleted | (norms == 0)] = -np.inf
+
+        k = min(k, rows)
+        top_rows = np.argpartition(-similarities, k - 1)[:k]
+        top_rows = top_rows[np.argsort(-similarities[top_rows])]
+        # Same scale as Elasticsearch cosine scores, (1 + cosine) / 2
+        return [((1 + float(similarities[row])) / 2, chunks[row])
+                for row in top_rows if np.isfinite(similarities[row])]
+
+    def bm25_top_k(self, query_text: str, k: int) -> List[Tuple[float, Dict[str, Any]]]:
+        """BM25 over title and content, query terms weighted like the Elasticsearch accurate search"""
+        with self.lock:
+            self.search_count += 1
+            live_count = len(self.doc_lens)
+            if not live_count or k <= 0:
+                return []
+            term_weights = calculate_term_weights(query_text) or {
+                term: 1.0 for term in tokenize(query_text)}
+            avg_len = self.total_len / live_count or 1.0
+
+            scores: Dict[int, float] = {}
+            for term, weight in term_weights.items():
+                postings = self.postings.get(term.lower())
+                if not postings:
+                    continue
+                idf = math.log(1 + (live_count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for row, tf in postings.items():
+                    norm_tf = tf * (BM25_K1 + 1) / (tf + BM25_K1 * (1 - BM25_B + BM25_B * self.doc_lens[row] / avg_len))
+                    scores[row] = scores.get(row, 0.0) + weight * idf * norm_tf
+            return [(score, self.chunks[row])
+                    for row, score in heapq.nlargest(k, scores.items(), key=lambda item: item[1])]
+
+    def store_size(self) -> int:
+        return sum(os.path.getsize(self._file(name)) for name in (VECTORS_FILE, TOMBSTONES_FILE, CHUNKS_FILE, META_FILE))
+
+
+class LocalVectorCore(VectorDatabaseCore):
+    """
+    Embedded vector store, running in-process without any external service.
+
+    Each index is a directory under root_path holding its embeddings in a memory-mapped float32 or float16
+    array, its chunks as JSON lines and a tombstone byte per row. Semantic search is an exact, vectorized
+    cosine top-k; accurate search is BM25 over an inverted index built with nexent.core.nlp.tokenizer.
+    Suited to small knowledge bases, edge deployments and tests; results have the same shape as
+    ElasticSearchCore.
+
+    search and multi_search accept a subset of the Elasticsearch query DSL: match_all, term, terms and
+    bool queries with from, size and _source excludes. Aggregations are not supported.
+    """
+
+    def __init__(
+        self,
+        root_path: str,
+        embedding_cache: Optional[EmbeddingCache] = None,
+        hybrid_fusion: str = DEFAULT_HYBRID_FUSION,
+        query_embedding_cache: Optional[QueryEmbeddingCache] = None,
+        embedding_coalescer: Optional[EmbeddingRequestCoalescer] = None,
+    ):
+        """
+        Initialize LocalVectorCore.
+
+        Args:
+            root_path: Directory holding one sub-directory per index, created if missing
+            embedding_cache: Optional content-hash cache; when set, only cache misses are sent to the embedding API
+            hybrid_fusion: Default rank fusion for hybrid search, "weighted" or "rrf"
+            query_embedding_cache: Optional TTL'd LRU of query embeddings used by semantic and hybrid search
+            embedding_coalescer: Optional coalescer batching concurrent query embeddings into shared API calls
+        """
+        self.root_path = root_path
+        os.makedirs(root_path, exist_ok=True)
+        self.embedding_cache = embedding_cache
+        self.hybrid_fusion = hybrid_fusion
+        self.query_embedding_cache = query_embedding_cache
+        self.embedding_coalescer = embedding_coalescer
+        self._indices: Dict[str, _LocalIndex] = {}
+        self._lock = threading.Lock()
+
+    # ---- INDEX MANAGEMENT ----
+
+    def _index_path(self, index_name: str) -> str:
+        if not index_name or index_name.startswith(".") or os.sep in index_name or "/" in index_name:
+            raise ValueError(f"Invalid index name: {index_name}")
+        return os.path.join(self.root_path, index_name)
+
+    def _get_index(self, index_name: str) -> _LocalIndex:
+        """
+        Return the loaded index, loading it from disk on first use and again whenever another process wrote
+        it since; raises KeyError if it does not exist
+        """
+        with self._lock:
+            path = self._index_path(index_name)
+            stamp = _LocalIndex.meta_stamp(path)
+            if stamp is None:
+                self._indices.pop(index_name, None)
+                raise KeyError(f"Index {index_name} not found")
+            index = self._indices.get(index_name)
+            if index is None or index.stamp != stamp:
+                index = _LocalIndex.load(path)
+                self._indices[index_name] = index
+            return index
+
+    def create_index(
+        self, index_name: str, embedding_dim: Optional[int] = None, index_profile: Optional[str] = None
+    ) -> bool:
+        """
+        Create a new local index.
+
+        Args:
+            index_name: Name of the index to create
+            embedding_dim: Dimension of the embedding vectors, defaults to 1024
+            index_profile: "float" stores float32 vectors; "float16", "int8" and "bbq" store float16 vectors
+
+        Returns:
+            bool: True if the index exists afterwards
+
+        Raises:
+            ValueError: If the profile is unknown
+        """
+        profile = index_profile or DEFAULT_LOCAL_VECTOR_PROFILE
+        dtype = LOCAL_VECTOR_PROFILES.get(profile)
+        if dtype is None:
+            raise ValueError(
+                f"Unsupported vector index profile: {profile}, only support: {', '.join(LOCAL_VECTOR_PROFILES)}")
+
+        with self._lock:
+            path = self._index_path(index_name)
+            if os.path.exists(os.path.join(path, META_FILE)):
+                logger.info(f"Index {index_name} already exists, skipping creation")
+                return True
+            try:
+                self._indices[index_name] = _LocalIndex.create(path, embedding_dim or DEFAULT_EMBEDDING_DIM, dtype)
+            except Exception as e:
+                logger.error(f"Error creating index: {str(e)}")
+                return False
+        logger.info(f"Successfully created index: {index_name}")
+        return True
+
+    def delete_index(self, index_name: str) -> bool:
+        with self._lock:
+            path = self._index_path(index_name)
+            self._indices.pop(index_name, None)
+            if not os.path.exists(path):
+                logger.info(f"Index {index_name} not found")
+                return False
+            try:
+                shutil.rmtree(path)
+            except Exception as e:
+                logger.error(f"Error deleting index: {str(e)}")
+                return False
+        logger.info(f"Successfully deleted the index: {index_name}")
+        return True
+
+    def get_user_indices(self, index_pattern: str = "*") -> List[str]:
+        try:
+            return sorted(
+                name for name in os.listdir(self.root_path)
+                if not name.startswith(".")
+                and os.path.exists(os.path.join(self.root_path, name, META_FILE))
+                and any(fnmatch.fnmatchcase(name, pattern) for pattern in index_pattern.split(","))
+            )
+        except Exception as e:
+            logger.error(f"Error getting user indices: {str(e)}")
+            return []
+
+    def check_index_exists(self, index_name: str) -> bool:
+        return os.path.exists(os.path.join(self._index_path(index_name), META_FILE))
+
+    def compact_index(self, index_name: str) -> int:
+        """
+        Physically remove deleted chunks from an index.
+
+        Returns:
+            int: Number of rows dropped
+        """
+        dropped = self._get_index(index_name).compact()
+        if dropped:
+            logger.info(f"Compacted index {index_name}: dropped {dropped} deleted rows")
+        return dropped
+
+    def _compact_if_needed(self, index: _LocalIndex) -> None:
+        if index.needs_compaction():
+            index.compact()
+
+    def get_rebuild_status(self, index_name: str) -> Optional[Dict[str, Any]]:
+        shadow_path = os.path.join(self.root_path, REBUILD_DIR_PREFIX + index_name)
+        if os.path.exists(os.path.join(shadow_path, META_FILE)):
+            with open(os.path.join(shadow_path, META_FILE), encoding="utf-8") as f:
+                return json.load(f).get("rebuild")
+        return self._get_index(index_name).meta.get("rebuild")
+
+    def rebuild_index(
+        self,
+        index_name: str,
+        embedding_model: BaseEmbedding,
+        embedding_dim: Optional[int] = None,
+        index_profile: Optional[str] = None,
+        batch_size: int = DEFAULT_CHUNK_BATCH_SIZE,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Re-embed an index into a hidden shadow directory and swap it in. The checkpoint lives in the shadow
+        meta file; the final catch-up and the directory swap run under the index lock, so writes made during
+        the copy are not lost.
+        """
+        index = self._get_index(index_name)
+        model_name = ElasticSearchCore._embedding_model_name(embedding_model)
+        shadow_path = os.path.join(self.root_path, REBUILD_DIR_PREFIX + index_name)
+
+        shadow: Optional[_LocalIndex] = None
+        if os.path.exists(os.path.join(shadow_path, META_FILE)):
+            shadow = _LocalIndex.load(shadow_path)
+            if (shadow.meta.get("rebuild") or {}).get("embedding_model") != model_name:
+                shutil.rmtree(shadow_path)
+                shadow = None
+        elif os.path.exists(shadow_path):
+            shutil.rmtree(shadow_path)
+        if shadow is None:
+            dtype = LOCAL_VECTOR_PROFILES.get(index_profile) if index_profile else index.dtype.name
+            if dtype is None:
+                raise ValueError(f"Unsupported vector index profile: {index_profile}")
+            shadow = _LocalIndex.create(
+                shadow_path, embedding_dim or getattr(embedding_model, "embedding_dim", None) or index.dim, dtype)
+            shadow.meta["rebuild"] = {"embedding_model": model_name, "cursor": None, "copied": 0}
+        checkpoint = shadow.meta["rebuild"]
+
+        def copy(entries: List[Tuple[str, Dict[str, Any]]]) -> None:
+            documents = [{**chunk, "embedding_model_name": model_name} for _, chunk in entries]
+            embeddings = self._get_document_embeddings(embedding_model, [doc.get("content") or "" for doc in documents])
+            shadow.append(documents, np.asarray(embeddings, dtype=np.float32), [doc_id for doc_id, _ in entries])
+
+        def save(**updates: Any) -> None:
+            checkpoint.update(updates, updated=int(time.time() * 1000))
+            shadow._write_meta()
+
+        try:
+            pending = self._sorted_entries(index_name, position=decode_cursor(checkpoint["cursor"]))
+            save(state="copying", total=checkpoint["copied"] + len(pending), error=None)
+            for start in range(0, len(pending), max(batch_size, 1)):
+                batch = pending[start:start + max(batch_size, 1)]
+                copy(batch)
+                save(copied=checkpoint["copied"] + len(batch), cursor=self._entry_cursor(batch[-1]))
+                if progress_callback is not None:
+                    progress_callback(checkpoint["copied"], checkpoint["total"])
+
+            save(state="reconciling")
+            with self._lock, index.writing():
+                live = dict(index.live_entries())
+                # Chunks updated in place since they were copied keep their document id, compare their content too
+                missing = [(doc_id, chunk) for doc_id, chunk in live.items()
+                           if doc_id not in shadow.doc_rows
+                           or ElasticSearchCore._rebuild_signature({"_source": chunk})
+                           != ElasticSearchCore._rebuild_signature({"_source": shadow.chunks[shadow.doc_rows[doc_id]]})]
+                extra = [row for doc_id, row in shadow.doc_rows.items() if doc_id not in live]
+                if missing:
+                    copy(missing)
+                shadow.tombstone(extra)
+                save(state="completed")
+
+                # Move the old directory aside before the shadow takes its name
+                path = self._index_path(index_name)
+                retired_path = shadow_path + ".old"
+                os.replace(path, retired_path)
+                os.replace(shadow_path, path)
+                shutil.rmtree(retired_path)
+                self._indices[index_name] = _LocalIndex.load(path)
+        except Exception as e:
+            save(state="failed", error=str(e))
+            raise
+        logger.info(f"Rebuilt {index_name} with {model_name}")
+        return {"index": index_name, "copied": len(missing), "deleted": len(extra)}
+
+    # ---- DOCUMENT OPERATIONS ----
+
+    def vectorize_documents(
+        self,
+        index_name: str,
+        embedding_model: BaseEmbedding,
+        documents: List[Dict[str, Any]],
+        batch_size: int = 64,
+        content_field: str = "content",
+    ) -> int:
+        logger.info(f"Indexing {len(documents)} chunks to {index_name}")
+        if not documents:
+            return 0
+
+        index = self._get_index(index_name)
+        processed_docs = ElasticSearchCore._preprocess_documents(documents, content_field)
+        indexed = 0
+        for start in range(0, len(processed_docs), max(batch_size, 1)):
+            batch = processed_docs[start:start + max(batch_size, 1)]
+            try:
+                embeddings = self._get_document_embeddings(
+                    embedding_model, [doc[content_field] for doc in batch])
+                for doc in batch:
+                    doc.pop("embedding", None)
+                    doc.setdefault("embedding_model_name", embedding_model.embedding_model_name)
+                index.append(batch, np.asarray(embeddings, dtype=np.float32))
+                indexed += len(batch)
+            except Exception as e:
+                logger.error(f"Failed to index batch starting at {start} into {index_name}: {e}")
+        logger.info(f"Local insert completed: {indexed} chunks indexed.")
+        return indexed
+
+    def _get_document_embeddings(self, embedding_model: BaseEmbedding, inputs: List[str]) -> List[List[float]]:
+        if self.embedding_cache is not None:
+            return self.embedding_cache.get_embeddings(embedding_model, inputs)
+        return embedding_model.get_embeddings(inputs)
+
+    def delete_documents(self, index_name: str, path_or_url: str) -> int:
+        try:
+            index = self._get_index(index_name)
+            with index.writing():
+                rows = [row for row, chunk in enumerate(index.chunks)
+                        if chunk is not None and chunk.get("path_or_url") == path_or_url]
+                index.tombstone(rows)
+                self._compact_if_needed(index)
+            logger.info(
+                f"Successfully deleted {len(rows)} documents with path_or_url: {path_or_url} from index: {index_name}")
+            return len(rows)
+        except Exception as e:
+            logger.error(f"Error deleting documents: {str(e)}")
+            return 0
+
+    def reindex_document(
+        self,
+        index_name: str,
+        embedding_model: BaseEmbedding,
+        path_or_url: str,
+        documents: List[Dict[str, Any]],
+        batch_size: int = 64,
+        content_field: str = "content",
+    ) -> Dict[str, int]:
+        """
+        Replace the indexed chunks of one document with a new version, embedding only the chunks that changed.
+        Unchanged chunks are rewritten with their stored vectors when their file-level metadata changed.
+        """
+        index = self._get_index(index_name)
+        # Chunks carry their document id as "_id" through the diff
+        added, removed, unchanged = diff_chunks(
+            ({**chunk, "_id": doc_id} for doc_id, chunk in self._sorted_entries(index_name, path_or_url)),
+            documents, content_field)
+        logger.info(
+            f"Re-indexing {path_or_url} in {index_name}: {len(added)} added, {len(removed)} removed, "
+            f"{len(unchanged)} unchanged chunks")
+
+        indexed = self.vectorize_documents(index_name, embedding_model, added, batch_size, content_field)
+        result = {"indexed": indexed, "deleted": 0, "unchanged": len(unchanged)}
+        if indexed < len(added):
+            logger.warning(
+                f"Only {indexed} of {len(added)} new chunks of {path_or_url} were indexed, keeping the previous version")
+            return result
+
+        version_fields = ElasticSearchCore._document_version_fields(documents, content_field)
+        stale = [chunk for chunk in unchanged
+                 if any(chunk.get(name) != value for name, value in version_fields.items())]
+        with index.writing():
+            rows = [index.doc_rows[chunk["_id"]] for chunk in removed if chunk["_id"] in index.doc_rows]
+            index.tombstone(rows)
+            result["deleted"] = len(rows)
+            stale = [chunk for chunk in stale if chunk["_id"] in index.doc_rows]
+            if stale:
+                stale_rows = [index.doc_rows[chunk["_id"]] for chunk in stale]
+                index.append([{**{key: value for key, value in chunk.items() if key != "_id"}, **version_fields}
+                              for chunk in stale],
+                             np.stack([index.vector(row) for row in stale_rows]),
+                             [chunk["_id"] for chunk in stale])
+            self._compact_if_needed(index)
+        return result
+
+    def count_documents(self, index_name: str) -> int:
+        try:
+            return len(self._get_index(index_name).doc_lens)
+        except Exception as e:
+            logger.error(f"Error counting documents: {str(e)}")
+            return 0
+
+    def _sorted_entries(
+        self, index_name: str, path_or_url: Optional[str] = None, position: Optional[Dict[str, Any]] = None
+    ) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Live (document id, chunk) pairs in the same stable "id" order as the Elasticsearch core, ties broken by
+        document id, starting after the position of a cursor from _entry_cursor
+        """
+        entries = [(doc_id, chunk) for doc_id, chunk in self._get_index(index_name).live_entries()
+                   if not path_or_url or chunk.get("path_or_url") == path_or_url]
+        entries.sort(key=lambda entry: (str(entry[1]["id"]), entry[0]))
+        if position is not None:
+            after = (str(position["after_id"]), position.get("after_doc_id"))
+            if after[1] is None:
+                # Cursor issued before ties were broken by document id
+                entries = [entry for entry in entries if str(entry[1]["id"]) > after[0]]
+            else:
+                entries = [entry for entry in entries if (str(entry[1]["id"]), entry[0]) > after]
+        return entries
+
+    @staticmethod
+    def _entry_cursor(entry: Tuple[str, Dict[str, Any]]) -> str:
+        return encode_cursor({"after_id": str(entry[1]["id"]), "after_doc_id": entry[0]})
+
+    def get_index_chunks(
+        self,
+        index_name: str,
+        page: Optional[int] = None,
+        page_size: Optional[int] = None,
+        path_or_url: Optional[str] = None,
+        cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        paginate = page_size is not None and (page is not None or cursor is not None)
+        position = decode_cursor(cursor)
+        try:
+            total = len(self._sorted_entries(index_name, path_or_url))
+            entries = self._sorted_entries(index_name, path_or_url, position)
+        except KeyError:
+            logger.info(f"Index {index_name} not found when fetching chunks")
+            total, entries = 0, []
+
+        next_cursor = None
+        if paginate and entries:
+            safe_page_size = max(page_size, 1)
+            offset = (page - 1) * safe_page_size if position is None and page and page > 1 else 0
+            entries = entries[offset:offset + safe_page_size]
+            if len(entries) == safe_page_size:
+                next_cursor = self._entry_cursor(entries[-1])
+        return {
+            "chunks": [chunk.copy() for _, chunk in entries],
+            "total": total,
+            "page": page if paginate else None,
+            "page_size": page_size if paginate else None,
+            "next_cursor": next_cursor,
+        }
+
+    def iter_index_chunks(
+        self,
+        index_name: str,
+        path_or_url: Optional[str] = None,
+        batch_size: int = DEFAULT_CHUNK_BATCH_SIZE,
+        cursor: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        for _, chunk in self._sorted_entries(index_name, path_or_url, decode_cursor(cursor)):
+            yield chunk.copy()
+
+    def _resolve_row(self, index: _LocalIndex, chunk_id: str) -> int:
+        """Row of a chunk by document id, falling back to the first row with that stored "id" """
+        row = index.doc_rows.get(str(chunk_id))
+        if row is None:
+            rows = index.id_rows.get(str(chunk_id))
+            if not rows:
+                raise KeyError(f"Chunk {chunk_id} not found")
+            row = min(rows)
+        return row
+
+    def create_chunk(self, index_name: str, chunk: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Create a single chunk document. Chunks created without an "embedding" field are found by
+        accurate search only, like chunks indexed into Elasticsearch without a vector.
+        """
+        try:
+            index = self._get_index(index_name)
+            payload = chunk.copy()
+            vector = payload.pop("embedding", None)
+            payload.setdefault("id", f"{int(time.time())}_{hash(payload.get('content', ''))}"[:20])
+            if "content" in payload:
+                payload["content_hash"] = content_hash(payload["content"])
+            with index.writing():
+                # The chunk id is the document id, as when Elasticsearch indexes with an explicit _id
+                result = "updated" if str(payload["id"]) in index.doc_rows else "created"
+                index.append([payload], np.asarray(vector if vector is not None else np.zeros(index.dim)),
+                             [str(payload["id"])])
+            logger.info("Created chunk %s in index %s", payload["id"], index_name)
+            return {"id": payload["id"], "result": result, "version": None}
+        except Exception as exc:
+            logger.error("Error creating chunk in index %s: %s", index_name, exc, exc_info=True)
+            raise
+
+    def update_chunk(self, index_name: str, chunk_id: str, chunk_updates: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Update an existing chunk document. The stored embedding is kept, as with a partial update in
+        Elasticsearch, unless chunk_updates carries a new "embedding".
+        """
+        try:
+            index = self._get_index(index_name)
+            updates = chunk_updates.copy()
+            vector = updates.pop("embedding", None)
+            with index.writing():
+                row = self._resolve_row(index, chunk_id)
+                updated = {**index.chunks[row], **updates, "id": index.chunks[row]["id"]}
+                if "content" in updates:
+                    updated["content_hash"] = content_hash(updates["content"])
+                index.append([updated], np.asarray(vector) if vector is not None else index.vector(row),
+                             [index.doc_ids[row]])
+                self._compact_if_needed(index)
+            logger.info("Updated chunk %s in index %s", chunk_id, index_name)
+            return {"id": updated["id"], "result": "updated", "version": None}
+        except Exception as exc:
+            logger.error("Error updating chunk %s in index %s: %s", chunk_id, index_name, exc, exc_info=True)
+            raise
+
+    def delete_chunk(self, index_name: str, chunk_id: str) -> bool:
+        try:
+            index = self._get_index(index_name)
+            with index.writing():
+                index.tombstone([self._resolve_row(index, chunk_id)])
+                self._compact_if_needed(index)
+            logger.info("Deleted chunk %s in index %s", chunk_id, index_name)
+            return True
+        except KeyError:
+            logger.warning("Chunk %s not found in index %s", chunk_id, index_name)
+            return False
+
+    def search(self, index_name: str, query: Dict[str, Any]) -> Dict[str, Any]:
+        if "aggs" in query or "aggregations" in query:
+            raise ValueError("Aggregations are not supported by the local vector store")
+        excludes = set(query.get("_source", {}).get("excludes", [])) if isinstance(query.get("_source"), dict) else set()
+        hits = []
+        for name in index_name.split(","):
+            hits.extend(
+                {"_index": name, "_id": doc_id, "_score": 1.0,
+                 "_source": {key: value for key, value in chunk.items() if key not in excludes}}
+                for doc_id, chunk in self._sorted_entries(name)
+                if self._matches(query.get("query", {"match_all": {}}), chunk)
+            )
+        start = query.get("from", 0)
+        return {"hits": {"total": {"value": len(hits), "relation": "eq"},
+                         "hits": hits[start:start + query.get("size", 10)]}}
+
+    def multi_search(self, body: List[Dict[str, Any]], index_name: str) -> Dict[str, Any]:
+        responses = []
+        for header, query in zip(body[::2], body[1::2]):
+            try:
+                responses.append(self.search(header.get("index", index_name), query))
+            except Exception as e:
+                responses.append({"error": {"reason": str(e)}})
+        return {"responses": responses}
+
+    @staticmethod
+    def _matches(query: Dict[str, Any], chunk: Dict[str, Any]) -> bool:
+        """Evaluate the supported query DSL subset against one chunk"""
+        (query_type, clause), = query.items()
+        if query_type == "match_all":
+            return True
+        if query_type in ("term", "terms"):
+            (field, expected), = clause.items()
+            if query_type == "term":
+                expected = [expected.get("value") if isinstance(expected, dict) else expected]
+            return chunk.get(field) in expected
+        if query_type == "bool":
+            def as_list(key: str) -> List[Dict[str, Any]]:
+                queries = clause.get(key, [])
+                return [queries] if isinstance(queries, dict) else queries
+
+            must = as_list("must") + as_list("filter")
+            should = as_list("should")
+            must_not = as_list("must_not")
+            return (all(LocalVectorCore._matches(q, chunk) for q in must)
+                    and not any(LocalVectorCore._matches(q, chunk) for q in must_not)
+                    and (not should or any(LocalVectorCore._matches(q, chunk) for q in should)))
+        raise ValueError(f"Query type {query_type} is not supported by the local vector store")
+
+    # ---- SEARCH OPERATIONS ----
+
+    def _merge_top_k(
+        self, index_names: List[str], top_k: int, scorer
+    ) -> List[Dict[str, Any]]:
+        candidates = []
+        for index_name in index_names:
+            for score, chunk in scorer(self._get_index(index_name)):
+                candidates.append({"score": score, "document": chunk.copy(), "index": index_name})
+        return heapq.nlargest(top_k, candidates, key=lambda result: result["score"])
+
+    def accurate_search(self, index_names: List[str], query_text: str, top_k: int = 5) -> List[Dict[str, Any]]:
+        return self._merge_top_k(index_names, top_k, lambda index: index.bm25_top_k(query_text, top_k))
+
+    def semantic_search(
+        self, index_names: List[str], query_text: str, embedding_model: BaseEmbedding, top_k: int = 5
+    ) -> List[Dict[str, Any]]:
+        query_vector = self._get_query_vector(embedding_model, query_text)
+        return self._merge_top_k(index_names, top_k, lambda index: index.cosine_top_k(query_vector, top_k))
+
+    def hybrid_search(
+        self,
+        index_names: List[str],
+        query_text: str,
+        embedding_model: BaseEmbedding,
+        top_k: int = 5,
+        weight_accurate: float = 0.3,
+        fusion: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        fusion = ElasticSearchCore._check_fusion(fusion or self.hybrid_fusion)
+        # Same wider per-leg window as the Elasticsearch core
+        window_size = top_k * 2
+        accurate_results = self.accurate_search(index_names, query_text, window_size)
+        semantic_results = self.semantic_search(index_names, query_text, embedding_model, window_size)
+        if fusion == HYBRID_FUSION_RRF:
+            results = ElasticSearchCore._fuse_rrf(accurate_results, semantic_results, weight_accurate)
+        else:
+            results = ElasticSearchCore._fuse_weighted(accurate_results, semantic_results, weight_accurate)
+        results.sort(key=lambda x: x["score"], reverse=True)
+        return results[:top_k]
+
+    def _get_query_vector(self, embedding_model: BaseEmbedding, query_text: str) -> np.ndarray:
+        if self.query_embedding_cache is not None:
+            vector = self.query_embedding_cache.get_embedding(embedding_model, query_text, self.embedding_coalescer)
+        else:
+            vector = embed_query(embedding_model, query_text, self.embedding_coalescer)
+        return np.asarray(vector, dtype=np.float32)
+
+    # ---- STATISTICS AND MONITORING ----
+
+    def _document_summaries(self, index_name: str) -> List[Dict[str, Any]]:
+        summaries: Dict[str, Dict[str, Any]] = {}
+        for chunk in self._get_index(index_name).live_chunks():
+            path_or_url = chunk.get("path_or_url")
+            if path_or_url is None:
+                continue
+            summary = summaries.get(path_or_url)
+            if summary is None:
+                summaries[path_or_url] = {
+                    "path_or_url": path_or_url,
+                    "filename": chunk.get("filename", ""),
+                    "file_size": chunk.get("file_size", 0),
+                    "create_time": chunk.get("create_time"),
+                    "chunk_count": 1,
+                }
+            else:
+                summary["chunk_count"] += 1
+        return list(summaries.values())
+
+    def list_documents(
+        self,
+        index_name: str,
+        page_size: int = DEFAULT_DOCUMENT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+        sort_by: str = "create_time",
+        sort_order: str = "desc",
+        path_or_urls: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        position = ElasticSearchCore._decode_document_cursor(cursor, sort_by, sort_order)
+        documents = self._document_summaries(index_name)
+        if path_or_urls is not None:
+            wanted = set(path_or_urls)
+            documents = [doc for doc in documents if doc["path_or_url"] in wanted]
+
+        # path_or_url breaks ties, documents missing the sort field go last in both orders
+        documents.sort(key=lambda doc: doc["path_or_url"])
+        present = [doc for doc in documents if doc.get(sort_by) is not None]
+        present.sort(key=lambda doc: doc[sort_by], reverse=sort_order == "desc")
+        documents = present + [doc for doc in documents if doc.get(sort_by) is None]
+
+        page_size = max(page_size, 1)
+        offset = position["offset"] if position else 0
+        page = documents[offset:offset + page_size]
+        next_cursor = None
+        if offset + page_size < len(documents):
+            next_cursor = encode_cursor({"offset": offset + page_size, "sort_by": sort_by, "sort_order": sort_order})
+        return {"documents": page, "total": len(documents), "next_cursor": next_cursor}
+
+    def get_documents_detail(self, index_name: str) -> List[Dict[str, Any]]:
+        try:
+            file_list = []
+            cursor = None
+            while True:
+                page = self.list_documents(
+                    index_name, page_size=DOCUMENT_CATALOG_BATCH_SIZE, cursor=cursor)
+                file_list.extend(page["documents"])
+                cursor = page["next_cursor"]
+                if not cursor:
+                    return file_list
+        except Exception as e:
+            logger.error(f"Error getting file list: {str(e)}")
+            return []
+
+    def get_indices_detail(
+        self, index_names: List[str], embedding_dim: Optional[int] = None
+    ) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        all_stats = {}
+        for index_name in index_names:
+            try:
+                index = self._get_index(index_name)
+                with index.lock:
+                    live_chunks = index.live_chunks()
+                    first_chunk = live_chunks[0] if live_chunks else {}
+                    all_stats[index_name] = {
+                        "base_info": {
+                            "doc_count": len({chunk.get("path_or_url") for chunk in live_chunks}),
+                            "chunk_count": len(live_chunks),
+                            "store_size": format_size(index.store_size()),
+                            "process_source": first_chunk.get("process_source", ""),
+                            "embedding_model": first_chunk.get("embedding_model_name", ""),
+                            "embedding_dim": embedding_dim or index.dim,
+                            "creation_date": index.meta["creation_date"],
+                            "update_date": index.meta["update_date"],
+                        },
+                        "search_performance": {
+                            "total_search_count": index.search_count,
+                            "hit_count": 0,
+                        },
+                    }
+            except Exception as e:
+                logger.error(f"Error getting stats for index {index_name}: {str(e)}")
+                all_stats[index_name] = {"error": str(e)}
+        return all_stats
@@ -0,0 +1,105 @@
+"""
+Query-embedding cache for search.
+
+Agents often re-issue the same query within a conversation, and users of one tenant ask similar questions, so
+query embeddings are cached in a bounded, TTL'd LRU keyed by (model name, dimension, normalized query).
+A repeated query then only costs the vector database round trip.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..core.models.embedding_cache import EmbeddingCache, normalize_text
+from ..core.models.embedding_coalescer import EmbeddingRequestCoalescer, embed_query
+
+
+DEFAULT_QUERY_CACHE_MAX_ENTRIES = 10000
+DEFAULT_QUERY_CACHE_TTL_S = 3600
+
+
+def normalize_query(query_text: str) -> str:
+    """Normalize a query so that trivially different spellings share one cache entry"""
+    return normalize_text(query_text).casefold()
+
+
+class QueryEmbeddingCache:
+    """
+    Bounded LRU of query embeddings with per-entry expiry.
+
+    Usage:
+        cache = QueryEmbeddingCache(max_entries=1000, ttl_seconds=600)
+        query_vector = cache.get_embedding(embedding_model, "what is nexent?")
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_QUERY_CACHE_MAX_ENTRIES,
+                 ttl_seconds: Optional[float] = DEFAULT_QUERY_CACHE_TTL_S):
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Tuple[str, Optional[int], str], Tuple[float, List[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    @staticmethod
+    def make_key(embedding_model: Any, query_text: str) -> Tuple[str, Optional[int], str]:
+        model_name, embedding_dim = EmbeddingCache.model_identity(embedding_model)
+        return model_name, embedding_dim, normalize_query(query_text)
+
+    def get(self, key: Tuple[str, Optional[int], str]) -> Optional[List[float]]:
+        """Return the cached vector for key, or None on a miss or an expired entry"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            expires_at, vector = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                self._expirations += 1
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return vector
+
+    def put(self, key: Tuple[str, Optional[int], str], vector: List[float]) -> None:
+        expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds else float("inf")
+        with self._lock:
+            self._entries[key] = (expires_at, vector)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def get_embedding(self, embedding_model: Any, query_text: str,
+                      coalescer: Optional[EmbeddingRequestCoalescer] = None) -> List[float]:
+        """Return the query embedding, calling the embedding model (through the coalescer if given) only on a miss"""
+        key = self.make_key(embedding_model, query_text)
+        vector = self.get(key)
+        if vector is None:
+            vector = embed_query(embedding_model, query_text, coalescer)
+            self.put(key, vector)
+        return vector
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+            }
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+            self._expirations = 0
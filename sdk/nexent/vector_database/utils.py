@@ -1,4 +1,9 @@
+import base64
+import hashlib
+import json
+from collections import defaultdict
 from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 def format_size(size_in_bytes):
     """Convert size in bytes to human readable format"""
@@ -84,4 +89,54 @@ def build_weighted_query(text, term_weights, field_weights=None, boost_factor=2.
         }
     }
 
-    return query_body
\ No newline at end of file
+    return query_body
+
+def encode_cursor(position: Dict[str, Any]) -> str:
+    """Encode a pagination position into an opaque, URL-safe cursor token"""
+    return base64.urlsafe_b64encode(json.dumps(position, separators=(",", ":")).encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Decode a cursor token produced by encode_cursor, raising ValueError if it is malformed"""
+    if not cursor:
+        return None
+    try:
+        position = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except (ValueError, UnicodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+    if not isinstance(position, dict):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return position
+
+
+def content_hash(text: Optional[str]) -> str:
+    """SHA-256 hex digest of a chunk's text, stored with the chunk to recognise it across document versions"""
+    return hashlib.sha256((text or "").encode("utf-8")).hexdigest()
+
+
+def diff_chunks(
+    existing: Iterable[Dict[str, Any]], documents: List[Dict[str, Any]], content_field: str = "content"
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Match the chunks of a new document version against the indexed chunks of the previous one by content hash.
+
+    Hashes are compared as a multiset, so text repeated within a document (headers, boilerplate) is kept exactly
+    as many times as the new version contains it. Indexed chunks without a stored hash are hashed on the fly.
+
+    Returns:
+        (new documents to embed, indexed chunks to delete, indexed chunks that stay unchanged)
+    """
+    indexed_by_hash: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    for chunk in existing:
+        indexed_by_hash[chunk.get("content_hash") or content_hash(chunk.get(content_field))].append(chunk)
+
+    added: List[Dict[str, Any]] = []
+    unchanged: List[Dict[str, Any]] = []
+    for doc in documents:
+        matches = indexed_by_hash.get(content_hash(doc.get(content_field)))
+        if matches:
+            unchanged.append(matches.pop())
+        else:
+            added.append(doc)
+    removed = [chunk for chunks in indexed_by_hash.values() for chunk in chunks]
+    return added, removed, unchanged
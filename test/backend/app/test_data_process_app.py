@@ -116,11 +116,20 @@ class _ServiceStub:
             raise RuntimeError("oops")
         return [{"id": "x"}]
 
+    async def get_index_files_status(self, index_name: str):
+        if index_name == "boom":
+            raise RuntimeError("oops")
+        return {"/p1": {"state": "COMPLETED", "latest_task_id": "2", "original_filename": "f1.txt",
+                        "source_type": "local"}}
+
     async def get_task_details(self, task_id: str):
         if task_id == "missing":
             return None
         return {"id": task_id, "ok": True}
 
+    async def get_actor_pool_stats(self):
+        return {"min_actors": 0, "max_actors": 4, "lanes": {"text": {"actors": 1, "busy": 1, "utilization": 0.25}}}
+
     async def filter_important_image(self, image_url: str, positive_prompt: str, negative_prompt: str):
         if image_url == "err":
             raise RuntimeError("bad")
@@ -363,6 +372,32 @@ def test_get_index_tasks_success_and_error():
     assert err.status_code == 500
 
 
+def test_get_index_files_status_success_and_error():
+    app = _build_app()
+    client = TestClient(app)
+    ok = client.get("/tasks/indices/idx/files")
+    assert ok.status_code == 200
+    assert ok.json()["/p1"]["state"] == "COMPLETED"
+    err = client.get("/tasks/indices/boom/files")
+    assert err.status_code == 500
+
+
+def test_get_actor_pool_stats_success_and_error(monkeypatch):
+    app = _build_app()
+    client = TestClient(app)
+    resp = client.get("/tasks/actor_pool")
+    assert resp.status_code == 200
+    assert resp.json()["lanes"]["text"]["busy"] == 1
+
+    from backend.apps import data_process_app as app_module
+
+    async def boom():
+        raise RuntimeError("ray down")
+    monkeypatch.setattr(app_module.service, "get_actor_pool_stats", boom)
+    resp = client.get("/tasks/actor_pool")
+    assert resp.status_code == 500
+
+
 def test_get_task_details_success_and_404():
     app = _build_app()
     client = TestClient(app)
@@ -30,6 +30,13 @@ sys.modules['nexent.core.agents'] = MagicMock()
 sys.modules['nexent.core.agents.agent_model'] = MagicMock()
 sys.modules['nexent.core.models'] = MagicMock()
 sys.modules['nexent.core.models.embedding_model'] = MagicMock()
+sys.modules['nexent.core.models.embedding_cache'] = MagicMock()
+sys.modules['nexent.core.models.embedding_coalescer'] = MagicMock()
+sys.modules['nexent.vector_database.query_embedding_cache'] = MagicMock()
+sys.modules['nexent.vector_database.index_stats_cache'] = MagicMock()
+sys.modules['nexent.vector_database.async_base'] = MagicMock()
+sys.modules['nexent.vector_database.async_elasticsearch_core'] = MagicMock()
+sys.modules['nexent.vector_database.local_core'] = MagicMock()
 sys.modules['nexent.core.models.stt_model'] = MagicMock()
 sys.modules['nexent.core.models.tts_model'] = MagicMock()
 sys.modules['nexent.core.nlp'] = MagicMock()
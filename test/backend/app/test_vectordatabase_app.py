@@ -63,6 +63,7 @@ patch('backend.database.client.db_client').start()
 
 # Mock Elasticsearch to prevent connection errors
 patch('elasticsearch.Elasticsearch', return_value=MagicMock()).start()
+patch('elasticsearch.AsyncElasticsearch', return_value=MagicMock()).start()
 
 # Create a mock for consts.model and patch it before any imports.
 # For models used in FastAPI endpoints, provide real Pydantic classes so that
@@ -545,6 +546,98 @@ async def test_create_index_documents_validation_exception(vdb_core_mock, auth_d
         mock_index.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_stream_index_documents_segment_ack(vdb_core_mock, auth_data):
+    """
+    Test streaming a non-final NDJSON segment.
+    Verifies that the raw body is handed to the service and its acknowledgement returned, without an embedding model.
+    """
+    with patch("backend.apps.vectordatabase_app.get_vector_db_core", return_value=vdb_core_mock), \
+            patch("backend.apps.vectordatabase_app.get_current_user_id", return_value=(auth_data["user_id"], auth_data["tenant_id"])), \
+            patch("backend.apps.vectordatabase_app.ElasticSearchService.ingest_document_segment") as mock_ingest, \
+            patch("backend.apps.vectordatabase_app.get_embedding_model") as mock_get_model:
+
+        body = b'{"content": "a"}\n{"content": "b"}\n'
+        mock_ingest.return_value = {"session_id": "s1", "next_offset": 2, "committed": False}
+
+        response = client.post(
+            "/indices/test_index/documents/stream", params={"session_id": "s1", "offset": 0}, content=body,
+            headers={**auth_data["auth_header"], "Content-Type": "application/x-ndjson"})
+
+        assert response.status_code == 200
+        assert response.json() == {"session_id": "s1", "next_offset": 2, "committed": False}
+        mock_ingest.assert_called_once_with(None, "test_index", "s1", 0, body, False, ANY, False)
+        mock_get_model.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_stream_index_documents_offset_conflict(vdb_core_mock, auth_data):
+    """
+    Test streaming a segment past the offset the session expects.
+    Verifies that the endpoint answers 409 with the offset to resume from.
+    """
+    from consts.exceptions import IngestOffsetConflictError
+
+    with patch("backend.apps.vectordatabase_app.get_vector_db_core", return_value=vdb_core_mock), \
+            patch("backend.apps.vectordatabase_app.get_current_user_id", return_value=(auth_data["user_id"], auth_data["tenant_id"])), \
+            patch("backend.apps.vectordatabase_app.ElasticSearchService.ingest_document_segment") as mock_ingest:
+
+        mock_ingest.side_effect = IngestOffsetConflictError(256)
+
+        response = client.post(
+            "/indices/test_index/documents/stream", params={"session_id": "s1", "offset": 512}, content=b"",
+            headers=auth_data["auth_header"])
+
+        assert response.status_code == 409
+        assert response.json()["detail"]["next_offset"] == 256
+
+
+@pytest.mark.asyncio
+async def test_stream_index_documents_commit_busy(vdb_core_mock, auth_data):
+    """
+    Test committing a streamed upload while all commit slots are taken.
+    Verifies that the endpoint answers 429 with a Retry-After header.
+    """
+    from consts.exceptions import LimitExceededError
+
+    with patch("backend.apps.vectordatabase_app.get_vector_db_core", return_value=vdb_core_mock), \
+            patch("backend.apps.vectordatabase_app.get_current_user_id", return_value=(auth_data["user_id"], auth_data["tenant_id"])), \
+            patch("backend.apps.vectordatabase_app.ElasticSearchService.ingest_document_segment") as mock_ingest, \
+            patch("backend.apps.vectordatabase_app.get_embedding_model", return_value=MagicMock()):
+
+        mock_ingest.side_effect = LimitExceededError("busy")
+
+        response = client.post(
+            "/indices/test_index/documents/stream", params={"session_id": "s1", "offset": 0, "final": "true"},
+            content=b'{"content": "a"}\n', headers=auth_data["auth_header"])
+
+        assert response.status_code == 429
+        assert "Retry-After" in response.headers
+
+
+@pytest.mark.asyncio
+async def test_stream_index_documents_write_blocked(vdb_core_mock, auth_data):
+    """
+    Test committing a streamed upload while a rebuild write blocks the index.
+    Verifies that the endpoint answers 503 so the forward task resends the final segment.
+    """
+    from nexent.vector_database.elasticsearch_core import IndexWriteBlockedError
+
+    with patch("backend.apps.vectordatabase_app.get_vector_db_core", return_value=vdb_core_mock), \
+            patch("backend.apps.vectordatabase_app.get_current_user_id", return_value=(auth_data["user_id"], auth_data["tenant_id"])), \
+            patch("backend.apps.vectordatabase_app.ElasticSearchService.ingest_document_segment") as mock_ingest, \
+            patch("backend.apps.vectordatabase_app.get_embedding_model", return_value=MagicMock()):
+
+        mock_ingest.side_effect = IndexWriteBlockedError("blocked")
+
+        response = client.post(
+            "/indices/test_index/documents/stream", params={"session_id": "s1", "offset": 0, "final": "true"},
+            content=b'{"content": "a"}\n', headers=auth_data["auth_header"])
+
+        assert response.status_code == 503
+        assert "Retry-After" in response.headers
+
+
 @pytest.mark.asyncio
 async def test_get_index_files_success(vdb_core_mock):
     """
@@ -577,6 +670,39 @@ async def test_get_index_files_success(vdb_core_mock):
             assert mock_list_files.called
 
 
+@pytest.mark.asyncio
+async def test_get_index_files_paginated(vdb_core_mock):
+    """
+    Test listing one page of index files.
+    Verifies that paging options are forwarded and total/next_cursor are returned.
+    """
+    with patch("backend.apps.vectordatabase_app.get_vector_db_core", return_value=vdb_core_mock), \
+            patch("backend.apps.vectordatabase_app.ElasticSearchService.list_files") as mock_list_files:
+
+        index_name = "test_index"
+        mock_list_files.return_value = {
+            "files": [{"path_or_url": "file1.txt", "status": "COMPLETED"}],
+            "total": 5,
+            "next_cursor": "cursor-2",
+        }
+
+        response = client.get(
+            f"/indices/{index_name}/files",
+            params={"page_size": 1, "sort_by": "file_size", "sort_order": "asc"}
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "status": "success",
+            "files": [{"path_or_url": "file1.txt", "status": "COMPLETED"}],
+            "total": 5,
+            "next_cursor": "cursor-2",
+        }
+        mock_list_files.assert_called_once_with(
+            index_name, include_chunks=False, vdb_core=ANY,
+            page_size=1, cursor=None, sort_by="file_size", sort_order="asc")
+
+
 @pytest.mark.asyncio
 async def test_get_index_files_exception(vdb_core_mock):
     """
@@ -703,7 +829,7 @@ async def test_get_index_chunks_success(vdb_core_mock):
     Verifies that the endpoint forwards query params and returns the service payload.
     """
     with patch("backend.apps.vectordatabase_app.get_vector_db_core", return_value=vdb_core_mock), \
-            patch("backend.apps.vectordatabase_app.ElasticSearchService.get_index_chunks") as mock_get_chunks:
+            patch("backend.apps.vectordatabase_app.ElasticSearchService.get_index_chunks_async") as mock_get_chunks:
 
         index_name = "test_index"
         expected_response = {
@@ -729,6 +855,7 @@ async def test_get_index_chunks_success(vdb_core_mock):
             page_size=50,
             path_or_url="/foo",
             vdb_core=ANY,
+            cursor=None,
         )
 
 
@@ -739,7 +866,7 @@ async def test_get_index_chunks_error(vdb_core_mock):
     Ensures the endpoint maps the exception to HTTP 500.
     """
     with patch("backend.apps.vectordatabase_app.get_vector_db_core", return_value=vdb_core_mock), \
-            patch("backend.apps.vectordatabase_app.ElasticSearchService.get_index_chunks") as mock_get_chunks:
+            patch("backend.apps.vectordatabase_app.ElasticSearchService.get_index_chunks_async") as mock_get_chunks:
 
         index_name = "test_index"
         mock_get_chunks.side_effect = Exception("Chunk failure")
@@ -754,6 +881,7 @@ async def test_get_index_chunks_error(vdb_core_mock):
             page_size=None,
             path_or_url=None,
             vdb_core=ANY,
+            cursor=None,
         )
 
 
@@ -1471,7 +1599,7 @@ async def test_hybrid_search_success(vdb_core_mock, auth_data):
     # Setup mocks
     with patch("backend.apps.vectordatabase_app.get_vector_db_core", return_value=vdb_core_mock), \
             patch("backend.apps.vectordatabase_app.get_current_user_id", return_value=(auth_data["user_id"], auth_data["tenant_id"])), \
-            patch("backend.apps.vectordatabase_app.ElasticSearchService.search_hybrid") as mock_search_hybrid:
+            patch("backend.apps.vectordatabase_app.ElasticSearchService.search_hybrid_async") as mock_search_hybrid:
 
         expected_response = {
             "results": [
@@ -1523,7 +1651,7 @@ async def test_hybrid_search_value_error(vdb_core_mock, auth_data):
     # Setup mocks
     with patch("backend.apps.vectordatabase_app.get_vector_db_core", return_value=vdb_core_mock), \
             patch("backend.apps.vectordatabase_app.get_current_user_id", return_value=(auth_data["user_id"], auth_data["tenant_id"])), \
-            patch("backend.apps.vectordatabase_app.ElasticSearchService.search_hybrid") as mock_search_hybrid:
+            patch("backend.apps.vectordatabase_app.ElasticSearchService.search_hybrid_async") as mock_search_hybrid:
 
         mock_search_hybrid.side_effect = ValueError("Query text is required")
 
@@ -1554,7 +1682,7 @@ async def test_hybrid_search_exception(vdb_core_mock, auth_data):
     # Setup mocks
     with patch("backend.apps.vectordatabase_app.get_vector_db_core", return_value=vdb_core_mock), \
             patch("backend.apps.vectordatabase_app.get_current_user_id", return_value=(auth_data["user_id"], auth_data["tenant_id"])), \
-            patch("backend.apps.vectordatabase_app.ElasticSearchService.search_hybrid") as mock_search_hybrid:
+            patch("backend.apps.vectordatabase_app.ElasticSearchService.search_hybrid_async") as mock_search_hybrid:
 
         mock_search_hybrid.side_effect = Exception("Search execution failed")
 
@@ -0,0 +1,101 @@
+import importlib
+import json
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+
+class DictRedisClient:
+    def __init__(self):
+        self.store = {}
+        self.expirations = {}
+
+    def set(self, key, value, ex=None):
+        self.store[key] = value
+        self.expirations[key] = ex
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def delete(self, *keys):
+        for key in keys:
+            self.store.pop(key, None)
+
+
+@pytest.fixture
+def transport(monkeypatch):
+    fake_consts_const = types.ModuleType("consts.const")
+    fake_consts_const.DP_CHUNK_SEGMENT_BYTES = 1024 * 1024
+    fake_consts_const.DP_CHUNK_ZSTD_LEVEL = 3
+    fake_consts_const.DP_CHUNKS_TTL_S = 7200
+    monkeypatch.setitem(sys.modules, "consts", types.ModuleType("consts"))
+    monkeypatch.setitem(sys.modules, "consts.const", fake_consts_const)
+
+    # Bypass backend.data_process __init__, which pulls in Celery and Ray
+    project_root = Path(__file__).resolve().parents[3]
+    backend_pkg = types.ModuleType("backend")
+    backend_pkg.__path__ = [str(project_root / "backend")]
+    monkeypatch.setitem(sys.modules, "backend", backend_pkg)
+    backend_dp_pkg = types.ModuleType("backend.data_process")
+    backend_dp_pkg.__path__ = [str(project_root / "backend" / "data_process")]
+    monkeypatch.setitem(sys.modules, "backend.data_process", backend_dp_pkg)
+    monkeypatch.delitem(sys.modules, "backend.data_process.chunk_transport", raising=False)
+
+    return importlib.import_module("backend.data_process.chunk_transport")
+
+
+def _chunks(count):
+    return [{"content": f"第{i}段 chunk text " * 20, "metadata": {"page": i, "date": None}} for i in range(count)]
+
+
+def test_round_trip_across_segments(transport):
+    client = DictRedisClient()
+    chunks = _chunks(50)
+
+    stats = transport.write_chunks(client, "dp:t:chunks", chunks, segment_bytes=2048, ttl_s=60)
+
+    assert stats["chunks"] == 50
+    assert stats["segments"] > 1
+    assert set(client.expirations.values()) == {60}
+    stream = transport.open_chunks(client, "dp:t:chunks")
+    assert len(stream) == 50
+    assert list(stream) == chunks
+
+
+def test_not_ready_until_manifest_is_written(transport):
+    client = DictRedisClient()
+    transport.write_chunks(client, "dp:t:chunks", _chunks(3))
+    client.delete(transport.manifest_key("dp:t:chunks"))
+
+    assert transport.open_chunks(client, "dp:t:chunks") is None
+
+
+def test_legacy_json_value_is_read(transport):
+    client = DictRedisClient()
+    client.set("dp:t:chunks", json.dumps(_chunks(2), ensure_ascii=False).encode())
+
+    assert transport.open_chunks(client, "dp:t:chunks") == _chunks(2)
+
+
+def test_unreadable_manifest_and_missing_segment_raise(transport):
+    client = DictRedisClient()
+    client.set(transport.manifest_key("dp:bad:chunks"), b"not-msgpack\xc1")
+    with pytest.raises(ValueError):
+        transport.open_chunks(client, "dp:bad:chunks")
+
+    transport.write_chunks(client, "dp:t:chunks", _chunks(10), segment_bytes=512)
+    client.delete(transport.segment_key("dp:t:chunks", 1))
+    with pytest.raises(ValueError):
+        list(transport.open_chunks(client, "dp:t:chunks"))
+
+
+def test_delete_chunks_removes_every_key(transport):
+    client = DictRedisClient()
+    transport.write_chunks(client, "dp:t:chunks", _chunks(10), segment_bytes=512)
+    client.set("dp:other:chunks", b"[]")
+
+    transport.delete_chunks(client, "dp:t:chunks")
+
+    assert list(client.store) == ["dp:other:chunks"]
@@ -0,0 +1,100 @@
+import importlib
+import io
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+
+class TTLRedisClient:
+    def __init__(self):
+        self.store = {}
+        self.ttls = {}
+
+    def set(self, key, value, ex=None):
+        self.store[key] = value
+        self.ttls[key] = ex if ex is not None else -1
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def ttl(self, key):
+        return self.ttls.get(key, -2)
+
+
+class ClosingStream(io.BytesIO):
+    """Storage stream that records how it was read"""
+
+    opened = []
+
+    def __init__(self, data):
+        super().__init__(data)
+        self.reads = []
+        ClosingStream.opened.append(self)
+
+    def read(self, size=-1):
+        self.reads.append(size)
+        return super().read(size)
+
+
+@pytest.fixture
+def content_store(monkeypatch):
+    fake_consts_const = types.ModuleType("consts.const")
+    fake_consts_const.DP_CHUNK_SEGMENT_BYTES = 1024 * 1024
+    fake_consts_const.DP_CHUNK_ZSTD_LEVEL = 3
+    fake_consts_const.DP_CHUNKS_TTL_S = 7200
+    monkeypatch.setitem(sys.modules, "consts", types.ModuleType("consts"))
+    monkeypatch.setitem(sys.modules, "consts.const", fake_consts_const)
+    fake_attachment_db = types.ModuleType("database.attachment_db")
+    fake_attachment_db.open_file_stream = lambda source: ClosingStream(b"minio bytes") if source == "kb/a.pdf" else None
+    monkeypatch.setitem(sys.modules, "database", types.ModuleType("database"))
+    monkeypatch.setitem(sys.modules, "database.attachment_db", fake_attachment_db)
+
+    # Bypass backend.data_process __init__, which pulls in Celery and Ray
+    project_root = Path(__file__).resolve().parents[3]
+    backend_pkg = types.ModuleType("backend")
+    backend_pkg.__path__ = [str(project_root / "backend")]
+    monkeypatch.setitem(sys.modules, "backend", backend_pkg)
+    backend_dp_pkg = types.ModuleType("backend.data_process")
+    backend_dp_pkg.__path__ = [str(project_root / "backend" / "data_process")]
+    monkeypatch.setitem(sys.modules, "backend.data_process", backend_dp_pkg)
+    for name in ("backend.data_process.chunk_transport", "backend.data_process.content_store"):
+        monkeypatch.delitem(sys.modules, name, raising=False)
+
+    return importlib.import_module("backend.data_process.content_store")
+
+
+def test_hash_file_is_the_same_for_local_and_minio_bytes(content_store, tmp_path):
+    f = tmp_path / "a.pdf"
+    f.write_bytes(b"minio bytes")
+
+    assert content_store.hash_file(str(f), "local") == content_store.hash_file("kb/a.pdf", "minio")
+    # The object is streamed block by block and closed, never read whole
+    stream = ClosingStream.opened[-1]
+    assert stream.closed and all(size == content_store.HASH_BLOCK_BYTES for size in stream.reads)
+    with pytest.raises(FileNotFoundError):
+        content_store.hash_file("kb/missing.pdf", "minio")
+
+
+def test_content_key_depends_on_processing_params(content_store):
+    base = content_store.content_key("abc", "basic", 1536, 1024)
+
+    assert base.startswith("abc:")
+    assert base == content_store.content_key("abc", "basic", 1536, 1024)
+    assert base != content_store.content_key("abc", "by_title", 1536, 1024)
+    assert base != content_store.content_key("abc", "basic", 3000, 1024)
+    assert base != content_store.content_key("abd", "basic", 1536, 1024)
+
+
+def test_lookup_content_ignores_missing_and_expiring_entries(content_store):
+    from backend.data_process.chunk_transport import write_chunks
+    client = TTLRedisClient()
+    key = content_store.content_key("abc", "basic")
+
+    assert content_store.lookup_content(client, key) is None
+    write_chunks(client, content_store.content_chunks_key(key), [{"content": "c"}] * 4, ttl_s=3600)
+    assert content_store.lookup_content(client, key) == 4
+
+    write_chunks(client, content_store.content_chunks_key(key), [{"content": "c"}] * 4, ttl_s=60)
+    assert content_store.lookup_content(client, key) is None
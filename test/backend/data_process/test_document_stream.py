@@ -0,0 +1,44 @@
+import importlib
+import json
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture
+def document_stream(monkeypatch):
+    # Bypass backend.data_process __init__, which pulls in Celery and Ray
+    project_root = Path(__file__).resolve().parents[3]
+    backend_pkg = types.ModuleType("backend")
+    backend_pkg.__path__ = [str(project_root / "backend")]
+    monkeypatch.setitem(sys.modules, "backend", backend_pkg)
+    backend_dp_pkg = types.ModuleType("backend.data_process")
+    backend_dp_pkg.__path__ = [str(project_root / "backend" / "data_process")]
+    monkeypatch.setitem(sys.modules, "backend.data_process", backend_dp_pkg)
+    monkeypatch.delitem(sys.modules, "backend.data_process.document_stream", raising=False)
+
+    return importlib.import_module("backend.data_process.document_stream")
+
+
+def _documents(count):
+    return [{"content": f"第{i}段", "metadata": {"page": i}} for i in range(count)]
+
+
+def test_segments_cover_documents_and_only_the_last_is_final(document_stream):
+    segments = list(document_stream.iter_segments(iter(_documents(7)), 3))
+
+    assert [(s.offset, s.count, s.final) for s in segments] == [(0, 3, False), (3, 3, False), (6, 1, True)]
+    lines = b"".join(s.body for s in segments).splitlines()
+    assert [json.loads(line) for line in lines] == _documents(7)
+
+
+def test_full_last_segment_is_final(document_stream):
+    segments = list(document_stream.iter_segments(_documents(6), 3))
+
+    assert [(s.offset, s.count, s.final) for s in segments] == [(0, 3, False), (3, 3, True)]
+
+
+def test_no_documents_yield_no_segment(document_stream):
+    assert list(document_stream.iter_segments([], 3)) == []
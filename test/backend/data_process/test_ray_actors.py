@@ -23,7 +23,7 @@ def make_fake_ray_module_identity_decorator():
 
 
 class FakeDataProcessCore:
-    def __init__(self):
+    def __init__(self, **kwargs):
         self.calls = []
 
     def file_process(self, file_data, filename, chunking_strategy, **params):
@@ -43,8 +43,10 @@ class FakeRedisClient:
     def from_url(cls, url, decode_responses=False):
         return cls()
 
-    def set(self, key, value):
+    def set(self, key, value, ex=None):
         self.store[key] = value
+        if ex is not None:
+            self.expirations[key] = ex
 
     def get(self, key):
         return self.store.get(key)
@@ -140,6 +142,31 @@ def import_module(monkeypatch):
     # New defaults required by ray_actors import
     fake_consts_const.DEFAULT_EXPECTED_CHUNK_SIZE = 1024
     fake_consts_const.DEFAULT_MAXIMUM_CHUNK_SIZE = 1536
+    fake_consts_const.DP_CHUNK_SEGMENT_BYTES = 1024 * 1024
+    fake_consts_const.DP_CHUNK_ZSTD_LEVEL = 3
+    fake_consts_const.DP_CHUNKS_TTL_S = 7200
+    fake_consts_const.DP_CONTENT_DEDUP = True
+    fake_consts_const.DP_CONTENT_CACHE_TTL_S = 86400
+    fake_consts_const.DP_ACTOR_POOL_MIN_ACTORS = 0
+    fake_consts_const.DP_ACTOR_POOL_MAX_ACTORS = 4
+    fake_consts_const.DP_ACTOR_POOL_IDLE_TIMEOUT_S = 60
+    fake_consts_const.DP_ACTOR_LEASE_TTL_S = 120
+    fake_consts_const.DP_ACTOR_ACQUIRE_TIMEOUT_S = 3600
+    fake_consts_const.DP_LARGE_FILE_MB = 20
+    fake_consts_const.DP_PAGE_RANGE_PARALLEL = True
+    fake_consts_const.DP_PAGES_PER_RANGE = 32
+    fake_consts_const.DP_MIN_PAGES_TO_SPLIT = 64
+    fake_consts_const.DP_PAGE_RANGE_NUM_CPUS = 1
+    fake_consts_const.DP_EXCEL_STREAMING = True
+    fake_consts_const.DP_PARTITION_CACHE = "none"
+    fake_consts_const.DP_PARTITION_CACHE_PREFIX = "partition_cache"
+    fake_consts_const.DP_PARTITION_CACHE_DIR = "/tmp/partition_cache"
+    fake_consts_const.DP_PARTITION_CACHE_TTL_S = 604800
+    fake_consts_const.DP_TASK_REGISTRY = True
+    fake_consts_const.DP_TASK_RESULT_TTL_S = 604800
+    fake_consts_const.DP_FORWARD_SEGMENT_CHUNKS = 256
+    fake_consts_const.DP_FORWARD_SEGMENT_TIMEOUT_S = 60
+    fake_consts_const.DP_FORWARD_COMMIT_TIMEOUT_S = 600
     monkeypatch.setitem(sys.modules, "consts", fake_consts_pkg)
     monkeypatch.setitem(sys.modules, "consts.const", fake_consts_const)
 
@@ -201,7 +228,7 @@ def test_process_file_applies_chunk_sizes_from_model(monkeypatch):
     class RecorderCore:
         captured_params = None
 
-        def __init__(self):
+        def __init__(self, **kwargs):
             pass
 
         def file_process(self, file_data, filename, chunking_strategy, **params):
@@ -241,7 +268,7 @@ def test_process_file_no_model_omits_chunk_params(monkeypatch):
     class RecorderCore:
         captured_params = None
 
-        def __init__(self):
+        def __init__(self, **kwargs):
             pass
 
         def file_process(self, file_data, filename, chunking_strategy, **params):
@@ -276,7 +303,7 @@ def test_process_file_model_lookup_exception_uses_defaults(monkeypatch):
     class RecorderCore:
         captured_params = None
 
-        def __init__(self):
+        def __init__(self, **kwargs):
             pass
 
         def file_process(self, file_data, filename, chunking_strategy, **params):
@@ -378,6 +405,31 @@ def test_process_file_get_stream_none_raises(monkeypatch):
     # Provide defaults required by backend.data_process.ray_actors import
     fake_consts_const.DEFAULT_EXPECTED_CHUNK_SIZE = 1024
     fake_consts_const.DEFAULT_MAXIMUM_CHUNK_SIZE = 1536
+    fake_consts_const.DP_CHUNK_SEGMENT_BYTES = 1024 * 1024
+    fake_consts_const.DP_CHUNK_ZSTD_LEVEL = 3
+    fake_consts_const.DP_CHUNKS_TTL_S = 7200
+    fake_consts_const.DP_CONTENT_DEDUP = True
+    fake_consts_const.DP_CONTENT_CACHE_TTL_S = 86400
+    fake_consts_const.DP_ACTOR_POOL_MIN_ACTORS = 0
+    fake_consts_const.DP_ACTOR_POOL_MAX_ACTORS = 4
+    fake_consts_const.DP_ACTOR_POOL_IDLE_TIMEOUT_S = 60
+    fake_consts_const.DP_ACTOR_LEASE_TTL_S = 120
+    fake_consts_const.DP_ACTOR_ACQUIRE_TIMEOUT_S = 3600
+    fake_consts_const.DP_LARGE_FILE_MB = 20
+    fake_consts_const.DP_PAGE_RANGE_PARALLEL = True
+    fake_consts_const.DP_PAGES_PER_RANGE = 32
+    fake_consts_const.DP_MIN_PAGES_TO_SPLIT = 64
+    fake_consts_const.DP_PAGE_RANGE_NUM_CPUS = 1
+    fake_consts_const.DP_EXCEL_STREAMING = True
+    fake_consts_const.DP_PARTITION_CACHE = "none"
+    fake_consts_const.DP_PARTITION_CACHE_PREFIX = "partition_cache"
+    fake_consts_const.DP_PARTITION_CACHE_DIR = "/tmp/partition_cache"
+    fake_consts_const.DP_PARTITION_CACHE_TTL_S = 604800
+    fake_consts_const.DP_TASK_REGISTRY = True
+    fake_consts_const.DP_TASK_RESULT_TTL_S = 604800
+    fake_consts_const.DP_FORWARD_SEGMENT_CHUNKS = 256
+    fake_consts_const.DP_FORWARD_SEGMENT_TIMEOUT_S = 60
+    fake_consts_const.DP_FORWARD_COMMIT_TIMEOUT_S = 600
     monkeypatch.setitem(sys.modules, "consts", fake_consts_pkg)
     monkeypatch.setitem(sys.modules, "consts.const", fake_consts_const)
 
@@ -487,6 +539,31 @@ def test_process_file_core_returns_none_list_variants(monkeypatch):
         # Provide defaults required by backend.data_process.ray_actors import
         fake_consts_const.DEFAULT_EXPECTED_CHUNK_SIZE = 1024
         fake_consts_const.DEFAULT_MAXIMUM_CHUNK_SIZE = 1536
+        fake_consts_const.DP_CHUNK_SEGMENT_BYTES = 1024 * 1024
+        fake_consts_const.DP_CHUNK_ZSTD_LEVEL = 3
+        fake_consts_const.DP_CHUNKS_TTL_S = 7200
+        fake_consts_const.DP_CONTENT_DEDUP = True
+        fake_consts_const.DP_CONTENT_CACHE_TTL_S = 86400
+        fake_consts_const.DP_ACTOR_POOL_MIN_ACTORS = 0
+        fake_consts_const.DP_ACTOR_POOL_MAX_ACTORS = 4
+        fake_consts_const.DP_ACTOR_POOL_IDLE_TIMEOUT_S = 60
+        fake_consts_const.DP_ACTOR_LEASE_TTL_S = 120
+        fake_consts_const.DP_ACTOR_ACQUIRE_TIMEOUT_S = 3600
+        fake_consts_const.DP_LARGE_FILE_MB = 20
+        fake_consts_const.DP_PAGE_RANGE_PARALLEL = True
+        fake_consts_const.DP_PAGES_PER_RANGE = 32
+        fake_consts_const.DP_MIN_PAGES_TO_SPLIT = 64
+        fake_consts_const.DP_PAGE_RANGE_NUM_CPUS = 1
+        fake_consts_const.DP_EXCEL_STREAMING = True
+        fake_consts_const.DP_PARTITION_CACHE = "none"
+        fake_consts_const.DP_PARTITION_CACHE_PREFIX = "partition_cache"
+        fake_consts_const.DP_PARTITION_CACHE_DIR = "/tmp/partition_cache"
+        fake_consts_const.DP_PARTITION_CACHE_TTL_S = 604800
+        fake_consts_const.DP_TASK_REGISTRY = True
+        fake_consts_const.DP_TASK_RESULT_TTL_S = 604800
+        fake_consts_const.DP_FORWARD_SEGMENT_CHUNKS = 256
+        fake_consts_const.DP_FORWARD_SEGMENT_TIMEOUT_S = 60
+        fake_consts_const.DP_FORWARD_COMMIT_TIMEOUT_S = 600
         monkeypatch.setitem(sys.modules, "consts", fake_consts_pkg)
         monkeypatch.setitem(sys.modules, "consts.const", fake_consts_const)
 
@@ -517,8 +594,28 @@ def test_store_chunks_in_redis_success(monkeypatch):
     monkeypatch.setitem(sys.modules, "redis", fake_redis_module)
 
     actor = ray_actors.DataProcessorRayActor()
-    ok = actor.store_chunks_in_redis("key1", [{"content": "a"}])
-    assert ok is True
+    stored = actor.store_chunks_in_redis("key1", [{"content": "a"}])
+    assert stored == 1
+
+
+def test_store_chunks_in_redis_writes_compressed_segments(monkeypatch):
+    ray_actors = import_module(monkeypatch)
+    from backend.data_process.chunk_transport import open_chunks
+    monkeypatch.setattr(ray_actors, "REDIS_BACKEND_URL", "redis://test")
+    fake_client = FakeRedisClient()
+    fake_redis_module = types.SimpleNamespace(Redis=types.SimpleNamespace(from_url=lambda *a, **k: fake_client))
+    monkeypatch.setitem(sys.modules, "redis", fake_redis_module)
+    chunks = [{"content": f"chunk {i} " * 50, "metadata": {"page": i}} for i in range(100)]
+
+    actor = ray_actors.DataProcessorRayActor()
+    assert actor.store_chunks_in_redis("dp:t1:chunks", chunks) == 100
+
+    assert "dp:t1:chunks:manifest" in fake_client.store
+    assert all(isinstance(value, bytes) for value in fake_client.store.values())
+    assert all(ttl == 7200 for ttl in fake_client.expirations.values())
+    # Compressed segments are much smaller than the JSON the chunks used to be stored as
+    assert sum(len(value) for value in fake_client.store.values()) < len(json.dumps(chunks)) / 4
+    assert list(open_chunks(fake_client, "dp:t1:chunks")) == chunks
 
 
 def test_store_chunks_in_redis_handles_none_and_serialization_error(monkeypatch):
@@ -530,20 +627,190 @@ def test_store_chunks_in_redis_handles_none_and_serialization_error(monkeypatch)
 
     actor = ray_actors.DataProcessorRayActor()
 
+    from backend.data_process.chunk_transport import open_chunks
+
     # None chunks -> stored []
-    ok_none = actor.store_chunks_in_redis("k-none", None)
-    assert ok_none is True
-    assert json.loads(fake_client.get("k-none")) == []
+    assert actor.store_chunks_in_redis("k-none", None) == 0
+    assert list(open_chunks(fake_client, "k-none")) == []
 
     # Non-serializable -> fallback []
-    ok_bad = actor.store_chunks_in_redis("k-bad", [{"s": {1, 2, 3}}])
-    assert ok_bad is True
-    assert json.loads(fake_client.get("k-bad")) == []
+    assert actor.store_chunks_in_redis("k-bad", [{"s": {1, 2, 3}}]) == 0
+    assert list(open_chunks(fake_client, "k-bad")) == []
 
 
-def test_store_chunks_in_redis_no_url_returns_false(monkeypatch):
+def test_store_chunks_in_redis_no_url_returns_none(monkeypatch):
     ray_actors = import_module(monkeypatch)
     monkeypatch.setattr(ray_actors, "REDIS_BACKEND_URL", "")
     actor = ray_actors.DataProcessorRayActor()
-    assert actor.store_chunks_in_redis("k", [{"content": "x"}]) is False
+    assert actor.store_chunks_in_redis("k", [{"content": "x"}]) is None
+
+
+def test_count_chunks(monkeypatch):
+    ray_actors = import_module(monkeypatch)
+    actor = ray_actors.DataProcessorRayActor()
+    assert actor.count_chunks([{"content": "a"}, {"content": "b"}]) == 2
+    assert actor.count_chunks(None) == 0
+
+
+
+def test_route_processing_lane(monkeypatch):
+    ray_actors = import_module(monkeypatch)
+    route = ray_actors.route_processing_lane
+
+    assert route("notes.md") == ray_actors.TEXT_LANE
+    assert route("http://minio/bucket/report.CSV?X-Amz-Signature=1") == ray_actors.SPREADSHEET_LANE
+    assert route("big.xlsx", file_size=500 * 1024 * 1024) == ray_actors.SPREADSHEET_LANE
+    assert route("paper.pdf", file_size=1024 * 1024) == ray_actors.DOCUMENT_LANE
+    assert route("scan.pdf", file_size=50 * 1024 * 1024) == ray_actors.LARGE_DOCUMENT_LANE
+    assert route("paper.pdf", chunking_strategy="hi_res") == ray_actors.LARGE_DOCUMENT_LANE
+
+
+def _make_pool(monkeypatch, ray_actors, **kwargs):
+    created, killed = [], []
+
+    def create(num_cpus):
+        actor = types.SimpleNamespace(num_cpus=num_cpus, index=len(created))
+        created.append(actor)
+        return actor
+
+    monkeypatch.setattr(ray_actors, "_create_processor_actor", create)
+    monkeypatch.setattr(ray_actors.ray, "kill", killed.append, raising=False)
+    return ray_actors.DataProcessorPoolActor(**kwargs), created, killed
+
+
+def test_actor_pool_scales_to_max_and_queues(monkeypatch):
+    import asyncio
+    ray_actors = import_module(monkeypatch)
+    pool, created, _ = _make_pool(monkeypatch, ray_actors, min_actors=0, max_actors=2, idle_timeout_s=60)
+
+    async def run():
+        first = await pool.acquire("text")
+        second = await pool.acquire("text")
+        waiter = asyncio.ensure_future(pool.acquire("text"))
+        await asyncio.sleep(0)
+        busy_stats = pool.stats()["lanes"]["text"]
+        # Other lanes are not held up by the busy text lane
+        other = await pool.acquire("large_document")
+        await pool.release("text", first[0])
+        third = await asyncio.wait_for(waiter, 1)
+        return first, second, third, other, busy_stats
+
+    first, second, third, other, busy_stats = asyncio.run(run())
+
+    assert len(created) == 3
+    assert third == first
+    assert busy_stats["busy"] == 2 and busy_stats["waiting"] == 1 and busy_stats["utilization"] == 1.0
+    assert first[1].num_cpus == 1
+    assert other[1].num_cpus == ray_actors.RAY_ACTOR_NUM_CPUS
+    assert pool.stats()["lanes"]["text"]["leases"] == 3
+
+
+def test_actor_pool_stops_idle_and_dead_actors(monkeypatch):
+    import asyncio
+    ray_actors = import_module(monkeypatch)
+    pool, created, killed = _make_pool(monkeypatch, ray_actors, min_actors=1, max_actors=3, idle_timeout_s=0)
+    # min_actors are started up front for every lane
+    assert len(created) == len(ray_actors.PROCESSING_LANE_CPUS)
+
+    async def run():
+        warm = await pool.acquire("document")
+        extra = await pool.acquire("document")
+        await pool.release("document", extra[0])
+        await pool.release("document", warm[0], healthy=False)
+        return warm, extra
+
+    warm, extra = asyncio.run(run())
+
+    # The idle actor above min_actors is stopped, the dead one is replaced to honour min_actors
+    assert killed == [extra[1], warm[1]]
+    stats = pool.stats()["lanes"]["document"]
+    assert stats["actors"] == 1 and stats["idle"] == 1
+    assert len(created) == len(ray_actors.PROCESSING_LANE_CPUS) + 2
+
+
+def test_actor_pool_reclaims_expired_leases(monkeypatch):
+    import asyncio
+    ray_actors = import_module(monkeypatch)
+    pool, created, killed = _make_pool(monkeypatch, ray_actors, min_actors=0, max_actors=1, lease_ttl_s=60)
+
+    async def run():
+        renewed = await pool.acquire("text")
+        assert pool.renew("text", renewed[0]) is True
+        waiter = asyncio.ensure_future(pool.acquire("text"))
+        await asyncio.sleep(0)
+        # The worker holding the lease died and stopped renewing it
+        lane = pool._lanes["text"]
+        lane.leased[renewed[0]] = 0
+        async with lane.condition:
+            pool._reclaim_expired(lane)
+        replacement = await asyncio.wait_for(waiter, 1)
+        # The dead worker's late release and renewals are ignored
+        assert pool.renew("text", renewed[0]) is False
+        await pool.release("text", renewed[0])
+        return renewed, replacement
+
+    renewed, replacement = asyncio.run(run())
+
+    assert killed == [renewed[1]]
+    assert replacement[0] != renewed[0]
+    stats = pool.stats()["lanes"]["text"]
+    assert stats["actors"] == 1 and stats["busy"] == 1
+
+
+def test_actor_pool_acquire_times_out(monkeypatch):
+    import asyncio
+    ray_actors = import_module(monkeypatch)
+    pool, _, _ = _make_pool(monkeypatch, ray_actors, min_actors=0, max_actors=1)
+
+    async def run():
+        await pool.acquire("text")
+        with pytest.raises(TimeoutError):
+            await pool.acquire("text", timeout_s=0.01)
+
+    asyncio.run(run())
+    assert pool.stats()["lanes"]["text"]["waiting"] == 0
+
+
+def test_actor_wires_ray_map_for_page_ranges(monkeypatch):
+    ray_actors = import_module(monkeypatch)
+    captured = {}
+
+    class RecorderCore(FakeDataProcessCore):
+        def __init__(self, **kwargs):
+            super().__init__()
+            captured.update(kwargs)
+
+    monkeypatch.setattr(ray_actors, "DataProcessCore", RecorderCore)
+    ray_actors.DataProcessorRayActor()
+
+    assert captured == {"page_range_map": ray_actors.ray_map, "pages_per_range": 32, "min_pages_to_split": 64,
+                        "excel_streaming": True, "partition_cache": None}
+
+
+def test_ray_map_runs_tasks_in_order_or_in_process(monkeypatch):
+    ray_actors = import_module(monkeypatch)
+    submitted = []
+
+    class RemoteFunction:
+        def __init__(self, func):
+            self.func = func
+
+        def remote(self, *args):
+            submitted.append(args)
+            return self.func(*args)
+
+    monkeypatch.setattr(ray_actors.ray, "remote", lambda **kwargs: RemoteFunction, raising=False)
+    monkeypatch.setattr(ray_actors.ray, "get", list, raising=False)
+    monkeypatch.setattr(ray_actors, "_remote_functions", {})
+
+    def add(a, b):
+        return a + b
+
+    monkeypatch.setattr(ray_actors.ray, "available_resources", lambda: {"CPU": 4.0}, raising=False)
+    assert ray_actors.ray_map(add, [1, 2, 3], [10, 20, 30]) == [11, 22, 33]
+    assert submitted == [(1, 10), (2, 20), (3, 30)]
 
+    # Without free CPUs the calls run in the caller instead of waiting on the cluster
+    monkeypatch.setattr(ray_actors.ray, "available_resources", lambda: {}, raising=False)
+    assert ray_actors.ray_map(add, [1], [1]) == [2]
+    assert len(submitted) == 3
@@ -95,6 +95,32 @@ def setup_mocks_for_ray_config(mocker, initialized=False):
         const_mod.FORWARD_REDIS_RETRY_DELAY_S = 0
         const_mod.FORWARD_REDIS_RETRY_MAX = 1
         const_mod.DISABLE_RAY_DASHBOARD = False
+        const_mod.DATA_PROCESS_CHUNK_TRANSPORT = "redis"
+        const_mod.DP_CHUNK_SEGMENT_BYTES = 1024 * 1024
+        const_mod.DP_CHUNK_ZSTD_LEVEL = 3
+        const_mod.DP_CHUNKS_TTL_S = 7200
+        const_mod.DP_CONTENT_DEDUP = True
+        const_mod.DP_CONTENT_CACHE_TTL_S = 86400
+        const_mod.DP_ACTOR_POOL_MIN_ACTORS = 0
+        const_mod.DP_ACTOR_POOL_MAX_ACTORS = 4
+        const_mod.DP_ACTOR_POOL_IDLE_TIMEOUT_S = 60
+        const_mod.DP_ACTOR_LEASE_TTL_S = 120
+        const_mod.DP_ACTOR_ACQUIRE_TIMEOUT_S = 3600
+        const_mod.DP_LARGE_FILE_MB = 20
+        const_mod.DP_PAGE_RANGE_PARALLEL = True
+        const_mod.DP_PAGES_PER_RANGE = 32
+        const_mod.DP_MIN_PAGES_TO_SPLIT = 64
+        const_mod.DP_PAGE_RANGE_NUM_CPUS = 1
+        const_mod.DP_EXCEL_STREAMING = True
+        const_mod.DP_PARTITION_CACHE = "none"
+        const_mod.DP_PARTITION_CACHE_PREFIX = "partition_cache"
+        const_mod.DP_PARTITION_CACHE_DIR = "/tmp/partition_cache"
+        const_mod.DP_PARTITION_CACHE_TTL_S = 604800
+        const_mod.DP_TASK_REGISTRY = True
+        const_mod.DP_TASK_RESULT_TTL_S = 604800
+        const_mod.DP_FORWARD_SEGMENT_CHUNKS = 256
+        const_mod.DP_FORWARD_SEGMENT_TIMEOUT_S = 60
+        const_mod.DP_FORWARD_COMMIT_TIMEOUT_S = 600
         sys.modules["consts.const"] = const_mod
     
     # Stub consts.model (required by utils.file_management_utils)
@@ -116,6 +142,8 @@ def setup_mocks_for_ray_config(mocker, initialized=False):
         sys.modules["database"] = db_pkg
     if "database.attachment_db" not in sys.modules:
         sys.modules["database.attachment_db"] = types.SimpleNamespace(
+            get_file_stream=lambda source: None,
+            open_file_stream=lambda source: None,
             get_file_size_from_minio=lambda object_name, bucket=None: 0,
         )
         setattr(sys.modules["database"], "attachment_db", sys.modules["database.attachment_db"])
@@ -167,6 +195,11 @@ def setup_mocks_for_ray_config(mocker, initialized=False):
     if "backend.data_process.ray_actors" not in sys.modules:
         ray_actors_mod = types.ModuleType("backend.data_process.ray_actors")
         ray_actors_mod.DataProcessorRayActor = type("DataProcessorRayActor", (), {})
+        ray_actors_mod.ChunkRefRegistryActor = type("ChunkRefRegistryActor", (), {})
+        ray_actors_mod.DataProcessorPoolActor = type("DataProcessorPoolActor", (), {})
+        ray_actors_mod.DOCUMENT_LANE = "document"
+        ray_actors_mod.route_processing_lane = lambda *a, **k: "document"
+        ray_actors_mod.resolve_chunk_size_params = lambda *a, **k: {}
         sys.modules["backend.data_process.ray_actors"] = ray_actors_mod
     
     # Stub aiohttp (required by tasks.py)
@@ -115,6 +115,32 @@ def import_tasks_with_fake_ray(monkeypatch, initialized=False):
         # New defaults required by ray_actors import
         const_mod.DEFAULT_EXPECTED_CHUNK_SIZE = 1024
         const_mod.DEFAULT_MAXIMUM_CHUNK_SIZE = 1536
+        const_mod.DATA_PROCESS_CHUNK_TRANSPORT = "redis"
+        const_mod.DP_CHUNK_SEGMENT_BYTES = 1024 * 1024
+        const_mod.DP_CHUNK_ZSTD_LEVEL = 3
+        const_mod.DP_CHUNKS_TTL_S = 7200
+        const_mod.DP_CONTENT_DEDUP = True
+        const_mod.DP_CONTENT_CACHE_TTL_S = 86400
+        const_mod.DP_ACTOR_POOL_MIN_ACTORS = 0
+        const_mod.DP_ACTOR_POOL_MAX_ACTORS = 4
+        const_mod.DP_ACTOR_POOL_IDLE_TIMEOUT_S = 60
+        const_mod.DP_ACTOR_LEASE_TTL_S = 120
+        const_mod.DP_ACTOR_ACQUIRE_TIMEOUT_S = 3600
+        const_mod.DP_LARGE_FILE_MB = 20
+        const_mod.DP_PAGE_RANGE_PARALLEL = True
+        const_mod.DP_PAGES_PER_RANGE = 32
+        const_mod.DP_MIN_PAGES_TO_SPLIT = 64
+        const_mod.DP_PAGE_RANGE_NUM_CPUS = 1
+        const_mod.DP_EXCEL_STREAMING = True
+        const_mod.DP_PARTITION_CACHE = "none"
+        const_mod.DP_PARTITION_CACHE_PREFIX = "partition_cache"
+        const_mod.DP_PARTITION_CACHE_DIR = "/tmp/partition_cache"
+        const_mod.DP_PARTITION_CACHE_TTL_S = 604800
+        const_mod.DP_TASK_REGISTRY = True
+        const_mod.DP_TASK_RESULT_TTL_S = 604800
+        const_mod.DP_FORWARD_SEGMENT_CHUNKS = 256
+        const_mod.DP_FORWARD_SEGMENT_TIMEOUT_S = 60
+        const_mod.DP_FORWARD_COMMIT_TIMEOUT_S = 600
         sys.modules["consts.const"] = const_mod
     # Minimal stub for consts.model used by utils.file_management_utils
     if "consts.model" not in sys.modules:
@@ -131,6 +157,7 @@ def import_tasks_with_fake_ray(monkeypatch, initialized=False):
     if "database.attachment_db" not in sys.modules:
         sys.modules["database.attachment_db"] = types.SimpleNamespace(
             get_file_stream=lambda source: io.BytesIO(b"stub-bytes"),
+            open_file_stream=lambda source: io.BytesIO(b"stub-bytes"),
             get_file_size_from_minio=lambda object_name, bucket=None: 0,
         )
     # Stub model_management_db module required by ray_actors
@@ -231,14 +258,6 @@ def import_tasks_with_fake_ray(monkeypatch, initialized=False):
             return task_obj
         return getattr(run_attr, "__func__", run_attr)
 
-    # Inject a default Ray actor so get_ray_actor works even when not monkeypatched in tests
-    default_actor = types.SimpleNamespace(
-        process_file=types.SimpleNamespace(remote=lambda *a, **k: "ref"),
-        store_chunks_in_redis=types.SimpleNamespace(remote=lambda *a, **k: None),
-    )
-    if not hasattr(tasks, "DataProcessorRayActor") or not hasattr(getattr(tasks, "DataProcessorRayActor"), "remote"):
-        tasks.DataProcessorRayActor = types.SimpleNamespace(remote=lambda: default_actor)
-
     # Preprocess for forward: drop empty/whitespace-only chunks before calling real run
     def _forward_preprocess(args, kwargs):
         pd = kwargs.get("processed_data")
@@ -334,13 +353,20 @@ def test_init_ray_in_worker_raises_on_init_failure(monkeypatch):
 def test_run_async_no_running_loop(monkeypatch):
     tasks, _ = import_tasks_with_fake_ray(monkeypatch)
 
+    closed = []
+
     async def sample():
         return 42
 
-    # Force RuntimeError in get_running_loop to trigger asyncio.run path
-    monkeypatch.setattr(asyncio, "get_running_loop", lambda: (_ for _ in ()).throw(RuntimeError("no loop")))
+    async def fake_close():
+        closed.append(asyncio.get_running_loop())
+
+    # Called outside of any event loop, so the asyncio.run path is taken
+    monkeypatch.setattr("nexent.core.models.embedding_model.close_async_http_sessions", fake_close)
     result = tasks.run_async(sample())
     assert result == 42
+    # The pooled embedding sessions of the short-lived loop are closed before it goes away
+    assert len(closed) == 1 and closed[0].is_closed()
 
 
 def test_run_async_running_loop_with_nest_asyncio(monkeypatch):
@@ -359,17 +385,80 @@ def test_run_async_running_loop_with_nest_asyncio(monkeypatch):
     assert result == "done"
 
 
-def test_get_ray_actor_returns_actor(monkeypatch):
+def test_get_ray_actor_leases_and_releases_pool_actor(monkeypatch):
     tasks, fake_ray = import_tasks_with_fake_ray(monkeypatch, initialized=True)
+    calls = []
+    actor = object()
 
-    class DummyActor:
-        @staticmethod
-        def remote():
-            return {"remote": True}
+    pool = types.SimpleNamespace(
+        acquire=types.SimpleNamespace(remote=lambda *a: calls.append(("acquire",) + a) or ("actor-1", actor)),
+        renew=types.SimpleNamespace(remote=lambda *a: calls.append(("renew",) + a)),
+        release=types.SimpleNamespace(remote=lambda *a: calls.append(("release",) + a)),
+    )
+    monkeypatch.setattr(tasks, "get_actor_pool", lambda: pool)
+    timeouts = []
+    monkeypatch.setattr(fake_ray, "get", lambda ref, timeout=None: timeouts.append(timeout) or ref)
+    monkeypatch.setattr(tasks, "_lease_heartbeat", object())
+    fake_ray.exceptions = types.SimpleNamespace(RayActorError=type("RayActorError", (Exception,), {}))
+
+    assert tasks.get_ray_actor("text") is actor
+    # Held leases are renewed so the pool does not reclaim them
+    tasks.renew_actor_leases()
+    tasks.release_ray_actor(actor)
+    # A second release and actors that were not leased are ignored
+    tasks.release_ray_actor(actor)
+    tasks.release_ray_actor(object())
+    # Nothing left to renew
+    tasks.renew_actor_leases()
+
+    assert calls == [("acquire", "text", 3600), ("renew", "text", "actor-1"),
+                     ("release", "text", "actor-1", True)]
+    assert timeouts == [3600 + tasks.ACTOR_ACQUIRE_GRACE_S]
+
+
+def test_release_ray_actor_drops_dead_actor(monkeypatch):
+    tasks, fake_ray = import_tasks_with_fake_ray(monkeypatch, initialized=True)
+    released = []
+    actor = object()
+    pool = types.SimpleNamespace(
+        acquire=types.SimpleNamespace(remote=lambda lane, timeout_s: ("actor-2", actor)),
+        release=types.SimpleNamespace(remote=lambda *a: released.append(a)),
+    )
+    monkeypatch.setattr(tasks, "get_actor_pool", lambda: pool)
+    monkeypatch.setattr(fake_ray, "get", lambda ref, timeout=None: ref)
+    monkeypatch.setattr(tasks, "_lease_heartbeat", object())
+    actor_error = type("RayActorError", (Exception,), {})
+    fake_ray.exceptions = types.SimpleNamespace(RayActorError=actor_error)
+
+    tasks.release_ray_actor(tasks.get_ray_actor(), actor_error("actor died"))
+
+    assert released == [("document", "actor-2", False)]
+
+
+def test_process_routes_file_to_lane(monkeypatch, tmp_path):
+    tasks, fake_ray = import_tasks_with_fake_ray(monkeypatch, initialized=True)
+    f = tmp_path / "sheet.xlsx"
+    f.write_bytes(b"xlsx")
+    lanes = []
+    released = []
+
+    class FakeActor:
+        def __init__(self):
+            self.process_file = types.SimpleNamespace(remote=lambda *a, **k: "ref")
+            self.store_chunks_in_redis = types.SimpleNamespace(remote=lambda *a, **k: None)
 
-    monkeypatch.setattr(tasks, "DataProcessorRayActor", DummyActor)
-    actor = tasks.get_ray_actor()
-    assert actor == {"remote": True}
+    def get_ray_actor(lane):
+        lanes.append(lane)
+        return FakeActor()
+
+    monkeypatch.setattr(tasks, "get_ray_actor", get_ray_actor)
+    monkeypatch.setattr(tasks, "release_ray_actor", lambda actor, error=None: released.append(error))
+    fake_ray.get_returns = 1
+
+    tasks.process(FakeSelf("lane1"), source=str(f), source_type="local", original_filename="sheet.xlsx")
+
+    assert lanes == ["spreadsheet"]
+    assert released == [None]
 
 
 class FakeSelf:
@@ -405,9 +494,9 @@ def test_process_local_happy_path(monkeypatch, tmp_path):
             self.process_file = types.SimpleNamespace(remote=lambda *a, **k: "ref1")
             self.store_chunks_in_redis = types.SimpleNamespace(remote=lambda *a, **k: None)
 
-    monkeypatch.setattr(tasks, "get_ray_actor", lambda: FakeActor())
-    # Mock ray.get to return chunks instead of reference
-    fake_ray.get_returns = mock_chunks
+    monkeypatch.setattr(tasks, "get_ray_actor", lambda *a, **k: FakeActor())
+    # The actor reports the number of chunks it stored instead of returning them
+    fake_ray.get_returns = len(mock_chunks)
 
     self = FakeSelf("p1")
 
@@ -432,9 +521,9 @@ def test_process_minio_path(monkeypatch):
             self.process_file = types.SimpleNamespace(remote=lambda *a, **k: "ref")
             self.store_chunks_in_redis = types.SimpleNamespace(remote=lambda *a, **k: None)
 
-    monkeypatch.setattr(tasks, "get_ray_actor", lambda: FakeActor())
-    # Mock ray.get to return chunks
-    fake_ray.get_returns = mock_chunks
+    monkeypatch.setattr(tasks, "get_ray_actor", lambda *a, **k: FakeActor())
+    # The actor reports the number of chunks it stored
+    fake_ray.get_returns = len(mock_chunks)
 
     self = FakeSelf("m1")
     result = tasks.process(self, source="http://minio/bucket/x", source_type="minio", chunking_strategy="basic")
@@ -463,8 +552,8 @@ def test_process_passes_embedding_ids_to_actor(monkeypatch, tmp_path):
             self.store_chunks_in_redis = types.SimpleNamespace(
                 remote=lambda *a, **k: None)
 
-    monkeypatch.setattr(tasks, "get_ray_actor", lambda: FakeActor())
-    fake_ray.get_returns = [{"content": "chunk", "metadata": {}}]
+    monkeypatch.setattr(tasks, "get_ray_actor", lambda *a, **k: FakeActor())
+    fake_ray.get_returns = 1
 
     self = FakeSelf("mid-1")
     tasks.process(
@@ -501,9 +590,9 @@ def test_process_large_file_with_many_chunks(monkeypatch, tmp_path):
             self.store_chunks_in_redis = types.SimpleNamespace(
                 remote=lambda *a, **k: None)
 
-    monkeypatch.setattr(tasks, "get_ray_actor", lambda: FakeActor())
-    # Mock ray.get to return large chunks
-    fake_ray.get_returns = mock_chunks
+    monkeypatch.setattr(tasks, "get_ray_actor", lambda *a, **k: FakeActor())
+    # The actor reports the number of chunks it stored
+    fake_ray.get_returns = len(mock_chunks)
 
     self = FakeSelf("large1")
 
@@ -574,6 +663,151 @@ def test_forward_redis_client_from_url_failure(monkeypatch):
     json.loads(str(ei.value))
 
 
+class DictRedisClient:
+    def __init__(self):
+        self.store = {}
+
+    def set(self, key, value, ex=None):
+        self.store[key] = value
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def delete(self, *keys):
+        for key in keys:
+            self.store.pop(key, None)
+
+    def ttl(self, key):
+        return -1 if key in self.store else -2
+
+
+def test_forward_streams_chunks_from_redis_segments(monkeypatch):
+    tasks, _ = import_tasks_with_fake_ray(monkeypatch)
+    from backend.data_process.chunk_transport import write_chunks
+    monkeypatch.setattr(tasks, "ELASTICSEARCH_SERVICE", "http://api")
+    monkeypatch.setattr(tasks, "REDIS_BACKEND_URL", "redis://test")
+    monkeypatch.setattr(tasks, "get_file_size", lambda *a, **k: 0)
+    monkeypatch.setattr(tasks, "run_async", lambda coro: (coro.close(), {
+                        "success": True, "total_indexed": 30, "total_submitted": 30, "message": "ok"})[1])
+    client = DictRedisClient()
+    write_chunks(client, "dp:s1:chunks", [{"content": f"chunk {i}", "metadata": {}} for i in range(30)],
+                 segment_bytes=64)
+    assert len(client.store) > 3
+    monkeypatch.setitem(sys.modules, "redis", types.SimpleNamespace(Redis=types.SimpleNamespace(
+        from_url=lambda url, decode_responses=False: client)))
+
+    self = FakeSelf("s1")
+    result = tasks.forward(self, processed_data={"redis_key": "dp:s1:chunks", "chunks_transport": "redis"},
+                           index_name="idx", source="/a.txt")
+
+    assert result["chunks_stored"] == 30
+    # The hand-off is deleted once the chunks are indexed
+    assert client.store == {}
+
+
+def test_forward_reads_legacy_json_chunks(monkeypatch):
+    tasks, _ = import_tasks_with_fake_ray(monkeypatch)
+    monkeypatch.setattr(tasks, "ELASTICSEARCH_SERVICE", "http://api")
+    monkeypatch.setattr(tasks, "REDIS_BACKEND_URL", "redis://test")
+    monkeypatch.setattr(tasks, "get_file_size", lambda *a, **k: 0)
+    monkeypatch.setattr(tasks, "run_async", lambda coro: (coro.close(), {
+                        "success": True, "total_indexed": 1, "total_submitted": 1, "message": "ok"})[1])
+    client = DictRedisClient()
+    client.set("dp:old:chunks", json.dumps([{"content": "legacy", "metadata": {}}]).encode())
+    monkeypatch.setitem(sys.modules, "redis", types.SimpleNamespace(Redis=types.SimpleNamespace(
+        from_url=lambda url, decode_responses=False: client)))
+
+    result = tasks.forward(FakeSelf("old"), processed_data={"redis_key": "dp:old:chunks"},
+                           index_name="idx", source="/a.txt")
+
+    assert result["chunks_stored"] == 1
+
+
+def test_process_object_ref_transport_registers_ref(monkeypatch, tmp_path):
+    tasks, fake_ray = import_tasks_with_fake_ray(monkeypatch, initialized=True)
+    monkeypatch.setattr(tasks, "DATA_PROCESS_CHUNK_TRANSPORT", "object_ref")
+    f = tmp_path / "o.txt"
+    f.write_text("content")
+    stored = []
+    registered = {}
+
+    class FakeActor:
+        def __init__(self):
+            self.process_file = types.SimpleNamespace(remote=lambda *a, **k: "chunks_ref")
+            self.count_chunks = types.SimpleNamespace(remote=lambda ref: ("count", ref))
+            self.store_chunks_in_redis = types.SimpleNamespace(remote=lambda *a, **k: stored.append(a))
+
+    registry = types.SimpleNamespace(put=types.SimpleNamespace(
+        remote=lambda key, refs: registered.update({key: refs})))
+    monkeypatch.setattr(tasks, "get_ray_actor", lambda *a, **k: FakeActor())
+    monkeypatch.setattr(tasks, "get_chunk_ref_registry", lambda: registry)
+    fetched = []
+    monkeypatch.setattr(fake_ray, "get", lambda ref: fetched.append(ref) or 1)
+    self = FakeSelf("o1")
+
+    result = tasks.process(self, source=str(f), source_type="local")
+
+    assert result["chunks_transport"] == "object_ref"
+    assert registered == {"dp:o1:chunks": ["chunks_ref"]}
+    assert stored == []
+    # Only the count is fetched into the worker, never the chunks themselves
+    assert "chunks_ref" not in fetched and ("count", "chunks_ref") in fetched
+    meta = [s for s in self.states if s.get("state") == tasks.states.SUCCESS][0]["meta"]
+    assert meta["chunks_count"] == 1
+
+
+def test_process_fails_when_chunks_cannot_be_stored(monkeypatch, tmp_path):
+    tasks, fake_ray = import_tasks_with_fake_ray(monkeypatch, initialized=True)
+    f = tmp_path / "s.txt"
+    f.write_text("content")
+
+    class FakeActor:
+        def __init__(self):
+            self.process_file = types.SimpleNamespace(remote=lambda *a, **k: "chunks_ref")
+            self.store_chunks_in_redis = types.SimpleNamespace(remote=lambda *a, **k: "store_ref")
+
+    monkeypatch.setattr(tasks, "get_ray_actor", lambda *a, **k: FakeActor())
+    fake_ray.get_returns = None
+
+    with pytest.raises(Exception) as ei:
+        tasks.process(FakeSelf("s1"), source=str(f), source_type="local")
+    assert "Failed to store chunks" in json.loads(str(ei.value))["message"]
+
+
+def test_forward_reads_object_ref_hand_off(monkeypatch):
+    tasks, fake_ray = import_tasks_with_fake_ray(monkeypatch)
+    monkeypatch.setattr(tasks, "ELASTICSEARCH_SERVICE", "http://api")
+    monkeypatch.setattr(tasks, "get_file_size", lambda *a, **k: 0)
+    monkeypatch.setattr(tasks, "run_async", lambda coro: (coro.close(), {
+                        "success": True, "total_indexed": 1, "total_submitted": 1, "message": "ok"})[1])
+    released = []
+    registry = types.SimpleNamespace(
+        get=types.SimpleNamespace(remote=lambda key: "registry_get_ref"),
+        release=types.SimpleNamespace(remote=released.append),
+    )
+    monkeypatch.setattr(tasks, "get_chunk_ref_registry", lambda: registry)
+    objects = {"registry_get_ref": ["chunks_ref"], "chunks_ref": [{"content": "from ray", "metadata": {}}]}
+    monkeypatch.setattr(fake_ray, "get", lambda ref: objects[ref])
+
+    result = tasks.forward(FakeSelf("o2"), processed_data={"redis_key": "dp:o1:chunks", "chunks_transport": "object_ref"},
+                           index_name="idx", source="/a.txt")
+
+    assert result["chunks_stored"] == 1
+    assert released == ["dp:o1:chunks"]
+
+
+def test_forward_object_ref_missing_raises(monkeypatch):
+    tasks, fake_ray = import_tasks_with_fake_ray(monkeypatch)
+    registry = types.SimpleNamespace(get=types.SimpleNamespace(remote=lambda key: "registry_get_ref"))
+    monkeypatch.setattr(tasks, "get_chunk_ref_registry", lambda: registry)
+    monkeypatch.setattr(fake_ray, "get", lambda ref: None)
+
+    with pytest.raises(Exception) as ei:
+        tasks.forward(FakeSelf("o3"), processed_data={"redis_key": "dp:gone:chunks", "chunks_transport": "object_ref"},
+                      index_name="idx", source="/a.txt")
+    assert "Ray object store" in json.loads(str(ei.value))["message"]
+
+
 def test_forward_skips_empty_chunk_without_preprocess(monkeypatch):
     tasks, _ = import_tasks_with_fake_ray(monkeypatch)
     monkeypatch.setattr(tasks, "ELASTICSEARCH_SERVICE", "http://api")
@@ -617,6 +851,9 @@ def test_forward_vectorize_documents_client_connector_error(monkeypatch):
             pass
 
     class Session:
+        def __init__(self, *a, **k):
+            pass
+
         async def __aenter__(self):
             return self
 
@@ -677,6 +914,9 @@ def test_forward_vectorize_documents_client_response_503(monkeypatch):
             return False
 
     class Session:
+        def __init__(self, *a, **k):
+            pass
+
         async def __aenter__(self):
             return self
 
@@ -751,6 +991,9 @@ def test_forward_vectorize_documents_timeout_error(monkeypatch):
             pass
 
     class Session:
+        def __init__(self, *a, **k):
+            pass
+
         async def __aenter__(self):
             return self
 
@@ -806,6 +1049,9 @@ def test_forward_vectorize_documents_unexpected_error(monkeypatch):
             pass
 
     class Session:
+        def __init__(self, *a, **k):
+            pass
+
         async def __aenter__(self):
             return self
 
@@ -972,7 +1218,7 @@ def test_process_sync_local_returns(monkeypatch):
         def __init__(self):
             self.process_file = types.SimpleNamespace(remote=lambda *a, **k: "ref1")
 
-    monkeypatch.setattr(tasks, "get_ray_actor", lambda: FakeActor())
+    monkeypatch.setattr(tasks, "get_ray_actor", lambda *a, **k: FakeActor())
     fake_ray.get_returns = [{"content": "a"}, {"content": "b"}]
 
     self = FakeSelf("s1")
@@ -1068,8 +1314,8 @@ def test_process_zero_file_size_speed_calculation(monkeypatch, tmp_path):
             self.store_chunks_in_redis = types.SimpleNamespace(
                 remote=lambda *a, **k: None)
 
-    monkeypatch.setattr(tasks, "get_ray_actor", lambda: FakeActor())
-    fake_ray.get_returns = mock_chunks
+    monkeypatch.setattr(tasks, "get_ray_actor", lambda *a, **k: FakeActor())
+    fake_ray.get_returns = len(mock_chunks)
 
     self = FakeSelf("empty1")
 
@@ -1097,8 +1343,8 @@ def test_process_url_source_with_many_chunks(monkeypatch):
             self.store_chunks_in_redis = types.SimpleNamespace(
                 remote=lambda *a, **k: None)
 
-    monkeypatch.setattr(tasks, "get_ray_actor", lambda: FakeActor())
-    fake_ray.get_returns = mock_chunks
+    monkeypatch.setattr(tasks, "get_ray_actor", lambda *a, **k: FakeActor())
+    fake_ray.get_returns = len(mock_chunks)
 
     self = FakeSelf("url1")
 
@@ -1147,3 +1393,171 @@ def test_forward_large_chunks_batch_success(monkeypatch):
     success_state = [s for s in self.states if s.get(
         "state") == tasks.states.SUCCESS][0]
     assert success_state.get("meta", {}).get("chunks_stored") == 150
+
+
+def test_process_reuses_stored_content_without_ray(monkeypatch, tmp_path):
+    tasks, _ = import_tasks_with_fake_ray(monkeypatch, initialized=True)
+    from backend.data_process.chunk_transport import write_chunks
+    f = tmp_path / "dup.pdf"
+    f.write_bytes(b"same bytes")
+    client = DictRedisClient()
+    key = tasks.content_key(tasks.hash_file(str(f), "local"), "basic")
+    write_chunks(client, tasks.content_chunks_key(key), [{"content": "c", "metadata": {}}] * 3)
+    monkeypatch.setitem(sys.modules, "redis", types.SimpleNamespace(Redis=types.SimpleNamespace(
+        from_url=lambda url, decode_responses=False: client)))
+    monkeypatch.setattr(tasks, "REDIS_BACKEND_URL", "redis://test")
+    monkeypatch.setattr(tasks, "get_ray_actor", lambda *a, **k: pytest.fail("Ray must not be used"))
+
+    self = FakeSelf("d1")
+    result = tasks.process(self, source=str(f), source_type="local", index_name="kb2")
+
+    assert result["redis_key"] == tasks.content_chunks_key(key)
+    assert result["shared_chunks"] is True
+    meta = [s for s in self.states if s.get("state") == tasks.states.SUCCESS][0]["meta"]
+    assert meta["chunks_count"] == 3 and meta["deduplicated"] is True
+
+    # The shared entry survives indexing into this knowledge base
+    monkeypatch.setattr(tasks, "ELASTICSEARCH_SERVICE", "http://api")
+    monkeypatch.setattr(tasks, "get_file_size", lambda *a, **k: 0)
+    monkeypatch.setattr(tasks, "run_async", lambda coro: (coro.close(), {
+                        "success": True, "total_indexed": 3, "total_submitted": 3, "message": "ok"})[1])
+    stored_keys = set(client.store)
+    tasks.forward(FakeSelf("d2"), processed_data=result, index_name="kb2", source=str(f))
+    assert set(client.store) == stored_keys
+
+
+def test_process_fills_content_store_on_miss(monkeypatch, tmp_path):
+    tasks, fake_ray = import_tasks_with_fake_ray(monkeypatch, initialized=True)
+    f = tmp_path / "new.pdf"
+    f.write_bytes(b"new bytes")
+    client = DictRedisClient()
+    stored = []
+
+    class FakeActor:
+        def __init__(self):
+            self.process_file = types.SimpleNamespace(remote=lambda *a, **k: "chunks_ref")
+            self.store_chunks_in_redis = types.SimpleNamespace(remote=lambda *a: stored.append(a))
+
+    monkeypatch.setitem(sys.modules, "redis", types.SimpleNamespace(Redis=types.SimpleNamespace(
+        from_url=lambda url, decode_responses=False: client)))
+    monkeypatch.setattr(tasks, "REDIS_BACKEND_URL", "redis://test")
+    monkeypatch.setattr(tasks, "resolve_chunk_size_params",
+                        lambda *a: {"max_characters": 3000, "new_after_n_chars": 2000})
+    monkeypatch.setattr(tasks, "get_ray_actor", lambda *a, **k: FakeActor())
+    fake_ray.get_returns = 1
+
+    result = tasks.process(FakeSelf("n1"), source=str(f), source_type="local", embedding_model_id=1, tenant_id="t")
+
+    key = tasks.content_key(tasks.hash_file(str(f), "local"), "basic", 3000, 2000)
+    assert result["redis_key"] == "dp:n1:chunks" and not result.get("shared_chunks")
+    assert stored == [("dp:n1:chunks", "chunks_ref"), (tasks.content_chunks_key(key), "chunks_ref", 86400)]
+
+
+class FakeIngestServer:
+    """Main service side of /documents/stream, answering like ingest_document_segment"""
+
+    def __init__(self, held=0, busy=0, lose_session_at=None):
+        self.next_offset = held
+        self.busy = busy
+        self.lose_session_at = lose_session_at
+        self.requests = []
+
+    def handle(self, params, body):
+        offset, final = params["offset"], params["final"] == "true"
+        count = len(body.splitlines())
+        self.requests.append((offset, count, final))
+        if final and self.busy:
+            self.busy -= 1
+            return 429, {"detail": "busy"}
+        if offset == self.lose_session_at:
+            self.lose_session_at = None
+            self.next_offset = 0
+        if offset > self.next_offset:
+            return 409, {"detail": {"next_offset": self.next_offset}}
+        self.next_offset = max(self.next_offset, offset + count)
+        if final:
+            return 200, {"committed": True, "next_offset": self.next_offset, "success": True,
+                         "total_indexed": self.next_offset, "total_submitted": self.next_offset}
+        return 200, {"committed": False, "next_offset": self.next_offset}
+
+
+def fake_aiohttp_for(server):
+    class Response:
+        def __init__(self, status, payload):
+            self.status = status
+            self.payload = payload
+            self.headers = {"Retry-After": "1"} if status == 429 else {}
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *a):
+            return False
+
+        async def json(self):
+            return self.payload
+
+        def raise_for_status(self):
+            assert self.status < 400
+
+    class Session:
+        def __init__(self, *a, **k):
+            pass
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *a):
+            return False
+
+        def post(self, url, headers=None, params=None, data=None, timeout=None):
+            assert url == "http://api/indices/idx/documents/stream"
+            assert headers["Content-Type"] == "application/x-ndjson"
+            return Response(*server.handle(params, data))
+
+    return types.SimpleNamespace(
+        ClientResponseError=type("ClientResponseError", (Exception,), {}),
+        ClientConnectorError=type("ClientConnectorError", (Exception,), {}),
+        TCPConnector=lambda verify_ssl=False: None,
+        ClientTimeout=lambda total=None: total,
+        ClientSession=Session,
+    )
+
+
+def _forward_with_server(monkeypatch, server, chunk_count):
+    tasks, _ = import_tasks_with_fake_ray(monkeypatch)
+    monkeypatch.setattr(tasks, "ELASTICSEARCH_SERVICE", "http://api")
+    monkeypatch.setattr(tasks, "aiohttp", fake_aiohttp_for(server))
+    monkeypatch.setattr(tasks, "DP_FORWARD_SEGMENT_CHUNKS", 256)
+
+    async def no_sleep(_):
+        return None
+    monkeypatch.setattr(tasks.asyncio, "sleep", no_sleep)
+    size_calls = []
+    monkeypatch.setattr(tasks, "get_file_size", lambda *a, **k: size_calls.append(a) or 42)
+
+    chunks = [{"content": f"chunk {i}", "metadata": {}} for i in range(chunk_count)]
+    result = tasks.forward(FakeSelf("stream1"), processed_data={"chunks": chunks}, index_name="idx",
+                           source="/a.txt")
+    return result, size_calls
+
+
+def test_forward_streams_segments_and_resumes_after_held_offset(monkeypatch):
+    # An earlier attempt stored two segments, the first ack skips the second one and the first commit is busy
+    server = FakeIngestServer(held=512, busy=1)
+
+    result, size_calls = _forward_with_server(monkeypatch, server, 600)
+
+    assert server.requests == [(0, 256, False), (512, 88, True), (512, 88, True)]
+    assert result["chunks_stored"] == 600
+    assert result["es_result"]["total_indexed"] == 600
+    assert len(size_calls) == 1
+
+
+def test_forward_restarts_upload_when_session_is_lost(monkeypatch):
+    server = FakeIngestServer(lose_session_at=256)
+
+    result, _ = _forward_with_server(monkeypatch, server, 300)
+
+    assert server.requests == [(0, 256, False), (256, 44, True), (0, 256, False), (256, 44, True)]
+    assert result["es_result"]["total_indexed"] == 300
@@ -44,6 +44,32 @@ def setup_mocks_for_worker(mocker, initialized=False):
         const_mod.FORWARD_REDIS_RETRY_MAX = 1
         const_mod.DISABLE_RAY_DASHBOARD = False
         const_mod.DATA_PROCESS_SERVICE = "http://data-process"
+        const_mod.DATA_PROCESS_CHUNK_TRANSPORT = "redis"
+        const_mod.DP_CHUNK_SEGMENT_BYTES = 1024 * 1024
+        const_mod.DP_CHUNK_ZSTD_LEVEL = 3
+        const_mod.DP_CHUNKS_TTL_S = 7200
+        const_mod.DP_CONTENT_DEDUP = True
+        const_mod.DP_CONTENT_CACHE_TTL_S = 86400
+        const_mod.DP_ACTOR_POOL_MIN_ACTORS = 0
+        const_mod.DP_ACTOR_POOL_MAX_ACTORS = 4
+        const_mod.DP_ACTOR_POOL_IDLE_TIMEOUT_S = 60
+        const_mod.DP_ACTOR_LEASE_TTL_S = 120
+        const_mod.DP_ACTOR_ACQUIRE_TIMEOUT_S = 3600
+        const_mod.DP_LARGE_FILE_MB = 20
+        const_mod.DP_PAGE_RANGE_PARALLEL = True
+        const_mod.DP_PAGES_PER_RANGE = 32
+        const_mod.DP_MIN_PAGES_TO_SPLIT = 64
+        const_mod.DP_PAGE_RANGE_NUM_CPUS = 1
+        const_mod.DP_EXCEL_STREAMING = True
+        const_mod.DP_PARTITION_CACHE = "none"
+        const_mod.DP_PARTITION_CACHE_PREFIX = "partition_cache"
+        const_mod.DP_PARTITION_CACHE_DIR = "/tmp/partition_cache"
+        const_mod.DP_PARTITION_CACHE_TTL_S = 604800
+        const_mod.DP_TASK_REGISTRY = True
+        const_mod.DP_TASK_RESULT_TTL_S = 604800
+        const_mod.DP_FORWARD_SEGMENT_CHUNKS = 256
+        const_mod.DP_FORWARD_SEGMENT_TIMEOUT_S = 60
+        const_mod.DP_FORWARD_COMMIT_TIMEOUT_S = 600
         sys.modules["consts.const"] = const_mod
     
     # Stub celery module and submodules (required by tasks.py imported via __init__.py)
@@ -132,6 +158,8 @@ def setup_mocks_for_worker(mocker, initialized=False):
         sys.modules["database"] = db_pkg
     if "database.attachment_db" not in sys.modules:
         sys.modules["database.attachment_db"] = types.SimpleNamespace(
+            get_file_stream=lambda source: None,
+            open_file_stream=lambda source: None,
             get_file_size_from_minio=lambda object_name, bucket=None: 0,
         )
         setattr(sys.modules["database"], "attachment_db", sys.modules["database.attachment_db"])
@@ -183,6 +211,11 @@ def setup_mocks_for_worker(mocker, initialized=False):
     if "backend.data_process.ray_actors" not in sys.modules:
         ray_actors_mod = types.ModuleType("backend.data_process.ray_actors")
         ray_actors_mod.DataProcessorRayActor = type("DataProcessorRayActor", (), {})
+        ray_actors_mod.ChunkRefRegistryActor = type("ChunkRefRegistryActor", (), {})
+        ray_actors_mod.DataProcessorPoolActor = type("DataProcessorPoolActor", (), {})
+        ray_actors_mod.DOCUMENT_LANE = "document"
+        ray_actors_mod.route_processing_lane = lambda *a, **k: "document"
+        ray_actors_mod.resolve_chunk_size_params = lambda *a, **k: {}
         sys.modules["backend.data_process.ray_actors"] = ray_actors_mod
     
     # Stub aiohttp (required by tasks.py)
@@ -647,3 +680,41 @@ def test_task_failure_handler(mocker):
     )
     
     assert worker_module.worker_state['tasks_failed'] == initial_failed + 1
+
+
+def test_task_signals_update_task_registry(mocker):
+    """Test process/forward task signals record their status in the task registry"""
+    worker_module, _ = setup_mocks_for_worker(mocker)
+    mocker.patch.object(worker_module, "get_registry_client", return_value="client")
+    record = mocker.patch.object(worker_module, "record_task_status")
+    task = types.SimpleNamespace(name="data_process.tasks.process")
+    task_kwargs = {"index_name": "kb1", "source": "kb1/a.pdf", "source_type": "minio", "original_filename": "a.pdf"}
+
+    worker_module.task_prerun_handler(task=task, task_id="p1", kwargs=task_kwargs)
+    worker_module.task_postrun_handler(task=task, task_id="p1", kwargs=task_kwargs, state="SUCCESS",
+                                       retval={"chunks_count": 3, "chunks": []})
+    worker_module.task_failure_handler(sender=task, task_id="p1", kwargs=task_kwargs,
+                                       exception=Exception('{"message": "bad pdf", "index_name": "kb1"}'))
+
+    statuses = [call.args[4] for call in record.call_args_list]
+    assert statuses == ["STARTED", "SUCCESS", "FAILURE"]
+    assert record.call_args_list[0].args[:4] == ("client", "p1", "process", "kb1")
+    assert record.call_args_list[0].kwargs["path_or_url"] == "kb1/a.pdf"
+    assert record.call_args_list[1].kwargs["chunks_count"] == 3
+    assert "chunks" not in record.call_args_list[1].kwargs
+    assert record.call_args_list[2].kwargs["error"] == "bad pdf"
+
+
+def test_task_registry_ignores_other_tasks_and_errors(mocker):
+    """Test tasks without an index are skipped and registry errors do not propagate"""
+    worker_module, _ = setup_mocks_for_worker(mocker)
+    mocker.patch.object(worker_module, "get_registry_client", return_value="client")
+    record = mocker.patch.object(worker_module, "record_task_status", side_effect=Exception("redis down"))
+
+    worker_module.update_task_registry("data_process.tasks.process_sync", "t1", {"index_name": "kb1"}, "STARTED")
+    worker_module.update_task_registry("data_process.tasks.forward", "t2", {}, "STARTED")
+    record.assert_not_called()
+
+    # Should not raise
+    worker_module.update_task_registry("data_process.tasks.forward", "t3", {"index_name": "kb1"}, "STARTED")
+    record.assert_called_once()
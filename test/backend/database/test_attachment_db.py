@@ -72,6 +72,7 @@ with patch('backend.database.attachment_db.minio_client', minio_client_mock):
         list_files,
         delete_file,
         get_file_stream,
+        open_file_stream,
         get_content_type
     )
 
@@ -453,6 +454,26 @@ class TestGetFileStream:
         assert result is None
 
 
+class TestOpenFileStream:
+    """Test cases for open_file_stream function"""
+
+    def test_open_file_stream_returns_storage_stream(self):
+        """The storage stream is returned as is, without reading it into memory"""
+        mock_stream = MagicMock()
+        minio_client_mock.get_file_stream.return_value = (True, mock_stream)
+
+        result = open_file_stream('attachments/test.txt', 'bucket')
+
+        assert result is mock_stream
+        mock_stream.read.assert_not_called()
+
+    def test_open_file_stream_failure(self):
+        """Test open_file_stream returns None on failure"""
+        minio_client_mock.get_file_stream.return_value = (False, 'Stream failed')
+
+        assert open_file_stream('attachments/test.txt', 'bucket') is None
+
+
 class TestGetContentType:
     """Test cases for get_content_type function"""
 
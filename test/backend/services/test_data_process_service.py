@@ -4,7 +4,7 @@ import os
 import io
 import base64
 import asyncio
-from unittest.mock import patch, MagicMock, AsyncMock
+from unittest.mock import patch, MagicMock, AsyncMock, ANY
 import warnings
 from PIL import Image
 import pytest
@@ -42,6 +42,7 @@ mock_const.CLIP_MODEL_PATH = "mock_clip_path"
 mock_const.IMAGE_FILTER = True
 mock_const.REDIS_BACKEND_URL = "redis://mock:6379/0"
 mock_const.REDIS_URL = "redis://mock:6379/0"
+mock_const.DP_TASK_REGISTRY = False
 sys.modules['consts.const'] = mock_const
 
 # from backend.services.data_process_service import DataProcessService, get_data_process_service
@@ -682,6 +683,109 @@ class TestDataProcessService(unittest.TestCase):
         """
         asyncio.run(self.async_test_get_index_tasks())
 
+    @patch('backend.services.data_process_service.DataProcessService.get_all_tasks')
+    @patch('backend.services.data_process_service.get_index_task_records')
+    @patch('backend.services.data_process_service.DP_TASK_REGISTRY', True)
+    def test_get_index_tasks_reads_task_registry(self, mock_get_records, mock_get_all_tasks):
+        """
+        Test get_index_tasks reads the index's records from the task registry without listing all tasks.
+        """
+        records = [{'id': 'task1', 'index_name': 'index1', 'task_name': 'process', 'status': 'SUCCESS'}]
+        mock_get_records.return_value = records
+        self.service.redis_client = MagicMock()
+
+        result = asyncio.run(self.service.get_index_tasks('index1'))
+
+        self.assertEqual(result, records)
+        mock_get_records.assert_called_once_with(self.service.redis_client, 'index1')
+        mock_get_all_tasks.assert_not_called()
+
+    @patch('backend.services.data_process_service.DataProcessService._get_celery_inspector')
+    @patch('backend.services.data_process_service.get_all_task_records')
+    @patch('backend.services.data_process_service.get_index_task_records')
+    @patch('backend.services.data_process_service.DP_TASK_REGISTRY', True)
+    def test_get_index_tasks_falls_back_when_registry_fails(self, mock_get_records, mock_get_all_records,
+                                                            mock_get_inspector):
+        """
+        Test get_index_tasks falls back to Celery when the task registry cannot be read.
+        """
+        mock_get_records.side_effect = Exception("Redis connection failed")
+        mock_get_all_records.side_effect = Exception("Redis connection failed")
+        mock_get_inspector.side_effect = Exception("No workers")
+        self.service.redis_client = MagicMock()
+
+        result = asyncio.run(self.service.get_index_tasks('index1'))
+
+        self.assertEqual(result, [])
+        mock_get_records.assert_called_once()
+        mock_get_inspector.assert_called_once()
+
+    @patch('backend.services.data_process_service.DataProcessService.get_index_tasks')
+    def test_get_index_files_status(self, mock_get_index_tasks):
+        """
+        Test get_index_files_status resolves every file's state from the index's tasks in one pass.
+        """
+        mock_get_index_tasks.return_value = [
+            {'id': 'p1', 'task_name': 'process', 'path_or_url': 'kb/a.pdf', 'status': 'SUCCESS', 'created_at': 1.0,
+             'original_filename': 'a.pdf', 'source_type': 'minio'},
+            {'id': 'f1', 'task_name': 'forward', 'path_or_url': 'kb/a.pdf', 'status': 'SUCCESS', 'created_at': 2.0,
+             'original_filename': 'a.pdf', 'source_type': 'minio'},
+            {'id': 'p2', 'task_name': 'process', 'path_or_url': 'kb/b.pdf', 'status': 'STARTED', 'created_at': 3.0,
+             'original_filename': 'b.pdf', 'source_type': 'minio'},
+        ]
+
+        result = asyncio.run(self.service.get_index_files_status('index1'))
+
+        mock_get_index_tasks.assert_called_once_with('index1')
+        self.assertEqual(result['kb/a.pdf'], {'state': 'COMPLETED', 'latest_task_id': 'f1',
+                                              'original_filename': 'a.pdf', 'source_type': 'minio'})
+        self.assertEqual(result['kb/b.pdf']['state'], 'PROCESSING')
+
+    @patch('backend.services.data_process_service.record_task_status')
+    @patch('backend.services.data_process_service.DP_TASK_REGISTRY', True)
+    @patch('backend.services.data_process_service.chain')
+    @patch('backend.services.data_process_service.forward')
+    @patch('backend.services.data_process_service.process')
+    def test_create_batch_tasks_registers_pending_tasks(self, mock_process, mock_forward, mock_chain,
+                                                        mock_record):
+        """
+        Test the process and forward tasks of each new chain are registered as PENDING before it is dispatched.
+        """
+        mock_process.s.return_value.set.return_value = MagicMock()
+        mock_forward.s.return_value.set.return_value = MagicMock()
+        events = []
+        mock_record.side_effect = lambda *a, **k: events.append("record")
+
+        def apply_async():
+            events.append("dispatch")
+            return MagicMock(id=mock_forward.s.return_value.set.call_args.kwargs['task_id'])
+
+        mock_chain.return_value.apply_async.side_effect = apply_async
+        self.service.redis_client = MagicMock()
+
+        from consts.model import BatchTaskRequest
+        request = BatchTaskRequest(sources=[{
+            'source': 'kb/doc1.pdf',
+            'source_type': 'minio',
+            'chunking_strategy': 'basic',
+            'index_name': 'index1',
+            'original_filename': 'doc1.pdf'
+        }])
+        result = asyncio.run(self.service.create_batch_tasks_impl(None, request))
+
+        process_id = mock_process.s.return_value.set.call_args.kwargs['task_id']
+        forward_id = mock_forward.s.return_value.set.call_args.kwargs['task_id']
+        self.assertEqual(result, [forward_id])
+        self.assertEqual(events, ["record", "record", "dispatch"])
+        registered = [(c.args[1], c.args[2], c.args[3], c.args[4]) for c in mock_record.call_args_list]
+        self.assertEqual(registered, [
+            (process_id, "process", "index1", states.PENDING),
+            (forward_id, "forward", "index1", states.PENDING),
+        ])
+        self.assertIn('ttl_s', mock_record.call_args.kwargs)
+        self.assertEqual(mock_record.call_args.kwargs['path_or_url'], 'kb/doc1.pdf')
+        self.assertEqual(mock_record.call_args.kwargs['source_type'], 'minio')
+
     @patch('aiohttp.ClientSession')
     @pytest.mark.asyncio
     async def async_test_load_image_from_url(self, mock_session):
@@ -1616,8 +1720,8 @@ class TestDataProcessService(unittest.TestCase):
         actual_process_calls = [kwargs for args,
                                 kwargs in mock_process.s.call_args_list]
         self.assertEqual(actual_process_calls, expected_process_calls)
-        process_sig_1.set.assert_called_once_with(queue='process_q')
-        process_sig_2.set.assert_called_once_with(queue='process_q')
+        process_sig_1.set.assert_called_once_with(queue='process_q', task_id=ANY)
+        process_sig_2.set.assert_called_once_with(queue='process_q', task_id=ANY)
 
         expected_forward_calls = [
             {
@@ -1638,8 +1742,8 @@ class TestDataProcessService(unittest.TestCase):
         actual_forward_calls = [kwargs for args,
                                 kwargs in mock_forward.s.call_args_list]
         self.assertEqual(actual_forward_calls, expected_forward_calls)
-        forward_sig_1.set.assert_called_once_with(queue='forward_q')
-        forward_sig_2.set.assert_called_once_with(queue='forward_q')
+        forward_sig_1.set.assert_called_once_with(queue='forward_q', task_id=ANY)
+        forward_sig_2.set.assert_called_once_with(queue='forward_q', task_id=ANY)
 
     @patch('backend.services.data_process_service.chain')
     @patch('backend.services.data_process_service.forward')
@@ -20,6 +20,8 @@ if "nexent.core" not in sys.modules:
     sys.modules["nexent.core"] = mock.MagicMock()
 if "nexent.core.agents" not in sys.modules:
     sys.modules["nexent.core.agents"] = mock.MagicMock()
+if "utils.embedding_cache_utils" not in sys.modules:
+    sys.modules["utils.embedding_cache_utils"] = mock.MagicMock()
 if "nexent.core.agents.agent_model" not in sys.modules:
     agent_model_mod = types.ModuleType("nexent.core.agents.agent_model")
 
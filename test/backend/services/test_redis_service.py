@@ -1,5 +1,5 @@
 import unittest
-from unittest.mock import patch, MagicMock, call
+from unittest.mock import patch, MagicMock, call, ANY
 import json
 import os
 import redis
@@ -217,7 +217,7 @@ class TestRedisService(unittest.TestCase):
         self.assertIn("Test error", result["errors"][0])
     
     def test_cleanup_celery_tasks(self):
-        """Test _cleanup_celery_tasks method"""
+        """Test _cleanup_celery_tasks scans task results when the registry has none for the index"""
         # Setup
         self.redis_service._backend_client = self.mock_backend_client
         
@@ -227,7 +227,7 @@ class TestRedisService(unittest.TestCase):
         # Task 1 matches our index
         task1_data = json.dumps({
             'result': {'index_name': 'test_index', 'some_key': 'some_value'},
-            'parent_id': '2'  # This will trigger a parent lookup
+            'parent_id': '2'  # Its parent also matches, so it is not looked up twice
         }).encode()
         
         # Task 2 has index name in a different location
@@ -242,29 +242,93 @@ class TestRedisService(unittest.TestCase):
             'result': {'index_name': 'other_index', 'some_key': 'some_value'}
         }).encode()
         
-        # Configure mock responses
-        self.mock_backend_client.keys.return_value = task_keys
-        self.mock_backend_client.get.side_effect = [task1_data, task2_data, task3_data]
-        
-        # We expect delete to be called and return 1 each time
-        self.mock_backend_client.delete.return_value = 1
+        # Configure mock responses: nothing registered, one MGET for the scan and one for the chains
+        self.mock_backend_client.zrange.return_value = []
+        self.mock_backend_client.exists.return_value = 0  # Legacy results not migrated yet
+        self.mock_backend_client.scan_iter.return_value = iter(task_keys)
+        self.mock_backend_client.mget.side_effect = [[task1_data, task2_data, task3_data], [task1_data, task2_data]]
+        self.mock_backend_client.delete.return_value = 2
+        mock_pipe = self.mock_backend_client.pipeline.return_value
+        mock_pipe.execute.side_effect = [[1], [None, None], []]  # Task 3 is registered
         
         # Execute
-        with patch.object(self.redis_service, '_recursively_delete_task_and_parents') as mock_recursive_delete:
-            mock_recursive_delete.side_effect = [(1, {'1'}), (1, {'2'})]
-            result = self.redis_service._cleanup_celery_tasks("test_index")
+        result = self.redis_service._cleanup_celery_tasks("test_index")
         
         # Verify
-        self.mock_backend_client.keys.assert_called_once_with('celery-task-meta-*')
-        # We expect 3 calls - one for each task key
-        self.assertEqual(self.mock_backend_client.get.call_count, 3)
+        self.mock_backend_client.keys.assert_not_called()
+        self.mock_backend_client.scan_iter.assert_called_once_with(match='celery-task-meta-*', count=1000)
+        self.assertEqual(self.mock_backend_client.mget.call_count, 2)
+        self.mock_backend_client.get.assert_not_called()
         
-        # Should have called recursive delete twice (for task1 and task2)
-        self.assertEqual(mock_recursive_delete.call_count, 2)
+        # Both matching tasks are deleted with a single DEL
+        self.mock_backend_client.delete.assert_called_once_with('celery-task-meta-1', 'celery-task-meta-2')
+        
+        # No unregistered result is left, so later cleanups skip the scan
+        mock_pipe.exists.assert_called_once_with('dp:task:3')
+        self.mock_backend_client.set.assert_called_once_with('dp:legacy_tasks_migrated', ANY)
         
         # Return value should be the number of deleted tasks
         self.assertEqual(result, 2)
     
+    def test_cleanup_celery_tasks_from_registry(self):
+        """Test _cleanup_celery_tasks deletes the registered tasks of the index without scanning"""
+        # Setup
+        self.redis_service._backend_client = self.mock_backend_client
+        
+        # Registered tasks of the index, the forward task being the child of p0
+        self.mock_backend_client.zrange.return_value = [b'p1', b'f1']
+        self.mock_backend_client.exists.return_value = 1  # Legacy results already migrated
+        self.mock_backend_client.mget.side_effect = [
+            [json.dumps({'parent_id': None}).encode(), json.dumps({'parent_id': 'p0'}).encode()],
+            [json.dumps({'parent_id': None}).encode()],
+        ]
+        self.mock_backend_client.delete.side_effect = [2, 1]
+        mock_pipe = self.mock_backend_client.pipeline.return_value
+        mock_pipe.execute.return_value = [b'kb/a.pdf', b'kb/a.pdf']
+        
+        # Execute
+        result = self.redis_service._cleanup_celery_tasks("test_index")
+        
+        # Verify
+        self.assertEqual(result, 3)
+        self.mock_backend_client.zrange.assert_called_once_with('dp:index_tasks:test_index', 0, -1)
+        self.mock_backend_client.scan_iter.assert_not_called()
+        self.mock_backend_client.mget.assert_has_calls([
+            call(['celery-task-meta-p1', 'celery-task-meta-f1']),
+            call(['celery-task-meta-p0']),
+        ])
+        
+        # Registry records of the index are removed as well
+        path_hash = hashlib.md5(b'kb/a.pdf').hexdigest()
+        mock_pipe.delete.assert_has_calls([
+            call('dp:task:p1', 'dp:task:f1'),
+            call(f'dp:doc_tasks:test_index:{path_hash}'),
+            call('dp:index_tasks:test_index'),
+        ])
+        mock_pipe.srem.assert_called_once_with('dp:task_indices', 'test_index')
+    
+    def test_cleanup_celery_tasks_registry_and_legacy(self):
+        """Test _cleanup_celery_tasks also scans for older tasks of an index that has registered ones"""
+        # Setup
+        self.redis_service._backend_client = self.mock_backend_client
+        self.mock_backend_client.zrange.return_value = [b'f1']
+        self.mock_backend_client.exists.return_value = 0
+        self.mock_backend_client.scan_iter.return_value = iter([b'celery-task-meta-f1', b'celery-task-meta-1'])
+        legacy_data = json.dumps({'result': {'index_name': 'test_index'}}).encode()
+        registered_data = json.dumps({'result': {'index_name': 'test_index'}, 'parent_id': None}).encode()
+        self.mock_backend_client.mget.side_effect = [[registered_data, legacy_data], [registered_data, legacy_data]]
+        self.mock_backend_client.delete.return_value = 2
+        mock_pipe = self.mock_backend_client.pipeline.return_value
+        mock_pipe.execute.side_effect = [[None], []]
+        
+        # Execute
+        result = self.redis_service._cleanup_celery_tasks("test_index")
+        
+        # Verify
+        self.assertEqual(result, 2)
+        self.mock_backend_client.delete.assert_called_once_with('celery-task-meta-f1', 'celery-task-meta-1')
+        self.mock_backend_client.set.assert_called_once_with('dp:legacy_tasks_migrated', ANY)
+    
     def test_cleanup_cache_keys(self):
         """Test _cleanup_cache_keys method"""
         # Setup
@@ -272,27 +336,27 @@ class TestRedisService(unittest.TestCase):
         
         # Configure mock responses for each pattern
         pattern_keys = {
-            '*test_index*': [b'key1', b'key2'],
+            '*test_index*': [b'key1', b'key2'],  # Not scanned, the patterns are index prefixes only
             'kb:test_index:*': [b'key3', b'key4', b'key5'],
             'index:test_index:*': [b'key6'],
             'search:test_index:*': [b'key7', b'key8']
         }
         
-        def mock_keys_side_effect(pattern):
-            return pattern_keys.get(pattern, [])
+        def mock_scan_iter_side_effect(match, count):
+            return iter(pattern_keys.get(match, []))
         
-        self.mock_redis_client.keys.side_effect = mock_keys_side_effect
+        self.mock_redis_client.scan_iter.side_effect = mock_scan_iter_side_effect
         self.mock_redis_client.delete.return_value = 1  # Each delete operation deletes 1 key
         
         # Execute
         result = self.redis_service._cleanup_cache_keys("test_index")
         
         # Verify
-        self.assertEqual(self.mock_redis_client.keys.call_count, 4)
+        self.assertEqual(self.mock_redis_client.scan_iter.call_count, 3)
+        self.mock_redis_client.keys.assert_not_called()
         
-        # All keys should be deleted (8 keys total)
+        # All keys under the index prefixes should be deleted (6 keys total)
         expected_calls = [
-            call(b'key1', b'key2'),
             call(b'key3', b'key4', b'key5'),
             call(b'key6'),
             call(b'key7', b'key8')
@@ -300,10 +364,25 @@ class TestRedisService(unittest.TestCase):
         self.mock_redis_client.delete.assert_has_calls(expected_calls, any_order=True)
         
         # Return value should be the number of deleted keys
-        self.assertEqual(result, 4)  # 4 successful delete operations
+        self.assertEqual(result, 3)  # 3 successful delete operations
+    
+    def test_cleanup_cache_keys_deletes_in_batches(self):
+        """Test _cleanup_cache_keys deletes scanned keys with one DEL per batch"""
+        # Setup
+        self.redis_service._client = self.mock_redis_client
+        keys = [f'kb:test_index:{i}'.encode() for i in range(2500)]
+        self.mock_redis_client.scan_iter.side_effect = lambda match, count: iter(keys if match == 'kb:test_index:*' else [])
+        self.mock_redis_client.delete.side_effect = lambda *batch: len(batch)
+        
+        # Execute
+        result = self.redis_service._cleanup_cache_keys("test_index")
+        
+        # Verify
+        self.assertEqual(result, 2500)
+        self.assertEqual([len(c.args) for c in self.mock_redis_client.delete.call_args_list], [1000, 1000, 500])
     
     def test_cleanup_document_celery_tasks(self):
-        """Test _cleanup_document_celery_tasks method"""
+        """Test _cleanup_document_celery_tasks scans task results when the registry has none for the document"""
         # Setup
         self.redis_service._backend_client = self.mock_backend_client
         
@@ -316,7 +395,7 @@ class TestRedisService(unittest.TestCase):
                 'index_name': 'test_index',
                 'source': 'path/to/doc.pdf'
             },
-            'parent_id': '2'  # This will trigger a parent lookup
+            'parent_id': '0'  # This will trigger a parent lookup
         }).encode()
         
         # Task 2 has the right index but wrong document
@@ -336,28 +415,61 @@ class TestRedisService(unittest.TestCase):
             'parent_id': None  # No parent
         }).encode()
         
-        # Configure mock responses
-        self.mock_backend_client.keys.return_value = task_keys
-        self.mock_backend_client.get.side_effect = [task1_data, task2_data, task3_data]
+        # Parent of task 1
+        task0_data = json.dumps({'result': {}}).encode()
         
-        # We expect delete to be called and return 1 each time
-        self.mock_backend_client.delete.return_value = 1
+        # Configure mock responses
+        self.mock_backend_client.zrange.return_value = []
+        self.mock_backend_client.exists.return_value = 0  # Legacy results not migrated yet
+        self.mock_backend_client.scan_iter.return_value = iter(task_keys)
+        self.mock_backend_client.mget.side_effect = [
+            [task1_data, task2_data, task3_data],  # scan
+            [task1_data, task3_data],  # matching tasks
+            [task0_data],  # their parents
+        ]
+        self.mock_backend_client.delete.side_effect = [2, 1]
+        mock_pipe = self.mock_backend_client.pipeline.return_value
+        mock_pipe.execute.side_effect = [[0], []]  # Task 2 predates the registry
         
         # Execute
-        with patch.object(self.redis_service, '_recursively_delete_task_and_parents') as mock_recursive_delete:
-            mock_recursive_delete.side_effect = [(1, {'1'}), (1, {'3'})]
-            result = self.redis_service._cleanup_document_celery_tasks("test_index", "path/to/doc.pdf")
+        result = self.redis_service._cleanup_document_celery_tasks("test_index", "path/to/doc.pdf")
         
         # Verify
-        self.mock_backend_client.keys.assert_called_once_with('celery-task-meta-*')
-        # We expect 3 calls - one for each task key
-        self.assertEqual(self.mock_backend_client.get.call_count, 3)
+        path_hash = hashlib.md5(b'path/to/doc.pdf').hexdigest()
+        self.mock_backend_client.zrange.assert_called_once_with(f'dp:doc_tasks:test_index:{path_hash}', 0, -1)
+        self.mock_backend_client.scan_iter.assert_called_once_with(match='celery-task-meta-*', count=1000)
+        self.mock_backend_client.delete.assert_has_calls([
+            call('celery-task-meta-1', 'celery-task-meta-3'),
+            call('celery-task-meta-0'),
+        ])
         
-        # Should have called recursive delete twice (for task1 and task3)
-        self.assertEqual(mock_recursive_delete.call_count, 2)
+        # Task 2 still needs the scan, so the migration marker is not set
+        self.mock_backend_client.set.assert_not_called()
         
         # Return value should be the number of deleted tasks
-        self.assertEqual(result, 2)
+        self.assertEqual(result, 3)
+    
+    def test_cleanup_document_celery_tasks_from_registry(self):
+        """Test _cleanup_document_celery_tasks deletes only the registered tasks of the document"""
+        # Setup
+        self.redis_service._backend_client = self.mock_backend_client
+        self.mock_backend_client.zrange.return_value = [b'p1']
+        self.mock_backend_client.exists.return_value = 1  # Legacy results already migrated
+        self.mock_backend_client.mget.return_value = [json.dumps({'parent_id': None}).encode()]
+        self.mock_backend_client.delete.return_value = 1
+        mock_pipe = self.mock_backend_client.pipeline.return_value
+        
+        # Execute
+        result = self.redis_service._cleanup_document_celery_tasks("test_index", "path/to/doc.pdf")
+        
+        # Verify
+        self.assertEqual(result, 1)
+        self.mock_backend_client.scan_iter.assert_not_called()
+        self.mock_backend_client.delete.assert_called_once_with('celery-task-meta-p1')
+        path_hash = hashlib.md5(b'path/to/doc.pdf').hexdigest()
+        mock_pipe.zrem.assert_called_once_with('dp:index_tasks:test_index', 'p1')
+        mock_pipe.delete.assert_has_calls([call('dp:task:p1'), call(f'dp:doc_tasks:test_index:{path_hash}')])
+        mock_pipe.srem.assert_not_called()
     
     @patch('hashlib.md5')
     @patch('urllib.parse.quote')
@@ -374,28 +486,26 @@ class TestRedisService(unittest.TestCase):
         
         # Configure mock responses for each pattern
         pattern_keys = {
-            '*test_index*safe_path*': [b'key1'],
-            '*test_index*path_hash*': [b'key2', b'key3'],
             'kb:test_index:doc:safe_path*': [b'key4'],
             'kb:test_index:doc:path_hash*': [b'key5'],
             'doc:safe_path:*': [b'key6', b'key7'],
             'doc:path_hash:*': [b'key8']
         }
         
-        def mock_keys_side_effect(pattern):
-            return pattern_keys.get(pattern, [])
+        def mock_scan_iter_side_effect(match, count):
+            return iter(pattern_keys.get(match, []))
         
-        self.mock_redis_client.keys.side_effect = mock_keys_side_effect
+        self.mock_redis_client.scan_iter.side_effect = mock_scan_iter_side_effect
         self.mock_redis_client.delete.return_value = 1  # Each delete operation deletes 1 key
         
         # Execute
         result = self.redis_service._cleanup_document_cache_keys("test_index", "path/to/doc.pdf")
         
         # Verify
-        self.assertEqual(self.mock_redis_client.keys.call_count, 6)
+        self.assertEqual(self.mock_redis_client.scan_iter.call_count, 4)
         
         # Return value should be the number of deleted keys
-        self.assertEqual(result, 6)  # 6 successful delete operations
+        self.assertEqual(result, 4)  # 4 successful delete operations
     
     def test_get_knowledgebase_task_count(self):
         """Test get_knowledgebase_task_count method"""
@@ -416,32 +526,50 @@ class TestRedisService(unittest.TestCase):
             'result': {'index_name': 'other_index'}
         }).encode()
         
-        # Configure mock responses for Celery tasks
-        self.mock_backend_client.keys.return_value = task_keys
-        self.mock_backend_client.get.side_effect = [task1_data, task2_data]
+        # Configure mock responses for Celery tasks, none of them registered
+        self.mock_backend_client.zrange.return_value = []
+        self.mock_backend_client.exists.return_value = 0  # Legacy results not migrated yet
+        self.mock_backend_client.scan_iter.return_value = iter(task_keys)
+        self.mock_backend_client.mget.return_value = [task1_data, task2_data]
         
         # Configure mock responses for cache keys
         cache_keys = {
-            '*test_index*': [b'key1', b'key2'],
-            'kb:test_index:*': [b'key3', b'key4'],
-            'index:test_index:*': [b'key5']
+            'kb:test_index:*': [b'key1', b'key2'],
+            'index:test_index:*': [b'key3', b'key4'],
+            'search:test_index:*': [b'key5']
         }
         
-        def mock_keys_side_effect(pattern):
-            return cache_keys.get(pattern, [])
+        def mock_scan_iter_side_effect(match, count):
+            return iter(cache_keys.get(match, []))
         
-        self.mock_redis_client.keys.side_effect = mock_keys_side_effect
+        self.mock_redis_client.scan_iter.side_effect = mock_scan_iter_side_effect
         
         # Execute
         result = self.redis_service.get_knowledgebase_task_count("test_index")
         
         # Verify
-        self.mock_backend_client.keys.assert_called_once_with('celery-task-meta-*')
-        self.assertEqual(self.mock_backend_client.get.call_count, 2)
+        self.mock_backend_client.scan_iter.assert_called_once_with(match='celery-task-meta-*', count=1000)
+        self.mock_backend_client.mget.assert_called_once_with(['celery-task-meta-1', 'celery-task-meta-2'])
         
         # Should count 1 matching task and 5 cache keys
         self.assertEqual(result, 6)
     
+    def test_get_knowledgebase_task_count_from_registry(self):
+        """Test get_knowledgebase_task_count counts registered tasks without scanning task results"""
+        # Setup
+        self.redis_service._client = self.mock_redis_client
+        self.redis_service._backend_client = self.mock_backend_client
+        self.mock_backend_client.zrange.return_value = [b'p1', b'f1', b'p2']
+        self.mock_backend_client.exists.return_value = 1  # Legacy results already migrated
+        self.mock_redis_client.scan_iter.side_effect = lambda match, count: iter([])
+        
+        # Execute
+        result = self.redis_service.get_knowledgebase_task_count("test_index")
+        
+        # Verify
+        self.assertEqual(result, 3)
+        self.mock_backend_client.scan_iter.assert_not_called()
+    
     def test_ping_success(self):
         """Test ping method when connection is successful"""
         # Setup
@@ -492,8 +620,8 @@ class TestRedisService(unittest.TestCase):
         self.assertEqual(service1, mock_instance)
         self.assertEqual(service2, mock_instance)  # Should return same instance
     
-    def test_recursively_delete_task_and_parents_no_parent(self):
-        """Test _recursively_delete_task_and_parents with task that has no parent"""
+    def test_delete_task_chains_no_parent(self):
+        """Test _delete_task_chains with a task that has no parent"""
         # Setup
         self.redis_service._backend_client = self.mock_backend_client
         
@@ -502,20 +630,20 @@ class TestRedisService(unittest.TestCase):
             'parent_id': None
         }).encode()
         
-        self.mock_backend_client.get.return_value = task_data
+        self.mock_backend_client.mget.return_value = [task_data]
         self.mock_backend_client.delete.return_value = 1
         
         # Execute
-        deleted_count, processed_ids = self.redis_service._recursively_delete_task_and_parents("task123")
+        deleted_count, processed_ids = self.redis_service._delete_task_chains(["task123"])
         
         # Verify
         self.assertEqual(deleted_count, 1)
         self.assertEqual(processed_ids, {"task123"})
-        self.mock_backend_client.get.assert_called_once_with('celery-task-meta-task123')
+        self.mock_backend_client.mget.assert_called_once_with(['celery-task-meta-task123'])
         self.mock_backend_client.delete.assert_called_once_with('celery-task-meta-task123')
     
-    def test_recursively_delete_task_and_parents_with_cycle_detection(self):
-        """Test _recursively_delete_task_and_parents detects and breaks cycles"""
+    def test_delete_task_chains_with_cycle_detection(self):
+        """Test _delete_task_chains detects and breaks cycles"""
         # Setup
         self.redis_service._backend_client = self.mock_backend_client
         
@@ -523,50 +651,49 @@ class TestRedisService(unittest.TestCase):
         task1_data = json.dumps({'parent_id': 'task2'}).encode()
         task2_data = json.dumps({'parent_id': 'task1'}).encode()
         
-        self.mock_backend_client.get.side_effect = [task1_data, task2_data]
+        self.mock_backend_client.mget.side_effect = [[task1_data], [task2_data]]
         self.mock_backend_client.delete.return_value = 1
         
         # Execute
-        deleted_count, processed_ids = self.redis_service._recursively_delete_task_and_parents("task1")
+        deleted_count, processed_ids = self.redis_service._delete_task_chains(["task1"])
         
         # Verify - should stop when cycle is detected
         self.assertEqual(deleted_count, 2)
         self.assertEqual(processed_ids, {"task1", "task2"})
+        self.assertEqual(self.mock_backend_client.mget.call_count, 2)
         self.assertEqual(self.mock_backend_client.delete.call_count, 2)
     
-    def test_recursively_delete_task_and_parents_json_decode_error(self):
-        """Test _recursively_delete_task_and_parents handles JSON decode errors"""
+    def test_delete_task_chains_json_decode_error(self):
+        """Test _delete_task_chains handles JSON decode errors"""
         # Setup
         self.redis_service._backend_client = self.mock_backend_client
         
         # Invalid JSON data
         invalid_json_data = b'invalid json data'
         
-        self.mock_backend_client.get.return_value = invalid_json_data
+        self.mock_backend_client.mget.return_value = [invalid_json_data]
         self.mock_backend_client.delete.return_value = 1
         
         # Execute
-        deleted_count, processed_ids = self.redis_service._recursively_delete_task_and_parents("task123")
+        deleted_count, processed_ids = self.redis_service._delete_task_chains(["task123"])
         
         # Verify - should still delete the task even if JSON parsing fails
         self.assertEqual(deleted_count, 1)
         self.assertEqual(processed_ids, {"task123"})
         self.mock_backend_client.delete.assert_called_once_with('celery-task-meta-task123')
     
-    def test_recursively_delete_task_and_parents_redis_error(self):
-        """Test _recursively_delete_task_and_parents handles Redis errors"""
+    def test_delete_task_chains_redis_error(self):
+        """Test _delete_task_chains lets Redis errors reach the cleanup result"""
         # Setup
         self.redis_service._backend_client = self.mock_backend_client
         
         # Simulate Redis error
-        self.mock_backend_client.get.side_effect = redis.RedisError("Connection lost")
-        
-        # Execute
-        deleted_count, processed_ids = self.redis_service._recursively_delete_task_and_parents("task123")
+        self.mock_backend_client.mget.side_effect = redis.RedisError("Connection lost")
         
-        # Verify - should return 0 when Redis error occurs
-        self.assertEqual(deleted_count, 0)
-        self.assertEqual(processed_ids, {"task123"})
+        # Execute & Verify
+        with self.assertRaises(redis.RedisError):
+            self.redis_service._delete_task_chains(["task123"])
+        self.mock_backend_client.delete.assert_not_called()
     
     def test_cleanup_celery_tasks_with_failed_task_metadata(self):
         """Test _cleanup_celery_tasks handles failed tasks with exception metadata"""
@@ -582,17 +709,18 @@ class TestRedisService(unittest.TestCase):
             }
         }).encode()
         
-        self.mock_backend_client.keys.return_value = task_keys
-        self.mock_backend_client.get.return_value = task_data
+        self.mock_backend_client.zrange.return_value = []
+        self.mock_backend_client.exists.return_value = 0  # Legacy results not migrated yet
+        self.mock_backend_client.scan_iter.return_value = iter(task_keys)
+        self.mock_backend_client.mget.return_value = [task_data]
+        self.mock_backend_client.delete.return_value = 1
         
         # Execute
-        with patch.object(self.redis_service, '_recursively_delete_task_and_parents') as mock_recursive_delete:
-            mock_recursive_delete.return_value = (1, {'1'})
-            result = self.redis_service._cleanup_celery_tasks("test_index")
+        result = self.redis_service._cleanup_celery_tasks("test_index")
         
         # Verify
         self.assertEqual(result, 1)
-        mock_recursive_delete.assert_called_once_with('1')
+        self.mock_backend_client.delete.assert_called_once_with('celery-task-meta-1')
     
     def test_cleanup_celery_tasks_invalid_exception_metadata(self):
         """Test _cleanup_celery_tasks handles invalid exception metadata gracefully"""
@@ -608,8 +736,10 @@ class TestRedisService(unittest.TestCase):
             }
         }).encode()
         
-        self.mock_backend_client.keys.return_value = task_keys
-        self.mock_backend_client.get.return_value = task_data
+        self.mock_backend_client.zrange.return_value = []
+        self.mock_backend_client.exists.return_value = 0  # Legacy results not migrated yet
+        self.mock_backend_client.scan_iter.return_value = iter(task_keys)
+        self.mock_backend_client.mget.return_value = [task_data]
         
         # Execute
         result = self.redis_service._cleanup_celery_tasks("test_index")
@@ -623,17 +753,17 @@ class TestRedisService(unittest.TestCase):
         self.redis_service._client = self.mock_redis_client
         
         # First pattern succeeds, second fails, third succeeds
-        def mock_keys_side_effect(pattern):
-            if pattern == 'kb:test_index:*':
+        def mock_scan_iter_side_effect(match, count):
+            if match == 'kb:test_index:*':
                 raise redis.RedisError("Connection error")
-            elif pattern == '*test_index*':
-                return [b'key1', b'key2']
-            elif pattern == 'index:test_index:*':
-                return [b'key3']
+            elif match == 'search:test_index:*':
+                return iter([b'key1', b'key2'])
+            elif match == 'index:test_index:*':
+                return iter([b'key3'])
             else:
-                return []
+                return iter([])
         
-        self.mock_redis_client.keys.side_effect = mock_keys_side_effect
+        self.mock_redis_client.scan_iter.side_effect = mock_scan_iter_side_effect
         self.mock_redis_client.delete.return_value = 1
         
         # Execute
@@ -648,16 +778,16 @@ class TestRedisService(unittest.TestCase):
         self.redis_service._client = self.mock_redis_client
         
         # Simulate an error for all pattern calls
-        # Each call to keys() will fail but be caught by inner try-catch
-        self.mock_redis_client.keys.side_effect = redis.RedisError("Redis connection failed")
+        # Each call to scan_iter() will fail but be caught by inner try-catch
+        self.mock_redis_client.scan_iter.side_effect = redis.RedisError("Redis connection failed")
         
         # Execute - should not raise exception but return 0
         result = self.redis_service._cleanup_cache_keys("test_index")
         
         # Verify - should handle gracefully and return 0
         self.assertEqual(result, 0)
-        # Should have tried all 4 patterns
-        self.assertEqual(self.mock_redis_client.keys.call_count, 4)
+        # Should have tried all 3 patterns
+        self.assertEqual(self.mock_redis_client.scan_iter.call_count, 3)
     
 
     def test_cleanup_document_cache_keys_empty_patterns(self):
@@ -666,14 +796,14 @@ class TestRedisService(unittest.TestCase):
         self.redis_service._client = self.mock_redis_client
         
         # All patterns return empty results
-        self.mock_redis_client.keys.return_value = []
+        self.mock_redis_client.scan_iter.side_effect = lambda match, count: iter([])
         
         # Execute
         result = self.redis_service._cleanup_document_cache_keys("test_index", "path/to/doc.pdf")
         
         # Verify
         self.assertEqual(result, 0)
-        self.assertEqual(self.mock_redis_client.keys.call_count, 6)  # All 6 patterns checked
+        self.assertEqual(self.mock_redis_client.scan_iter.call_count, 4)  # All 4 patterns checked
         self.mock_redis_client.delete.assert_not_called()
     
     def test_get_knowledgebase_task_count_with_backend_errors(self):
@@ -683,22 +813,22 @@ class TestRedisService(unittest.TestCase):
         self.redis_service._backend_client = self.mock_backend_client
         
         # Setup backend client to fail - this will be caught by outer try block
-        self.mock_backend_client.keys.side_effect = redis.RedisError("Backend connection failed")
+        self.mock_backend_client.zrange.side_effect = redis.RedisError("Backend connection failed")
         
         # Setup regular client to succeed (but it won't be reached due to outer exception)
-        self.mock_redis_client.keys.return_value = [b'key1', b'key2', b'key3']
+        self.mock_redis_client.scan_iter.return_value = iter([b'key1', b'key2', b'key3'])
         
         # Execute
         result = self.redis_service.get_knowledgebase_task_count("test_index")
         
-        # Verify - when backend_client.keys() fails, the outer try catches it
+        # Verify - when the registry read fails, the outer try catches it
         # and the method returns 0 without processing cache keys
         self.assertEqual(result, 0)
         
-        # Verify that backend keys was called and failed
-        self.mock_backend_client.keys.assert_called_once_with('celery-task-meta-*')
-        # Verify that regular client keys was NOT called due to the exception
-        self.mock_redis_client.keys.assert_not_called()
+        # Verify that the registry was read and failed
+        self.mock_backend_client.zrange.assert_called_once_with('dp:index_tasks:test_index', 0, -1)
+        # Verify that regular client scan_iter was NOT called due to the exception
+        self.mock_redis_client.scan_iter.assert_not_called()
     
     def test_get_knowledgebase_task_count_complete_failure(self):
         """Test get_knowledgebase_task_count handles complete Redis failure"""
@@ -707,8 +837,8 @@ class TestRedisService(unittest.TestCase):
         self.redis_service._backend_client = self.mock_backend_client
         
         # Both clients fail
-        self.mock_backend_client.keys.side_effect = redis.RedisError("Backend failed")
-        self.mock_redis_client.keys.side_effect = redis.RedisError("Cache failed")
+        self.mock_backend_client.zrange.side_effect = redis.RedisError("Backend failed")
+        self.mock_redis_client.scan_iter.side_effect = redis.RedisError("Cache failed")
         
         # Execute
         result = self.redis_service.get_knowledgebase_task_count("test_index")
@@ -754,8 +884,10 @@ class TestRedisService(unittest.TestCase):
             'result': "string result instead of dict"
         }).encode()
         
-        self.mock_backend_client.keys.return_value = task_keys
-        self.mock_backend_client.get.return_value = task_data
+        self.mock_backend_client.zrange.return_value = []
+        self.mock_backend_client.exists.return_value = 0  # Legacy results not migrated yet
+        self.mock_backend_client.scan_iter.return_value = iter(task_keys)
+        self.mock_backend_client.mget.return_value = [task_data]
         
         # Execute
         result = self.redis_service._cleanup_celery_tasks("test_index")
@@ -766,11 +898,11 @@ class TestRedisService(unittest.TestCase):
     def test_cleanup_cache_keys_all_failures(self):
         """Test _cleanup_cache_keys returns 0 when all patterns fail"""
         self.redis_service._client = self.mock_redis_client
-        self.mock_redis_client.keys.side_effect = redis.RedisError("Redis connection failed")
+        self.mock_redis_client.scan_iter.side_effect = redis.RedisError("Redis connection failed")
 
         result = self.redis_service._cleanup_cache_keys("test_index")
         self.assertEqual(result, 0)
-        self.assertEqual(self.mock_redis_client.keys.call_count, 4)
+        self.assertEqual(self.mock_redis_client.scan_iter.call_count, 3)
 
     def test_ping_backend_failure(self):
         """Test ping returns False if backend client fails but main client succeeds"""
@@ -22,6 +22,10 @@ sys.modules['nexent'] = MagicMock()
 sys.modules['nexent.memory'] = MagicMock()
 nexent_memory_service = MagicMock()
 sys.modules['nexent.memory.memory_service'] = nexent_memory_service
+sys.modules['nexent.core.models.embedding_cache'] = MagicMock()
+sys.modules['nexent.core.models.embedding_coalescer'] = MagicMock()
+sys.modules['nexent.vector_database.query_embedding_cache'] = MagicMock()
+sys.modules['nexent.vector_database.index_stats_cache'] = MagicMock()
 sys.modules['nexent.storage.storage_client_factory'] = MagicMock()
 
 from consts.exceptions import NoInviteCodeException, IncorrectInviteCodeException, UserRegistrationException, UnauthorizedError
@@ -3,7 +3,7 @@ import sys
 import os
 import time
 import unittest
-from unittest.mock import MagicMock, ANY
+from unittest.mock import AsyncMock, MagicMock, ANY, call
 # Mock MinioClient before importing modules that use it
 from unittest.mock import patch
 import numpy as np
@@ -37,6 +37,13 @@ sys.modules['nexent.core.agents'] = _create_package_mock('nexent.core.agents')
 sys.modules['nexent.core.agents.agent_model'] = MagicMock()
 sys.modules['nexent.core.models'] = _create_package_mock('nexent.core.models')
 sys.modules['nexent.core.models.embedding_model'] = MagicMock()
+sys.modules['nexent.core.models.embedding_cache'] = MagicMock()
+sys.modules['nexent.core.models.embedding_coalescer'] = MagicMock()
+sys.modules['nexent.vector_database.query_embedding_cache'] = MagicMock()
+sys.modules['nexent.vector_database.index_stats_cache'] = MagicMock()
+sys.modules['nexent.vector_database.async_base'] = MagicMock()
+sys.modules['nexent.vector_database.async_elasticsearch_core'] = MagicMock()
+sys.modules['nexent.vector_database.local_core'] = MagicMock()
 sys.modules['nexent.core.models.stt_model'] = MagicMock()
 sys.modules['nexent.core.nlp'] = _create_package_mock('nexent.core.nlp')
 sys.modules['nexent.core.nlp.tokenizer'] = MagicMock()
@@ -52,6 +59,8 @@ class _VectorDatabaseCore:
 vector_db_base_module.VectorDatabaseCore = _VectorDatabaseCore
 sys.modules['nexent.vector_database.base'] = vector_db_base_module
 sys.modules['nexent.vector_database.elasticsearch_core'] = MagicMock()
+sys.modules['nexent.vector_database.elasticsearch_core'].IndexWriteBlockedError = type(
+    'IndexWriteBlockedError', (RuntimeError,), {})
 # Mock nexent.storage module and its submodules before any imports
 sys.modules['nexent.storage'] = _create_package_mock('nexent.storage')
 storage_factory_module = MagicMock()
@@ -97,6 +106,8 @@ patch('backend.database.attachment_db.minio_client', minio_client_mock).start()
 with patch('botocore.client.BaseClient._make_api_call'), \
         patch('elasticsearch.Elasticsearch', return_value=MagicMock()):
     from backend.services.vectordatabase_service import ElasticSearchService, check_knowledge_base_exist_impl
+from consts.const import EMBEDDING_HTTP_POOL_MAXSIZE
+from consts.exceptions import IngestOffsetConflictError, LimitExceededError
 
 
 def _accurate_search_impl(request, vdb_core):
@@ -206,9 +217,34 @@ class TestElasticSearchService(unittest.TestCase):
         self.mock_vdb_core.check_index_exists.assert_called_once_with(
             "test_index")
         self.mock_vdb_core.create_index.assert_called_once_with(
-            "test_index", embedding_dim=768)
+            "test_index", embedding_dim=768, index_profile="float")
         mock_create_knowledge.assert_called_once()
 
+    @patch('backend.services.vectordatabase_service.create_knowledge_record')
+    def test_create_index_records_index_profile(self, mock_create_knowledge):
+        """
+        Test that the chosen vector index profile is passed to the core and recorded on the knowledge base.
+        """
+        # Setup
+        self.mock_vdb_core.check_index_exists.return_value = False
+        self.mock_vdb_core.create_index.return_value = True
+
+        # Execute
+        ElasticSearchService.create_index(
+            index_name="test_index",
+            embedding_dim=768,
+            vdb_core=self.mock_vdb_core,
+            user_id="test_user",
+            tenant_id="test_tenant",
+            index_profile="int8",
+        )
+
+        # Assert
+        self.mock_vdb_core.create_index.assert_called_once_with(
+            "test_index", embedding_dim=768, index_profile="int8")
+        knowledge_data = mock_create_knowledge.call_args[0][0]
+        self.assertEqual(knowledge_data["vector_index_profile"], "int8")
+
     @patch('backend.services.vectordatabase_service.create_knowledge_record')
     def test_create_index_already_exists(self, mock_create_knowledge):
         """
@@ -703,6 +739,62 @@ class TestElasticSearchService(unittest.TestCase):
 
         self.assertIn("Error during indexing", str(context.exception))
 
+    def test_index_documents_write_blocked_is_not_wrapped(self):
+        """
+        Test a write block raised while indexing reaches the caller as IndexWriteBlockedError.
+
+        The endpoints answer it with 503, which the forward task retries once the rebuild swapped the index.
+        """
+        from backend.services.vectordatabase_service import IndexWriteBlockedError
+
+        self.mock_vdb_core.check_index_exists.return_value = True
+        self.mock_vdb_core.vectorize_documents.side_effect = IndexWriteBlockedError("blocked")
+
+        with self.assertRaises(IndexWriteBlockedError):
+            ElasticSearchService.index_documents(
+                index_name="test_index",
+                data=[{"metadata": {}, "path_or_url": "test_path", "content": "Test content"}],
+                vdb_core=self.mock_vdb_core,
+                embedding_model=MagicMock()
+            )
+
+    def test_index_documents_incremental(self):
+        """
+        Test incremental indexing re-indexes each document version separately.
+
+        This test verifies that:
+        1. Chunks are grouped by path_or_url and passed to reindex_document
+        2. Unchanged chunks count as indexed so the totals still match
+        3. vectorize_documents is not called directly
+        """
+        self.mock_vdb_core.check_index_exists.return_value = True
+        self.mock_vdb_core.reindex_document.side_effect = [
+            {"indexed": 1, "deleted": 2, "unchanged": 1},
+            {"indexed": 1, "deleted": 0, "unchanged": 0},
+        ]
+        test_data = [
+            {"path_or_url": "doc_a", "content": "page 1"},
+            {"path_or_url": "doc_b", "content": "other"},
+            {"path_or_url": "doc_a", "content": "page 2"},
+        ]
+
+        result = ElasticSearchService.index_documents(
+            index_name="test_index",
+            data=test_data,
+            vdb_core=self.mock_vdb_core,
+            embedding_model=MagicMock(),
+            incremental=True
+        )
+
+        self.assertEqual(result["total_indexed"], 3)
+        self.assertEqual(result["total_submitted"], 3)
+        self.assertEqual(result["total_embedded"], 2)
+        self.assertEqual(result["total_deleted"], 2)
+        first_call = self.mock_vdb_core.reindex_document.call_args_list[0].kwargs
+        self.assertEqual(first_call["path_or_url"], "doc_a")
+        self.assertEqual([doc["content"] for doc in first_call["documents"]], ["page 1", "page 2"])
+        self.mock_vdb_core.vectorize_documents.assert_not_called()
+
     @patch('backend.services.vectordatabase_service.get_all_files_status')
     def test_list_files_without_chunks(self, mock_get_files_status):
         """
@@ -743,6 +835,77 @@ class TestElasticSearchService(unittest.TestCase):
         self.mock_vdb_core.get_documents_detail.assert_called_once_with(
             "test_index")
 
+    @patch('backend.services.vectordatabase_service.get_all_files_status')
+    def test_list_files_paginated(self, mock_get_files_status):
+        """
+        Test listing one page of files from the document catalog.
+
+        This test verifies that:
+        1. Stored files come from vdb_core.list_documents with the paging options
+        2. In-progress files already stored on another page are not reported twice
+        3. total and next_cursor are passed through
+        """
+        self.mock_vdb_core.list_documents.side_effect = [
+            {
+                "documents": [{
+                    "path_or_url": "file1",
+                    "filename": "file1.txt",
+                    "file_size": 1024,
+                    "create_time": "2023-01-01T12:00:00",
+                    "chunk_count": 4,
+                }],
+                "total": 3,
+                "next_cursor": "cursor-2",
+            },
+            {"documents": [{"path_or_url": "file3"}], "total": 1, "next_cursor": None},
+        ]
+        mock_get_files_status.return_value = {
+            "file2": {"state": "PROCESSING", "latest_task_id": "task123"},
+            "file3": {"state": "COMPLETED", "latest_task_id": "task456"},
+        }
+
+        async def run_test():
+            return await ElasticSearchService.list_files(
+                index_name="test_index",
+                include_chunks=False,
+                vdb_core=self.mock_vdb_core,
+                page_size=1,
+                sort_by="file_size",
+            )
+
+        result = asyncio.run(run_test())
+
+        self.assertEqual([f["path_or_url"] for f in result["files"]], ["file1", "file2"])
+        self.assertEqual(result["files"][0]["chunk_count"], 4)
+        self.assertEqual(result["total"], 3)
+        self.assertEqual(result["next_cursor"], "cursor-2")
+        self.mock_vdb_core.list_documents.assert_any_call(
+            "test_index", page_size=1, cursor=None, sort_by="file_size", sort_order="desc")
+        self.mock_vdb_core.get_documents_detail.assert_not_called()
+
+    @patch('backend.services.vectordatabase_service.get_all_files_status')
+    def test_list_files_paginated_next_page_skips_in_progress(self, mock_get_files_status):
+        """
+        Test later pages only contain stored files.
+        """
+        self.mock_vdb_core.list_documents.return_value = {
+            "documents": [], "total": 1, "next_cursor": None}
+
+        async def run_test():
+            return await ElasticSearchService.list_files(
+                index_name="test_index",
+                include_chunks=False,
+                vdb_core=self.mock_vdb_core,
+                page_size=10,
+                cursor="cursor-2",
+            )
+
+        result = asyncio.run(run_test())
+
+        self.assertEqual(result["files"], [])
+        mock_get_files_status.assert_not_called()
+        self.mock_vdb_core.list_documents.assert_called_once()
+
     @patch('backend.services.vectordatabase_service.get_all_files_status')
     def test_list_files_with_chunks(self, mock_get_files_status):
         """
@@ -873,6 +1036,20 @@ class TestElasticSearchService(unittest.TestCase):
         # Verify that delete_file was called with the correct path
         mock_delete_file.assert_called_once_with("test_path")
 
+    @patch('backend.services.vectordatabase_service.delete_file')
+    @patch('backend.services.vectordatabase_service.evict_partition_cache')
+    def test_delete_documents_evicts_partition_results_before_the_file(self, mock_evict, mock_delete_file):
+        """Partition results are keyed by the file content, so they are evicted while the file can still be read"""
+        calls = MagicMock()
+        calls.attach_mock(mock_evict, "evict")
+        calls.attach_mock(mock_delete_file, "delete_file")
+        mock_delete_file.return_value = {"success": True}
+
+        ElasticSearchService.delete_documents(
+            index_name="test_index", path_or_url="test_path", vdb_core=self.mock_vdb_core)
+
+        self.assertEqual(calls.mock_calls, [call.evict("test_path"), call.delete_file("test_path")])
+
     def test_accurate_search(self):
         """
         Test accurate (keyword-based) search functionality.
@@ -1045,6 +1222,56 @@ class TestElasticSearchService(unittest.TestCase):
             weight_accurate=0.5
         )
 
+    def test_search_hybrid_async_success(self):
+        """
+        Test the async hybrid search awaits the async core and formats results like search_hybrid.
+        """
+        async_vdb_core = MagicMock()
+        async_vdb_core.hybrid_search = AsyncMock(return_value=[
+            {
+                "document": {"title": "Doc1", "content": "Content1"},
+                "score": 0.90,
+                "index": "test_index",
+                "scores": {"accurate": 0.85, "semantic": 0.95}
+            }
+        ])
+
+        result = asyncio.run(ElasticSearchService.search_hybrid_async(
+            index_names=["test_index"],
+            query="test query",
+            tenant_id="test_tenant",
+            top_k=10,
+            weight_accurate=0.5,
+            vdb_core=async_vdb_core
+        ))
+
+        self.assertEqual(result["total"], 1)
+        self.assertEqual(result["results"][0]["score"], 0.90)
+        self.assertEqual(result["results"][0]["score_details"]["semantic"], 0.95)
+        async_vdb_core.hybrid_search.assert_awaited_once_with(
+            index_names=["test_index"],
+            query_text="test query",
+            embedding_model=self.mock_embedding,
+            top_k=10,
+            weight_accurate=0.5
+        )
+
+    def test_search_hybrid_async_validation_error(self):
+        """Test search_hybrid_async validates arguments before querying."""
+        async_vdb_core = MagicMock()
+        async_vdb_core.hybrid_search = AsyncMock()
+
+        with self.assertRaises(ValueError) as context:
+            asyncio.run(ElasticSearchService.search_hybrid_async(
+                index_names=[],
+                query="test query",
+                tenant_id="test_tenant",
+                vdb_core=async_vdb_core
+            ))
+
+        self.assertIn("At least one index name is required", str(context.exception))
+        async_vdb_core.hybrid_search.assert_not_awaited()
+
     def test_search_hybrid_missing_tenant_id(self):
         """Test search_hybrid raises ValueError when tenant_id is missing."""
         with self.assertRaises(ValueError) as context:
@@ -1208,6 +1435,84 @@ class TestElasticSearchService(unittest.TestCase):
             weight_accurate=0.3
         )
 
+    @patch('backend.services.vectordatabase_service.threading.Thread')
+    @patch('backend.services.vectordatabase_service.get_embedding_model')
+    @patch('backend.services.vectordatabase_service.get_knowledge_record')
+    def test_rebuild_index_starts_background_job(self, mock_get_record, mock_get_embedding, mock_thread):
+        """
+        Test starting an embedding model rebuild.
+
+        This test verifies that:
+        1. The rebuild runs in a background thread with the tenant's embedding model
+        2. The knowledge base's vector index profile is kept
+        3. A second request while the job holds the rebuild lock, in any process, does not start another one
+        """
+        mock_get_record.return_value = {"index_name": "kb", "vector_index_profile": "int8"}
+        mock_get_embedding.return_value = self.mock_embedding
+        self.mock_embedding.model = "new-model"
+        redis_client = _IngestRedisClient()
+
+        with patch('backend.services.vectordatabase_service.get_redis_service',
+                   return_value=SimpleNamespace(client=redis_client)):
+            first = ElasticSearchService.rebuild_index("kb", "tenant", "user", self.mock_vdb_core)
+            second = ElasticSearchService.rebuild_index("kb", "tenant", "user", self.mock_vdb_core)
+            status = ElasticSearchService.get_rebuild_status("kb", self.mock_vdb_core)
+
+        self.assertEqual(first, {"status": "started", "embedding_model": "new-model"})
+        self.assertEqual(second["status"], "running")
+        self.assertTrue(status["running"])
+        mock_thread.assert_called_once()
+        self.assertEqual(mock_thread.call_args.kwargs["args"][:3], ("kb", self.mock_embedding, "int8"))
+        mock_thread.return_value.start.assert_called_once()
+
+    @patch('backend.services.vectordatabase_service.update_model_name_by_index_name')
+    def test_run_index_rebuild_switches_model_after_swap(self, mock_update_model):
+        """
+        Test the background job records the new model only once the rebuild succeeded.
+        """
+        self.mock_embedding.model = "new-model"
+        self.mock_embedding.embedding_dim = 768
+        self.mock_vdb_core.rebuild_index.return_value = {"index": "kb__gen1", "copied": 0, "deleted": 0}
+
+        lock = MagicMock()
+
+        ElasticSearchService._run_index_rebuild(
+            "kb", self.mock_embedding, None, "tenant", "user", self.mock_vdb_core, lock)
+        mock_update_model.assert_called_once_with("kb", "new-model", "tenant", "user")
+        self.assertEqual(self.mock_vdb_core.rebuild_index.call_args.kwargs["embedding_dim"], 768)
+        lock.release.assert_called_once()
+
+        mock_update_model.reset_mock()
+        self.mock_vdb_core.rebuild_index.side_effect = RuntimeError("embedding failed")
+        ElasticSearchService._run_index_rebuild(
+            "kb", self.mock_embedding, None, "tenant", "user", self.mock_vdb_core, lock)
+        mock_update_model.assert_not_called()
+        self.assertEqual(lock.release.call_count, 2)
+
+    @patch('backend.services.vectordatabase_service.ES_REBUILD_LOCK_TTL_S', 0.03)
+    @patch('backend.services.vectordatabase_service.update_model_name_by_index_name')
+    def test_run_index_rebuild_stops_when_lock_is_lost(self, mock_update_model):
+        """
+        Test the rebuild keeps its lock alive and stops at its next batch once another process could take it.
+        """
+        lock = MagicMock()
+        lock.reacquire.side_effect = [None, RuntimeError("lock not owned")]
+
+        def fake_rebuild(index_name, embedding_model, embedding_dim=None, index_profile=None,
+                         progress_callback=None):
+            progress_callback(1, 3)
+            time.sleep(0.1)
+            progress_callback(2, 3)
+
+        self.mock_vdb_core.rebuild_index.side_effect = fake_rebuild
+
+        ElasticSearchService._run_index_rebuild(
+            "kb", self.mock_embedding, None, "tenant", "user", self.mock_vdb_core, lock)
+
+        self.assertEqual(lock.reacquire.call_count, 2)
+        mock_update_model.assert_not_called()
+        lock.release.assert_called_once()
+
     def test_health_check_healthy(self):
         """
         Test health check when Elasticsearch is healthy.
@@ -1727,6 +2032,7 @@ class TestElasticSearchService(unittest.TestCase):
             page=None,
             page_size=None,
             path_or_url=None,
+            cursor=None,
         )
 
     def test_get_index_chunks_keeps_non_dict_entries(self):
@@ -1762,6 +2068,36 @@ class TestElasticSearchService(unittest.TestCase):
 
         self.assertIn("Error retrieving chunks from index kb-index: boom", str(exc.exception))
 
+    def test_get_index_chunks_async_filters_fields(self):
+        """
+        Test async chunk retrieval awaits the async core and filters fields.
+        """
+        async_vdb_core = MagicMock()
+        async_vdb_core.get_index_chunks = AsyncMock(return_value={
+            "chunks": [{"id": "1", "content": "A", "extra": "ignore"}],
+            "total": 1,
+            "page": 1,
+            "page_size": 10,
+            "next_cursor": "abc",
+        })
+
+        result = asyncio.run(ElasticSearchService.get_index_chunks_async(
+            index_name="kb-index",
+            page=1,
+            page_size=10,
+            vdb_core=async_vdb_core
+        ))
+
+        self.assertEqual(result["chunks"], [{"id": "1", "content": "A"}])
+        self.assertEqual(result["next_cursor"], "abc")
+        async_vdb_core.get_index_chunks.assert_awaited_once_with(
+            "kb-index",
+            page=1,
+            page_size=10,
+            path_or_url=None,
+            cursor=None,
+        )
+
     def test_create_chunk_builds_payload_and_calls_core(self):
         """
         Test create_chunk builds payload and delegates to vdb_core.create_chunk.
@@ -2322,6 +2658,23 @@ class TestElasticSearchService(unittest.TestCase):
         # The result should be the elastic_core instance
         self.assertTrue(hasattr(result, 'client'))
 
+    def test_get_vdb_core_local_is_shared(self):
+        """
+        Test the local vector store is created once under LOCAL_VECTOR_STORE_PATH and shared by every caller.
+        """
+        import backend.services.vectordatabase_service as vectordatabase_service
+        from consts.const import VectorDatabaseType
+
+        with patch.object(vectordatabase_service, '_local_vector_core', None), \
+                patch.object(vectordatabase_service, 'LocalVectorCore') as mock_local_core, \
+                patch.object(vectordatabase_service, 'LOCAL_VECTOR_STORE_PATH', '/tmp/vector_store'):
+            first = vectordatabase_service.get_vector_db_core(VectorDatabaseType.LOCAL)
+            second = vectordatabase_service.get_vector_db_core(VectorDatabaseType.LOCAL)
+
+        self.assertIs(first, second)
+        mock_local_core.assert_called_once()
+        self.assertEqual(mock_local_core.call_args.kwargs["root_path"], '/tmp/vector_store')
+
     @patch('backend.services.vectordatabase_service.tenant_config_manager')
     def test_get_embedding_model_embedding_type(self, mock_tenant_config_manager):
         """
@@ -2363,7 +2716,8 @@ class TestElasticSearchService(unittest.TestCase):
                     api_key="test_api_key",
                     base_url="https://test.api.com",
                     model_name="test-model",
-                    embedding_dim=1024
+                    embedding_dim=1024,
+                    pool_maxsize=EMBEDDING_HTTP_POOL_MAXSIZE
                 )
         finally:
             # Restart the mock for other tests
@@ -2410,7 +2764,8 @@ class TestElasticSearchService(unittest.TestCase):
                     api_key="test_api_key",
                     base_url="https://test.api.com",
                     model_name="test-model",
-                    embedding_dim=2048
+                    embedding_dim=2048,
+                    pool_maxsize=EMBEDDING_HTTP_POOL_MAXSIZE
                 )
         finally:
             # Restart the mock for other tests
@@ -2521,6 +2876,222 @@ class TestElasticSearchService(unittest.TestCase):
             self.get_embedding_model_patcher.start()
 
 
+
+class _IngestPipeline:
+    def __init__(self, client):
+        self.client = client
+        self.calls = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+        return queue
+
+    def execute(self):
+        return [getattr(self.client, name)(*args, **kwargs) for name, args, kwargs in self.calls]
+
+
+class _IngestLock:
+    def __init__(self, client, name):
+        self.client = client
+        self.name = name
+
+    def acquire(self, blocking=True):
+        if self.name in self.client.locks:
+            return False
+        self.client.locks.add(self.name)
+        return True
+
+    def release(self):
+        self.client.locks.discard(self.name)
+
+
+class _IngestRedisClient:
+    """Bytes-returning Redis client holding the keys of ingestion sessions"""
+
+    def __init__(self):
+        self.store = {}
+        self.hashes = {}
+        self.zsets = {}
+        self.locks = set()
+
+    def pipeline(self, transaction=True):
+        return _IngestPipeline(self)
+
+    def lock(self, name, timeout=None):
+        return _IngestLock(self, name)
+
+    def set(self, key, value, ex=None):
+        self.store[key] = value
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def hset(self, key, mapping):
+        self.hashes.setdefault(key, {}).update({k.encode(): str(v).encode() for k, v in mapping.items()})
+
+    def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    def hdel(self, key, *fields):
+        for field in fields:
+            self.hashes.get(key, {}).pop(field.encode(), None)
+
+    def zadd(self, key, mapping, xx=False):
+        zset = self.zsets.setdefault(key, {})
+        zset.update({member: score for member, score in mapping.items() if not xx or member in zset})
+
+    def zrange(self, key, start, end):
+        zset = self.zsets.get(key, {})
+        return [str(member).encode() for member in sorted(zset, key=zset.get)]
+
+    def zrank(self, key, member):
+        zset = self.zsets.get(key, {})
+        ranked = sorted(zset, key=zset.get)
+        return ranked.index(member) if member in ranked else None
+
+    def zrem(self, key, *members):
+        for member in members:
+            self.zsets.get(key, {}).pop(member, None)
+
+    def zremrangebyscore(self, key, min_score, max_score):
+        zset = self.zsets.get(key, {})
+        for member in [member for member, score in zset.items() if score <= max_score]:
+            del zset[member]
+
+    def expire(self, key, ttl):
+        pass
+
+    def exists(self, key):
+        return int(key in self.store or key in self.locks)
+
+    def delete(self, *keys):
+        for key in keys:
+            self.store.pop(key, None)
+            self.zsets.pop(key, None)
+
+
+class TestIngestDocumentSegment(unittest.TestCase):
+    def setUp(self):
+        self.redis_client = _IngestRedisClient()
+        redis_patcher = patch('backend.services.vectordatabase_service.get_redis_service',
+                              return_value=SimpleNamespace(client=self.redis_client))
+        redis_patcher.start()
+        self.addCleanup(redis_patcher.stop)
+        self.indexed = []
+
+        def fake_index_documents(embedding_model, index_name, data, vdb_core, incremental=False):
+            self.indexed = list(data)
+            return {"success": True, "total_indexed": len(self.indexed), "total_submitted": len(self.indexed)}
+
+        index_patcher = patch.object(ElasticSearchService, 'index_documents', side_effect=fake_index_documents)
+        self.mock_index_documents = index_patcher.start()
+        self.addCleanup(index_patcher.stop)
+
+    @staticmethod
+    def _body(start, count):
+        return "".join(f'{{"content": "chunk {i}"}}\n' for i in range(start, start + count)).encode()
+
+    def _send(self, offset, count, final=False, session_id="s1"):
+        return ElasticSearchService.ingest_document_segment(
+            MagicMock(), "kb1", session_id, offset, self._body(offset, count), final, MagicMock(), incremental=True)
+
+    def test_segments_are_spooled_and_committed_once(self):
+        self.assertEqual(self._send(0, 3), {"session_id": "s1", "next_offset": 3, "committed": False})
+        # A resent segment overlapping the spool only adds its new chunks
+        self.assertEqual(self._send(0, 5)["next_offset"], 5)
+
+        result = self._send(5, 2, final=True)
+
+        self.assertTrue(result["committed"])
+        self.assertEqual(result["total_indexed"], 7)
+        self.assertEqual([d["content"] for d in self.indexed], [f"chunk {i}" for i in range(7)])
+        self.assertEqual(self.redis_client.store, {})
+        self.assertEqual(self._send(5, 2, final=True), result)
+        self.mock_index_documents.assert_called_once()
+        self.assertTrue(self.mock_index_documents.call_args.kwargs["incremental"])
+
+    def test_segment_past_the_expected_offset_conflicts(self):
+        self._send(0, 3)
+
+        with self.assertRaises(IngestOffsetConflictError) as ctx:
+            self._send(6, 3)
+
+        self.assertEqual(ctx.exception.next_offset, 3)
+
+    def test_commit_is_refused_when_all_slots_are_busy(self):
+        # Slots are shared through Redis, so commits of other processes count
+        self.redis_client.zadd("dp:ingest_commits", {"other": time.time()})
+
+        with patch('backend.services.vectordatabase_service.DP_INGEST_MAX_CONCURRENT_COMMITS', 1):
+            with self.assertRaises(LimitExceededError):
+                self._send(0, 2, final=True)
+
+        self.mock_index_documents.assert_not_called()
+        self.assertIsNone(self.redis_client.hgetall("dp:ingest:s1").get(b"result"))
+        self.assertEqual(list(self.redis_client.zsets["dp:ingest_commits"]), ["other"])
+
+    def test_final_segment_resent_during_commit_is_not_indexed_twice(self):
+        def index_while_resent(embedding_model, index_name, data, vdb_core, incremental=False):
+            with self.assertRaises(LimitExceededError):
+                self._send(0, 2, final=True)
+            return {"success": True, "total_indexed": len(list(data)), "total_submitted": 2}
+
+        self.mock_index_documents.side_effect = index_while_resent
+
+        result = self._send(0, 2, final=True)
+
+        self.assertTrue(result["committed"])
+        self.mock_index_documents.assert_called_once()
+        self.assertEqual(self._send(0, 2, final=True), result)
+        self.assertEqual(self.redis_client.zsets["dp:ingest_commits"], {})
+        self.assertNotIn(b"committing", self.redis_client.hgetall("dp:ingest:s1"))
+
+    @patch('backend.services.vectordatabase_service.DP_INGEST_COMMIT_STALE_S', 0.06)
+    def test_commit_running_past_the_stale_period_keeps_its_session(self):
+        def slow_index(embedding_model, index_name, data, vdb_core, incremental=False):
+            started = time.time()
+            time.sleep(0.2)
+            # The heartbeat kept the commit alive, so the resend is refused instead of indexing the file again
+            with self.assertRaises(LimitExceededError):
+                self._send(0, 2, final=True)
+            self.assertGreater(self.redis_client.zsets["dp:ingest_commits"]["s1"], started)
+            return {"success": True, "total_indexed": len(list(data)), "total_submitted": 2}
+
+        self.mock_index_documents.side_effect = slow_index
+
+        self.assertTrue(self._send(0, 2, final=True)["committed"])
+        self.mock_index_documents.assert_called_once()
+        self.assertNotIn(b"committing", self.redis_client.hgetall("dp:ingest:s1"))
+        self.assertEqual(self.redis_client.zsets["dp:ingest_commits"], {})
+
+    def test_failed_commit_can_be_resent(self):
+        self.mock_index_documents.side_effect = [RuntimeError("es down"),
+                                                 {"success": True, "total_indexed": 2, "total_submitted": 2}]
+
+        with self.assertRaises(RuntimeError):
+            self._send(0, 2, final=True)
+
+        self.assertNotIn(b"committing", self.redis_client.hgetall("dp:ingest:s1"))
+        self.assertTrue(self._send(0, 2, final=True)["committed"])
+        self.assertEqual(self.mock_index_documents.call_count, 2)
+
+    def test_segment_racing_another_request_of_the_session_is_refused(self):
+        self.redis_client.locks.add("dp:ingest:s1:lock")
+
+        with self.assertRaises(LimitExceededError):
+            self._send(0, 3)
+
+        self.assertIsNone(self.redis_client.hgetall("dp:ingest:s1").get(b"next_offset"))
+
+    def test_session_of_another_index_is_rejected(self):
+        self._send(0, 1)
+
+        with self.assertRaises(ValueError):
+            ElasticSearchService.ingest_document_segment(
+                MagicMock(), "kb2", "s1", 1, self._body(1, 1), False, MagicMock())
+
+
 if __name__ == '__main__':
     unittest.main()
 
@@ -29,6 +29,13 @@ nexent_mock = MagicMock()
 sys.modules['nexent'] = nexent_mock
 sys.modules['nexent.core'] = MagicMock()
 sys.modules['nexent.core.models.embedding_model'] = MagicMock()
+sys.modules['nexent.core.models.embedding_cache'] = MagicMock()
+sys.modules['nexent.core.models.embedding_coalescer'] = MagicMock()
+sys.modules['nexent.vector_database.query_embedding_cache'] = MagicMock()
+sys.modules['nexent.vector_database.index_stats_cache'] = MagicMock()
+sys.modules['nexent.vector_database.async_base'] = MagicMock()
+sys.modules['nexent.vector_database.async_elasticsearch_core'] = MagicMock()
+sys.modules['nexent.vector_database.local_core'] = MagicMock()
 sys.modules['nexent.core.nlp'] = MagicMock()
 sys.modules['nexent.core.nlp.tokenizer'] = MagicMock()
 
@@ -83,6 +90,7 @@ class MockElasticSearchCore:
         pass
 
 vector_db_es_module.ElasticSearchCore = MockElasticSearchCore
+vector_db_es_module.IndexWriteBlockedError = type('IndexWriteBlockedError', (RuntimeError,), {})
 
 sys.modules['nexent.vector_database'] = vector_db_module
 sys.modules['nexent.vector_database.base'] = vector_db_base_module
@@ -0,0 +1,109 @@
+import os
+import sys
+
+import pytest
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../')))
+
+from backend.utils import embedding_cache_utils
+from nexent.core.models.embedding_cache import DiskCacheTier, LRUCacheTier, RedisCacheTier
+
+
+@pytest.fixture(autouse=True)
+def reset_singleton(mocker):
+    mocker.patch.object(embedding_cache_utils, "_embedding_cache", None)
+    mocker.patch.object(embedding_cache_utils, "_query_embedding_cache", None)
+    mocker.patch.object(embedding_cache_utils, "set_default_embedding_cache")
+    mocker.patch.object(embedding_cache_utils, "_embedding_coalescer", None)
+    mocker.patch.object(embedding_cache_utils, "set_default_embedding_coalescer")
+
+
+def test_build_embedding_cache_disabled(mocker):
+    mocker.patch.object(embedding_cache_utils, "EMBEDDING_CACHE_ENABLED", False)
+    assert embedding_cache_utils.build_embedding_cache() is None
+    assert embedding_cache_utils.get_embedding_cache() is None
+
+
+def test_build_embedding_cache_memory_only(mocker):
+    mocker.patch.object(embedding_cache_utils, "EMBEDDING_CACHE_ENABLED", True)
+    mocker.patch.object(embedding_cache_utils, "EMBEDDING_CACHE_REDIS_ENABLED", False)
+    mocker.patch.object(embedding_cache_utils, "EMBEDDING_CACHE_DISK_PATH", "")
+    mocker.patch.object(embedding_cache_utils, "EMBEDDING_CACHE_MAX_ENTRIES", 10)
+
+    cache = embedding_cache_utils.build_embedding_cache()
+
+    assert len(cache.tiers) == 1
+    assert isinstance(cache.tiers[0], LRUCacheTier)
+    assert cache.tiers[0].max_entries == 10
+
+
+def test_build_embedding_cache_all_tiers(mocker, tmp_path):
+    mocker.patch.object(embedding_cache_utils, "EMBEDDING_CACHE_ENABLED", True)
+    mocker.patch.object(embedding_cache_utils, "EMBEDDING_CACHE_REDIS_ENABLED", True)
+    mocker.patch.object(embedding_cache_utils, "REDIS_URL", "redis://localhost:6379/0")
+    mocker.patch.object(embedding_cache_utils, "EMBEDDING_CACHE_DISK_PATH", str(tmp_path / "cache.db"))
+    mocker.patch("redis.from_url")
+
+    cache = embedding_cache_utils.build_embedding_cache()
+
+    assert [type(tier) for tier in cache.tiers] == [LRUCacheTier, RedisCacheTier, DiskCacheTier]
+
+
+def test_build_embedding_cache_redis_without_url(mocker):
+    mocker.patch.object(embedding_cache_utils, "EMBEDDING_CACHE_ENABLED", True)
+    mocker.patch.object(embedding_cache_utils, "EMBEDDING_CACHE_REDIS_ENABLED", True)
+    mocker.patch.object(embedding_cache_utils, "REDIS_URL", None)
+    mocker.patch.object(embedding_cache_utils, "EMBEDDING_CACHE_DISK_PATH", "")
+
+    cache = embedding_cache_utils.build_embedding_cache()
+
+    assert len(cache.tiers) == 1
+
+
+def test_get_embedding_cache_is_singleton_and_registers_default(mocker):
+    mocker.patch.object(embedding_cache_utils, "EMBEDDING_CACHE_ENABLED", True)
+    mocker.patch.object(embedding_cache_utils, "EMBEDDING_CACHE_REDIS_ENABLED", False)
+    mocker.patch.object(embedding_cache_utils, "EMBEDDING_CACHE_DISK_PATH", "")
+
+    first = embedding_cache_utils.get_embedding_cache()
+    second = embedding_cache_utils.get_embedding_cache()
+
+    assert first is second
+    embedding_cache_utils.set_default_embedding_cache.assert_called_once_with(first)
+
+
+def test_get_query_embedding_cache_uses_config(mocker):
+    mocker.patch.object(embedding_cache_utils, "QUERY_EMBEDDING_CACHE_ENABLED", True)
+    mocker.patch.object(embedding_cache_utils, "QUERY_EMBEDDING_CACHE_MAX_ENTRIES", 5)
+    mocker.patch.object(embedding_cache_utils, "QUERY_EMBEDDING_CACHE_TTL_S", 30)
+
+    cache = embedding_cache_utils.get_query_embedding_cache()
+
+    assert cache is embedding_cache_utils.get_query_embedding_cache()
+    assert cache.max_entries == 5
+    assert cache.ttl_seconds == 30
+
+
+def test_get_query_embedding_cache_disabled(mocker):
+    mocker.patch.object(embedding_cache_utils, "QUERY_EMBEDDING_CACHE_ENABLED", False)
+    assert embedding_cache_utils.get_query_embedding_cache() is None
+
+
+def test_get_embedding_coalescer_uses_config_and_registers_default(mocker):
+    mocker.patch.object(embedding_cache_utils, "EMBEDDING_COALESCE_ENABLED", True)
+    mocker.patch.object(embedding_cache_utils, "EMBEDDING_COALESCE_MAX_BATCH", 8)
+    mocker.patch.object(embedding_cache_utils, "EMBEDDING_COALESCE_MAX_WAIT_MS", 2.0)
+
+    coalescer = embedding_cache_utils.get_embedding_coalescer()
+
+    assert coalescer is embedding_cache_utils.get_embedding_coalescer()
+    assert coalescer.max_batch_size == 8
+    assert coalescer.max_wait_s == 0.002
+    embedding_cache_utils.set_default_embedding_coalescer.assert_called_once_with(coalescer)
+    coalescer.close()
+
+
+def test_get_embedding_coalescer_disabled(mocker):
+    mocker.patch.object(embedding_cache_utils, "EMBEDDING_COALESCE_ENABLED", False)
+    assert embedding_cache_utils.get_embedding_coalescer() is None
@@ -248,41 +248,20 @@ async def test_trigger_data_process_batch_non201_and_request_error(fmu, monkeypa
 
 
 @pytest.mark.asyncio
-async def test_get_all_files_status_success_and_convert(fmu, monkeypatch):
-    tasks_list = [
-        {
-            "id": "1",
-            "task_name": "process",
-            "index_name": "idx",
-            "path_or_url": "/p1",
-            "original_filename": "f1",
-            "source_type": "local",
-            "status": "SUCCESS",
-            "created_at": 1,
-        },
-        {
-            "id": "2",
-            "task_name": "forward",
-            "index_name": "idx",
-            "path_or_url": "/p1",
-            "original_filename": "f1",
-            "source_type": "local",
-            "status": "PENDING",
-            "created_at": 2,
-        },
-    ]
-    fake_client = _FakeAsyncClient(_Resp(200, tasks_list))
+async def test_get_all_files_status_single_request(fmu, monkeypatch):
+    files_status = {
+        "/p1": {"state": "FORWARDING", "latest_task_id": "2", "original_filename": "f1", "source_type": "local"},
+        "/p2": {"state": "COMPLETED", "latest_task_id": "4", "original_filename": "f2", "source_type": "minio"},
+    }
+    fake_client = _FakeAsyncClient(_Resp(200, files_status))
     monkeypatch.setattr(fmu, "httpx", types.SimpleNamespace(AsyncClient=lambda: fake_client))
-    async def _fake_convert(process_celery_state, forward_celery_state):
-        return "COMPLETED"
-    monkeypatch.setattr(fmu, "_convert_to_custom_state", _fake_convert)
 
     out = await fmu.get_all_files_status("idx")
-    assert "/p1" in out
-    assert out["/p1"]["state"] == "COMPLETED"
-    assert out["/p1"]["latest_task_id"] == "2"
-    assert out["/p1"]["original_filename"] == "f1"
-    assert out["/p1"]["source_type"] == "local"
+
+    assert out == files_status
+    assert fake_client.last_get["url"] == "http://data-process/tasks/indices/idx/files"
+    # States come resolved, no per-file conversion request
+    assert fake_client.last_post == {}
 
 
 @pytest.mark.asyncio
@@ -300,43 +279,6 @@ async def test_get_all_files_status_connect_error_and_non200(fmu, monkeypatch):
     assert out2 == {}
 
 
-# -------------------- _convert_to_custom_state --------------------
-
-
-@pytest.mark.asyncio
-async def test_convert_to_custom_state_remote_success(fmu, monkeypatch):
-    fake_client = _FakeAsyncClient(_Resp(200, {"state": "COMPLETED"}))
-    monkeypatch.setattr(fmu, "httpx", types.SimpleNamespace(AsyncClient=lambda: fake_client))
-    out = await fmu._convert_to_custom_state("SUCCESS", "SUCCESS")
-    assert out == "COMPLETED"
-
-
-@pytest.mark.asyncio
-async def test_convert_to_custom_state_fallback_mappings(fmu, monkeypatch):
-    # non-200 triggers fallback
-    fake_client = _FakeAsyncClient(_Resp(500, None))
-    monkeypatch.setattr(fmu, "httpx", types.SimpleNamespace(AsyncClient=lambda: fake_client))
-
-    # process failure
-    assert (await fmu._convert_to_custom_state("FAILURE", "")) == "PROCESS_FAILED"
-    # forward failure
-    assert (await fmu._convert_to_custom_state("", "FAILURE")) == "FORWARD_FAILED"
-    # both success
-    assert (await fmu._convert_to_custom_state("SUCCESS", "SUCCESS")) == "COMPLETED"
-    # both empty
-    assert (await fmu._convert_to_custom_state("", "")) == "WAIT_FOR_PROCESSING"
-    # forward-only mapping
-    assert (await fmu._convert_to_custom_state("", "PENDING")) == "WAIT_FOR_FORWARDING"
-    assert (await fmu._convert_to_custom_state("", "STARTED")) == "FORWARDING"
-    assert (await fmu._convert_to_custom_state("", "SUCCESS")) == "COMPLETED"
-    assert (await fmu._convert_to_custom_state("", "X")) == "WAIT_FOR_FORWARDING"
-    # process-only mapping
-    assert (await fmu._convert_to_custom_state("PENDING", "")) == "WAIT_FOR_PROCESSING"
-    assert (await fmu._convert_to_custom_state("STARTED", "")) == "PROCESSING"
-    assert (await fmu._convert_to_custom_state("SUCCESS", "")) == "WAIT_FOR_FORWARDING"
-    assert (await fmu._convert_to_custom_state("Y", "")) == "WAIT_FOR_PROCESSING"
-
-
 # -------------------- get_file_size --------------------
 
 
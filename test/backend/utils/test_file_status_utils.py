@@ -0,0 +1,42 @@
+from backend.utils.file_status_utils import convert_celery_states_to_custom, summarize_file_states
+
+
+def test_convert_celery_states_to_custom_mappings():
+    # failures win
+    assert convert_celery_states_to_custom("FAILURE", "") == "PROCESS_FAILED"
+    assert convert_celery_states_to_custom("SUCCESS", "FAILURE") == "FORWARD_FAILED"
+    # both success
+    assert convert_celery_states_to_custom("SUCCESS", "SUCCESS") == "COMPLETED"
+    # both empty
+    assert convert_celery_states_to_custom("", "") == "WAIT_FOR_PROCESSING"
+    # forward state decides once there is one
+    assert convert_celery_states_to_custom("SUCCESS", "PENDING") == "WAIT_FOR_FORWARDING"
+    assert convert_celery_states_to_custom("", "STARTED") == "FORWARDING"
+    assert convert_celery_states_to_custom("", "SUCCESS") == "COMPLETED"
+    assert convert_celery_states_to_custom("", "X") == "WAIT_FOR_FORWARDING"
+    # process-only mapping
+    assert convert_celery_states_to_custom("PENDING", "") == "WAIT_FOR_PROCESSING"
+    assert convert_celery_states_to_custom("STARTED", "") == "PROCESSING"
+    assert convert_celery_states_to_custom("SUCCESS", "") == "WAIT_FOR_FORWARDING"
+    assert convert_celery_states_to_custom("Y", "") == "WAIT_FOR_PROCESSING"
+
+
+def test_summarize_file_states_uses_latest_tasks():
+    tasks = [
+        {"id": "1", "task_name": "process", "path_or_url": "/p1", "original_filename": "f1",
+         "source_type": "local", "status": "FAILURE", "created_at": 1},
+        {"id": "3", "task_name": "process", "path_or_url": "/p1", "original_filename": "f1",
+         "source_type": "local", "status": "SUCCESS", "created_at": 3},
+        {"id": "4", "task_name": "forward", "path_or_url": "/p1", "original_filename": "f1",
+         "source_type": "local", "status": "STARTED", "created_at": 4},
+        {"id": "5", "task_name": "process", "path_or_url": "/p2", "original_filename": "f2",
+         "source_type": "minio", "status": "PENDING", "created_at": ""},
+        {"id": "6", "task_name": "process", "path_or_url": "", "status": "SUCCESS", "created_at": 6},
+    ]
+
+    out = summarize_file_states(tasks)
+
+    assert out == {
+        "/p1": {"state": "FORWARDING", "latest_task_id": "4", "original_filename": "f1", "source_type": "local"},
+        "/p2": {"state": "WAIT_FOR_PROCESSING", "latest_task_id": "", "original_filename": "", "source_type": ""},
+    }
@@ -10,6 +10,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..',
 sys.modules['consts'] = MagicMock()
 sys.modules['consts.const'] = MagicMock()
 sys.modules['utils.config_utils'] = MagicMock()
+sys.modules['utils.embedding_cache_utils'] = MagicMock()
 
 # Mock logger
 logger_mock = MagicMock()
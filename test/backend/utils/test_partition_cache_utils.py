@@ -0,0 +1,69 @@
+import hashlib
+import io
+import os
+import sys
+import types
+
+import pytest
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../')))
+
+from backend.utils import partition_cache_utils
+from nexent.data_process import LocalPartitionCache, StoragePartitionCache
+
+
+class ClosingStream(io.BytesIO):
+    closed_by_caller = False
+
+    def close(self):
+        self.closed_by_caller = True
+        super().close()
+
+
+def test_create_partition_cache_follows_config(mocker):
+    fake_client_mod = types.ModuleType("database.client")
+    fake_client_mod.minio_client = "minio-client"
+    mocker.patch.dict(sys.modules, {"database.client": fake_client_mod})
+    mocker.patch.object(partition_cache_utils, "DP_PARTITION_CACHE_TTL_S", 86400)
+
+    mocker.patch.object(partition_cache_utils, "DP_PARTITION_CACHE", "minio")
+    cache = partition_cache_utils.create_partition_cache()
+    assert isinstance(cache, StoragePartitionCache)
+    assert (cache.storage_client, cache.prefix, cache.ttl_s) == ("minio-client", "partition_cache", 86400)
+
+    mocker.patch.object(partition_cache_utils, "DP_PARTITION_CACHE", "local")
+    mocker.patch.object(partition_cache_utils, "DP_PARTITION_CACHE_DIR", "/tmp/partition_cache")
+    cache = partition_cache_utils.create_partition_cache()
+    assert isinstance(cache, LocalPartitionCache)
+    assert (cache.directory, cache.ttl_s) == ("/tmp/partition_cache", 86400)
+
+    mocker.patch.object(partition_cache_utils, "DP_PARTITION_CACHE", "none")
+    assert partition_cache_utils.create_partition_cache() is None
+
+
+def test_evict_partition_cache_hashes_the_file_and_evicts_its_entries(mocker):
+    stream = ClosingStream(b"file bytes")
+    mocker.patch.dict(sys.modules, {"database.attachment_db": types.SimpleNamespace(
+        open_file_stream=lambda object_name: stream if object_name == "kb/a.pdf" else None)})
+    cache = mocker.MagicMock()
+    cache.evict_file.return_value = 2
+    mocker.patch.object(partition_cache_utils, "create_partition_cache", return_value=cache)
+
+    assert partition_cache_utils.evict_partition_cache("kb/a.pdf") == 2
+    cache.evict_file.assert_called_once_with(hashlib.sha256(b"file bytes").hexdigest())
+    assert stream.closed_by_caller
+    assert partition_cache_utils.evict_partition_cache("kb/missing.pdf") == 0
+
+
+def test_evict_partition_cache_is_a_no_op_when_disabled_or_failing(mocker):
+    open_file_stream = mocker.MagicMock(side_effect=RuntimeError("minio down"))
+    mocker.patch.dict(sys.modules, {"database.attachment_db": types.SimpleNamespace(
+        open_file_stream=open_file_stream)})
+
+    mocker.patch.object(partition_cache_utils, "create_partition_cache", return_value=None)
+    assert partition_cache_utils.evict_partition_cache("kb/a.pdf") == 0
+    open_file_stream.assert_not_called()
+
+    mocker.patch.object(partition_cache_utils, "create_partition_cache", return_value=mocker.MagicMock())
+    assert partition_cache_utils.evict_partition_cache("kb/a.pdf") == 0
@@ -0,0 +1,178 @@
+import pytest
+
+from backend.utils import task_registry_utils
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.calls = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+        return queue
+
+    def execute(self):
+        results = [getattr(self.client, name)(*args, **kwargs) for name, args, kwargs in self.calls]
+        self.calls = []
+        return results
+
+
+class DictRedisClient:
+    """Hashes, sorted sets and sets of a decode_responses=True client"""
+
+    def __init__(self):
+        self.hashes = {}
+        self.zsets = {}
+        self.sets = {}
+        self.ttls = {}
+        self.strings = {}
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def hset(self, key, mapping):
+        self.hashes.setdefault(key, {}).update({k: str(v) for k, v in mapping.items()})
+
+    def hsetnx(self, key, field, value):
+        self.hashes.setdefault(key, {}).setdefault(field, str(value))
+
+    def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    def hget(self, key, field):
+        return self.hashes.get(key, {}).get(field)
+
+    def delete(self, *keys):
+        for key in keys:
+            self.hashes.pop(key, None)
+            self.zsets.pop(key, None)
+
+    def zadd(self, key, mapping, nx=False):
+        zset = self.zsets.setdefault(key, {})
+        for member, score in mapping.items():
+            if not (nx and member in zset):
+                zset[member] = score
+
+    def zrange(self, key, start, end):
+        return [member for member, _ in sorted(self.zsets.get(key, {}).items(), key=lambda item: item[1])]
+
+    def zrem(self, key, *members):
+        for member in members:
+            self.zsets.get(key, {}).pop(member, None)
+
+    def sadd(self, key, *members):
+        self.sets.setdefault(key, set()).update(members)
+
+    def smembers(self, key):
+        return set(self.sets.get(key, set()))
+
+    def srem(self, key, *members):
+        self.sets.get(key, set()).difference_update(members)
+
+    def exists(self, key):
+        return int(key in self.hashes or key in self.zsets or key in self.strings)
+
+    def set(self, key, value):
+        self.strings[key] = str(value)
+
+    def expire(self, key, seconds):
+        self.ttls[key] = seconds
+
+    def zremrangebyscore(self, key, min_score, max_score):
+        zset = self.zsets.get(key, {})
+        for member in [member for member, score in zset.items() if score <= max_score]:
+            del zset[member]
+
+
+def test_records_follow_the_task_lifecycle():
+    client = DictRedisClient()
+    task_registry_utils.record_task_status(client, "p1", "process", "kb1", "PENDING", created_at=100.0,
+                                path_or_url="kb1/a.pdf", original_filename="a.pdf", source_type="minio")
+    task_registry_utils.record_task_status(client, "p1", "process", "kb1", "STARTED", created_at=105.0,
+                                path_or_url="kb1/a.pdf", original_filename="a.pdf", source_type="minio")
+    task_registry_utils.record_task_status(client, "p1", "process", "kb1", "SUCCESS", chunks_count=12)
+
+    [record] = task_registry_utils.get_index_task_records(client, "kb1")
+
+    assert record["id"] == "p1"
+    assert record["status"] == "SUCCESS"
+    assert record["created_at"] == 105.0
+    assert record["chunks_count"] == 12
+    assert record["path_or_url"] == "kb1/a.pdf"
+    assert record["source_type"] == "minio"
+    assert record["error"] is None
+
+
+def test_failure_keeps_error_and_created_at():
+    client = DictRedisClient()
+    task_registry_utils.record_task_status(client, "f1", "forward", "kb1", "FAILURE", error="es down")
+
+    [record] = task_registry_utils.get_index_task_records(client, "kb1")
+
+    assert record["error"] == "es down"
+    assert record["created_at"] == pytest.approx(record["updated_at"])
+
+
+def test_reads_are_scoped_to_the_index():
+    client = DictRedisClient()
+    task_registry_utils.record_task_status(client, "a2", "forward", "kb1", "PENDING", created_at=2.0)
+    task_registry_utils.record_task_status(client, "a1", "process", "kb1", "PENDING", created_at=1.0)
+    task_registry_utils.record_task_status(client, "b1", "process", "kb2", "PENDING", created_at=3.0)
+
+    assert [r["id"] for r in task_registry_utils.get_index_task_records(client, "kb1")] == ["a1", "a2"]
+    assert [r["id"] for r in task_registry_utils.get_index_task_records(client, "missing")] == []
+    assert sorted(r["id"] for r in task_registry_utils.get_all_task_records(client)) == ["a1", "a2", "b1"]
+
+
+def test_document_tasks_are_removed_alone():
+    client = DictRedisClient()
+    task_registry_utils.record_task_status(client, "p1", "process", "kb1", "PENDING", created_at=1.0, path_or_url="kb1/a.pdf")
+    task_registry_utils.record_task_status(client, "f1", "forward", "kb1", "PENDING", created_at=2.0, path_or_url="kb1/a.pdf")
+    task_registry_utils.record_task_status(client, "p2", "process", "kb1", "PENDING", created_at=3.0, path_or_url="kb1/b.pdf")
+
+    task_ids = task_registry_utils.get_task_ids(client, "kb1", "kb1/a.pdf")
+    task_registry_utils.remove_task_records(client, "kb1", task_ids, "kb1/a.pdf")
+
+    assert task_ids == ["p1", "f1"]
+    assert task_registry_utils.get_task_ids(client, "kb1", "kb1/a.pdf") == []
+    assert [r["id"] for r in task_registry_utils.get_index_task_records(client, "kb1")] == ["p2"]
+
+
+def test_index_removal_drops_every_key_of_the_index():
+    client = DictRedisClient()
+    task_registry_utils.record_task_status(client, "p1", "process", "kb1", "PENDING", created_at=1.0, path_or_url="kb1/a.pdf")
+    task_registry_utils.record_task_status(client, "p2", "process", "kb2", "PENDING", created_at=2.0, path_or_url="kb2/a.pdf")
+
+    task_registry_utils.remove_task_records(client, "kb1", task_registry_utils.get_task_ids(client, "kb1"))
+
+    assert list(client.hashes) == [task_registry_utils.task_key("p2")]
+    assert set(client.zsets) == {task_registry_utils.index_tasks_key("kb2"), task_registry_utils.document_tasks_key("kb2", "kb2/a.pdf")}
+    assert client.smembers(task_registry_utils.TASK_INDICES_KEY) == {"kb2"}
+
+
+def test_records_expire_with_the_celery_results(monkeypatch):
+    client = DictRedisClient()
+    monkeypatch.setattr(task_registry_utils.time, "time", lambda: 1000.0)
+    task_registry_utils.record_task_status(client, "old", "process", "kb1", "SUCCESS", created_at=100.0,
+                                           path_or_url="kb1/a.pdf")
+    task_registry_utils.record_task_status(client, "new", "process", "kb1", "PENDING", created_at=990.0,
+                                           ttl_s=600, path_or_url="kb1/a.pdf")
+
+    assert client.ttls == {"dp:task:new": 600, "dp:index_tasks:kb1": 600,
+                           task_registry_utils.document_tasks_key("kb1", "kb1/a.pdf"): 600}
+    # Members older than the TTL, whose records have expired, are trimmed from the task sets
+    assert task_registry_utils.get_task_ids(client, "kb1") == ["new"]
+    assert task_registry_utils.get_task_ids(client, "kb1", "kb1/a.pdf") == ["new"]
+
+
+def test_unregistered_task_ids_and_migration_marker():
+    client = DictRedisClient()
+    task_registry_utils.record_task_status(client, "p1", "process", "kb1", "SUCCESS", created_at=1.0)
+
+    assert task_registry_utils.get_unregistered_task_ids(client, ["p1", "legacy"]) == ["legacy"]
+    assert task_registry_utils.get_unregistered_task_ids(client, []) == []
+    assert not task_registry_utils.legacy_tasks_migrated(client)
+    task_registry_utils.mark_legacy_tasks_migrated(client)
+    assert task_registry_utils.legacy_tasks_migrated(client)
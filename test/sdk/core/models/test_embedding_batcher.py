@@ -0,0 +1,143 @@
+import asyncio
+
+import pytest
+
+from sdk.nexent.core.models.embedding_batcher import (
+    AdaptiveEmbeddingBatcher,
+    estimate_tokens,
+    get_embedding_batcher,
+    is_overload_error,
+    plan_batches,
+)
+from sdk.nexent.core.models.embedding_cache import EmbeddingCache
+
+
+class OverloadError(Exception):
+    """Stand-in for an aiohttp.ClientResponseError with status 429"""
+    status = 429
+
+
+class FakeAsyncEmbedding:
+    """Async embedding model that rejects batches larger than max_batch and records concurrency."""
+
+    def __init__(self, max_batch=None, delay=0.0):
+        self.model = "fake-model"
+        self.embedding_dim = 1
+        self.api_url = "http://embed.local/v1/embeddings"
+        self.max_batch = max_batch
+        self.delay = delay
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def aget_embeddings(self, inputs, timeout=None, retries=3):
+        self.calls.append(list(inputs))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.max_batch is not None and len(inputs) > self.max_batch:
+                raise OverloadError("Too Many Requests")
+            return [[float(text.split()[-1])] for text in inputs]
+        finally:
+            self.in_flight -= 1
+
+
+def _texts(count):
+    return [f"text {i}" for i in range(count)]
+
+
+def test_estimate_tokens_counts_cjk_per_character():
+    assert estimate_tokens("abcdefgh") == 3
+    assert estimate_tokens("知识库") == 4
+
+
+def test_plan_batches_by_tokens_and_items():
+    texts = ["a" * 40, "b" * 40, "c" * 40, "d"]
+
+    # 11 estimated tokens each for the long texts
+    assert plan_batches(texts, max_batch_tokens=25, max_batch_size=10) == [(0, 2), (2, 4)]
+    assert plan_batches(texts, max_batch_tokens=1000, max_batch_size=3) == [(0, 3), (3, 4)]
+    # A text over the budget still gets a batch of its own
+    assert plan_batches(texts, max_batch_tokens=5, max_batch_size=10) == [(0, 1), (1, 2), (2, 3), (3, 4)]
+    assert plan_batches([], 10, 10) == []
+
+
+def test_is_overload_error():
+    assert is_overload_error(asyncio.TimeoutError())
+    assert is_overload_error(OverloadError())
+    assert not is_overload_error(ValueError("bad input"))
+
+
+def test_embed_splits_rejected_batches_and_keeps_order():
+    model = FakeAsyncEmbedding(max_batch=3)
+    batcher = AdaptiveEmbeddingBatcher(max_batch_size=8)
+
+    vectors = asyncio.run(batcher.embed(model, _texts(8)))
+
+    assert vectors == [[float(i)] for i in range(8)]
+    assert sorted(len(call) for call in model.calls) == [2, 2, 2, 2, 4, 4, 8]
+    # Pushback halved both the concurrency limit and the token budget
+    assert batcher.concurrency_limit < batcher.max_concurrency
+    assert batcher.batch_tokens < batcher.max_batch_tokens
+
+
+def test_embed_bounds_requests_in_flight():
+    model = FakeAsyncEmbedding(delay=0.01)
+    batcher = AdaptiveEmbeddingBatcher(max_batch_size=1, max_concurrency=3)
+
+    asyncio.run(batcher.embed(model, _texts(12)))
+
+    assert len(model.calls) == 12
+    assert model.max_in_flight == 3
+
+
+def test_single_text_retries_then_raises():
+    model = FakeAsyncEmbedding(max_batch=0)
+    batcher = AdaptiveEmbeddingBatcher(max_retries=2, base_backoff_s=0.0)
+
+    with pytest.raises(OverloadError):
+        asyncio.run(batcher.embed(model, "text 1"))
+    assert len(model.calls) == 3
+
+
+def test_non_overload_errors_propagate():
+    class BrokenEmbedding(FakeAsyncEmbedding):
+        async def aget_embeddings(self, inputs, timeout=None, retries=3):
+            raise ValueError("invalid input")
+
+    with pytest.raises(ValueError):
+        asyncio.run(AdaptiveEmbeddingBatcher().embed(BrokenEmbedding(), _texts(4)))
+
+
+def test_rising_latency_shrinks_concurrency():
+    batcher = AdaptiveEmbeddingBatcher(max_concurrency=8)
+    batcher._record_latency(0.1, 100)
+    assert batcher.concurrency_limit == 8
+
+    for _ in range(5):
+        batcher._record_latency(1.0, 100)
+
+    assert batcher.concurrency_limit < 8
+
+
+def test_embed_only_sends_cache_misses_once():
+    model = FakeAsyncEmbedding()
+    cache = EmbeddingCache()
+    cache.put_many("fake-model", 1, ["text 1"], [[1.0]])
+
+    vectors = asyncio.run(AdaptiveEmbeddingBatcher().embed(model, ["text 1", "text 2", "text 2"], cache))
+
+    assert vectors == [[1.0], [2.0], [2.0]]
+    assert model.calls == [["text 2"]]
+    assert cache.get_many("fake-model", 1, ["text 2"]) == [[2.0]]
+
+
+def test_get_embedding_batcher_shared_per_endpoint():
+    first = FakeAsyncEmbedding()
+    second = FakeAsyncEmbedding()
+    other = FakeAsyncEmbedding()
+    other.api_url = "http://other.local/v1/embeddings"
+
+    assert get_embedding_batcher(first) is get_embedding_batcher(second)
+    assert get_embedding_batcher(other) is not get_embedding_batcher(first)
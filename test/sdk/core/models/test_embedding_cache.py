@@ -0,0 +1,144 @@
+import pytest
+from unittest.mock import MagicMock
+
+from sdk.nexent.core.models.embedding_cache import (
+    DiskCacheTier,
+    EmbeddingCache,
+    LRUCacheTier,
+    RedisCacheTier,
+    get_default_embedding_cache,
+    normalize_text,
+    set_default_embedding_cache,
+)
+
+
+class FakeEmbedding:
+    """Deterministic embedding model that records every API call."""
+
+    def __init__(self, model="fake-model", embedding_dim=2):
+        self.model = model
+        self.embedding_dim = embedding_dim
+        self.calls = []
+
+    def get_embeddings(self, inputs):
+        texts = [inputs] if isinstance(inputs, str) else list(inputs)
+        self.calls.append(texts)
+        return [[float(len(text)), 1.0] for text in texts]
+
+
+@pytest.fixture
+def embedding_model():
+    return FakeEmbedding()
+
+
+def test_normalize_text_collapses_whitespace():
+    assert normalize_text("  hello \n  world\t") == "hello world"
+
+
+def test_make_key_depends_on_model_and_dimension():
+    key = EmbeddingCache.make_key("m", 2, "text")
+    assert key == EmbeddingCache.make_key("m", 2, " text ")
+    assert key != EmbeddingCache.make_key("other", 2, "text")
+    assert key != EmbeddingCache.make_key("m", 4, "text")
+
+
+def test_get_embeddings_only_sends_misses(embedding_model):
+    cache = EmbeddingCache([LRUCacheTier(max_entries=10)])
+
+    first = cache.get_embeddings(embedding_model, ["a", "bb"])
+    second = cache.get_embeddings(embedding_model, ["bb", "ccc", "a"])
+
+    assert first == [[1.0, 1.0], [2.0, 1.0]]
+    assert second == [[2.0, 1.0], [3.0, 1.0], [1.0, 1.0]]
+    assert embedding_model.calls == [["a", "bb"], ["ccc"]]
+
+    stats = cache.stats()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 3
+    assert stats["api_calls"] == 2
+    assert stats["hit_rate"] == pytest.approx(0.4)
+
+
+def test_get_embeddings_deduplicates_within_call(embedding_model):
+    cache = EmbeddingCache()
+
+    result = cache.get_embeddings(embedding_model, ["same", "same", "same "])
+
+    assert len(result) == 3
+    assert embedding_model.calls == [["same"]]
+
+
+def test_get_embeddings_accepts_single_string(embedding_model):
+    cache = EmbeddingCache()
+    assert cache.get_embeddings(embedding_model, "abc") == [[3.0, 1.0]]
+    assert cache.get_embeddings(embedding_model, []) == []
+
+
+def test_get_embeddings_length_mismatch_raises():
+    model = MagicMock()
+    model.model = "m"
+    model.embedding_dim = 2
+    model.get_embeddings.return_value = [[0.1, 0.2]]
+
+    with pytest.raises(ValueError):
+        EmbeddingCache().get_embeddings(model, ["a", "b"])
+
+
+def test_lru_tier_evicts_least_recently_used():
+    tier = LRUCacheTier(max_entries=2)
+    tier.put_many({"a": [1.0], "b": [2.0]})
+    tier.get_many(["a"])
+    tier.put_many({"c": [3.0]})
+
+    assert set(tier.get_many(["a", "b", "c"]).keys()) == {"a", "c"}
+    assert len(tier) == 2
+
+
+def test_lru_tier_stores_packed_float32():
+    tier = LRUCacheTier(max_entries=2)
+    tier.put_many({"a": [0.5, 0.25]})
+
+    assert tier._entries["a"].typecode == "f"
+    assert tier.get_many(["a"]) == {"a": [0.5, 0.25]}
+
+
+def test_lower_tier_hits_are_promoted(tmp_path, embedding_model):
+    disk_tier = DiskCacheTier(str(tmp_path / "embeddings.db"))
+    EmbeddingCache([disk_tier]).get_embeddings(embedding_model, ["persisted"])
+
+    memory_tier = LRUCacheTier()
+    cache = EmbeddingCache([memory_tier, disk_tier])
+    result = cache.get_embeddings(embedding_model, ["persisted"])
+
+    assert result == [[9.0, 1.0]]
+    assert len(embedding_model.calls) == 1
+    assert len(memory_tier) == 1
+    assert cache.stats()["tier_hits"] == {"disk": 1}
+
+
+def test_redis_tier_round_trip_and_errors():
+    store = {}
+    client = MagicMock()
+    client.mget.side_effect = lambda keys: [store.get(key) for key in keys]
+    pipeline = MagicMock()
+    pipeline.set.side_effect = lambda key, value, ex=None: store.__setitem__(key, value)
+    client.pipeline.return_value = pipeline
+
+    tier = RedisCacheTier(client, key_prefix="p:", ttl_seconds=60)
+    tier.put_many({"k": [0.5, 0.25]})
+
+    assert "p:k" in store
+    assert tier.get_many(["k", "missing"]) == {"k": [0.5, 0.25]}
+
+    client.mget.side_effect = Exception("redis down")
+    assert tier.get_many(["k"]) == {}
+
+
+def test_default_embedding_cache_registry():
+    cache = EmbeddingCache()
+    set_default_embedding_cache(cache)
+    try:
+        assert get_default_embedding_cache() is cache
+    finally:
+        set_default_embedding_cache(None)
+    assert get_default_embedding_cache() is None
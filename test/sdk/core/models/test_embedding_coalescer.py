@@ -0,0 +1,156 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from sdk.nexent.core.models.embedding_coalescer import (
+    EmbeddingRequestCoalescer,
+    aembed_query,
+    embed_query,
+    get_default_embedding_coalescer,
+    set_default_embedding_coalescer,
+)
+
+
+class RecordingEmbedding:
+    """Blocking embedding model that records every API call."""
+
+    def __init__(self, api_key="key", fail=False):
+        self.model = "fake-model"
+        self.embedding_dim = 1
+        self.api_url = "http://embed.local/v1/embeddings"
+        self.api_key = api_key
+        self.fail = fail
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def get_embeddings(self, inputs):
+        texts = [inputs] if isinstance(inputs, str) else list(inputs)
+        with self._lock:
+            self.calls.append(texts)
+        if self.fail:
+            raise RuntimeError("embedding API down")
+        return [[float(len(text))] for text in texts]
+
+    async def aget_embeddings(self, inputs):
+        return self.get_embeddings(inputs)
+
+
+@pytest.fixture
+def coalescer():
+    coalescer = EmbeddingRequestCoalescer(max_batch_size=16, max_wait_ms=50)
+    yield coalescer
+    coalescer.close()
+
+
+def test_concurrent_requests_share_one_call(coalescer):
+    model = RecordingEmbedding()
+    texts = [f"query {'x' * i}" for i in range(8)]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        vectors = list(executor.map(lambda text: coalescer.embed(model, text), texts))
+
+    assert vectors == [[float(len(text))] for text in texts]
+    assert len(model.calls) == 1
+    assert sorted(model.calls[0]) == sorted(texts)
+    assert coalescer.stats()["requests"] == 8
+
+
+def test_duplicate_texts_embedded_once(coalescer):
+    model = RecordingEmbedding()
+
+    futures = [coalescer.submit(model, "same query") for _ in range(4)]
+
+    assert [future.result() for future in futures] == [[10.0]] * 4
+    assert model.calls == [["same query"]]
+
+
+def test_full_batch_is_sent_without_waiting():
+    coalescer = EmbeddingRequestCoalescer(max_batch_size=2, max_wait_ms=10000)
+    model = RecordingEmbedding()
+    try:
+        futures = [coalescer.submit(model, text) for text in ("a", "bb", "ccc")]
+
+        assert futures[0].result(timeout=5) == [1.0]
+        assert futures[1].result(timeout=5) == [2.0]
+        assert not futures[2].done()
+    finally:
+        coalescer.close()
+
+    assert futures[2].result() == [3.0]
+    assert model.calls == [["a", "bb"], ["ccc"]]
+
+
+def test_other_endpoints_are_not_mixed(coalescer):
+    tenant_a = RecordingEmbedding(api_key="a")
+    tenant_b = RecordingEmbedding(api_key="b")
+
+    futures = [coalescer.submit(tenant_a, "q1"), coalescer.submit(tenant_b, "q2")]
+    [future.result() for future in futures]
+
+    assert tenant_a.calls == [["q1"]]
+    assert tenant_b.calls == [["q2"]]
+
+
+def test_errors_reach_every_caller(coalescer):
+    model = RecordingEmbedding(fail=True)
+
+    futures = [coalescer.submit(model, text) for text in ("a", "b")]
+
+    for future in futures:
+        with pytest.raises(RuntimeError):
+            future.result()
+
+
+def test_aembed_from_event_loop(coalescer):
+    model = RecordingEmbedding()
+
+    async def run():
+        return await asyncio.gather(*(aembed_query(model, text, coalescer) for text in ("a", "bb")))
+
+    assert asyncio.run(run()) == [[1.0], [2.0]]
+    assert len(model.calls) == 1
+
+
+def test_embed_query_without_coalescer_calls_model():
+    model = RecordingEmbedding()
+
+    assert embed_query(model, "abc") == [3.0]
+    assert asyncio.run(aembed_query(model, "ab")) == [2.0]
+    assert model.calls == [["abc"], ["ab"]]
+
+
+def test_default_coalescer_registry(coalescer):
+    set_default_embedding_coalescer(coalescer)
+    try:
+        assert get_default_embedding_coalescer() is coalescer
+    finally:
+        set_default_embedding_coalescer(None)
+
+
+class FlakyEmbedding(RecordingEmbedding):
+    """Async-only embedding model that rejects any batch holding a bad text."""
+
+    def get_embeddings(self, inputs):
+        raise AssertionError("the coalescer must await aget_embeddings")
+
+    async def aget_embeddings(self, inputs):
+        texts = [inputs] if isinstance(inputs, str) else list(inputs)
+        self.calls.append(texts)
+        if "bad" in texts:
+            raise ValueError("input too long")
+        return [[float(len(text))] for text in texts]
+
+
+def test_failed_batch_is_retried_one_text_at_a_time(coalescer):
+    model = FlakyEmbedding()
+
+    futures = [coalescer.submit(model, text) for text in ("a", "bad", "ccc")]
+
+    assert futures[0].result(timeout=5) == [1.0]
+    assert futures[2].result(timeout=5) == [3.0]
+    with pytest.raises(ValueError):
+        futures[1].result(timeout=5)
+    assert sorted(model.calls[0]) == ["a", "bad", "ccc"]
+    assert sorted(model.calls[1:]) == [["a"], ["bad"], ["ccc"]]
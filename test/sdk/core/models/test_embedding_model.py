@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 import requests
 import importlib.util
@@ -313,7 +315,7 @@ def test_jina_get_multimodal_embeddings_parses_embeddings(jina_embedding_instanc
     mock_resp.json = Mock(return_value=fake_response)
 
     with patch(
-        "embedding_model_under_test.requests.post", return_value=mock_resp
+        "embedding_model_under_test.requests.Session.post", return_value=mock_resp
     ) as mock_post:
         inputs = [{"text": "t1"}, {"image": "http://x/y.jpg"}]
         result = jina_embedding_instance.get_multimodal_embeddings(
@@ -341,7 +343,7 @@ def test_jina_get_multimodal_embeddings_with_metadata(jina_embedding_instance):
     mock_resp.raise_for_status = Mock()
     mock_resp.json = Mock(return_value=fake_response)
 
-    with patch("embedding_model_under_test.requests.post", return_value=mock_resp) as mock_post:
+    with patch("embedding_model_under_test.requests.Session.post", return_value=mock_resp) as mock_post:
         inputs = [{"text": "t"}]
         result = jina_embedding_instance.get_multimodal_embeddings(
             inputs, with_metadata=True, timeout=4
@@ -377,7 +379,7 @@ def test_jina_get_multimodal_embeddings_timeout_retry_succeeds(jina_embedding_in
     side_effect.calls = 0
 
     with patch(
-        "embedding_model_under_test.requests.post", side_effect=side_effect
+        "embedding_model_under_test.requests.Session.post", side_effect=side_effect
     ) as mock_post:
         inputs = [{"text": "t"}]
         result = jina_embedding_instance.get_multimodal_embeddings(
@@ -398,7 +400,7 @@ def test_jina_get_multimodal_embeddings_timeout_exhausts_raises(
     """Should raise Timeout after exhausting retries."""
 
     with patch(
-        "embedding_model_under_test.requests.post",
+        "embedding_model_under_test.requests.Session.post",
         side_effect=requests.exceptions.Timeout(),
     ) as mock_post:
         with pytest.raises(requests.exceptions.Timeout):
@@ -476,8 +478,8 @@ def test_openai_get_embeddings_string_prepares_input_list(openai_embedding_insta
         mock_make_request.assert_called_once()
 
 
-def test_openai_make_request_invokes_requests_post(openai_embedding_instance):
-    """Cover OpenAI _make_request by patching requests.post path."""
+def test_openai_make_request_uses_pooled_session(openai_embedding_instance):
+    """Cover OpenAI _make_request by patching the pooled session post."""
 
     fake_response = {"data": [{"embedding": [7, 8]}]}
 
@@ -485,7 +487,7 @@ def test_openai_make_request_invokes_requests_post(openai_embedding_instance):
     mock_resp.raise_for_status = Mock()
     mock_resp.json = Mock(return_value=fake_response)
 
-    with patch("embedding_model_under_test.requests.post", return_value=mock_resp) as mock_post:
+    with patch("embedding_model_under_test.requests.Session.post", return_value=mock_resp) as mock_post:
         result = openai_embedding_instance.get_embeddings(
             ["hi"], with_metadata=False, timeout=2
         )
@@ -516,3 +518,116 @@ async def test_openai_dimension_check_connection_error_returns_empty(openai_embe
         result = await openai_embedding_instance.dimension_check()
 
         assert result == []
+
+
+# ---------------------------------------------------------------------------
+# Tests for the pooled HTTP sessions
+# ---------------------------------------------------------------------------
+
+
+def test_http_session_shared_per_host_and_pool_size():
+    """Clients of the same host share one keep-alive session, other hosts get their own."""
+
+    embedding_model_module.close_http_sessions()
+    session = embedding_model_module.get_http_session("https://api.example.com/v1/embeddings")
+
+    assert embedding_model_module.get_http_session("https://api.example.com/v2/other") is session
+    assert embedding_model_module.get_http_session("https://api.jina.ai/v1/embeddings") is not session
+    assert embedding_model_module.get_http_session("https://api.example.com/v1/embeddings", 4) is not session
+    assert session.get_adapter("https://api.example.com")._pool_maxsize == \
+        embedding_model_module.DEFAULT_HTTP_POOL_MAXSIZE
+
+    embedding_model_module.close_http_sessions()
+    assert embedding_model_module.get_http_session("https://api.example.com/v1/embeddings") is not session
+
+
+def test_make_request_reuses_session_across_instances():
+    """Two clients of the same endpoint post through the same pooled session."""
+
+    first = OpenAICompatibleEmbedding("m", "https://api.example.com/v1/embeddings", "k", 8, pool_maxsize=2)
+    second = JinaEmbedding(api_key="k", base_url="https://api.example.com/v1/embeddings", pool_maxsize=2)
+    mock_session = Mock()
+    mock_session.post.return_value.json.return_value = {"data": [{"embedding": [1.0]}]}
+
+    with patch("embedding_model_under_test.get_http_session", return_value=mock_session) as mock_get_session:
+        assert first.get_embeddings("a", timeout=1) == [[1.0]]
+        assert second.get_embeddings("b", timeout=1) == [[1.0]]
+
+    assert mock_get_session.call_args_list[0].args == ("https://api.example.com/v1/embeddings", 2)
+    assert mock_get_session.call_args_list[1].args == ("https://api.example.com/v1/embeddings", 2)
+    assert mock_session.post.call_count == 2
+
+
+# ---------------------------------------------------------------------------
+# Tests for aget_embeddings
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_openai_aget_embeddings_retries_timeouts(openai_embedding_instance):
+    """Timeouts are retried on the event loop with a growing timeout."""
+
+    timeouts = []
+
+    async def fake_request(data, timeout=None):
+        timeouts.append(timeout)
+        if len(timeouts) == 1:
+            raise asyncio.TimeoutError()
+        return {"data": [{"embedding": [1.0]}]}
+
+    with patch.object(openai_embedding_instance, "_amake_request", side_effect=fake_request):
+        result = await openai_embedding_instance.aget_embeddings("hi", timeout=2, retry_timeout_step=3)
+
+    assert result == [[1.0]]
+    assert timeouts == [2, 5]
+
+
+@pytest.mark.asyncio
+async def test_jina_aget_embeddings_sends_text_inputs(jina_embedding_instance):
+    with patch.object(
+        jina_embedding_instance, "_amake_request", new_callable=AsyncMock,
+        return_value={"data": [{"embedding": [0.5]}]},
+    ) as mock_request:
+        result = await jina_embedding_instance.aget_embeddings(["a"])
+
+    assert result == [[0.5]]
+    assert mock_request.call_args.args[0]["input"] == [{"text": "a"}]
+
+
+def test_async_http_session_shared_within_event_loop():
+    async def get_session():
+        session = embedding_model_module.get_async_http_session("https://api.example.com/v1/embeddings")
+        assert embedding_model_module.get_async_http_session("https://api.example.com/v2/other") is session
+        await embedding_model_module.close_async_http_sessions()
+        return session
+
+    assert asyncio.run(get_session()).closed
+
+
+def test_closing_async_http_sessions_closes_sessions_of_short_lived_loop():
+    sessions = []
+
+    async def embed():
+        sessions.append(embedding_model_module.get_async_http_session("https://api.example.com/v1/embeddings"))
+        return "done"
+
+    assert asyncio.run(embedding_model_module.closing_async_http_sessions(embed())) == "done"
+    assert sessions[0].closed
+
+
+def test_async_http_sessions_of_closed_loops_are_dropped():
+    loop = asyncio.new_event_loop()
+
+    async def open_session():
+        return embedding_model_module.get_async_http_session("https://api.example.com/v1/embeddings")
+
+    stale_session = loop.run_until_complete(open_session())
+    loop.close()
+
+    async def get_session():
+        session = embedding_model_module.get_async_http_session("https://api.example.com/v1/embeddings")
+        await embedding_model_module.close_async_http_sessions()
+        return session
+
+    assert asyncio.run(get_session()) is not stale_session
+    assert loop not in embedding_model_module._async_http_sessions
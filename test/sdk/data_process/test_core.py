@@ -20,6 +20,26 @@ class TestDataProcessCore:
         assert "OpenPyxl" in core.processors
         assert len(core.processors) == 2
 
+    def test_init_passes_page_range_options(self):
+        """Test DataProcessCore hands the page-range options to the Unstructured processor"""
+        core = DataProcessCore(page_range_map=map, pages_per_range=8, min_pages_to_split=16)
+
+        processor = core.processors["Unstructured"]
+        assert processor.page_range_map is map
+        assert processor.pages_per_range == 8
+        assert processor.min_pages_to_split == 16
+
+    def test_init_passes_excel_streaming(self):
+        """Test DataProcessCore hands the streaming option to the OpenPyxl processor"""
+        assert DataProcessCore(excel_streaming=True).processors["OpenPyxl"].streaming is True
+        assert DataProcessCore().processors["OpenPyxl"].streaming is False
+
+    def test_init_passes_partition_cache(self):
+        """Test DataProcessCore hands the partition cache to the Unstructured processor"""
+        cache = Mock()
+        assert DataProcessCore(partition_cache=cache).processors["Unstructured"].partition_cache is cache
+        assert DataProcessCore().processors["Unstructured"].partition_cache is None
+
     def test_file_process_with_excel_file(self, core, mocker: MockFixture):
         """Test file processing with Excel file"""
         # Mock OpenPyxl processor
@@ -537,3 +537,66 @@ class TestOpenPyxlProcessor:
         result = processor._check_file_exists("/path/to/file.xlsx")
 
         assert result is False
+
+
+class TestOpenPyxlProcessorStreaming:
+    """Streaming mode reads real workbooks row by row and must match the default mode"""
+
+    @staticmethod
+    def _workbook_bytes():
+        openpyxl = pytest.importorskip("openpyxl")
+        wb = openpyxl.Workbook()
+        table = wb.active
+        table.title = "Table"
+        table.append(["Quarterly report", None, None])
+        table.append([None, None, None])
+        table.append(["Region", "Product", "Sales"])
+        table.append(["North", "A", 10])
+        table.append([None, "B\nnew", 20])
+        table.append(["South", "A", 30])
+        table.merge_cells("A4:A5")
+        table.merge_cells("A1:C1")
+        table.merge_cells("B8:C9")
+
+        notes = wb.create_sheet("Notes")
+        notes.append(["first line"])
+        notes.append([None])
+        notes.append(["second\nline"])
+
+        buffer = io.BytesIO()
+        wb.save(buffer)
+        return buffer.getvalue()
+
+    def test_streaming_matches_default_mode(self):
+        """Test streaming output equals the output of loading the whole workbook"""
+        file_data = self._workbook_bytes()
+
+        expected = OpenPyxlProcessor().process_file(file_data, "basic", "report.xlsx")
+        result = OpenPyxlProcessor(streaming=True).process_file(file_data, "basic", "report.xlsx")
+
+        assert result == expected
+        assert [chunk["metadata"]["chunk_index"] for chunk in result] == list(range(len(result)))
+
+    def test_streaming_fills_column_merges(self):
+        """Test vertically merged cells carry their value into every row they span"""
+        chunks = list(OpenPyxlProcessor(streaming=True).iter_chunks(self._workbook_bytes(), "report.xlsx"))
+
+        assert "| North | B<br>new | 20 | <br>Quarterly report |" in chunks[1]["content"]
+        assert chunks[-1]["content"] == "first line\nsecond<br>line\n\n————Notes"
+
+    def test_iter_chunks_is_lazy(self, mocker: MockFixture):
+        """Test the workbook is only opened once chunks are requested and closed afterwards"""
+        load = mocker.patch("openpyxl.load_workbook", wraps=__import__("openpyxl").load_workbook)
+        file_data = self._workbook_bytes()
+        chunks = OpenPyxlProcessor(streaming=True).iter_chunks(file_data, "report.xlsx")
+
+        load.assert_not_called()
+        assert next(chunks)["metadata"]["chunk_index"] == 0
+        assert load.call_args.kwargs["read_only"] is True
+        chunks.close()
+
+    def test_iter_chunks_invalid_file(self):
+        """Test an unreadable file raises like the default mode"""
+        pytest.importorskip("openpyxl")
+        with pytest.raises(Exception, match="Failed to load Excel file"):
+            next(OpenPyxlProcessor(streaming=True).iter_chunks(b"not an excel file", "bad.xlsx"))
@@ -0,0 +1,141 @@
+import io
+import os
+import sys
+import time
+import types
+
+import pytest
+from pytest_mock import MockFixture
+
+from sdk.nexent.data_process.partition_cache import (
+    LocalPartitionCache,
+    StoragePartitionCache,
+    deserialize_elements,
+    hash_file_stream,
+    partition_cache_key,
+    serialize_elements,
+)
+
+
+class FakeStorageClient:
+    def __init__(self):
+        self.objects = {}
+        self.expirations = []
+
+    def upload_fileobj(self, file_obj, object_name, bucket=None):
+        self.objects[(bucket, object_name)] = file_obj.read()
+        return True, f"/{bucket}/{object_name}"
+
+    def get_file_stream(self, object_name, bucket=None):
+        if (bucket, object_name) not in self.objects:
+            return False, "NoSuchKey"
+        return True, io.BytesIO(self.objects[(bucket, object_name)])
+
+    def list_files(self, prefix="", bucket=None):
+        return [{"key": name} for b, name in self.objects if b == bucket and name.startswith(prefix)]
+
+    def delete_file(self, object_name, bucket=None):
+        self.objects.pop((bucket, object_name), None)
+        return True, "deleted"
+
+    def set_prefix_expiration(self, prefix, days, bucket=None):
+        self.expirations.append((prefix, days, bucket))
+        return True, "ok"
+
+
+def test_local_cache_round_trip(tmp_path):
+    cache = LocalPartitionCache(str(tmp_path))
+
+    assert cache.get("abcdef") is None
+    cache.put("abcdef", b"elements")
+
+    assert cache.get("abcdef") == b"elements"
+    assert (tmp_path / "ab" / "abcdef.json.gz").exists()
+    assert list((tmp_path / "ab").glob("*.tmp")) == []
+
+
+def test_storage_cache_round_trip():
+    client = FakeStorageClient()
+    cache = StoragePartitionCache(client, prefix="/partition_cache/", bucket="kb")
+
+    assert cache.get("abc") is None
+    cache.put("abc", b"elements")
+
+    assert cache.get("abc") == b"elements"
+    assert list(client.objects) == [("kb", "partition_cache/abc.json.gz")]
+
+
+def test_storage_cache_put_failure_raises():
+    client = FakeStorageClient()
+    client.upload_fileobj = lambda *args: (False, "bucket missing")
+
+    with pytest.raises(IOError):
+        StoragePartitionCache(client).put("abc", b"elements")
+
+
+def test_local_cache_entries_expire(tmp_path):
+    cache = LocalPartitionCache(str(tmp_path), ttl_s=60)
+    cache.put("ab-old", b"old")
+    cache.put("ab-stale", b"stale")
+    past = time.time() - 120
+    os.utime(tmp_path / "ab" / "ab-old.json.gz", (past, past))
+    os.utime(tmp_path / "ab" / "ab-stale.json.gz", (past, past))
+
+    assert cache.get("ab-old") is None
+    assert not (tmp_path / "ab" / "ab-old.json.gz").exists()
+    # A put removes the expired entries of its fan-out directory
+    cache.put("ab-new", b"new")
+    assert sorted(path.name for path in (tmp_path / "ab").iterdir()) == ["ab-new.json.gz"]
+
+
+def test_local_cache_evicts_every_entry_of_a_file(tmp_path):
+    cache = LocalPartitionCache(str(tmp_path))
+    cache.put("abc-fast", b"1")
+    cache.put("abc-hires", b"2")
+    cache.put("abd-fast", b"3")
+
+    assert cache.evict_file("abc") == 2
+    assert cache.get("abc-fast") is None
+    assert cache.get("abd-fast") == b"3"
+
+
+def test_storage_cache_sets_expiration_once_and_evicts_a_file():
+    client = FakeStorageClient()
+    cache = StoragePartitionCache(client, bucket="kb", ttl_s=36 * 3600)
+    cache.put("abc-fast", b"1")
+    cache.put("abc-hires", b"2")
+    cache.put("abd-fast", b"3")
+
+    assert client.expirations == [("partition_cache/", 2, "kb")]
+    assert cache.evict_file("abc") == 2
+    assert list(client.objects) == [("kb", "partition_cache/abd-fast.json.gz")]
+
+
+def test_hash_file_stream_matches_the_key_prefix():
+    data = b"x" * (3 * 1024 * 1024 + 5)
+
+    assert partition_cache_key(data, {}).startswith(hash_file_stream(io.BytesIO(data)) + "-")
+
+
+def test_key_depends_on_content_and_partition_params():
+    key = partition_cache_key(b"file", {"strategy": "fast", "skip_infer_table_types": []})
+
+    assert key == partition_cache_key(b"file", {"skip_infer_table_types": [], "strategy": "fast"})
+    assert key != partition_cache_key(b"other", {"strategy": "fast", "skip_infer_table_types": []})
+    assert key != partition_cache_key(b"file", {"strategy": "hi_res", "skip_infer_table_types": []})
+
+
+def test_elements_round_trip_through_staging(mocker: MockFixture):
+    fake_staging = types.ModuleType("unstructured.staging.base")
+    fake_staging.elements_to_dicts = lambda elements: [{"text": text} for text in elements]
+    fake_staging.elements_from_dicts = lambda dicts: [d["text"] for d in dicts]
+    mocker.patch.dict(sys.modules, {
+        "unstructured": types.ModuleType("unstructured"),
+        "unstructured.staging": types.ModuleType("unstructured.staging"),
+        "unstructured.staging.base": fake_staging,
+    })
+
+    data = serialize_elements(["第一段", "second"])
+
+    assert data[:2] == b"\x1f\x8b"
+    assert deserialize_elements(data) == ["第一段", "second"]
@@ -556,3 +556,226 @@ class TestUnstructuredProcessor:
 
         assert len(result) >= 1
         assert result[0]["filename"] is None
+
+
+class FakeElement:
+    def __init__(self, text, page_number):
+        self.text = text
+        self.page_number = page_number
+        self.languages = None
+
+    @property
+    def metadata(self):
+        element = self
+
+        class _Metadata:
+            def to_dict(self):
+                return {"page_number": element.page_number, "languages": element.languages}
+
+        return _Metadata()
+
+
+def setup_page_range_mocks(mocker: MockFixture):
+    """Install fake partition, chunk dispatch and language modules for the page-range path."""
+    mock_partition = setup_partition_mock(mocker, return_value=[])
+    mock_partition.side_effect = lambda file, starting_page_number, **kwargs: [
+        FakeElement(f"{file.read().decode()} p{starting_page_number}", starting_page_number),
+        FakeElement(f"tail p{starting_page_number}", starting_page_number + 1),
+    ]
+
+    fake_chunking = types.ModuleType("unstructured.chunking")
+    fake_dispatch = types.ModuleType("unstructured.chunking.dispatch")
+    fake_common = types.ModuleType("unstructured.partition.common")
+    fake_lang = types.ModuleType("unstructured.partition.common.lang")
+    mocker.patch.dict(sys.modules, {
+        "unstructured.chunking": fake_chunking,
+        "unstructured.chunking.dispatch": fake_dispatch,
+        "unstructured.partition.common": fake_common,
+        "unstructured.partition.common.lang": fake_lang,
+    })
+    # Chunking merges consecutive element pairs
+    fake_dispatch.chunk = mocker.Mock(side_effect=lambda elements, strategy, **kwargs: [
+        FakeElement(" ".join(e.text for e in elements[i:i + 2]), elements[i].page_number)
+        for i in range(0, len(elements), 2)
+    ])
+
+    def apply_lang_metadata(elements, languages):
+        for element in elements:
+            element.languages = ["eng"]
+            yield element
+
+    fake_lang.apply_lang_metadata = apply_lang_metadata
+    return mock_partition, fake_dispatch.chunk
+
+
+class TestPageRangePartitioning:
+    """Split/partition/merge mode for large PDFs"""
+
+    def test_split_pdf_page_ranges(self):
+        pypdf = pytest.importorskip("pypdf")
+        writer = pypdf.PdfWriter()
+        for _ in range(5):
+            writer.add_blank_page(width=72, height=72)
+        buffer = io.BytesIO()
+        writer.write(buffer)
+
+        from sdk.nexent.data_process.unstructured_processor import split_pdf_page_ranges
+        ranges = split_pdf_page_ranges(buffer.getvalue(), pages_per_range=2)
+
+        assert [start for start, _ in ranges] == [1, 3, 5]
+        assert [len(pypdf.PdfReader(io.BytesIO(data)).pages) for _, data in ranges] == [2, 2, 1]
+        # Too few pages to be worth splitting
+        assert split_pdf_page_ranges(buffer.getvalue(), pages_per_range=2, min_pages=6) == []
+        assert split_pdf_page_ranges(buffer.getvalue(), pages_per_range=5) == []
+
+    def test_ranges_are_merged_in_order_then_chunked_once(self, mocker: MockFixture):
+        mock_partition, mock_chunk = setup_page_range_mocks(mocker)
+        mocker.patch(
+            "sdk.nexent.data_process.unstructured_processor.split_pdf_page_ranges",
+            return_value=[(1, b"a"), (33, b"b")],
+        )
+        calls = []
+
+        def recording_map(func, *iterables):
+            calls.append(iterables)
+            return map(func, *iterables)
+
+        processor = UnstructuredProcessor(page_range_map=recording_map)
+        result = processor._process_file(b"pdf", "by_title", "big.pdf", max_characters=100)
+
+        assert len(calls) == 1 and calls[0][1] == [1, 33]
+        # Ranges are partitioned without chunking; chunking runs once over the merged elements
+        assert all("chunking_strategy" not in call.kwargs for call in mock_partition.call_args_list)
+        merged = mock_chunk.call_args[0][0]
+        assert [e.text for e in merged] == ["a p1", "tail p1", "b p33", "tail p33"]
+        assert mock_chunk.call_args[0][1] == "by_title"
+        assert mock_chunk.call_args[1] == {"max_characters": 100, "new_after_n_chars": 1024}
+        assert [doc["content"] for doc in result] == ["a p1 tail p1", "b p33 tail p33"]
+        assert [doc["metadata"]["chunk_index"] for doc in result] == [0, 1]
+        assert [doc["metadata"]["page_number"] for doc in result] == [1, 33]
+        assert all(doc["language"] == "eng" for doc in result)
+
+    def test_none_strategy_skips_chunking(self, mocker: MockFixture):
+        _, mock_chunk = setup_page_range_mocks(mocker)
+        mocker.patch(
+            "sdk.nexent.data_process.unstructured_processor.split_pdf_page_ranges",
+            return_value=[(1, b"a"), (3, b"b")],
+        )
+
+        result = UnstructuredProcessor(page_range_map=map)._process_file(b"pdf", "none", "big.pdf")
+
+        mock_chunk.assert_not_called()
+        assert result[0]["content"] == "a p1\n\ntail p1\n\nb p3\n\ntail p3"
+
+    @pytest.mark.parametrize("page_range_map,filename", [(None, "big.pdf"), (map, "big.docx")])
+    def test_other_files_are_partitioned_whole(self, mocker: MockFixture, page_range_map, filename):
+        mock_partition = setup_partition_mock(mocker, return_value=[])
+        mock_split = mocker.patch("sdk.nexent.data_process.unstructured_processor.split_pdf_page_ranges")
+
+        UnstructuredProcessor(page_range_map=page_range_map)._process_file(b"data", "basic", filename)
+
+        mock_split.assert_not_called()
+        assert mock_partition.call_args[1]["chunking_strategy"] == "basic"
+
+    def test_unsplittable_pdf_falls_back_to_single_call(self, mocker: MockFixture):
+        mock_partition = setup_partition_mock(mocker, return_value=[])
+        mocker.patch(
+            "sdk.nexent.data_process.unstructured_processor.split_pdf_page_ranges",
+            side_effect=ValueError("broken xref"),
+        )
+
+        UnstructuredProcessor(page_range_map=map)._process_file(b"data", "basic", "big.pdf")
+
+        mock_partition.assert_called_once()
+
+
+class DictPartitionCache:
+    def __init__(self, entries=None):
+        self.entries = dict(entries or {})
+        self.puts = []
+
+    def get(self, key):
+        return self.entries.get(key)
+
+    def put(self, key, data):
+        self.puts.append(key)
+        self.entries[key] = data
+
+
+def setup_staging_mock(mocker: MockFixture):
+    """Fake unstructured.staging.base that serializes FakeElements through plain dicts."""
+    fake_staging = types.ModuleType("unstructured.staging")
+    fake_staging_base = types.ModuleType("unstructured.staging.base")
+    fake_staging_base.elements_to_dicts = lambda elements: [
+        {"text": e.text, "page_number": e.page_number} for e in elements]
+    fake_staging_base.elements_from_dicts = lambda dicts: [
+        FakeElement(d["text"], d["page_number"]) for d in dicts]
+    mocker.patch.dict(sys.modules, {
+        "unstructured.staging": fake_staging,
+        "unstructured.staging.base": fake_staging_base,
+    })
+
+
+class TestPartitionCache:
+    """Unchunked partition results cached and re-chunked"""
+
+    def test_miss_partitions_without_chunking_and_stores_elements(self, mocker: MockFixture):
+        mock_partition, mock_chunk = setup_page_range_mocks(mocker)
+        mock_partition.side_effect = lambda file, **kwargs: [FakeElement("a", 1), FakeElement("b", 2)]
+        setup_staging_mock(mocker)
+        cache = DictPartitionCache()
+
+        result = UnstructuredProcessor(partition_cache=cache)._process_file(b"doc", "basic", "a.docx")
+
+        assert "chunking_strategy" not in mock_partition.call_args.kwargs
+        assert mock_partition.call_args.kwargs["strategy"] == "fast"
+        mock_chunk.assert_called_once()
+        assert len(cache.puts) == 1
+        assert [doc["content"] for doc in result] == ["a b"]
+
+    def test_hit_rechunks_cached_elements_without_partitioning(self, mocker: MockFixture):
+        mock_partition, mock_chunk = setup_page_range_mocks(mocker)
+        mock_partition.side_effect = lambda file, **kwargs: [FakeElement("a", 1), FakeElement("b", 2)]
+        setup_staging_mock(mocker)
+        cache = DictPartitionCache()
+        processor = UnstructuredProcessor(partition_cache=cache)
+        processor._process_file(b"doc", "basic", "a.docx")
+
+        result = processor._process_file(b"doc", "by_title", "a.docx", max_characters=10, new_after_n_chars=5)
+
+        mock_partition.assert_called_once()
+        assert len(cache.puts) == 1
+        assert mock_chunk.call_args[0][1] == "by_title"
+        assert mock_chunk.call_args[1] == {"max_characters": 10, "new_after_n_chars": 5}
+        assert [doc["content"] for doc in result] == ["a b"]
+        assert [doc["metadata"]["page_number"] for doc in result] == [1]
+
+    def test_page_ranges_are_cached_merged(self, mocker: MockFixture):
+        mock_partition, _ = setup_page_range_mocks(mocker)
+        setup_staging_mock(mocker)
+        mocker.patch(
+            "sdk.nexent.data_process.unstructured_processor.split_pdf_page_ranges",
+            return_value=[(1, b"a"), (33, b"b")],
+        )
+        cache = DictPartitionCache()
+        processor = UnstructuredProcessor(page_range_map=map, partition_cache=cache)
+
+        first = processor._process_file(b"pdf", "basic", "big.pdf")
+        second = processor._process_file(b"pdf", "none", "big.pdf")
+
+        assert mock_partition.call_count == 2
+        assert [doc["content"] for doc in first] == ["a p1 tail p1", "b p33 tail p33"]
+        assert second[0]["content"] == "a p1\n\ntail p1\n\nb p33\n\ntail p33"
+
+    def test_cache_errors_fall_back_to_partitioning(self, mocker: MockFixture):
+        mock_partition, _ = setup_page_range_mocks(mocker)
+        mock_partition.side_effect = lambda file, **kwargs: [FakeElement("a", 1)]
+        setup_staging_mock(mocker)
+        cache = mocker.Mock()
+        cache.get.side_effect = IOError("disk gone")
+        cache.put.side_effect = IOError("disk gone")
+
+        result = UnstructuredProcessor(partition_cache=cache)._process_file(b"doc", "basic", "a.docx")
+
+        mock_partition.assert_called_once()
+        assert [doc["content"] for doc in result] == ["a"]
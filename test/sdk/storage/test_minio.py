@@ -883,3 +883,75 @@ class TestMinIOStorageClientExists:
 
         assert exists is False
 
+
+
+class TestMinIOStorageClientSetPrefixExpiration:
+    """Test cases for set_prefix_expiration method"""
+
+    @patch('nexent.storage.minio.boto3')
+    def test_set_prefix_expiration_keeps_other_rules(self, mock_boto3):
+        """Test the rule of the prefix is replaced and the other rules of the bucket are kept"""
+        mock_client = MagicMock()
+        mock_boto3.client.return_value = mock_client
+        other_rule = {'ID': 'other', 'Filter': {'Prefix': 'tmp/'}, 'Status': 'Enabled', 'Expiration': {'Days': 1}}
+        old_rule = {'ID': 'expire-cache/', 'Filter': {'Prefix': 'cache/'}, 'Status': 'Enabled',
+                    'Expiration': {'Days': 30}}
+        mock_client.get_bucket_lifecycle_configuration.return_value = {'Rules': [other_rule, old_rule]}
+
+        client = MinIOStorageClient(
+            endpoint="http://localhost:9000",
+            access_key="minioadmin",
+            secret_key="minioadmin",
+            default_bucket="test-bucket"
+        )
+
+        success, _ = client.set_prefix_expiration('cache/', 7)
+
+        assert success is True
+        mock_client.put_bucket_lifecycle_configuration.assert_called_once_with(
+            Bucket='test-bucket',
+            LifecycleConfiguration={'Rules': [other_rule, {
+                'ID': 'expire-cache/', 'Filter': {'Prefix': 'cache/'}, 'Status': 'Enabled',
+                'Expiration': {'Days': 7}}]})
+
+    @patch('nexent.storage.minio.boto3')
+    def test_set_prefix_expiration_without_lifecycle(self, mock_boto3):
+        """Test a bucket without lifecycle configuration gets one rule"""
+        mock_client = MagicMock()
+        mock_boto3.client.return_value = mock_client
+        mock_client.get_bucket_lifecycle_configuration.side_effect = ClientError(
+            {'Error': {'Code': 'NoSuchLifecycleConfiguration'}}, 'GetBucketLifecycleConfiguration')
+
+        client = MinIOStorageClient(
+            endpoint="http://localhost:9000",
+            access_key="minioadmin",
+            secret_key="minioadmin",
+            default_bucket="test-bucket"
+        )
+
+        success, _ = client.set_prefix_expiration('cache/', 1)
+
+        assert success is True
+        rules = mock_client.put_bucket_lifecycle_configuration.call_args.kwargs['LifecycleConfiguration']['Rules']
+        assert [rule['ID'] for rule in rules] == ['expire-cache/']
+
+    @patch('nexent.storage.minio.boto3')
+    def test_set_prefix_expiration_error(self, mock_boto3):
+        """Test set_prefix_expiration reports storage errors"""
+        mock_client = MagicMock()
+        mock_boto3.client.return_value = mock_client
+        mock_client.get_bucket_lifecycle_configuration.side_effect = ClientError(
+            {'Error': {'Code': 'AccessDenied'}}, 'GetBucketLifecycleConfiguration')
+
+        client = MinIOStorageClient(
+            endpoint="http://localhost:9000",
+            access_key="minioadmin",
+            secret_key="minioadmin",
+            default_bucket="test-bucket"
+        )
+
+        success, message = client.set_prefix_expiration('cache/', 1)
+
+        assert success is False
+        assert "AccessDenied" in message
+        mock_client.put_bucket_lifecycle_configuration.assert_not_called()
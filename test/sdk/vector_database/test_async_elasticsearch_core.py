@@ -0,0 +1,222 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from sdk.nexent.vector_database.async_elasticsearch_core import AsyncElasticSearchCore
+from sdk.nexent.vector_database.elasticsearch_core import DOCUMENT_CATALOG_INDEX, ElasticSearchCore
+from sdk.nexent.vector_database.index_stats_cache import IndexStatsCache
+from sdk.nexent.vector_database.query_embedding_cache import QueryEmbeddingCache
+
+
+# ----------------------------------------------------------------------------
+# Fixtures
+# ----------------------------------------------------------------------------
+
+@pytest.fixture
+def es_client():
+    """AsyncElasticsearch stand-in whose methods are all awaitable."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def async_core(es_client):
+    """Create an AsyncElasticSearchCore on a shared client for testing."""
+    return AsyncElasticSearchCore(
+        host="http://localhost:9200",
+        api_key="test_api_key",
+        client=es_client,
+    )
+
+
+def _hit(doc_id, score, index="idx"):
+    return {"_id": doc_id, "_score": score, "_index": index, "_source": {"id": doc_id, "content": doc_id}}
+
+
+def _msearch_response(accurate_hits, semantic_hits):
+    return {"responses": [{"hits": {"hits": accurate_hits}}, {"hits": {"hits": semantic_hits}}]}
+
+
+# ----------------------------------------------------------------------------
+# Client lifecycle
+# ----------------------------------------------------------------------------
+
+def test_shared_client_is_not_closed(async_core, es_client):
+    """A client passed in belongs to the caller and survives close()."""
+    asyncio.run(async_core.close())
+    es_client.close.assert_not_awaited()
+
+
+def test_owned_client_is_closed():
+    """A client built by the core is closed with it."""
+    owned_client = AsyncMock()
+    with patch.object(AsyncElasticSearchCore, "build_client", return_value=owned_client) as mock_build:
+        core = AsyncElasticSearchCore("http://localhost:9200", "key", connections_per_node=8)
+        asyncio.run(core.close())
+
+    assert mock_build.call_args.kwargs["connections_per_node"] == 8
+    owned_client.close.assert_awaited_once()
+
+
+# ----------------------------------------------------------------------------
+# Search
+# ----------------------------------------------------------------------------
+
+def test_hybrid_search_single_msearch(async_core, es_client):
+    """Both legs go out in one awaited msearch and are fused like the sync core."""
+    es_client.msearch.return_value = _msearch_response(
+        [_hit("a", 4.0), _hit("b", 2.0)], [_hit("b", 0.9), _hit("c", 0.6)])
+    embedding_model = MagicMock()
+    embedding_model.aget_embeddings = AsyncMock(return_value=[[0.1, 0.2]])
+
+    results = asyncio.run(async_core.hybrid_search(["idx"], "query", embedding_model, top_k=2))
+
+    es_client.msearch.assert_awaited_once()
+    assert es_client.msearch.call_args.kwargs["index"] == "idx"
+    assert [r["document"]["id"] for r in results] == ["b", "c"]
+    embedding_model.aget_embeddings.assert_awaited_once_with("query")
+
+
+def test_hybrid_search_rejects_unknown_fusion(async_core, es_client):
+    with pytest.raises(ValueError):
+        asyncio.run(async_core.hybrid_search(["idx"], "query", MagicMock(), fusion="max"))
+    es_client.msearch.assert_not_awaited()
+
+
+def test_semantic_search_uses_query_embedding_cache(es_client):
+    """Repeated queries are embedded once."""
+    core = AsyncElasticSearchCore(None, None, client=es_client, query_embedding_cache=QueryEmbeddingCache())
+    es_client.search.return_value = {"hits": {"hits": [_hit("a", 0.8)]}}
+    embedding_model = MagicMock()
+    embedding_model.model = "embed"
+    embedding_model.embedding_dim = 2
+    embedding_model.aget_embeddings = AsyncMock(return_value=[[0.1, 0.2]])
+
+    for _ in range(2):
+        results = asyncio.run(core.semantic_search(["idx"], "query", embedding_model, top_k=1))
+
+    assert results == [{"score": 0.8, "document": {"id": "a", "content": "a"}, "index": "idx"}]
+    embedding_model.aget_embeddings.assert_awaited_once()
+    assert es_client.search.await_count == 2
+
+
+def test_accurate_search(async_core, es_client):
+    es_client.search.return_value = {"hits": {"hits": [_hit("a", 1.5, index="kb")]}}
+
+    results = asyncio.run(async_core.accurate_search(["kb", "kb2"], "query", top_k=3))
+
+    assert results[0]["index"] == "kb"
+    assert es_client.search.call_args.kwargs["index"] == "kb,kb2"
+    assert es_client.search.call_args.kwargs["body"]["size"] == 3
+
+
+# ----------------------------------------------------------------------------
+# Chunks
+# ----------------------------------------------------------------------------
+
+def test_iter_index_chunks_pages_and_closes_pit(async_core, es_client):
+    es_client.open_point_in_time.return_value = {"id": "pit-1"}
+    es_client.search.side_effect = [
+        {"pit_id": "pit-2", "hits": {"hits": [
+            {"_id": "1", "_source": {"id": "1"}, "sort": ["1"]},
+            {"_id": "2", "_source": {"id": "2"}, "sort": ["2"]},
+        ]}},
+        {"pit_id": "pit-2", "hits": {"hits": [{"_id": "3", "_source": {"id": "3"}, "sort": ["3"]}]}},
+    ]
+
+    async def collect():
+        return [chunk async for chunk in async_core.iter_index_chunks("idx", batch_size=2)]
+
+    chunks = asyncio.run(collect())
+
+    assert [chunk["id"] for chunk in chunks] == ["1", "2", "3"]
+    second_body = es_client.search.call_args_list[1].kwargs["body"]
+    assert second_body["search_after"] == ["2"]
+    assert second_body["pit"]["id"] == "pit-2"
+    es_client.close_point_in_time.assert_awaited_once_with(body={"id": "pit-2"})
+
+
+def test_get_index_chunks_paginated_returns_cursor(async_core, es_client):
+    es_client.count.return_value = {"count": 5}
+    es_client.search.return_value = {"hits": {"hits": [
+        {"_id": "1", "_source": {"id": "1"}},
+        {"_id": "2", "_source": {"id": "2"}},
+    ]}}
+
+    result = asyncio.run(async_core.get_index_chunks("idx", page=1, page_size=2))
+
+    assert result["total"] == 5
+    assert [chunk["id"] for chunk in result["chunks"]] == ["1", "2"]
+    assert result["next_cursor"] is not None
+
+
+def test_delete_chunk_updates_catalog(async_core, es_client):
+    es_client.get.side_effect = [{"_id": "c1"}, {"_source": {"path_or_url": "/doc"}}]
+    es_client.delete.return_value = {"result": "deleted"}
+    es_client.indices.exists.return_value = True
+    es_client.search.return_value = {"aggregations": {"documents": {"buckets": []}}}
+    es_client.bulk.return_value = {"errors": False}
+
+    assert asyncio.run(async_core.delete_chunk("idx", "c1")) is True
+
+    operations = es_client.bulk.call_args.kwargs["operations"]
+    assert operations[0]["delete"]["_index"] == DOCUMENT_CATALOG_INDEX
+    assert es_client.delete.await_count == 1
+
+
+def test_failed_catalog_update_drops_marker(async_core, es_client):
+    es_client.indices.exists.return_value = True
+    es_client.search.side_effect = RuntimeError("search unavailable")
+
+    asyncio.run(async_core._sync_document_summaries("idx", ["/doc"]))
+
+    assert es_client.delete.call_args.kwargs["id"] == ElasticSearchCore._document_summary_id("idx", "")
+
+
+# ----------------------------------------------------------------------------
+# Listing and statistics
+# ----------------------------------------------------------------------------
+
+def test_get_user_indices_hides_catalog(async_core, es_client):
+    es_client.indices.get_alias.return_value = {"kb": {}, ".system": {}, DOCUMENT_CATALOG_INDEX: {}}
+
+    assert asyncio.run(async_core.get_user_indices()) == ["kb"]
+
+
+def test_list_documents_reads_catalog(async_core, es_client):
+    es_client.exists.return_value = True
+    es_client.search.return_value = {"hits": {"total": {"value": 1}, "hits": [
+        {"_source": {"path_or_url": "/doc", "filename": "doc", "file_size": 3, "chunk_count": 2},
+         "sort": [1, "/doc"]},
+    ]}}
+
+    page = asyncio.run(async_core.list_documents("idx", page_size=10))
+
+    assert page["total"] == 1
+    assert page["documents"][0]["chunk_count"] == 2
+    assert page["next_cursor"] is None
+    assert es_client.search.call_args.kwargs["index"] == DOCUMENT_CATALOG_INDEX
+
+
+def test_get_indices_detail_uses_cache(es_client):
+    core = AsyncElasticSearchCore(None, None, client=es_client, index_stats_cache=IndexStatsCache(ttl_seconds=60))
+    es_client.indices.stats.return_value = {"indices": {"kb": {"primaries": {
+        "docs": {"count": 4},
+        "store": {"size_in_bytes": 1024},
+        "search": {"query_total": 2},
+        "request_cache": {"hit_count": 1},
+    }}}}
+    es_client.indices.get_settings.return_value = {"kb": {"settings": {"index": {"creation_date": "1000"}}}}
+    es_client.msearch.return_value = {"responses": [{"aggregations": {
+        "unique_path_or_url_count": {"value": 2},
+        "process_sources": {"buckets": []},
+        "embedding_models": {"buckets": [{"key": "embed"}]},
+    }}]}
+
+    first = asyncio.run(core.get_indices_detail(["kb"]))
+    second = asyncio.run(core.get_indices_detail(["kb"]))
+
+    assert first == second
+    assert first["kb"]["base_info"]["chunk_count"] == 4
+    assert first["kb"]["base_info"]["embedding_model"] == "embed"
+    es_client.msearch.assert_awaited_once()
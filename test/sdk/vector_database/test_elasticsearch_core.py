@@ -5,7 +5,11 @@ from typing import List, Dict, Any
 from elasticsearch import exceptions
 
 # Import the class under test
-from sdk.nexent.vector_database.elasticsearch_core import ElasticSearchCore
+from sdk.nexent.core.models.embedding_cache import EmbeddingCache
+from sdk.nexent.vector_database.elasticsearch_core import ElasticSearchCore, IndexWriteBlockedError, IngestionStats
+from sdk.nexent.vector_database.index_stats_cache import IndexStatsCache
+from sdk.nexent.vector_database.query_embedding_cache import QueryEmbeddingCache
+from sdk.nexent.vector_database.utils import decode_cursor, encode_cursor
 
 
 # ----------------------------------------------------------------------------
@@ -417,6 +421,48 @@ def test_create_index_success(elasticsearch_core_instance):
         mock_ready.assert_called_once_with("test_index")
 
 
+def test_create_index_quantized_profile(elasticsearch_core_instance):
+    """Quantized profiles map to the matching HNSW index_options and optional _source exclusion."""
+    elasticsearch_core_instance.hnsw_m = 32
+    elasticsearch_core_instance.hnsw_ef_construction = 200
+    elasticsearch_core_instance.exclude_vector_source = True
+    with patch.object(elasticsearch_core_instance.client.indices, 'exists', return_value=False), \
+            patch.object(elasticsearch_core_instance.client.indices, 'create') as mock_create, \
+            patch.object(elasticsearch_core_instance, '_force_refresh_with_retry'), \
+            patch.object(elasticsearch_core_instance, '_ensure_index_ready'):
+
+        assert elasticsearch_core_instance.create_index("test_index", embedding_dim=1024, index_profile="bbq")
+
+        mappings = mock_create.call_args.kwargs["mappings"]
+        assert mappings["properties"]["embedding"]["index_options"] == {
+            "type": "bbq_hnsw", "m": 32, "ef_construction": 200}
+        assert mappings["_source"] == {"excludes": ["embedding"]}
+
+
+def test_create_index_default_profile_is_float(elasticsearch_core_instance):
+    """Without a profile the embedding is stored as a float HNSW vector and kept in _source."""
+    with patch.object(elasticsearch_core_instance.client.indices, 'exists', return_value=False), \
+            patch.object(elasticsearch_core_instance.client.indices, 'create') as mock_create, \
+            patch.object(elasticsearch_core_instance, '_force_refresh_with_retry'), \
+            patch.object(elasticsearch_core_instance, '_ensure_index_ready'):
+
+        elasticsearch_core_instance.create_index("test_index", embedding_dim=8)
+
+        mappings = mock_create.call_args.kwargs["mappings"]
+        assert mappings["properties"]["embedding"]["index_options"]["type"] == "hnsw"
+        assert "_source" not in mappings
+
+
+@pytest.mark.parametrize("index_profile, embedding_dim", [("unknown", 1024), ("bbq", 32)])
+def test_create_index_rejects_invalid_profile(elasticsearch_core_instance, index_profile, embedding_dim):
+    """Unknown profiles and bbq on small vectors are rejected before touching the cluster."""
+    with patch.object(elasticsearch_core_instance.client.indices, 'create') as mock_create:
+        with pytest.raises(ValueError):
+            elasticsearch_core_instance.create_index(
+                "test_index", embedding_dim=embedding_dim, index_profile=index_profile)
+        mock_create.assert_not_called()
+
+
 def test_create_index_already_exists(elasticsearch_core_instance):
     """Test creating an index that already exists."""
     with patch.object(elasticsearch_core_instance.client.indices, 'exists') as mock_exists, \
@@ -462,7 +508,8 @@ def test_get_user_indices_success(elasticsearch_core_instance):
         mock_get_alias.return_value = {
             "user_index_1": {},
             "user_index_2": {},
-            ".system_index": {}
+            ".system_index": {},
+            "nexent_document_catalog": {}
         }
 
         result = elasticsearch_core_instance.get_user_indices()
@@ -471,6 +518,189 @@ def test_get_user_indices_success(elasticsearch_core_instance):
         assert "user_index_1" in result
         assert "user_index_2" in result
         assert ".system_index" not in result
+        assert "nexent_document_catalog" not in result
+
+
+def test_get_user_indices_lists_rebuilt_index_by_alias(elasticsearch_core_instance):
+    """A rebuilt knowledge base is listed under its alias and a rebuild in progress is hidden."""
+    elasticsearch_core_instance.client = MagicMock()
+    elasticsearch_core_instance.client.indices.get_alias.return_value = {
+        "kb__gen2": {"aliases": {"kb": {}}},
+        "kb__gen3": {"aliases": {}},
+        "other": {"aliases": {"ops-alias": {}}},
+    }
+
+    assert elasticsearch_core_instance.get_user_indices() == ["kb", "other"]
+
+
+def test_delete_index_deletes_all_generations(elasticsearch_core_instance):
+    """Deleting a rebuilt knowledge base deletes the indices behind its alias and any unfinished rebuild."""
+    elasticsearch_core_instance.client = MagicMock()
+    elasticsearch_core_instance.client.indices.get_alias.return_value = {
+        "kb__gen1": {"aliases": {"kb": {}}},
+        "kb__gen2": {"aliases": {}},
+        "kb_other": {"aliases": {}},
+    }
+
+    assert elasticsearch_core_instance.delete_index("kb") is True
+
+    elasticsearch_core_instance.client.indices.delete.assert_called_once_with(index="kb__gen1,kb__gen2")
+
+
+def _rebuild_core(core, indices, mapping=None):
+    core.client = MagicMock()
+    core.client.indices.get_alias.return_value = indices
+    core.client.indices.get_mapping.return_value = mapping or {}
+    core.client.count.return_value = {"count": 2}
+    embedding_model = MagicMock()
+    embedding_model.model = "new-model"
+    embedding_model.embedding_dim = 8
+    return embedding_model
+
+
+def _chunk_hit(doc_id, **source):
+    return {"_id": doc_id, "_source": {"id": "shared", **source}}
+
+
+def test_rebuild_index_copies_reconciles_and_swaps(elasticsearch_core_instance):
+    """Chunks are re-embedded into a new generation, catch-up writes are applied, then the alias is swapped."""
+    embedding_model = _rebuild_core(elasticsearch_core_instance, {"kb": {"aliases": {}}})
+    elasticsearch_core_instance.client.search.side_effect = [
+        {"hits": {"hits": [_chunk_hit("c1", content="a", embedding_model_name="old"), _chunk_hit("c2", content="b")]}},
+        {"hits": {"hits": []}},
+    ]
+    copied_batches = []
+
+    def fake_insert(index_name, documents, batch_size, content_field, model, keep_ids=False):
+        assert keep_ids
+        copied_batches.append((index_name, documents))
+        return len(documents)
+
+    with patch.object(elasticsearch_core_instance, "create_index", return_value=True) as mock_create, \
+            patch.object(elasticsearch_core_instance, "_large_batch_insert", side_effect=fake_insert), \
+            patch.object(elasticsearch_core_instance, "_iter_chunk_hits", side_effect=[
+                iter([_chunk_hit("c1"), _chunk_hit("c2"), _chunk_hit("gone")]),
+                iter([_chunk_hit("c1"), _chunk_hit("c2"), _chunk_hit("c3", content="added during copy")]),
+                # After the write block: one more chunk landed before it
+                iter([_chunk_hit("c1"), _chunk_hit("c2"), _chunk_hit("c3")]),
+                iter([_chunk_hit("c1"), _chunk_hit("c2"), _chunk_hit("c3"), _chunk_hit("c4", content="late")]),
+            ]):
+        result = elasticsearch_core_instance.rebuild_index("kb", embedding_model, batch_size=2)
+
+    assert result == {"index": "kb__gen1", "copied": 2, "deleted": 1}
+    mock_create.assert_called_once_with("kb__gen1", 8, None)
+    # Chunks sharing a stored id are copied under their own _id
+    assert [doc["_id"] for _, docs in copied_batches for doc in docs] == ["c1", "c2", "c3", "c4"]
+    assert copied_batches[0][1][0]["embedding_model_name"] == "new-model"
+    delete_body = elasticsearch_core_instance.client.delete_by_query.call_args.kwargs["body"]
+    assert delete_body == {"query": {"ids": {"values": ["gone"]}}}
+    elasticsearch_core_instance.client.indices.add_block.assert_called_once_with(index="kb", block="write")
+    elasticsearch_core_instance.client.indices.update_aliases.assert_called_once_with(actions=[
+        {"add": {"index": "kb__gen1", "alias": "kb"}},
+        {"remove_index": {"index": "kb"}},
+    ])
+    final_meta = elasticsearch_core_instance.client.indices.put_mapping.call_args.kwargs["meta"]["rebuild"]
+    assert final_meta["state"] == "completed"
+    assert final_meta["copied"] == 2
+
+
+def test_reconcile_rebuild_recopies_chunks_updated_in_place(elasticsearch_core_instance):
+    """A chunk updated under the same _id after it was copied is copied again with its new content."""
+    elasticsearch_core_instance.client = MagicMock()
+    copied = []
+
+    def fake_copy(shadow, hits, embedding_model, model_name):
+        copied.extend(hit["_id"] for hit in hits)
+
+    shadow_hits = [_chunk_hit("c1", content="old text", content_hash="h-old", file_size=10),
+                   _chunk_hit("c2", content="same", file_size=10),
+                   # Copying filled in the default file size of a chunk stored without one
+                   _chunk_hit("c3", content="no size", file_size=0)]
+    source_hits = [_chunk_hit("c1", content="new text", content_hash="h-new", file_size=10),
+                   _chunk_hit("c2", content="same", file_size=10),
+                   _chunk_hit("c3", content="no size")]
+
+    with patch.object(elasticsearch_core_instance, "_iter_chunk_hits", side_effect=[iter(shadow_hits), iter(source_hits)]), \
+            patch.object(elasticsearch_core_instance, "_copy_chunks", side_effect=fake_copy):
+        result = elasticsearch_core_instance._reconcile_rebuild("kb", "kb__gen1", MagicMock(), "new-model")
+
+    assert result == (1, 0)
+    assert copied == ["c1"]
+    elasticsearch_core_instance.client.delete_by_query.assert_not_called()
+
+
+def test_rebuild_index_resumes_from_checkpoint(elasticsearch_core_instance):
+    """A rebuild for the same model continues after the checkpointed chunk in the existing shadow index."""
+    checkpoint = {"source": "kb__gen1", "embedding_model": "new-model",
+                  "cursor": encode_cursor({"after_id": "c1"}), "copied": 1}
+    embedding_model = _rebuild_core(
+        elasticsearch_core_instance,
+        {"kb__gen1": {"aliases": {"kb": {}}}, "kb__gen2": {"aliases": {}}},
+        {"kb__gen2": {"mappings": {"_meta": {"rebuild": checkpoint}}}})
+    elasticsearch_core_instance.client.search.return_value = {"hits": {"hits": []}}
+
+    with patch.object(elasticsearch_core_instance, "create_index") as mock_create, \
+            patch.object(elasticsearch_core_instance, "_iter_chunk_hits", side_effect=[iter([]) for _ in range(4)]):
+        result = elasticsearch_core_instance.rebuild_index("kb", embedding_model)
+
+    assert result["index"] == "kb__gen2"
+    mock_create.assert_not_called()
+    query = elasticsearch_core_instance.client.search.call_args.kwargs["body"]["query"]
+    assert {"range": {"id": {"gt": "c1"}}} in query["bool"]["filter"]
+    elasticsearch_core_instance.client.indices.update_aliases.assert_called_once_with(actions=[
+        {"add": {"index": "kb__gen2", "alias": "kb"}},
+        {"remove_index": {"index": "kb__gen1"}},
+    ])
+
+
+def test_rebuild_index_records_failure(elasticsearch_core_instance):
+    """A batch that cannot be embedded fails the rebuild without swapping and keeps the checkpoint."""
+    embedding_model = _rebuild_core(elasticsearch_core_instance, {"kb": {"aliases": {}}})
+    elasticsearch_core_instance.client.search.return_value = {
+        "hits": {"hits": [{"_id": "c1", "_source": {"id": "c1", "content": "a"}}]}}
+
+    with patch.object(elasticsearch_core_instance, "create_index", return_value=True), \
+            patch.object(elasticsearch_core_instance, "_large_batch_insert", return_value=0):
+        with pytest.raises(RuntimeError):
+            elasticsearch_core_instance.rebuild_index("kb", embedding_model)
+
+    elasticsearch_core_instance.client.indices.update_aliases.assert_not_called()
+    failed_meta = elasticsearch_core_instance.client.indices.put_mapping.call_args.kwargs["meta"]["rebuild"]
+    assert failed_meta["state"] == "failed"
+    assert failed_meta["cursor"] is None
+
+
+def test_rebuild_index_fails_when_copied_items_are_rejected(elasticsearch_core_instance):
+    """Chunks rejected item by item inside a bulk request fail the rebuild before the alias swap."""
+    embedding_model = _rebuild_core(elasticsearch_core_instance, {"kb": {"aliases": {}}})
+    embedding_model.get_embeddings.side_effect = lambda texts: [[0.1] for _ in texts]
+    elasticsearch_core_instance.client.search.return_value = {
+        "hits": {"hits": [_chunk_hit("c1", content="a"), _chunk_hit("c2", content="b")]}}
+    elasticsearch_core_instance.client.bulk.return_value = _bulk_item_errors("mapper_parsing_exception")
+
+    with patch.object(elasticsearch_core_instance, "create_index", return_value=True):
+        with pytest.raises(RuntimeError, match="Only 1 of 2"):
+            elasticsearch_core_instance.rebuild_index("kb", embedding_model)
+
+    elasticsearch_core_instance.client.indices.update_aliases.assert_not_called()
+    failed_meta = elasticsearch_core_instance.client.indices.put_mapping.call_args.kwargs["meta"]["rebuild"]
+    assert failed_meta["state"] == "failed"
+
+
+def test_rebuild_index_lifts_write_block_when_final_pass_fails(elasticsearch_core_instance):
+    """A failure after the old index was write blocked makes it writable again."""
+    embedding_model = _rebuild_core(elasticsearch_core_instance, {"kb": {"aliases": {}}})
+    elasticsearch_core_instance.client.search.return_value = {"hits": {"hits": []}}
+
+    with patch.object(elasticsearch_core_instance, "create_index", return_value=True), \
+            patch.object(elasticsearch_core_instance, "_reconcile_rebuild",
+                         side_effect=[(0, 0), RuntimeError("embedding failed")]):
+        with pytest.raises(RuntimeError):
+            elasticsearch_core_instance.rebuild_index("kb", embedding_model)
+
+    elasticsearch_core_instance.client.indices.put_settings.assert_any_call(
+        index="kb", settings={"index.blocks.write": False})
+    elasticsearch_core_instance.client.indices.update_aliases.assert_not_called()
 
 
 # ----------------------------------------------------------------------------
@@ -559,6 +789,198 @@ def test_vectorize_documents_large_batch(elasticsearch_core_instance):
         mock_refresh.assert_called_once_with("test_index")
 
 
+def test_large_batch_insert_bulk_order_preserved_with_concurrent_embedding(elasticsearch_core_instance):
+    """ES batches are bulk-indexed in order even when later embeddings finish first."""
+    elasticsearch_core_instance.embedding_concurrency = 4
+
+    class SlowFirstEmbedding:
+        embedding_model_name = "test-model"
+
+        def get_embeddings(self, texts):
+            if texts[0] == "doc 0":
+                time.sleep(0.2)
+            return [[0.1] for _ in texts]
+
+    documents = [{"content": f"doc {i}", "id": str(i)} for i in range(4)]
+    bulk_batches = []
+
+    def record_bulk(index, operations, refresh):
+        bulk_batches.append([op["id"] for op in operations[1::2]])
+        return {"errors": False, "items": []}
+
+    with patch.object(elasticsearch_core_instance.client, 'bulk', side_effect=record_bulk), \
+            patch.object(elasticsearch_core_instance, '_force_refresh_with_retry'):
+        result = elasticsearch_core_instance._large_batch_insert(
+            "test_index", documents, 1, "content", SlowFirstEmbedding())
+
+    assert result == 4
+    assert bulk_batches == [["0"], ["1"], ["2"], ["3"]]
+
+
+def test_large_batch_insert_skips_failed_sub_batch(elasticsearch_core_instance):
+    """A sub-batch that fails all embedding retries is skipped while others are indexed."""
+
+    class FailingEmbedding:
+        def get_embeddings(self, texts):
+            if texts[0] == "bad":
+                raise Exception("Embedding API error")
+            return [[0.1] for _ in texts]
+
+    documents = [{"content": "good", "id": "1"}, {"content": "bad", "id": "2"}, {"content": "good", "id": "3"}]
+
+    with patch.object(elasticsearch_core_instance.client, 'bulk') as mock_bulk, \
+            patch.object(elasticsearch_core_instance, '_force_refresh_with_retry'), \
+            patch('time.sleep'):
+        mock_bulk.return_value = {"errors": False, "items": []}
+        result = elasticsearch_core_instance._large_batch_insert(
+            "test_index", documents, 1, "content", FailingEmbedding())
+
+    assert result == 2
+    assert mock_bulk.call_count == 2
+
+
+def test_large_batch_insert_survives_a_batch_that_cannot_be_built(elasticsearch_core_instance):
+    """A batch failing before its bulk call is counted as failed and the writer keeps draining the queue."""
+    elasticsearch_core_instance.bulk_queue_size = 1
+    embedding_model = MagicMock()
+    embedding_model.get_embeddings.side_effect = lambda texts: [[0.1] for _ in texts]
+    # keep_ids expects an "_id" on every document: the first one lacks it
+    documents = [{"content": "no id", "id": "0"}] + \
+        [{"content": f"doc {i}", "id": str(i), "_id": f"c{i}"} for i in range(1, 5)]
+
+    with patch.object(elasticsearch_core_instance.client, 'bulk') as mock_bulk, \
+            patch.object(elasticsearch_core_instance, '_force_refresh_with_retry'):
+        mock_bulk.return_value = {"errors": False, "items": []}
+        result = elasticsearch_core_instance._large_batch_insert(
+            "test_index", documents, 1, "content", embedding_model, keep_ids=True)
+
+    assert result == 4
+    assert mock_bulk.call_count == 4
+
+
+def test_embed_sub_batch_splits_on_overload(elasticsearch_core_instance):
+    """A sub-batch rejected with HTTP 429 is split in half instead of being resent whole."""
+
+    class RateLimitedEmbedding:
+        def __init__(self):
+            self.calls = []
+
+        def get_embeddings(self, texts):
+            self.calls.append(len(texts))
+            if len(texts) > 2:
+                error = Exception("Too Many Requests")
+                error.status = 429
+                raise error
+            return [[0.1] for _ in texts]
+
+    model = RateLimitedEmbedding()
+    documents = [{"content": f"chunk {i}", "id": str(i)} for i in range(4)]
+
+    pairs = elasticsearch_core_instance._embed_sub_batch(
+        documents, "content", model, 1, 0, IngestionStats(total_docs=4))
+
+    assert [doc["id"] for doc, _ in pairs] == ["0", "1", "2", "3"]
+    assert model.calls == [4, 2, 2]
+
+
+def test_large_batch_insert_sizes_sub_batches_by_tokens(elasticsearch_core_instance):
+    """Long chunks travel in smaller embedding requests than short ones."""
+    embedding_model = MagicMock()
+    embedding_model.get_embeddings.side_effect = lambda texts: [[0.1] for _ in texts]
+    documents = [{"content": "x" * 400, "id": str(i)} for i in range(4)] + \
+        [{"content": "short", "id": str(i)} for i in range(4, 8)]
+
+    with patch.object(elasticsearch_core_instance.client, 'bulk', return_value={"errors": False, "items": []}), \
+            patch.object(elasticsearch_core_instance, '_force_refresh_with_retry'), \
+            patch('sdk.nexent.vector_database.elasticsearch_core.EMBEDDING_SUB_BATCH_TOKENS', 250):
+        result = elasticsearch_core_instance._large_batch_insert(
+            "test_index", documents, 8, "content", embedding_model)
+
+    assert result == 8
+    sizes = sorted(len(call.args[0]) for call in embedding_model.get_embeddings.call_args_list)
+    assert sizes == [2, 6]
+
+
+def test_ingestion_stats_throughput():
+    """IngestionStats reports per-stage docs per second and failure counts."""
+    stats = IngestionStats(total_docs=10)
+    stats.record_embedding(8, 2.0, success=True)
+    stats.record_embedding(2, 1.0, success=False)
+    stats.record_bulk(8, 0.5, success=True)
+
+    throughput = stats.throughput()
+    assert stats.embedding_failed_docs == 2
+    assert throughput["embedding_docs_per_s"] == pytest.approx(8 / 3.0)
+    assert throughput["bulk_docs_per_s"] == pytest.approx(16.0)
+    assert IngestionStats(total_docs=0).throughput() == {"embedding_docs_per_s": 0.0, "bulk_docs_per_s": 0.0}
+
+
+def _bulk_item_errors(*error_types):
+    return {"errors": True, "items": [{"index": {"status": 200}}] + [
+        {"index": {"error": {"type": error_type, "reason": error_type}}} for error_type in error_types]}
+
+
+def test_large_batch_insert_counts_failed_items(elasticsearch_core_instance):
+    """Items rejected inside a successful bulk request are not counted as indexed."""
+    embedding_model = MagicMock()
+    embedding_model.get_embeddings.side_effect = lambda texts: [[0.1] for _ in texts]
+    documents = [{"content": f"doc {i}", "id": str(i)} for i in range(4)]
+
+    with patch.object(elasticsearch_core_instance.client, 'bulk') as mock_bulk, \
+            patch.object(elasticsearch_core_instance, '_force_refresh_with_retry'):
+        mock_bulk.side_effect = [_bulk_item_errors("mapper_parsing_exception"), {"errors": False, "items": []}]
+        result = elasticsearch_core_instance._large_batch_insert("test_index", documents, 2, "content", embedding_model)
+
+    assert result == 3
+
+
+def test_large_batch_insert_raises_on_write_block(elasticsearch_core_instance):
+    """Items rejected by a write block surface as IndexWriteBlockedError so the caller retries them later."""
+    embedding_model = MagicMock()
+    embedding_model.get_embeddings.side_effect = lambda texts: [[0.1] for _ in texts]
+    documents = [{"content": f"doc {i}", "id": str(i)} for i in range(2)]
+
+    with patch.object(elasticsearch_core_instance.client, 'bulk') as mock_bulk, \
+            patch.object(elasticsearch_core_instance, '_force_refresh_with_retry'):
+        mock_bulk.return_value = _bulk_item_errors("cluster_block_exception")
+        with pytest.raises(IndexWriteBlockedError):
+            elasticsearch_core_instance._large_batch_insert("test_index", documents, 2, "content", embedding_model)
+
+
+def test_small_batch_insert_counts_failed_items_and_raises_on_write_block(elasticsearch_core_instance):
+    """Small inserts report only the items that were stored and raise when the index is write blocked."""
+    embedding_model = MagicMock()
+    embedding_model.get_embeddings.side_effect = lambda texts: [[0.1] for _ in texts]
+    documents = [{"content": f"doc {i}", "id": str(i)} for i in range(2)]
+
+    with patch.object(elasticsearch_core_instance.client, 'bulk') as mock_bulk:
+        mock_bulk.return_value = _bulk_item_errors("mapper_parsing_exception")
+        assert elasticsearch_core_instance._small_batch_insert("test_index", documents, "content", embedding_model) == 1
+
+        mock_bulk.return_value = _bulk_item_errors("cluster_block_exception")
+        with pytest.raises(IndexWriteBlockedError):
+            elasticsearch_core_instance._small_batch_insert("test_index", documents, "content", embedding_model)
+
+
+def test_small_batch_insert_uses_embedding_cache(elasticsearch_core_instance):
+    """Only cache misses are sent to the embedding model when a cache is configured."""
+    mock_embedding_model = MagicMock()
+    mock_embedding_model.model = "test-model"
+    mock_embedding_model.embedding_dim = 2
+    mock_embedding_model.get_embeddings.side_effect = lambda texts: [[0.1, 0.2] for _ in texts]
+    elasticsearch_core_instance.embedding_cache = EmbeddingCache()
+
+    documents = [{"content": "cached text", "id": "1"}]
+    with patch.object(elasticsearch_core_instance.client, 'bulk') as mock_bulk:
+        mock_bulk.return_value = {"errors": False, "items": []}
+        elasticsearch_core_instance._small_batch_insert("test_index", documents, "content", mock_embedding_model)
+        elasticsearch_core_instance._small_batch_insert("test_index", documents, "content", mock_embedding_model)
+
+    mock_embedding_model.get_embeddings.assert_called_once_with(["cached text"])
+    assert mock_bulk.call_count == 2
+    assert elasticsearch_core_instance.embedding_cache.stats()["hits"] == 1
+
+
 def test_delete_documents_success(elasticsearch_core_instance):
     """Test deleting documents by path_or_url successfully."""
     with patch.object(elasticsearch_core_instance.client, 'delete_by_query') as mock_delete:
@@ -573,6 +995,89 @@ def test_delete_documents_success(elasticsearch_core_instance):
         mock_delete.assert_called_once()
 
 
+def test_reindex_document_embeds_only_changed_chunks(elasticsearch_core_instance):
+    """Test re-indexing a new document version embeds added chunks and deletes removed ones."""
+    elasticsearch_core_instance.client = MagicMock()
+    elasticsearch_core_instance.client.delete_by_query.return_value = {"deleted": 1}
+    # Both chunks share the stored id, only their _id tells them apart
+    indexed_hits = [
+        {"_id": "es-1", "_source": {"id": "old", "content": "page one", "path_or_url": "/doc", "file_size": 10}},
+        {"_id": "es-2", "_source": {"id": "old", "content": "page two", "path_or_url": "/doc", "file_size": 10}},
+    ]
+    new_version = [
+        {"content": "page one", "path_or_url": "/doc", "file_size": 20},
+        {"content": "page two, edited", "path_or_url": "/doc", "file_size": 20},
+    ]
+
+    with patch.object(elasticsearch_core_instance, "_iter_chunk_hits", return_value=iter(indexed_hits)), \
+            patch.object(elasticsearch_core_instance, "vectorize_documents", return_value=1) as mock_vectorize, \
+            patch.object(elasticsearch_core_instance, "_sync_document_summaries") as mock_sync:
+        result = elasticsearch_core_instance.reindex_document("idx", MagicMock(), "/doc", new_version)
+
+    assert result == {"indexed": 1, "deleted": 1, "unchanged": 1}
+    assert [doc["content"] for doc in mock_vectorize.call_args.args[2]] == ["page two, edited"]
+    delete_query = elasticsearch_core_instance.client.delete_by_query.call_args.kwargs["body"]["query"]
+    assert delete_query["bool"]["filter"] == [{"term": {"path_or_url": "/doc"}}, {"ids": {"values": ["es-2"]}}]
+    # The unchanged chunk picks up the new file size without being re-embedded
+    update_body = elasticsearch_core_instance.client.update_by_query.call_args.kwargs["body"]
+    assert update_body["query"]["bool"]["filter"][1] == {"ids": {"values": ["es-1"]}}
+    assert update_body["script"]["params"]["fields"]["file_size"] == 20
+    mock_sync.assert_called_once_with("idx", ["/doc"])
+
+
+def test_reindex_document_replaces_every_chunk_without_vector_source(elasticsearch_core_instance):
+    """Test new metadata on an index excluding embeddings from _source re-embeds instead of updating in place."""
+    elasticsearch_core_instance.client = MagicMock()
+    elasticsearch_core_instance.client.indices.get_mapping.return_value = {
+        "idx__gen2": {"mappings": {"_source": {"excludes": ["embedding"]}}}}
+    elasticsearch_core_instance.client.delete_by_query.return_value = {"deleted": 1}
+    indexed_hits = [
+        {"_id": "es-1", "_source": {"id": "old", "content": "page one", "path_or_url": "/doc", "file_size": 10}}]
+    new_version = [{"content": "page one", "path_or_url": "/doc", "file_size": 20}]
+
+    with patch.object(elasticsearch_core_instance, "_iter_chunk_hits", return_value=iter(indexed_hits)), \
+            patch.object(elasticsearch_core_instance, "vectorize_documents", return_value=1) as mock_vectorize, \
+            patch.object(elasticsearch_core_instance, "_sync_document_summaries"):
+        result = elasticsearch_core_instance.reindex_document("idx", MagicMock(), "/doc", new_version)
+
+    assert result == {"indexed": 1, "deleted": 1, "unchanged": 0}
+    assert mock_vectorize.call_args.args[2] == new_version
+    delete_query = elasticsearch_core_instance.client.delete_by_query.call_args.kwargs["body"]["query"]
+    assert delete_query["bool"]["filter"][1] == {"ids": {"values": ["es-1"]}}
+    elasticsearch_core_instance.client.update_by_query.assert_not_called()
+
+
+def test_reindex_document_ignores_generated_create_time(elasticsearch_core_instance):
+    """Test a retried version whose create_time defaulted to the indexing time leaves unchanged chunks alone."""
+    elasticsearch_core_instance.client = MagicMock()
+    indexed_hits = [{"_id": "es-1", "_source": {
+        "id": "old", "content": "page one", "path_or_url": "/doc", "file_size": 10,
+        "create_time": "2025-01-15T10:30:00"}}]
+
+    with patch.object(elasticsearch_core_instance, "_iter_chunk_hits", return_value=iter(indexed_hits)), \
+            patch.object(elasticsearch_core_instance, "vectorize_documents", return_value=0):
+        result = elasticsearch_core_instance.reindex_document(
+            "idx", MagicMock(), "/doc", [{"content": "page one", "path_or_url": "/doc", "file_size": 10}])
+
+    assert result == {"indexed": 0, "deleted": 0, "unchanged": 1}
+    elasticsearch_core_instance.client.update_by_query.assert_not_called()
+    elasticsearch_core_instance.client.indices.get_mapping.assert_not_called()
+
+
+def test_reindex_document_keeps_old_version_on_failed_embedding(elasticsearch_core_instance):
+    """Test nothing is deleted when not all new chunks could be indexed."""
+    elasticsearch_core_instance.client = MagicMock()
+    indexed_hits = [{"_id": "es-1", "_source": {"id": "old-1", "content": "old", "path_or_url": "/doc"}}]
+
+    with patch.object(elasticsearch_core_instance, "_iter_chunk_hits", return_value=iter(indexed_hits)), \
+            patch.object(elasticsearch_core_instance, "vectorize_documents", return_value=0):
+        result = elasticsearch_core_instance.reindex_document(
+            "idx", MagicMock(), "/doc", [{"content": "new", "path_or_url": "/doc"}])
+
+    assert result == {"indexed": 0, "deleted": 0, "unchanged": 0}
+    elasticsearch_core_instance.client.delete_by_query.assert_not_called()
+
+
 def test_create_chunk_success(elasticsearch_core_instance):
     """Test creating a single chunk document."""
     elasticsearch_core_instance.client = MagicMock()
@@ -621,7 +1126,7 @@ def test_delete_chunk_success(elasticsearch_core_instance):
         elasticsearch_core_instance,
         "_resolve_chunk_document_id",
         return_value="es-id-1",
-    ):
+    ), patch.object(elasticsearch_core_instance, "_sync_document_summaries"):
         elasticsearch_core_instance.client.delete.return_value = {
             "result": "deleted"
         }
@@ -775,22 +1280,18 @@ def test_resolve_chunk_document_id_not_found(elasticsearch_core_instance):
 
 
 def test_get_index_chunks_success(elasticsearch_core_instance):
-    """Test fetching chunks via scroll API."""
+    """Test fetching all chunks through a point in time."""
     elasticsearch_core_instance.client = MagicMock()
     elasticsearch_core_instance.client.count.return_value = {"count": 2}
+    elasticsearch_core_instance.client.open_point_in_time.return_value = {"id": "pit-1"}
     elasticsearch_core_instance.client.search.return_value = {
-        "_scroll_id": "scroll123",
         "hits": {
             "hits": [
-                {"_id": "doc-1", "_source": {"id": "chunk-1", "content": "A"}},
-                {"_id": "doc-2", "_source": {"content": "B"}}
+                {"_id": "doc-1", "_source": {"id": "chunk-1", "content": "A"}, "sort": ["chunk-1"]},
+                {"_id": "doc-2", "_source": {"content": "B"}, "sort": ["doc-2"]}
             ]
         }
     }
-    elasticsearch_core_instance.client.scroll.return_value = {
-        "_scroll_id": "scroll123",
-        "hits": {"hits": []}
-    }
 
     result = elasticsearch_core_instance.get_index_chunks("kb-index")
 
@@ -799,9 +1300,84 @@ def test_get_index_chunks_success(elasticsearch_core_instance):
         {"content": "B", "id": "doc-2"}
     ]
     assert result["total"] == 2
+    assert result["next_cursor"] is None
+    elasticsearch_core_instance.client.open_point_in_time.assert_called_once_with(
+        index="kb-index", keep_alive="2m")
     elasticsearch_core_instance.client.search.assert_called_once()
-    elasticsearch_core_instance.client.scroll.assert_called_once_with(scroll_id="scroll123", scroll="2m")
-    elasticsearch_core_instance.client.clear_scroll.assert_called_once_with(scroll_id="scroll123")
+    elasticsearch_core_instance.client.scroll.assert_not_called()
+    elasticsearch_core_instance.client.close_point_in_time.assert_called_once_with(body={"id": "pit-1"})
+
+
+def test_iter_index_chunks_pages_with_search_after(elasticsearch_core_instance):
+    """Test batches are chained with search_after and the latest PIT id."""
+    elasticsearch_core_instance.client = MagicMock()
+    elasticsearch_core_instance.client.open_point_in_time.return_value = {"id": "pit-1"}
+    elasticsearch_core_instance.client.search.side_effect = [
+        {
+            "pit_id": "pit-2",
+            "hits": {
+                "hits": [
+                    {"_id": "doc-1", "_source": {"id": "chunk-1"}, "sort": ["chunk-1"]},
+                    {"_id": "doc-2", "_source": {"id": "chunk-2"}, "sort": ["chunk-2"]},
+                ]
+            }
+        },
+        {"pit_id": "pit-2", "hits": {"hits": [{"_id": "doc-3", "_source": {"id": "chunk-3"}, "sort": ["chunk-3"]}]}},
+    ]
+
+    chunks = list(elasticsearch_core_instance.iter_index_chunks("kb-index", batch_size=2))
+
+    assert [chunk["id"] for chunk in chunks] == ["chunk-1", "chunk-2", "chunk-3"]
+    first_call, second_call = elasticsearch_core_instance.client.search.call_args_list
+    assert first_call.kwargs["size"] == 2
+    assert first_call.kwargs["body"]["pit"] == {"id": "pit-1", "keep_alive": "2m"}
+    assert "search_after" not in first_call.kwargs["body"]
+    assert second_call.kwargs["body"]["pit"]["id"] == "pit-2"
+    assert second_call.kwargs["body"]["search_after"] == ["chunk-2"]
+    elasticsearch_core_instance.client.close_point_in_time.assert_called_once_with(body={"id": "pit-2"})
+
+
+def test_iter_index_chunks_closes_pit_when_stopped_early(elasticsearch_core_instance):
+    """Test the point in time is released when the consumer stops iterating."""
+    elasticsearch_core_instance.client = MagicMock()
+    elasticsearch_core_instance.client.open_point_in_time.return_value = {"id": "pit-1"}
+    elasticsearch_core_instance.client.search.return_value = {
+        "hits": {
+            "hits": [
+                {"_id": "doc-1", "_source": {"id": "a"}, "sort": ["a"]},
+                {"_id": "doc-2", "_source": {"id": "b"}, "sort": ["b"]},
+            ]
+        }
+    }
+
+    iterator = elasticsearch_core_instance.iter_index_chunks("kb-index", batch_size=2)
+    assert next(iterator) == {"id": "a"}
+    iterator.close()
+
+    elasticsearch_core_instance.client.close_point_in_time.assert_called_once_with(body={"id": "pit-1"})
+
+
+def test_iter_index_chunks_resumes_from_cursor(elasticsearch_core_instance):
+    """Test a cursor restricts the stream to chunks after the encoded id."""
+    elasticsearch_core_instance.client = MagicMock()
+    elasticsearch_core_instance.client.open_point_in_time.return_value = {"id": "pit-1"}
+    elasticsearch_core_instance.client.search.return_value = {"hits": {"hits": []}}
+    cursor = ElasticSearchCore.chunk_cursor([{"_id": "doc-9", "_source": {"id": "chunk-9"}}])
+
+    chunks = list(elasticsearch_core_instance.iter_index_chunks(
+        "kb-index", path_or_url="/a.pdf", cursor=cursor))
+
+    assert chunks == []
+    body = elasticsearch_core_instance.client.search.call_args.kwargs["body"]
+    assert body["sort"] == [{"id": {"order": "asc", "missing": "_last"}}, {"_shard_doc": {"order": "asc"}}]
+    assert body["query"] == {"bool": {"filter": [
+        {"term": {"path_or_url": "/a.pdf"}},
+        {"bool": {"should": [
+            {"range": {"id": {"gt": "chunk-9"}}},
+            {"bool": {"filter": [{"term": {"id": "chunk-9"}}], "must_not": [{"ids": {"values": ["doc-9"]}}]}},
+            {"bool": {"must_not": [{"exists": {"field": "id"}}]}},
+        ], "minimum_should_match": 1}},
+    ]}}
 
 
 def test_get_index_chunks_paginated(elasticsearch_core_instance):
@@ -823,8 +1399,62 @@ def test_get_index_chunks_paginated(elasticsearch_core_instance):
     assert result["page"] == 2
     assert result["page_size"] == 1
     assert result["total"] == 5
-    elasticsearch_core_instance.client.scroll.assert_not_called()
-    elasticsearch_core_instance.client.clear_scroll.assert_not_called()
+    # A chunk without a stored "id" sorts last, so its cursor resumes within that tail
+    assert decode_cursor(result["next_cursor"]) == {"after_id": None, "after_doc_ids": ["doc-2"]}
+    search_kwargs = elasticsearch_core_instance.client.search.call_args.kwargs
+    assert search_kwargs["from_"] == 1
+    assert search_kwargs["body"]["sort"] == [{"id": {"order": "asc", "missing": "_last"}}]
+    elasticsearch_core_instance.client.open_point_in_time.assert_not_called()
+
+
+def test_get_index_chunks_paginated_with_cursor(elasticsearch_core_instance):
+    """Test a cursor page seeks with a range filter instead of from/size."""
+    elasticsearch_core_instance.client = MagicMock()
+    elasticsearch_core_instance.client.count.return_value = {"count": 5}
+    elasticsearch_core_instance.client.search.return_value = {
+        "hits": {"hits": [{"_id": "doc-5", "_source": {"id": "chunk-5"}}]}
+    }
+    cursor = encode_cursor({"after_id": "chunk-4"})
+
+    result = elasticsearch_core_instance.get_index_chunks(
+        "kb-index", page_size=2, cursor=cursor)
+
+    assert result["chunks"] == [{"id": "chunk-5"}]
+    assert result["next_cursor"] is None
+    search_kwargs = elasticsearch_core_instance.client.search.call_args.kwargs
+    assert "from_" not in search_kwargs
+    assert search_kwargs["size"] == 2
+    assert search_kwargs["body"]["query"] == {
+        "bool": {"filter": [{"range": {"id": {"gt": "chunk-4"}}}]}}
+
+
+def test_get_index_chunks_cursor_keeps_tied_ids(elasticsearch_core_instance):
+    """Test chunks sharing an id across pages are skipped by _id, not dropped by the range seek."""
+    elasticsearch_core_instance.client = MagicMock()
+    elasticsearch_core_instance.client.count.return_value = {"count": 5}
+    elasticsearch_core_instance.client.search.return_value = {"hits": {"hits": [
+        {"_id": "doc-2", "_source": {"id": "dup"}},
+        {"_id": "doc-3", "_source": {"id": "dup"}},
+    ]}}
+    cursor = encode_cursor({"after_id": "dup", "after_doc_ids": ["doc-1"]})
+
+    result = elasticsearch_core_instance.get_index_chunks("kb-index", page_size=2, cursor=cursor)
+
+    assert decode_cursor(result["next_cursor"]) == {"after_id": "dup", "after_doc_ids": ["doc-1", "doc-2", "doc-3"]}
+    seek = elasticsearch_core_instance.client.search.call_args.kwargs["body"]["query"]["bool"]["filter"][0]
+    assert {"bool": {"filter": [{"term": {"id": "dup"}}], "must_not": [{"ids": {"values": ["doc-1"]}}]}} \
+        in seek["bool"]["should"]
+
+
+def test_get_index_chunks_invalid_cursor(elasticsearch_core_instance):
+    """Test a malformed cursor is rejected before querying."""
+    elasticsearch_core_instance.client = MagicMock()
+
+    with pytest.raises(ValueError):
+        elasticsearch_core_instance.get_index_chunks(
+            "kb-index", page_size=2, cursor="not-a-cursor")
+
+    elasticsearch_core_instance.client.search.assert_not_called()
 
 
 def test_get_index_chunks_not_found(elasticsearch_core_instance):
@@ -836,33 +1466,29 @@ def test_get_index_chunks_not_found(elasticsearch_core_instance):
     chunks = elasticsearch_core_instance.get_index_chunks("missing-index")
 
     assert chunks == {"chunks": [], "total": 0,
-                      "page": None, "page_size": None}
-    elasticsearch_core_instance.client.clear_scroll.assert_not_called()
+                      "page": None, "page_size": None, "next_cursor": None}
+    elasticsearch_core_instance.client.open_point_in_time.assert_not_called()
 
 
 def test_get_index_chunks_cleanup_failure(elasticsearch_core_instance):
-    """Test cleanup warning path when clear_scroll raises."""
+    """Test cleanup warning path when close_point_in_time raises."""
     elasticsearch_core_instance.client = MagicMock()
     elasticsearch_core_instance.client.count.return_value = {"count": 1}
+    elasticsearch_core_instance.client.open_point_in_time.return_value = {"id": "pit-1"}
     elasticsearch_core_instance.client.search.return_value = {
-        "_scroll_id": "scroll123",
         "hits": {
             "hits": [
-                {"_id": "doc-1", "_source": {"content": "A"}}
+                {"_id": "doc-1", "_source": {"content": "A"}, "sort": ["doc-1"]}
             ]
         }
     }
-    elasticsearch_core_instance.client.scroll.return_value = {
-        "_scroll_id": "scroll123",
-        "hits": {"hits": []}
-    }
-    elasticsearch_core_instance.client.clear_scroll.side_effect = Exception("cleanup error")
+    elasticsearch_core_instance.client.close_point_in_time.side_effect = Exception("cleanup error")
 
     chunks = elasticsearch_core_instance.get_index_chunks("kb-index")
 
     assert len(chunks["chunks"]) == 1
     assert chunks["chunks"][0]["id"] == "doc-1"
-    elasticsearch_core_instance.client.clear_scroll.assert_called_once_with(scroll_id="scroll123")
+    elasticsearch_core_instance.client.close_point_in_time.assert_called_once_with(body={"id": "pit-1"})
 
 
 # ----------------------------------------------------------------------------
@@ -979,33 +1605,48 @@ def test_semantic_search_sets_knn_parameters(elasticsearch_core_instance):
         assert search_query["_source"]["excludes"] == ["embedding"]
 
 
-def test_hybrid_search_success(elasticsearch_core_instance):
-    """Test hybrid search combining accurate and semantic results."""
+def test_semantic_search_uses_query_embedding_cache(elasticsearch_core_instance):
+    """A repeated query is embedded once when a query embedding cache is configured."""
     mock_embedding_model = MagicMock()
+    mock_embedding_model.model = "test-model"
+    mock_embedding_model.embedding_dim = 8
+    mock_embedding_model.get_embeddings.return_value = [[0.2] * 8]
+    elasticsearch_core_instance.query_embedding_cache = QueryEmbeddingCache()
 
-    with patch.object(elasticsearch_core_instance, 'accurate_search') as mock_accurate, \
-            patch.object(elasticsearch_core_instance, 'semantic_search') as mock_semantic:
+    with patch.object(elasticsearch_core_instance, 'exec_query') as mock_exec:
+        mock_exec.return_value = []
+        elasticsearch_core_instance.semantic_search(["index_x"], "query terms", mock_embedding_model)
+        elasticsearch_core_instance.semantic_search(["index_x"], "query terms", mock_embedding_model)
 
-        mock_accurate.return_value = [
-            {
-                "score": 10.0,
-                "document": {"id": "doc1", "content": "Test doc 1"},
-                "index": "test_index"
-            }
-        ]
+    mock_embedding_model.get_embeddings.assert_called_once_with("query terms")
+    assert mock_exec.call_count == 2
+    assert elasticsearch_core_instance.query_embedding_cache.stats()["hits"] == 1
 
-        mock_semantic.return_value = [
-            {
-                "score": 0.9,
-                "document": {"id": "doc1", "content": "Test doc 1"},
-                "index": "test_index"
-            },
-            {
-                "score": 0.8,
-                "document": {"id": "doc2", "content": "Test doc 2"},
-                "index": "test_index"
-            }
-        ]
+
+def _search_response(hits):
+    """Build an ES search response from (doc_id, score) pairs."""
+    return {
+        "hits": {
+            "hits": [
+                {"_score": score, "_index": "test_index", "_source": {"id": doc_id, "content": f"Test {doc_id}"}}
+                for doc_id, score in hits
+            ]
+        }
+    }
+
+
+def test_hybrid_search_success(elasticsearch_core_instance):
+    """Test hybrid search combining accurate and semantic results from one msearch request."""
+    mock_embedding_model = MagicMock()
+    mock_embedding_model.get_embeddings.return_value = [[0.1] * 8]
+
+    with patch.object(elasticsearch_core_instance.client, 'msearch') as mock_msearch, \
+            patch('sdk.nexent.vector_database.elasticsearch_core.calculate_term_weights') as mock_weights:
+        mock_weights.return_value = {"test": 1.0}
+        mock_msearch.return_value = {"responses": [
+            _search_response([("doc1", 10.0)]),
+            _search_response([("doc1", 0.9), ("doc2", 0.8)]),
+        ]}
 
         result = elasticsearch_core_instance.hybrid_search(
             ["test_index"],
@@ -1016,43 +1657,104 @@ def test_hybrid_search_success(elasticsearch_core_instance):
         )
 
         assert len(result) == 2
-        assert all("score" in r for r in result)
-        assert all("document" in r for r in result)
-        mock_accurate.assert_called_once()
-        mock_semantic.assert_called_once()
+        assert [r["document"]["id"] for r in result] == ["doc1", "doc2"]
+        assert result[0]["score"] == pytest.approx(1.0)
+        assert result[1]["score"] == pytest.approx(0.7 * 0.8 / 0.9)
+        mock_msearch.assert_called_once()
+        mock_embedding_model.get_embeddings.assert_called_once_with("test query")
+
+
+def test_hybrid_search_builds_single_msearch(elasticsearch_core_instance):
+    """Both legs are sent in one msearch with candidate depth independent of top_k."""
+    mock_embedding_model = MagicMock()
+    mock_embedding_model.get_embeddings.return_value = [[0.1] * 8]
+
+    with patch.object(elasticsearch_core_instance.client, 'msearch') as mock_msearch:
+        mock_msearch.return_value = {"responses": [_search_response([]), _search_response([])]}
+
+        elasticsearch_core_instance.hybrid_search(
+            ["index_a", "index_b"], "query", mock_embedding_model, top_k=3, num_candidates=500)
+
+        kwargs = mock_msearch.call_args.kwargs
+        assert kwargs["index"] == "index_a,index_b"
+        body = kwargs["body"]
+        assert len(body) == 4
+        assert body[1]["size"] == 6
+        assert "query" in body[1]
+        assert body[3]["knn"]["k"] == 6
+        assert body[3]["knn"]["num_candidates"] == 500
+
+
+def test_hybrid_search_rrf_fusion(elasticsearch_core_instance):
+    """Reciprocal rank fusion ranks documents by weighted 1 / (60 + rank)."""
+    mock_embedding_model = MagicMock()
+    mock_embedding_model.get_embeddings.return_value = [[0.1] * 8]
+
+    with patch.object(elasticsearch_core_instance.client, 'msearch') as mock_msearch:
+        mock_msearch.return_value = {"responses": [
+            _search_response([("doc1", 50.0), ("doc2", 1.0)]),
+            _search_response([("doc2", 0.9), ("doc3", 0.8)]),
+        ]}
+
+        result = elasticsearch_core_instance.hybrid_search(
+            ["test_index"], "query", mock_embedding_model, top_k=2, weight_accurate=0.5, fusion="rrf")
+
+        assert [r["document"]["id"] for r in result] == ["doc2", "doc1"]
+        assert result[0]["score"] == pytest.approx(0.5 / 62 + 0.5 / 61)
+        assert result[0]["scores"] == {"accurate": pytest.approx(0.5 / 62), "semantic": pytest.approx(0.5 / 61)}
+
+
+def test_hybrid_search_failed_leg_uses_other_leg(elasticsearch_core_instance):
+    """A failed msearch leg is skipped instead of failing the whole search."""
+    mock_embedding_model = MagicMock()
+    mock_embedding_model.get_embeddings.return_value = [[0.1] * 8]
+
+    with patch.object(elasticsearch_core_instance.client, 'msearch') as mock_msearch:
+        mock_msearch.return_value = {"responses": [
+            {"error": {"type": "search_phase_execution_exception"}},
+            _search_response([("doc1", 0.9)]),
+        ]}
+
+        result = elasticsearch_core_instance.hybrid_search(
+            ["test_index"], "query", mock_embedding_model)
+
+        assert [r["document"]["id"] for r in result] == ["doc1"]
+
+
+def test_hybrid_search_invalid_fusion(elasticsearch_core_instance):
+    """Unknown fusion modes are rejected before any request is sent."""
+    with patch.object(elasticsearch_core_instance.client, 'msearch') as mock_msearch:
+        with pytest.raises(ValueError):
+            elasticsearch_core_instance.hybrid_search(
+                ["test_index"], "query", MagicMock(), fusion="unknown")
+        mock_msearch.assert_not_called()
 
 
 # ----------------------------------------------------------------------------
 # Tests for statistics and monitoring
 # ----------------------------------------------------------------------------
 
+def _catalog_hit(path_or_url, chunk_count, create_time="2025-01-15T10:30:00"):
+    return {
+        "_source": {
+            "record_type": "document",
+            "index_name": "test_index",
+            "path_or_url": path_or_url,
+            "filename": path_or_url.rsplit("/", 1)[-1],
+            "file_size": 1024,
+            "create_time": create_time,
+            "chunk_count": chunk_count,
+        },
+        "sort": [create_time, path_or_url],
+    }
+
+
 def test_get_documents_detail_success(elasticsearch_core_instance):
-    """Test getting file list with details."""
-    with patch.object(elasticsearch_core_instance.client, 'search') as mock_search:
+    """Test getting file list with details from the document catalog."""
+    with patch.object(elasticsearch_core_instance.client, 'exists', return_value=True), \
+            patch.object(elasticsearch_core_instance.client, 'search') as mock_search:
         mock_search.return_value = {
-            "aggregations": {
-                "unique_sources": {
-                    "buckets": [
-                        {
-                            "doc_count": 3,
-                            "file_sample": {
-                                "hits": {
-                                    "hits": [
-                                        {
-                                            "_source": {
-                                                "path_or_url": "/path/to/file1.pdf",
-                                                "filename": "file1.pdf",
-                                                "file_size": 1024,
-                                                "create_time": "2025-01-15T10:30:00"
-                                            }
-                                        }
-                                    ]
-                                }
-                            }
-                        }
-                    ]
-                }
-            }
+            "hits": {"total": {"value": 1}, "hits": [_catalog_hit("/path/to/file1.pdf", 3)]}
         }
 
         result = elasticsearch_core_instance.get_documents_detail(
@@ -1064,44 +1766,172 @@ def test_get_documents_detail_success(elasticsearch_core_instance):
         assert result[0]["file_size"] == 1024
         assert result[0]["chunk_count"] == 3
         mock_search.assert_called_once()
+        assert mock_search.call_args.kwargs["index"] == "nexent_document_catalog"
 
 
-def test_get_indices_detail_success(elasticsearch_core_instance):
-    """Test getting index statistics."""
-    with patch.object(elasticsearch_core_instance.client.indices, 'stats') as mock_stats, \
-            patch.object(elasticsearch_core_instance.client.indices, 'get_settings') as mock_settings, \
-            patch.object(elasticsearch_core_instance.client, 'search') as mock_search:
+def test_list_documents_paginates_with_cursor(elasticsearch_core_instance):
+    """Test catalog pages are chained with search_after through next_cursor."""
+    elasticsearch_core_instance.client = MagicMock()
+    elasticsearch_core_instance.client.exists.return_value = True
+    elasticsearch_core_instance.client.search.side_effect = [
+        {"hits": {"total": {"value": 3}, "hits": [_catalog_hit("/a.pdf", 1), _catalog_hit("/b.pdf", 2)]}},
+        {"hits": {"total": {"value": 3}, "hits": [_catalog_hit("/c.pdf", 4)]}},
+    ]
 
-        mock_stats.return_value = {
-            "indices": {
-                "test_index": {
-                    "primaries": {
-                        "docs": {"count": 100},
-                        "store": {"size_in_bytes": 1024000},
-                        "search": {"query_total": 50},
-                        "request_cache": {"hit_count": 25}
-                    }
-                }
-            }
-        }
+    first = elasticsearch_core_instance.list_documents(
+        "test_index", page_size=2, sort_by="chunk_count", sort_order="asc")
+    second = elasticsearch_core_instance.list_documents(
+        "test_index", page_size=2, cursor=first["next_cursor"], sort_by="chunk_count", sort_order="asc")
+
+    assert [doc["path_or_url"] for doc in first["documents"]] == ["/a.pdf", "/b.pdf"]
+    assert first["total"] == 3
+    assert [doc["path_or_url"] for doc in second["documents"]] == ["/c.pdf"]
+    assert second["next_cursor"] is None
+    first_body, second_body = [call.kwargs["body"] for call in elasticsearch_core_instance.client.search.call_args_list]
+    assert first_body["sort"] == [
+        {"chunk_count": {"order": "asc", "missing": "_last"}},
+        {"path_or_url": {"order": "asc"}},
+    ]
+    assert "search_after" not in first_body
+    assert second_body["search_after"] == ["2025-01-15T10:30:00", "/b.pdf"]
+    # The backfill marker is only checked for the first page
+    elasticsearch_core_instance.client.exists.assert_called_once()
 
-        mock_settings.return_value = {
-            "test_index": {
-                "settings": {
-                    "index": {
-                        "creation_date": "1642234567000"
-                    }
-                }
+
+def test_list_documents_rejects_invalid_sort(elasticsearch_core_instance):
+    """Test unsupported sort options and mismatched cursors are rejected."""
+    elasticsearch_core_instance.client = MagicMock()
+    cursor = encode_cursor({"search_after": [1, "/a.pdf"], "sort_by": "file_size", "sort_order": "desc"})
+
+    with pytest.raises(ValueError):
+        elasticsearch_core_instance.list_documents("test_index", sort_by="content")
+    with pytest.raises(ValueError):
+        elasticsearch_core_instance.list_documents("test_index", sort_order="up")
+    with pytest.raises(ValueError):
+        elasticsearch_core_instance.list_documents("test_index", cursor=cursor)
+    elasticsearch_core_instance.client.search.assert_not_called()
+
+
+def test_list_documents_backfills_uncataloged_index(elasticsearch_core_instance):
+    """Test the first listing of an index without catalog marker rebuilds it with a composite aggregation."""
+    elasticsearch_core_instance.client = MagicMock()
+    elasticsearch_core_instance.client.exists.return_value = False
+    elasticsearch_core_instance.client.indices.exists.return_value = True
+    composite_response = {
+        "aggregations": {
+            "documents": {
+                "after_key": {"path_or_url": "/a.pdf"},
+                "buckets": [{
+                    "key": {"path_or_url": "/a.pdf"},
+                    "doc_count": 7,
+                    "file_sample": {"hits": {"hits": [
+                        {"_source": {"filename": "a.pdf", "file_size": 10, "create_time": "2025-01-15T10:30:00"}}
+                    ]}},
+                }],
             }
         }
+    }
+    elasticsearch_core_instance.client.search.side_effect = [
+        composite_response,
+        {"hits": {"total": {"value": 1}, "hits": [_catalog_hit("/a.pdf", 7)]}},
+    ]
+    elasticsearch_core_instance.client.bulk.return_value = {"errors": False}
 
-        mock_search.return_value = {
-            "aggregations": {
-                "unique_path_or_url_count": {"value": 10},
-                "process_sources": {"buckets": [{"key": "Unstructured"}]},
-                "embedding_models": {"buckets": [{"key": "test-model"}]}
-            }
+    result = elasticsearch_core_instance.list_documents("test_index")
+
+    assert result["documents"][0]["chunk_count"] == 7
+    composite_body = elasticsearch_core_instance.client.search.call_args_list[0].kwargs["body"]
+    assert "composite" in composite_body["aggs"]["documents"]
+    operations = elasticsearch_core_instance.client.bulk.call_args.kwargs["operations"]
+    assert operations[0]["index"]["_index"] == "nexent_document_catalog"
+    assert operations[1]["chunk_count"] == 7
+    assert operations[1]["path_or_url"] == "/a.pdf"
+    elasticsearch_core_instance.client.delete_by_query.assert_called_once()
+    marker = elasticsearch_core_instance.client.index.call_args.kwargs["document"]
+    assert marker == {"record_type": "catalog_marker", "index_name": "test_index"}
+
+
+def test_vectorize_documents_updates_document_catalog(elasticsearch_core_instance):
+    """Test ingestion recounts the catalog records of the ingested files."""
+    elasticsearch_core_instance.client = MagicMock()
+    elasticsearch_core_instance.client.indices.exists.return_value = True
+    elasticsearch_core_instance.client.search.return_value = {
+        "aggregations": {"documents": {"buckets": [{
+            "key": {"path_or_url": "/a.pdf"},
+            "doc_count": 2,
+            "file_sample": {"hits": {"hits": [{"_source": {"filename": "a.pdf"}}]}},
+        }]}}
+    }
+    elasticsearch_core_instance.client.bulk.return_value = {"errors": False}
+    documents = [{"content": "A", "path_or_url": "/a.pdf"}, {"content": "B", "path_or_url": "/a.pdf"}]
+
+    with patch.object(elasticsearch_core_instance, '_small_batch_insert', return_value=2):
+        result = elasticsearch_core_instance.vectorize_documents(
+            "test_index", MagicMock(), documents)
+
+    assert result == 2
+    query = elasticsearch_core_instance.client.search.call_args.kwargs["body"]["query"]
+    assert query == {"terms": {"path_or_url": ["/a.pdf"]}}
+    operations = elasticsearch_core_instance.client.bulk.call_args.kwargs["operations"]
+    assert operations[1]["chunk_count"] == 2
+    assert len(operations) == 2
+    elasticsearch_core_instance.client.delete.assert_not_called()
+
+
+def test_sync_document_summaries_failure_drops_catalog_marker(elasticsearch_core_instance):
+    """Test a failed catalog update drops the marker, so the next listing rebuilds the catalog."""
+    elasticsearch_core_instance.client = MagicMock()
+    elasticsearch_core_instance.client.indices.exists.return_value = True
+    elasticsearch_core_instance.client.search.return_value = {
+        "aggregations": {"documents": {"buckets": []}}}
+    elasticsearch_core_instance.client.bulk.return_value = {"errors": True}
+
+    elasticsearch_core_instance._sync_document_summaries("test_index", ["/a.pdf"])
+
+    delete_kwargs = elasticsearch_core_instance.client.delete.call_args.kwargs
+    assert delete_kwargs["index"] == "nexent_document_catalog"
+    assert delete_kwargs["id"] == ElasticSearchCore._document_summary_id("test_index", "")
+
+
+def test_delete_documents_removes_catalog_record(elasticsearch_core_instance):
+    """Test deleting a file also drops its catalog record."""
+    elasticsearch_core_instance.client = MagicMock()
+    elasticsearch_core_instance.client.delete_by_query.return_value = {"deleted": 2}
+
+    assert elasticsearch_core_instance.delete_documents("test_index", "/a.pdf") == 2
+
+    delete_kwargs = elasticsearch_core_instance.client.delete.call_args.kwargs
+    assert delete_kwargs["index"] == "nexent_document_catalog"
+    assert delete_kwargs["id"] == ElasticSearchCore._document_summary_id("test_index", "/a.pdf")
+
+
+def _index_stats_responses(index_names):
+    """Build stats, settings and msearch responses for a batched get_indices_detail call."""
+    stats = {"indices": {
+        name: {"primaries": {
+            "docs": {"count": 100},
+            "store": {"size_in_bytes": 1024000},
+            "search": {"query_total": 50},
+            "request_cache": {"hit_count": 25}
+        }} for name in index_names
+    }}
+    settings = {name: {"settings": {"index": {"creation_date": "1642234567000"}}} for name in index_names}
+    msearch = {"responses": [{
+        "aggregations": {
+            "unique_path_or_url_count": {"value": 10},
+            "process_sources": {"buckets": [{"key": "Unstructured"}]},
+            "embedding_models": {"buckets": [{"key": "test-model"}]}
         }
+    } for _ in index_names]}
+    return stats, settings, msearch
+
+
+def test_get_indices_detail_success(elasticsearch_core_instance):
+    """Test getting index statistics."""
+    stats, settings, msearch = _index_stats_responses(["test_index"])
+    with patch.object(elasticsearch_core_instance.client.indices, 'stats', return_value=stats) as mock_stats, \
+            patch.object(elasticsearch_core_instance.client.indices, 'get_settings', return_value=settings) as mock_settings, \
+            patch.object(elasticsearch_core_instance.client, 'msearch', return_value=msearch) as mock_msearch:
 
         result = elasticsearch_core_instance.get_indices_detail(
             ["test_index"], embedding_dim=1024)
@@ -1111,7 +1941,60 @@ def test_get_indices_detail_success(elasticsearch_core_instance):
         assert result["test_index"]["base_info"]["chunk_count"] == 100
         mock_stats.assert_called_once()
         mock_settings.assert_called_once()
-        mock_search.assert_called_once()
+        mock_msearch.assert_called_once()
+
+
+def test_get_indices_detail_batches_all_indices(elasticsearch_core_instance):
+    """Many indices still cost one stats call, one settings call and one msearch."""
+    index_names = ["kb_a", "kb_b", "kb_c"]
+    stats, settings, msearch = _index_stats_responses(index_names)
+    msearch["responses"][1] = {"error": {"type": "index_not_found_exception"}}
+    with patch.object(elasticsearch_core_instance.client.indices, 'stats', return_value=stats) as mock_stats, \
+            patch.object(elasticsearch_core_instance.client.indices, 'get_settings', return_value=settings) as mock_settings, \
+            patch.object(elasticsearch_core_instance.client, 'msearch', return_value=msearch) as mock_msearch:
+
+        result = elasticsearch_core_instance.get_indices_detail(index_names)
+
+        assert mock_stats.call_args.kwargs["index"] == "kb_a,kb_b,kb_c"
+        assert mock_settings.call_args.kwargs["index"] == "kb_a,kb_b,kb_c"
+        body = mock_msearch.call_args.kwargs["body"]
+        assert [header["index"] for header in body[::2]] == index_names
+        assert "base_info" in result["kb_a"]
+        assert "error" in result["kb_b"]
+        assert "base_info" in result["kb_c"]
+
+
+def test_get_indices_detail_resolves_aliases(elasticsearch_core_instance):
+    """Stats of a rebuilt knowledge base come back under its generation index and are reported by alias."""
+    stats, settings, msearch = _index_stats_responses(["kb__gen1"])
+    with patch.object(elasticsearch_core_instance.client.indices, 'stats', return_value=stats), \
+            patch.object(elasticsearch_core_instance.client.indices, 'get_settings', return_value=settings), \
+            patch.object(elasticsearch_core_instance.client.indices, 'get_alias',
+                         return_value={"kb__gen1": {"aliases": {"kb": {}}}}), \
+            patch.object(elasticsearch_core_instance.client, 'msearch', return_value=msearch):
+
+        result = elasticsearch_core_instance.get_indices_detail(["kb"])
+
+    assert result["kb"]["base_info"]["chunk_count"] == 100
+
+
+def test_get_indices_detail_uses_and_invalidates_cache(elasticsearch_core_instance):
+    """Cached stats are served without ES calls until a write to the index invalidates them."""
+    elasticsearch_core_instance.index_stats_cache = IndexStatsCache(ttl_seconds=60)
+    stats, settings, msearch = _index_stats_responses(["test_index"])
+    with patch.object(elasticsearch_core_instance.client.indices, 'stats', return_value=stats) as mock_stats, \
+            patch.object(elasticsearch_core_instance.client.indices, 'get_settings', return_value=settings), \
+            patch.object(elasticsearch_core_instance.client, 'msearch', return_value=msearch), \
+            patch.object(elasticsearch_core_instance.client, 'delete_by_query', return_value={"deleted": 1}):
+
+        first = elasticsearch_core_instance.get_indices_detail(["test_index"])
+        second = elasticsearch_core_instance.get_indices_detail(["test_index"])
+        assert first == second
+        assert mock_stats.call_count == 1
+
+        elasticsearch_core_instance.delete_documents("test_index", "/path/file.pdf")
+        elasticsearch_core_instance.get_indices_detail(["test_index"])
+        assert mock_stats.call_count == 2
 
 
 # ----------------------------------------------------------------------------
@@ -1134,8 +2017,9 @@ def test_handle_bulk_errors_with_errors(elasticsearch_core_instance):
         ]
     }
 
-    # Should not raise exception, just log errors
-    elasticsearch_core_instance._handle_bulk_errors(response)
+    # Should not raise exception, just log and return the errors
+    errors = elasticsearch_core_instance._handle_bulk_errors(response)
+    assert [error["type"] for error in errors] == ["mapper_parsing_exception"]
 
 
 def test_handle_bulk_errors_version_conflict(elasticsearch_core_instance):
@@ -1155,7 +2039,7 @@ def test_handle_bulk_errors_version_conflict(elasticsearch_core_instance):
     }
 
     # Should not raise exception or log error for version conflicts
-    elasticsearch_core_instance._handle_bulk_errors(response)
+    assert elasticsearch_core_instance._handle_bulk_errors(response) == []
 
 
 def test_bulk_operation_context(elasticsearch_core_instance):
@@ -267,29 +267,25 @@ class TestElasticSearchCoreCoverage:
         result = vdb_core.get_index_chunks("missing-index")
 
         assert result == {"chunks": [], "total": 0,
-                          "page": None, "page_size": None}
-        vdb_core.client.clear_scroll.assert_not_called()
+                          "page": None, "page_size": None, "next_cursor": None}
+        vdb_core.client.open_point_in_time.assert_not_called()
 
     def test_get_index_chunks_cleanup_warning(self, vdb_core):
-        """Ensure clear_scroll errors are swallowed."""
+        """Ensure close_point_in_time errors are swallowed."""
         vdb_core.client = MagicMock()
         vdb_core.client.count.return_value = {"count": 1}
+        vdb_core.client.open_point_in_time.return_value = {"id": "pit123"}
         vdb_core.client.search.return_value = {
-            "_scroll_id": "scroll123",
-            "hits": {"hits": [{"_id": "doc-1", "_source": {"content": "A"}}]}
+            "hits": {"hits": [{"_id": "doc-1", "_source": {"content": "A"}, "sort": ["doc-1"]}]}
         }
-        vdb_core.client.scroll.return_value = {
-            "_scroll_id": "scroll123",
-            "hits": {"hits": []}
-        }
-        vdb_core.client.clear_scroll.side_effect = Exception("cleanup-failed")
+        vdb_core.client.close_point_in_time.side_effect = Exception("cleanup-failed")
 
         result = vdb_core.get_index_chunks("kb-index")
 
         assert len(result["chunks"]) == 1
         assert result["chunks"][0]["id"] == "doc-1"
-        vdb_core.client.clear_scroll.assert_called_once_with(
-            scroll_id="scroll123")
+        vdb_core.client.close_point_in_time.assert_called_once_with(
+            body={"id": "pit123"})
 
     def test_create_index_request_error_existing(self, vdb_core):
         """Ensure RequestError with resource already exists still succeeds."""
@@ -464,50 +460,35 @@ class TestElasticSearchCoreCoverage:
     def test_hybrid_search_missing_fields_logged_for_accurate(self, vdb_core):
         """Ensure hybrid_search tolerates missing accurate fields."""
         mock_embedding_model = MagicMock()
-        with patch.object(vdb_core, "accurate_search", return_value=[{"score": 1.0}]), \
-                patch.object(vdb_core, "semantic_search", return_value=[]):
-            assert vdb_core.hybrid_search(["idx"], "query", mock_embedding_model) == []
+        mock_embedding_model.get_embeddings.return_value = [[0.1]]
+        vdb_core.client = MagicMock()
+        vdb_core.client.msearch.return_value = {"responses": [
+            {"hits": {"hits": [{"_score": 1.0, "_index": "idx", "_source": {}}]}},
+            {"hits": {"hits": []}},
+        ]}
+        assert vdb_core.hybrid_search(["idx"], "query", mock_embedding_model) == []
 
     def test_hybrid_search_missing_fields_logged_for_semantic(self, vdb_core):
         """Ensure hybrid_search tolerates missing semantic fields."""
         mock_embedding_model = MagicMock()
-        with patch.object(vdb_core, "accurate_search", return_value=[]), \
-                patch.object(vdb_core, "semantic_search", return_value=[{"score": 0.5}]):
-            assert vdb_core.hybrid_search(["idx"], "query", mock_embedding_model) == []
+        mock_embedding_model.get_embeddings.return_value = [[0.1]]
+        vdb_core.client = MagicMock()
+        vdb_core.client.msearch.return_value = {"responses": [
+            {"hits": {"hits": []}},
+            {"hits": {"hits": [{"_score": 0.5, "_index": "idx", "_source": {}}]}},
+        ]}
+        assert vdb_core.hybrid_search(["idx"], "query", mock_embedding_model) == []
 
-    def test_hybrid_search_faulty_combined_results(self, vdb_core):
-        """Inject faulty combined result to hit KeyError handling in final loop."""
+    def test_hybrid_search_both_legs_failed(self, vdb_core):
+        """Ensure hybrid_search returns no results when both msearch legs fail."""
         mock_embedding_model = MagicMock()
-        accurate_payload = [
-            {"score": 1.0, "document": {"id": "doc1"}, "index": "idx"}
-        ]
-
-        with patch.object(vdb_core, "accurate_search", return_value=accurate_payload), \
-                patch.object(vdb_core, "semantic_search", return_value=[]):
-
-            injected = {"done": False}
-
-            def tracer(frame, event, arg):
-                if (
-                    frame.f_code.co_name == "hybrid_search"
-                    and event == "line"
-                    and frame.f_lineno == 788
-                    and not injected["done"]
-                ):
-                    frame.f_locals["combined_results"]["faulty"] = {
-                        "accurate_score": 0,
-                        "semantic_score": 0,
-                    }
-                    injected["done"] = True
-                return tracer
-
-            sys.settrace(tracer)
-            try:
-                results = vdb_core.hybrid_search(["idx"], "query", mock_embedding_model)
-            finally:
-                sys.settrace(None)
-
-            assert len(results) == 1
+        mock_embedding_model.get_embeddings.return_value = [[0.1]]
+        vdb_core.client = MagicMock()
+        vdb_core.client.msearch.return_value = {"responses": [
+            {"error": {"type": "index_not_found_exception"}},
+            {"error": {"type": "index_not_found_exception"}},
+        ]}
+        assert vdb_core.hybrid_search(["idx"], "query", mock_embedding_model, fusion="rrf") == []
 
     def test_get_documents_detail_exception(self, vdb_core):
         """Ensure get_documents_detail returns empty list on failure."""
@@ -542,13 +523,13 @@ class TestElasticSearchCoreCoverage:
                 }
             }
         }
-        vdb_core.client.search.return_value = {
+        vdb_core.client.msearch.return_value = {"responses": [{
             "aggregations": {
                 "unique_path_or_url_count": {"value": 10},
                 "process_sources": {"buckets": [{"key": "test_source"}]},
                 "embedding_models": {"buckets": [{"key": "test_model"}]}
             }
-        }
+        }]}
         
         result = vdb_core.get_indices_detail(["test_index"])
         assert "test_index" in result
@@ -591,13 +572,13 @@ class TestElasticSearchCoreCoverage:
                 }
             }
         }
-        vdb_core.client.search.return_value = {
+        vdb_core.client.msearch.return_value = {"responses": [{
             "aggregations": {
                 "unique_path_or_url_count": {"value": 10},
                 "process_sources": {"buckets": [{"key": "test_source"}]},
                 "embedding_models": {"buckets": [{"key": "test_model"}]}
             }
-        }
+        }]}
         
         result = vdb_core.get_indices_detail(["test_index"], embedding_dim=512)
         assert "test_index" in result
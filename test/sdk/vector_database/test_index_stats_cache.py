@@ -0,0 +1,30 @@
+from unittest.mock import patch
+
+from sdk.nexent.vector_database.index_stats_cache import IndexStatsCache
+
+
+def test_get_many_returns_only_cached_indices():
+    cache = IndexStatsCache(ttl_seconds=60)
+    cache.put("kb_a", {"base_info": {"doc_count": 1}})
+
+    assert cache.get_many(["kb_a", "kb_b"]) == {"kb_a": {"base_info": {"doc_count": 1}}}
+
+
+def test_entries_expire_after_ttl():
+    cache = IndexStatsCache(ttl_seconds=10)
+    with patch("sdk.nexent.vector_database.index_stats_cache.time.monotonic", side_effect=[0, 5, 11]):
+        cache.put("kb_a", {"base_info": {}})
+        assert "kb_a" in cache.get_many(["kb_a"])
+        assert cache.get_many(["kb_a"]) == {}
+
+
+def test_invalidate_single_index_and_all():
+    cache = IndexStatsCache()
+    cache.put("kb_a", {})
+    cache.put("kb_b", {})
+
+    cache.invalidate("kb_a")
+    assert set(cache.get_many(["kb_a", "kb_b"])) == {"kb_b"}
+
+    cache.invalidate()
+    assert cache.get_many(["kb_a", "kb_b"]) == {}
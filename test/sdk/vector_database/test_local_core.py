@@ -0,0 +1,332 @@
+import os
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from sdk.nexent.vector_database import local_core
+from sdk.nexent.vector_database.local_core import CHUNKS_FILE, VECTORS_FILE, LocalVectorCore
+
+
+# ----------------------------------------------------------------------------
+# Fixtures
+# ----------------------------------------------------------------------------
+
+VECTORS = {
+    "apple pie recipe": [1.0, 0.0, 0.0],
+    "banana bread recipe": [0.0, 1.0, 0.0],
+    "car engine repair": [0.0, 0.0, 1.0],
+    "apple": [0.9, 0.1, 0.0],
+}
+
+
+@pytest.fixture(autouse=True)
+def whitespace_tokenizer():
+    """Replace the jieba tokenizer with whitespace splitting to keep BM25 scores predictable."""
+    with patch.object(local_core, "tokenize", side_effect=lambda text: text.lower().split()), \
+            patch.object(local_core, "calculate_term_weights", return_value={}):
+        yield
+
+
+@pytest.fixture
+def embedding_model():
+    model = MagicMock()
+    model.embedding_model_name = "test-embedding"
+    model.get_embeddings.side_effect = lambda inputs: [
+        VECTORS[text] for text in ([inputs] if isinstance(inputs, str) else inputs)]
+    return model
+
+
+@pytest.fixture
+def core(tmp_path, embedding_model):
+    """A LocalVectorCore with one index holding three documents."""
+    vdb_core = LocalVectorCore(str(tmp_path))
+    vdb_core.create_index("kb", embedding_dim=3)
+    vdb_core.vectorize_documents("kb", embedding_model, [
+        {"id": "c1", "content": "apple pie recipe", "path_or_url": "/a", "filename": "a.txt", "file_size": 10},
+        {"id": "c2", "content": "banana bread recipe", "path_or_url": "/b", "filename": "b.txt", "file_size": 20},
+        {"id": "c3", "content": "car engine repair", "path_or_url": "/b", "filename": "b.txt", "file_size": 20},
+    ])
+    return vdb_core
+
+
+# ----------------------------------------------------------------------------
+# Index management
+# ----------------------------------------------------------------------------
+
+def test_create_index_rejects_unknown_profile(tmp_path):
+    with pytest.raises(ValueError):
+        LocalVectorCore(str(tmp_path)).create_index("kb", embedding_dim=3, index_profile="hnsw")
+
+
+def test_quantized_profile_stores_float16(tmp_path, embedding_model):
+    vdb_core = LocalVectorCore(str(tmp_path))
+    vdb_core.create_index("kb", embedding_dim=3, index_profile="int8")
+    vdb_core.vectorize_documents("kb", embedding_model, [{"id": "c1", "content": "apple pie recipe"}])
+
+    assert os.path.getsize(tmp_path / "kb" / VECTORS_FILE) == 3 * 2
+
+
+def test_user_indices_and_delete(core):
+    assert core.get_user_indices() == ["kb"]
+    assert core.check_index_exists("kb")
+    assert core.delete_index("kb") is True
+    assert core.get_user_indices() == []
+    assert core.delete_index("kb") is False
+
+
+@pytest.fixture
+def new_embedding_model():
+    """A 2-dimensional model to rebuild into."""
+    model = MagicMock()
+    model.model = "new-embedding"
+    model.embedding_dim = 2
+    model.get_embeddings.side_effect = lambda inputs: [
+        [1.0, 0.0] if "apple" in text else [0.0, 1.0] for text in ([inputs] if isinstance(inputs, str) else inputs)]
+    return model
+
+
+def test_rebuild_index_swaps_in_new_embeddings(tmp_path, core, new_embedding_model):
+    # A chunk deleted while the copy runs must not come back with the rebuilt index
+    result = core.rebuild_index("kb", new_embedding_model, batch_size=2,
+                                progress_callback=lambda copied, total: core.delete_chunk("kb", "c3"))
+
+    assert result == {"index": "kb", "copied": 0, "deleted": 1}
+    assert core.get_rebuild_status("kb")["state"] == "completed"
+    assert core.get_user_indices() == ["kb"]
+    assert not os.path.exists(tmp_path / ".rebuild-kb")
+    results = core.semantic_search(["kb"], "apple", new_embedding_model, top_k=5)
+    assert [r["document"]["id"] for r in results] == ["c1", "c2"]
+    assert results[0]["document"]["embedding_model_name"] == "new-embedding"
+    assert LocalVectorCore(str(tmp_path)).get_indices_detail(["kb"])["kb"]["base_info"]["embedding_dim"] == 2
+
+
+def test_rebuild_index_recopies_chunks_updated_during_the_copy(core, new_embedding_model):
+    def update(copied, total):
+        if copied == 3:
+            core.update_chunk("kb", "c1", {"content": "apple crumble"})
+
+    result = core.rebuild_index("kb", new_embedding_model, batch_size=3, progress_callback=update)
+
+    assert result["copied"] == 1
+    assert [c["content"] for c in core.iter_index_chunks("kb") if c["id"] == "c1"] == ["apple crumble"]
+
+
+def test_rebuild_index_resumes_after_failure(core, new_embedding_model):
+    embed = new_embedding_model.get_embeddings.side_effect
+    new_embedding_model.get_embeddings.side_effect = [embed(["apple pie recipe"]), RuntimeError("rate limited")]
+    with pytest.raises(RuntimeError):
+        core.rebuild_index("kb", new_embedding_model, batch_size=1)
+    assert core.get_rebuild_status("kb")["state"] == "failed"
+    assert core.get_rebuild_status("kb")["copied"] == 1
+
+    new_embedding_model.get_embeddings.side_effect = embed
+    core.rebuild_index("kb", new_embedding_model, batch_size=1)
+
+    # Only the two chunks after the checkpoint were embedded again
+    assert new_embedding_model.get_embeddings.call_count == 4
+    assert core.count_documents("kb") == 3
+
+
+def test_invalid_index_name(core):
+    with pytest.raises(ValueError):
+        core.check_index_exists("../escape")
+
+
+# ----------------------------------------------------------------------------
+# Search
+# ----------------------------------------------------------------------------
+
+def test_semantic_search_ranks_by_cosine(core, embedding_model):
+    results = core.semantic_search(["kb"], "apple", embedding_model, top_k=2)
+
+    assert [r["document"]["id"] for r in results] == ["c1", "c2"]
+    assert results[0]["index"] == "kb"
+    # Same (1 + cosine) / 2 scale as Elasticsearch
+    assert results[0]["score"] == pytest.approx((1 + 0.9 / np.linalg.norm([0.9, 0.1])) / 2)
+
+
+def test_accurate_search_bm25(core):
+    results = core.accurate_search(["kb"], "bread recipe", top_k=5)
+
+    assert [r["document"]["id"] for r in results] == ["c2", "c1"]
+    assert results[0]["score"] > results[1]["score"] > 0
+
+
+def test_hybrid_search_fuses_both_legs(core, embedding_model):
+    results = core.hybrid_search(["kb"], "apple", embedding_model, top_k=3, weight_accurate=0.5)
+
+    assert results[0]["document"]["id"] == "c1"
+    assert set(results[0]["scores"]) == {"accurate", "semantic"}
+
+
+def test_search_dsl_subset(core):
+    response = core.search("kb", {"query": {"bool": {"filter": [{"term": {"path_or_url": "/b"}}]}}, "size": 1})
+
+    assert response["hits"]["total"]["value"] == 2
+    assert [hit["_source"]["id"] for hit in response["hits"]["hits"]] == ["c2"]
+    with pytest.raises(ValueError):
+        core.search("kb", {"size": 0, "aggs": {}})
+
+
+# ----------------------------------------------------------------------------
+# Updates, tombstones and persistence
+# ----------------------------------------------------------------------------
+
+def test_delete_documents_tombstones_rows(core, embedding_model):
+    assert core.delete_documents("kb", "/b") == 2
+
+    assert core.count_documents("kb") == 1
+    assert [r["document"]["id"] for r in core.semantic_search(["kb"], "apple", embedding_model, top_k=3)] == ["c1"]
+    assert core.accurate_search(["kb"], "bread", top_k=3) == []
+
+
+def test_reindex_document_embeds_only_changed_chunks(core, embedding_model):
+    result = core.reindex_document("kb", embedding_model, "/b", [
+        {"content": "banana bread recipe", "path_or_url": "/b", "filename": "b.txt", "file_size": 30},
+        {"content": "apple", "path_or_url": "/b", "filename": "b.txt", "file_size": 30},
+    ])
+
+    assert result == {"indexed": 1, "deleted": 1, "unchanged": 1}
+    embedding_model.get_embeddings.assert_called_with(["apple"])
+    chunks = core.get_index_chunks("kb", path_or_url="/b")["chunks"]
+    assert sorted(chunk["content"] for chunk in chunks) == ["apple", "banana bread recipe"]
+    assert {chunk["file_size"] for chunk in chunks} == {30}
+    # The unchanged chunk kept its id and vector
+    assert core.semantic_search(["kb"], "banana bread recipe", embedding_model, 1)[0]["document"]["id"] == "c2"
+
+
+def test_reindex_document_only_matches_the_same_path(core, embedding_model):
+    # A re-upload gets a new object name, so it is a new document and the old version stays
+    result = core.reindex_document("kb", embedding_model, "/b_1", [
+        {"content": "banana bread recipe", "path_or_url": "/b_1", "filename": "b_1.txt"},
+    ])
+
+    assert result == {"indexed": 1, "deleted": 0, "unchanged": 0}
+    assert core.get_index_chunks("kb", path_or_url="/b")["total"] == 2
+
+
+def test_update_chunk_keeps_embedding(core, embedding_model):
+    core.update_chunk("kb", "c2", {"content": "apple apple apple"})
+
+    assert core.accurate_search(["kb"], "apple", top_k=1)[0]["document"]["id"] == "c2"
+    # The vector still is the banana one
+    semantic = core.semantic_search(["kb"], "apple", embedding_model, top_k=1)
+    assert semantic[0]["document"]["id"] == "c1"
+    assert core.count_documents("kb") == 3
+
+
+def test_chunk_without_embedding_is_keyword_only(core, embedding_model):
+    core.create_chunk("kb", {"id": "manual", "content": "apple notes", "path_or_url": "/m"})
+
+    assert "manual" in [r["document"]["id"] for r in core.accurate_search(["kb"], "notes", top_k=5)]
+    assert "manual" not in [r["document"]["id"] for r in core.semantic_search(["kb"], "apple", embedding_model, 5)]
+
+
+def test_delete_chunk(core):
+    assert core.delete_chunk("kb", "c1") is True
+    assert core.delete_chunk("kb", "c1") is False
+
+
+def test_reload_from_disk_and_compact(tmp_path, core, embedding_model):
+    core.delete_chunk("kb", "c3")
+
+    reloaded = LocalVectorCore(str(tmp_path))
+    assert reloaded.count_documents("kb") == 2
+    # One tombstoned row out of three exceeds the compaction ratio, so it was already dropped
+    with open(tmp_path / "kb" / CHUNKS_FILE, encoding="utf-8") as f:
+        assert len(f.readlines()) == 2
+    assert [r["document"]["id"] for r in reloaded.semantic_search(["kb"], "apple", embedding_model, 1)] == ["c1"]
+
+
+def test_chunks_sharing_an_id_are_all_kept(tmp_path, core, embedding_model):
+    core.vectorize_documents("kb", embedding_model, [
+        {"id": "c1", "content": "apple", "path_or_url": "/c"},
+        {"id": "c1", "content": "car engine repair", "path_or_url": "/c"},
+    ])
+
+    assert core.count_documents("kb") == 5
+    assert LocalVectorCore(str(tmp_path)).count_documents("kb") == 5
+    first = core.get_index_chunks("kb", page_size=2, page=1)
+    second = core.get_index_chunks("kb", page_size=2, cursor=first["next_cursor"])
+    third = core.get_index_chunks("kb", page_size=2, cursor=second["next_cursor"])
+    paged = [(c["id"], c["content"]) for page in (first, second, third) for c in page["chunks"]]
+    assert sorted(paged) == sorted((c["id"], c["content"]) for c in core.iter_index_chunks("kb"))
+    assert len(paged) == 5
+
+
+def test_writes_from_another_process_are_reloaded(tmp_path, core, embedding_model):
+    assert core.count_documents("kb") == 3
+    other = LocalVectorCore(str(tmp_path))
+
+    other.vectorize_documents("kb", embedding_model, [{"id": "c4", "content": "apple", "path_or_url": "/c"}])
+
+    assert core.count_documents("kb") == 4
+    loaded = core._indices["kb"]
+    core.delete_chunk("kb", "c4")
+    # Its own writes do not make a process reload the index
+    assert core._get_index("kb") is loaded
+    assert other.count_documents("kb") == 3
+
+
+def test_write_through_a_stale_handle_reloads_first(tmp_path, core, embedding_model):
+    stale = core._get_index("kb")
+    other = LocalVectorCore(str(tmp_path))
+    other.vectorize_documents("kb", embedding_model, [{"id": "c4", "content": "apple", "path_or_url": "/c"}])
+
+    # The handle was loaded before the other write; appending through it must not overwrite row 3
+    stale.append([{"id": "c5", "content": "apple", "path_or_url": "/d"}], np.array([[0.9, 0.1, 0.0]]))
+
+    # The process kept its own write without reloading, so its copy must include the other write as well
+    assert core._get_index("kb") is stale
+    assert sorted(c["id"] for c in core.iter_index_chunks("kb")) == ["c1", "c2", "c3", "c4", "c5"]
+    reloaded = LocalVectorCore(str(tmp_path))
+    assert sorted(c["id"] for c in reloaded.iter_index_chunks("kb")) == ["c1", "c2", "c3", "c4", "c5"]
+    assert os.path.getsize(tmp_path / "kb" / VECTORS_FILE) == 5 * 3 * 4
+
+
+def test_interrupted_append_is_truncated(tmp_path, core):
+    with open(tmp_path / "kb" / VECTORS_FILE, "ab") as f:
+        f.write(np.zeros(3, dtype=np.float32).tobytes())
+
+    reloaded = LocalVectorCore(str(tmp_path))
+
+    assert reloaded.count_documents("kb") == 3
+    assert os.path.getsize(tmp_path / "kb" / VECTORS_FILE) == 3 * 3 * 4
+
+
+# ----------------------------------------------------------------------------
+# Listings and statistics
+# ----------------------------------------------------------------------------
+
+def test_get_index_chunks_cursor_pages(core):
+    first = core.get_index_chunks("kb", page=1, page_size=2)
+    second = core.get_index_chunks("kb", page_size=2, cursor=first["next_cursor"])
+
+    assert first["total"] == 3
+    assert [c["id"] for c in first["chunks"]] == ["c1", "c2"]
+    assert [c["id"] for c in second["chunks"]] == ["c3"]
+    assert second["next_cursor"] is None
+
+
+def test_list_documents_sorted_pages(core):
+    first = core.list_documents("kb", page_size=1, sort_by="file_size", sort_order="desc")
+    second = core.list_documents("kb", page_size=1, cursor=first["next_cursor"], sort_by="file_size", sort_order="desc")
+
+    assert first["total"] == 2
+    assert first["documents"][0]["path_or_url"] == "/b"
+    assert first["documents"][0]["chunk_count"] == 2
+    assert second["documents"][0]["path_or_url"] == "/a"
+    assert second["next_cursor"] is None
+    with pytest.raises(ValueError):
+        core.list_documents("kb", cursor=first["next_cursor"], sort_by="create_time")
+
+
+def test_get_indices_detail(core):
+    detail = core.get_indices_detail(["kb", "missing"])
+
+    assert detail["kb"]["base_info"]["doc_count"] == 2
+    assert detail["kb"]["base_info"]["chunk_count"] == 3
+    assert detail["kb"]["base_info"]["embedding_model"] == "test-embedding"
+    assert detail["kb"]["base_info"]["embedding_dim"] == 3
+    assert "error" in detail["missing"]
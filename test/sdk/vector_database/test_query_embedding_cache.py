@@ -0,0 +1,82 @@
+import pytest
+from unittest.mock import MagicMock, patch
+
+from sdk.nexent.vector_database.query_embedding_cache import QueryEmbeddingCache, normalize_query
+
+
+def _embedding_model(model="fake-model", embedding_dim=2):
+    model_mock = MagicMock()
+    model_mock.model = model
+    model_mock.embedding_dim = embedding_dim
+    model_mock.get_embeddings.side_effect = lambda text: [[float(len(text)), 1.0]]
+    return model_mock
+
+
+def test_normalize_query_ignores_case_and_whitespace():
+    assert normalize_query("  What IS\n nexent ") == "what is nexent"
+
+
+def test_repeated_query_only_embeds_once():
+    cache = QueryEmbeddingCache(max_entries=10, ttl_seconds=60)
+    embedding_model = _embedding_model()
+
+    first = cache.get_embedding(embedding_model, "hello world")
+    second = cache.get_embedding(embedding_model, "Hello   World")
+
+    assert first == second
+    embedding_model.get_embeddings.assert_called_once_with("hello world")
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == pytest.approx(0.5)
+
+
+def test_cache_miss_goes_through_coalescer():
+    cache = QueryEmbeddingCache()
+    embedding_model = _embedding_model()
+    coalescer = MagicMock()
+    coalescer.embed.return_value = [0.5, 0.5]
+
+    assert cache.get_embedding(embedding_model, "hello", coalescer) == [0.5, 0.5]
+    assert cache.get_embedding(embedding_model, "hello", coalescer) == [0.5, 0.5]
+
+    coalescer.embed.assert_called_once_with(embedding_model, "hello")
+    embedding_model.get_embeddings.assert_not_called()
+
+
+def test_entries_are_scoped_by_model():
+    cache = QueryEmbeddingCache()
+    model_a = _embedding_model(model="a")
+    model_b = _embedding_model(model="b")
+
+    cache.get_embedding(model_a, "query")
+    cache.get_embedding(model_b, "query")
+
+    model_a.get_embeddings.assert_called_once()
+    model_b.get_embeddings.assert_called_once()
+
+
+def test_lru_eviction():
+    cache = QueryEmbeddingCache(max_entries=2, ttl_seconds=None)
+    embedding_model = _embedding_model()
+
+    cache.get_embedding(embedding_model, "a")
+    cache.get_embedding(embedding_model, "b")
+    cache.get_embedding(embedding_model, "a")
+    cache.get_embedding(embedding_model, "c")
+
+    assert cache.stats()["evictions"] == 1
+    assert cache.get(QueryEmbeddingCache.make_key(embedding_model, "b")) is None
+    assert cache.get(QueryEmbeddingCache.make_key(embedding_model, "a")) is not None
+
+
+def test_expired_entries_are_re_embedded():
+    cache = QueryEmbeddingCache(ttl_seconds=10)
+    embedding_model = _embedding_model()
+
+    with patch("sdk.nexent.vector_database.query_embedding_cache.time.monotonic", side_effect=[0, 20, 20]):
+        cache.get_embedding(embedding_model, "query")
+        cache.get_embedding(embedding_model, "query")
+
+    assert embedding_model.get_embeddings.call_count == 2
+    assert cache.stats()["expirations"] == 1